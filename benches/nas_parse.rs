@@ -0,0 +1,133 @@
+
+use criterion::{criterion_group, criterion_main, Criterion, Throughput};
+use pycrate_rs::nas::NASMessage;
+use std::hint::black_box;
+
+/// Autogenerated rust code, do not modify directly! Any changes should be
+/// made via the python generator scripts.
+
+/// Each message type's benchmark group, along with the hex payloads it
+/// parses on every iteration
+const GROUPS: &[(&str, &[&str])] = &[
+    ("emm_attach_request", &[
+        "0741020bf6130184fa6ab2c05ff06205f07000001000360201d031d1272f8080211001000010810600000000830600000000000d00000300ff0003130184000100000c00000a00000500001000521301846a025c0a009011034f18a6f15d0103c1000000000000",
+    ]),
+    ("emm_attach_accept", &[
+        "0742014906201301846b0100b25201c101051703696d73066d6e63343830066d6363333131046770727309020000000016f6a0df5e02b5b5583327838080211003000010810600000000830600000000000110200148880002713a00a0010400000071000110200148880004fe0000b0010400000259000110200148880004fe0000b0010400000205000310200148880016ff0001e1000d00000000000310200148880017ff0001e4000d00000000001002059400050102ff000413018405500bf6130184fa6aaec191ee7d5302172c3404030019f16401036603aabbcc",
+        "0742014906201301846b0100030202d9172c9353162a020102c1790003010203500bf6130184fa6aaec191ee7d",
+        "0742014906201301846b0100b25201c101051703696d73066d6e63343830066d6363333131046770727309020000000016f6a0df5e02b5b5583327838080211003000010810600000000830600000000000110200148880002713a00a0010400000071000110200148880004fe0000b0010400000259000110200148880004fe0000b0010400000205000310200148880016ff0001e1000d00000000000310200148880017ff0001e4000d00000000001002059400050102ff000413018405500bf6130184fa6aaec191ee7d5302172c3404030019f1640103",
+    ]),
+    ("emm_attach_complete", &[
+        "074300035200c2",
+        "074300035200c2000000000000",
+    ]),
+    ("emm_attach_reject", &[
+        "0744137800040201d121",
+    ]),
+    ("emm_detach_request_mo", &[
+        "0745630bf602f8108003c8c2e65e9a",
+        "0745290bf6130184fa6aaec192a663000000000000",
+    ]),
+    ("emm_tracking_area_update_request", &[
+        "0748610bf602f8108003c8c2e65e9a5804e060c0405202f810c4c25c0a00570220003103e5e0341302f810040511035758a65d0100c1",
+        "0748220bf6130184fa0a08c3910e865805f070000010521301840d07570260009011034f18a6f15d0103c1000000000000",
+    ]),
+    ("emm_tracking_area_update_accept", &[
+        "0749005a23500bf6130184fa6aaec197f5bb540b411301846a021301846a0157026000172c3404030019f1640103",
+    ]),
+    ("emm_tracking_area_update_complete", &[
+        "074a",
+    ]),
+    ("emm_tracking_area_update_reject", &[
+        "074b09",
+    ]),
+    ("emm_ext_service_request", &[
+        "074c6005f4c2e65e9a57022000",
+    ]),
+    ("emmcp_service_request", &[
+        "074d707800040200e86f6703091011570233c9d1",
+    ]),
+    ("emm_authentication_request", &[
+        "07520035040951a94d3d9487a31d5d7dd58b17108709d118a5238001b73bffabc570d08d",
+    ]),
+    ("emm_authentication_response", &[
+        "0753086eb1a96fa2807037000000000000",
+    ]),
+    ("emm_identity_request", &[
+        "075501",
+    ]),
+    ("emm_security_mode_command", &[
+        "075d330002f070c1",
+    ]),
+    ("emm_security_mode_complete", &[
+        "075e23093395684292874145f0",
+    ]),
+    ("emm_information", &[
+        "0761430f80d6b23cad7fbb41d7b4bccc2ecfe745048356ed15462b474210013213322b490100",
+    ]),
+    ("emmulnas_transport", &[
+        "07632009011d00010007913386094000f01101830a816000000000000005d4f29cae00",
+    ]),
+    ("emm_detach_request_mt", &[
+        "074502",
+    ]),
+    ("emm_sec_prot_nas_message", &[
+        "17a1b2c3d405074300035200c2",
+        "27a1b2c3d40512345678",
+    ]),
+    ("emm_service_request", &[
+        "c70a1b2c",
+    ]),
+    ("esm_act_default_eps_bearer_ctxt_request", &[
+        "0200c101051703696d73066d6e63343830066d6363333131046770727309020000000016f6a0df5e02b5b5583327838080211003000010810600000000830600000000000110200148880002713a00a0010400000071000110200148880004fe0000b0010400000259000110200148880004fe0000b0010400000205000310200148880016ff0001e1000d00000000000310200148880017ff0001e4000d00000000001002059400050102ff000413018405500bf6130184fa6aaec191ee7d5302172c3404030019f1640103",
+    ]),
+    ("esm_deact_eps_bearer_ctxt_request", &[
+        "0200cd24",
+    ]),
+    ("esmpdn_connectivity_request", &[
+        "0200d031280c0b565a57494e5445524e455427298080211001000010810600000000830600000000000d00000300ff0003130184000a00000500001000000000000000",
+    ]),
+    ("esmpdn_connectivity_reject", &[
+        "0200d12100000000000000000000000000000000000000000000000000000000",
+    ]),
+    ("esm_information_request", &[
+        "0202d9",
+    ]),
+    ("esm_information_response", &[
+        "0202da2807066f72616e6765",
+    ]),
+];
+
+fn unhexlify(byte_str: &str) -> Vec<u8> {
+    (0..byte_str.len())
+        .step_by(2)
+        .map(|i| u8::from_str_radix(&byte_str[i..i + 2], 16).unwrap())
+        .collect()
+}
+
+fn parse_all(payloads: &[Vec<u8>]) {
+    for payload in payloads {
+        let _ = black_box(NASMessage::parse(black_box(payload)));
+    }
+}
+
+fn bench_nas_parse(c: &mut Criterion) {
+    for (name, hexstrings) in GROUPS {
+        let payloads: Vec<Vec<u8>> = hexstrings.iter().map(|s| unhexlify(s)).collect();
+        for (hexstring, payload) in hexstrings.iter().zip(&payloads) {
+            if let Err(err) = NASMessage::parse(payload) {
+                panic!("{name}: failed to parse {hexstring}: {err:?}");
+            }
+        }
+        let num_bytes: usize = payloads.iter().map(|payload| payload.len()).sum();
+        let mut group = c.benchmark_group(*name);
+        group.throughput(Throughput::Elements(payloads.len() as u64));
+        group.bench_function("messages", |b| b.iter(|| parse_all(&payloads)));
+        group.throughput(Throughput::Bytes(num_bytes as u64));
+        group.bench_function("bytes", |b| b.iter(|| parse_all(&payloads)));
+        group.finish();
+    }
+}
+
+criterion_group!(benches, bench_nas_parse);
+criterion_main!(benches);
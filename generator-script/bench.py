@@ -0,0 +1,274 @@
+import argparse
+import binascii
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, cast
+
+import main
+from generator.dispatch import emm_dispatch, esm_dispatch
+from generator.ir import dump_indices, export_modules, load_indices
+from generator.modules import RustModule, RustTypeCache, render_modules
+from generator.parse_cache import pycrate_version
+from generator.pcap import GSMTAP_TYPE_NAS, gsmtap_record, write_pcap
+from generator.python_decoders import PythonDecoders, load
+from generator.tests import RustTestCase
+
+
+# GSMTAP types which aren't NAS, used as noise in the synthetic pcaps
+NON_NAS_GSMTAP_TYPES = [1, 2, 13, 15]
+
+
+class StageTimer:
+    """Collects wall-clock samples for each named pipeline stage"""
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.samples.setdefault(stage, []).append(seconds)
+
+    def time(self, stage: str, f: Callable[[], object]) -> object:
+        start = time.perf_counter()
+        result = f()
+        self.add(stage, time.perf_counter() - start)
+        return result
+
+    def results(self) -> Dict[str, Dict[str, float]]:
+        return {
+            stage: {
+                'runs': len(samples),
+                'min_s': min(samples),
+                'median_s': statistics.median(samples),
+                'mean_s': statistics.mean(samples),
+            }
+            for stage, samples in self.samples.items()
+        }
+
+
+def synthetic_payloads(seed: int, count: int) -> List[bytes]:
+    """Returns a reproducible stream of NAS payloads drawn from the test
+    cases in main.py, weighted towards short messages the way real captures
+    are dominated by periodic TAUs and identity requests
+    """
+    rng = random.Random(seed)
+    cases = [binascii.unhexlify(c) for c in main.EMM_TEST_CASES + main.ESM_TEST_CASES]
+    weights = [1 / len(case) for case in cases]
+    return rng.choices(cases, weights, k=count)
+
+
+def write_synthetic_pcaps(dirpath: str, seed: int, num_files: int, packets_per_file: int) -> None:
+    rng = random.Random(seed)
+    for i in range(num_files):
+        records = []
+        for payload in synthetic_payloads(seed + i, packets_per_file):
+            records.append(gsmtap_record(GSMTAP_TYPE_NAS, payload))
+            # sprinkle in some non-NAS records for the reader to skip
+            if rng.random() < 0.5:
+                noise = rng.randbytes(rng.randint(8, 64))
+                records.append(gsmtap_record(rng.choice(NON_NAS_GSMTAP_TYPES), noise))
+        with open(os.path.join(dirpath, f'synthetic_{i}.pcap'), 'wb') as f:
+            write_pcap(f, records)
+
+
+def bench_ingestion(timer: StageTimer, seed: int, num_files: int, packets_per_file: int) -> None:
+    with tempfile.TemporaryDirectory() as pcap_dir:
+        write_synthetic_pcaps(pcap_dir, seed, num_files, packets_per_file)
+        # keep the parse cache in memory so every run starts cold
+        timer.time('pcap_ingestion', lambda: main.get_test_cases(pcap_dir, 1, None))
+
+
+def bench_pycrate_parsing(timer: StageTimer, payloads: List[bytes]) -> None:
+    from pycrate_mobile import NASLTE
+
+    def parse_all() -> None:
+        for payload in payloads:
+            msg, err = NASLTE.parse_NASLTE_MO(payload)
+            if err != 0:
+                NASLTE.parse_NASLTE_MT(payload)
+    timer.time('pycrate_parsing', parse_all)
+
+
+def bench_python_decoders(timer: StageTimer, payloads: List[bytes]) -> None:
+    """Times rendering the generated Python decoders, and decoding the same
+    payloads as pycrate_parsing with them
+    """
+    def render() -> str:
+        decoders = PythonDecoders.from_classes(main.get_emm_classes() + main.get_esm_classes())
+        decoders.add_dispatch(emm_dispatch())
+        decoders.add_dispatch(esm_dispatch())
+        return decoders.to_python()
+    nas_decoders = load(cast(str, timer.time('python_decoders_render', render)))
+
+    def decode_all() -> None:
+        for payload in payloads:
+            nas_decoders.decode(payload)
+    timer.time('python_decoders_parsing', decode_all)
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return
+    # decode_columns reads one message type at a time, so batch the payloads
+    # by type first
+    batches: Dict[str, List[bytes]] = {}
+    for payload in payloads:
+        try:
+            name, _ = nas_decoders.decode(payload)
+        except nas_decoders.DecodeError:
+            continue
+        if name in nas_decoders.COLUMNS:
+            batches.setdefault(name, []).append(payload)
+
+    def decode_columns_all() -> None:
+        for name, batch in batches.items():
+            offsets = [0]
+            for payload in batch:
+                offsets.append(offsets[-1] + len(payload))
+            nas_decoders.decode_columns(name, b''.join(batch), offsets)
+    timer.time('python_decoders_columns', decode_columns_all)
+
+
+def bench_modules(timer: StageTimer) -> None:
+    """Times type resolution, rendering and test assertion building for
+    every EMM and ESM class. resolve_struct is timed on its own, and is also
+    included in resolve_types.
+    """
+    classes = main.get_emm_classes() + main.get_esm_classes()
+    resolve_struct = RustTypeCache.resolve_struct
+    resolve_struct_time = 0.0
+    # resolve_struct calls itself when a struct has to be resolved right
+    # away, so only the outermost call is timed, or nested calls would be
+    # counted more than once
+    depth = 0
+
+    def timed_resolve_struct(self: RustTypeCache) -> None:
+        nonlocal resolve_struct_time, depth
+        if depth:
+            resolve_struct(self)
+            return
+        depth += 1
+        start = time.perf_counter()
+        try:
+            resolve_struct(self)
+        finally:
+            resolve_struct_time += time.perf_counter() - start
+            depth -= 1
+
+    modules = [RustModule(clazz()) for clazz in classes]
+    RustTypeCache.resolve_struct = timed_resolve_struct  # type: ignore[method-assign]
+    try:
+        def resolve_all() -> None:
+            for module in modules:
+                module.resolve_types()
+        timer.time('resolve_types', resolve_all)
+    finally:
+        RustTypeCache.resolve_struct = resolve_struct  # type: ignore[method-assign]
+    timer.add('resolve_struct', resolve_struct_time)
+
+    def render_structs() -> None:
+        for module in modules:
+            for struct in module.cache.struct_cache.values():
+                struct.to_rust()
+
+    def render_enums() -> None:
+        for module in modules:
+            for enum in module.cache.enum_cache.values():
+                enum.to_rust()
+    timer.time('struct_to_rust', render_structs)
+    timer.time('enum_to_rust', render_enums)
+
+    # parse the test cases up front so only assertion building is timed
+    from pycrate_mobile import NASLTE
+    modules_by_name = {module.pyobj._name: module for module in modules}
+    parsed = []
+    for case_str in main.EMM_TEST_CASES + main.ESM_TEST_CASES:
+        case = binascii.unhexlify(case_str)
+        msg, err = NASLTE.parse_NASLTE_MO(case)
+        if err != 0:
+            msg, err = NASLTE.parse_NASLTE_MT(case)
+        module = modules_by_name[msg._name]
+        pyobj = module.pyobj.__class__()
+        pyobj.from_bytes(case)
+        parsed.append((case_str, module, pyobj))
+
+    def build_assertions() -> None:
+        for case_str, module, pyobj in parsed:
+            RustTestCase('case', case_str, module.base_struct, pyobj)
+    timer.time('test_assertions', build_assertions)
+
+
+def bench_file_writes(timer: StageTimer) -> None:
+    index = render_modules(main.get_emm_classes(), main.EMM_TEST_CASES)
+    with tempfile.TemporaryDirectory() as output_dir:
+        timer.time('file_writes_fresh', lambda: index.generate_module(output_dir))
+        timer.time('file_writes_unchanged', lambda: index.generate_module(output_dir))
+
+
+def bench_ir(timer: StageTimer) -> None:
+    """Times exporting every EMM and ESM module's IR, and rendering them back
+    from it, which is all a --from-ir run does before writing files
+    """
+    def export() -> dict:
+        return dump_indices({
+            'emm': export_modules(main.get_emm_classes(), main.EMM_TEST_CASES),
+            'esm': export_modules(main.get_esm_classes(), main.ESM_TEST_CASES),
+        }, {'emm': emm_dispatch(), 'esm': esm_dispatch()})
+    data = json.loads(json.dumps(timer.time('ir_export', export)))
+    timer.time('ir_render', lambda: load_indices(data))
+
+
+def run(repeat: int, seed: int, num_files: int, packets_per_file: int) -> dict:
+    # import pycrate up front, so its startup cost doesn't land on whichever
+    # stage happens to need it first
+    from pycrate_mobile import NASLTE  # noqa: F401
+    timer = StageTimer()
+    payloads = synthetic_payloads(seed, num_files * packets_per_file)
+    for _ in range(repeat):
+        bench_ingestion(timer, seed, num_files, packets_per_file)
+        bench_pycrate_parsing(timer, payloads)
+        bench_python_decoders(timer, payloads)
+        bench_modules(timer)
+        bench_file_writes(timer)
+        bench_ir(timer)
+    return {
+        'python_version': platform.python_version(),
+        'pycrate_version': pycrate_version(),
+        'config': {
+            'repeat': repeat,
+            'seed': seed,
+            'pcap_files': num_files,
+            'packets_per_file': packets_per_file,
+        },
+        'stages': timer.results(),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmarks each stage of the generator pipeline')
+    parser.add_argument('--repeat', type=int, default=3, help='number of times to run each stage')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the synthetic inputs')
+    parser.add_argument('--pcap-files', type=int, default=4, help='number of synthetic pcaps to ingest')
+    parser.add_argument('--packets-per-file', type=int, default=2000, help='NAS packets per synthetic pcap')
+    parser.add_argument('--output', help='write JSON results here instead of stdout')
+    args = parser.parse_args()
+
+    # the pipeline prints progress as it goes, so keep it away from the
+    # results when they're going to stdout
+    real_stdout = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        results = run(args.repeat, args.seed, args.pcap_files, args.packets_per_file)
+    finally:
+        sys.stdout = real_stdout
+    if args.output is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,40 @@
+import argparse
+import hashlib
+import os
+import shlex
+import sys
+
+from generator.differential import DEFAULT_NAS_PARSE_COMMAND, diff_corpus
+from generator.pcap import iter_nas_payloads
+
+
+def corpus_payloads(pcap_dir_filepath: str) -> list[bytes]:
+    """Returns every distinct NAS payload in a directory of pcaps, in the
+    order they were first seen
+    """
+    payloads = []
+    seen: set[bytes] = set()
+    pcap_filepaths = sorted(
+        entry.path for entry in os.scandir(pcap_dir_filepath) if entry.is_file()
+    )
+    for pcap_filepath in pcap_filepaths:
+        with open(pcap_filepath, 'rb') as f:
+            for payload in iter_nas_payloads(f):
+                digest = hashlib.blake2b(payload, digest_size=8).digest()
+                if digest not in seen:
+                    seen.add(digest)
+                    payloads.append(payload)
+    return payloads
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Compares the generated Rust parser against pycrate on every payload in a directory of pcaps')
+    parser.add_argument('pcap_dir_filepath', help='directory of GSMTAP pcaps to compare the parsers on')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of worker processes to decode payloads in pycrate with')
+    parser.add_argument('--nas-parse', default=shlex.join(DEFAULT_NAS_PARSE_COMMAND), help='command which runs the nas-parse binary, from the repo root')
+    args = parser.parse_args()
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    payloads = corpus_payloads(args.pcap_dir_filepath)
+    report = diff_corpus(payloads, shlex.split(args.nas_parse), repo_root, args.jobs)
+    print(report.to_text())
+    sys.exit(0 if report.is_clean() else 1)
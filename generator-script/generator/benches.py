@@ -0,0 +1,106 @@
+import unittest
+from typing import Dict
+
+from generator.modules import RenderedModule, RustModuleIndex
+from generator.util import indent
+
+
+class RustBenchSuite:
+    """Generates a Criterion benchmark suite with a group for each message
+    type which has payloads, timing NASMessage::parse over all of them. Each
+    group reports its throughput in both messages and bytes per second.
+    Every payload is checked to parse before it's timed, so a regression
+    can't make a benchmark faster by only timing the error path.
+    """
+
+    def __init__(self, indices: Dict[str, RustModuleIndex]) -> None:
+        self.indices = indices
+
+    def _groups(self) -> list[RenderedModule]:
+        return [
+            module
+            for index in self.indices.values()
+            if not index.standalone
+            for module in index.modules
+            if len(module.payloads)
+        ]
+
+    def _group_to_rust(self, module: RenderedModule) -> str:
+        # the same payload can be harvested more than once, but it'd only
+        # skew the group towards it
+        payloads = '\n'.join(f'"{payload}",' for payload in dict.fromkeys(module.payloads))
+        return f'''\
+("{module.name}", &[
+{indent(payloads)}
+]),'''
+
+    def to_rust(self) -> str:
+        groups = '\n'.join(self._group_to_rust(module) for module in self._groups())
+        return f"""
+use criterion::{{criterion_group, criterion_main, Criterion, Throughput}};
+use pycrate_rs::nas::NASMessage;
+use std::hint::black_box;
+
+/// Autogenerated rust code, do not modify directly! Any changes should be
+/// made via the python generator scripts.
+
+/// Each message type's benchmark group, along with the hex payloads it
+/// parses on every iteration
+const GROUPS: &[(&str, &[&str])] = &[
+{indent(groups)}
+];
+
+fn unhexlify(byte_str: &str) -> Vec<u8> {{
+    (0..byte_str.len())
+        .step_by(2)
+        .map(|i| u8::from_str_radix(&byte_str[i..i + 2], 16).unwrap())
+        .collect()
+}}
+
+fn parse_all(payloads: &[Vec<u8>]) {{
+    for payload in payloads {{
+        let _ = black_box(NASMessage::parse(black_box(payload)));
+    }}
+}}
+
+fn bench_nas_parse(c: &mut Criterion) {{
+    for (name, hexstrings) in GROUPS {{
+        let payloads: Vec<Vec<u8>> = hexstrings.iter().map(|s| unhexlify(s)).collect();
+        for (hexstring, payload) in hexstrings.iter().zip(&payloads) {{
+            if let Err(err) = NASMessage::parse(payload) {{
+                panic!("{{name}}: failed to parse {{hexstring}}: {{err:?}}");
+            }}
+        }}
+        let num_bytes: usize = payloads.iter().map(|payload| payload.len()).sum();
+        let mut group = c.benchmark_group(*name);
+        group.throughput(Throughput::Elements(payloads.len() as u64));
+        group.bench_function("messages", |b| b.iter(|| parse_all(&payloads)));
+        group.throughput(Throughput::Bytes(num_bytes as u64));
+        group.bench_function("bytes", |b| b.iter(|| parse_all(&payloads)));
+        group.finish();
+    }}
+}}
+
+criterion_group!(benches, bench_nas_parse);
+criterion_main!(benches);
+"""
+
+
+class TestRustBenchSuite(unittest.TestCase):
+    def test_groups(self):
+        index = RustModuleIndex()
+        index.add(RenderedModule('emm_attach_complete', 'EMMAttachComplete', False, [], [], '', ['074300035200c2']))
+        index.add(RenderedModule('emm_attach_reject', 'EMMAttachReject', False, [], [], ''))
+        index.add(RenderedModule('emm_identity_request', 'EMMIdentityRequest', False, [], [], '', ['075501', '075502', '075501']))
+        rust = RustBenchSuite({'emm': index}).to_rust()
+        assert '    ("emm_attach_complete", &[\n        "074300035200c2",\n    ]),' in rust
+        # duplicate payloads are only benchmarked once
+        assert '    ("emm_identity_request", &[\n        "075501",\n        "075502",\n    ]),' in rust
+        # every payload is checked before it's timed
+        assert 'panic!("{name}: failed to parse {hexstring}: {err:?}");' in rust
+        # types without any payloads have nothing to benchmark
+        assert 'emm_attach_reject' not in rust
+
+
+if __name__ == "__main__":
+    unittest.main()
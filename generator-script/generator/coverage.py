@@ -0,0 +1,180 @@
+import unittest
+from typing import Any, Dict, Optional, Tuple
+
+from pycrate_core import elt
+
+from generator.rust_types import get_layer3_wrapper
+
+
+def parse_nas_message(payload: bytes) -> Optional[Any]:
+    """Parses a NAS payload with pycrate, trying the uplink parser first
+    like parse_nas_packet does, and returns the message or None
+    """
+    # pycrate is slow to import, so only pay for it once we actually need to
+    # parse something
+    from pycrate_mobile import NASLTE
+    msg, _ = NASLTE.parse_NASLTE_MO(payload)
+    if msg is None:
+        msg, _ = NASLTE.parse_NASLTE_MT(payload)
+    return msg
+
+
+def message_features(msg: elt.Element) -> frozenset[str]:
+    """Returns what a parsed message exercises in the generated parser: the
+    path of every element pycrate found in it, the value of every enum, and
+    the tag of every optional IE. Elements of a list share a path, so the
+    number of features stays bounded no matter how long the list is.
+    """
+    features: set[str] = set()
+    _add_features(msg, msg._name, features)
+    return frozenset(features)
+
+
+def _add_features(obj: elt.Element, path: str, features: set[str]) -> None:
+    # pycrate sets the transparency flag on values which aren't in the
+    # payload
+    if obj.get_trans():
+        return
+    features.add(f'field:{path}')
+    layer3_wrapper = get_layer3_wrapper(obj) if isinstance(obj, elt.Envelope) else None
+    if layer3_wrapper is not None and layer3_wrapper.tag is not None:
+        features.add(f'tag:{layer3_wrapper.tag:#x}')
+    if isinstance(obj, (elt.Envelope, elt.Sequence, elt.Array)):
+        for item in obj:
+            item_path = path if isinstance(obj, (elt.Sequence, elt.Array)) else f'{path}.{item._name}'
+            _add_features(item, item_path, features)
+    elif isinstance(obj, elt.Atom) and obj._dic:
+        features.add(f'enum:{path}={obj.get_val()}')
+
+
+def feature_counts(features: set[str] | frozenset[str]) -> Tuple[int, int, int]:
+    """Returns how many fields, enum values and IE tags are in a set of
+    features
+    """
+    kinds = [feature.split(':', 1)[0] for feature in features]
+    return kinds.count('field'), kinds.count('enum'), kinds.count('tag')
+
+
+def greedy_cover(candidates: Dict[frozenset[str], bytes]) -> list[bytes]:
+    """Picks payloads until every feature of every candidate is covered, each
+    time taking the one which covers the most features that aren't covered
+    yet. On ties the shortest payload wins, so the tests stay small. This is
+    the usual greedy approximation of set cover, which is within a log
+    factor of the smallest possible set.
+    """
+    uncovered = set().union(*candidates)
+    selected = []
+    remaining = dict(candidates)
+    while len(uncovered):
+        features, payload = max(
+            remaining.items(),
+            key=lambda item: (len(item[0] & uncovered), -len(item[1]), item[1]),
+        )
+        selected.append(payload)
+        uncovered -= features
+        del remaining[features]
+    return selected
+
+
+class CoveragePool:
+    """The candidate payloads for a single message type, keyed by the
+    features they cover. Payloads covering the same features as one we
+    already have are only kept if they're shorter. Once the pool holds
+    pool_size candidates, new ones are only kept if they cover something no
+    other candidate does, so it never holds more than pool_size candidates
+    plus one per feature.
+    """
+
+    def __init__(self, pool_size: int) -> None:
+        self.pool_size = pool_size
+        self.candidates: Dict[frozenset[str], bytes] = {}
+        self.covered: set[str] = set()
+        # how many payloads were offered to the pool
+        self.seen = 0
+
+    def add(self, payload: bytes, features: frozenset[str]) -> None:
+        self.seen += 1
+        existing = self.candidates.get(features)
+        if existing is not None:
+            if len(payload) < len(existing):
+                self.candidates[features] = payload
+            return
+        if len(self.candidates) >= self.pool_size and features <= self.covered:
+            return
+        self.candidates[features] = payload
+        self.covered |= features
+
+    def merge(self, other: 'CoveragePool') -> None:
+        """Merges another pool's candidates into this one, as if they'd been
+        added to it after this pool's
+        """
+        seen = self.seen
+        for features, payload in other.candidates.items():
+            self.add(payload, features)
+        self.seen = seen + other.seen
+
+    def select(self) -> list[bytes]:
+        return greedy_cover(self.candidates)
+
+    def report(self, type_name: str) -> str:
+        """Describes how much of the pool's coverage the selected payloads
+        keep, compared to keeping only the longest payload
+        """
+        selected = self.select()
+        fields, enums, tags = feature_counts(self.covered)
+        longest = max(self.candidates.items(), key=lambda item: (len(item[1]), item[1]))[0]
+        return (
+            f'{type_name}: {len(selected)} of {len(self.candidates)} candidates '
+            f'({self.seen} payloads) cover {len(self.covered)} features '
+            f'({fields} fields, {enums} enum values, {tags} IE tags), '
+            f'the longest payload alone covers {len(longest)}'
+        )
+
+
+class TestCoverage(unittest.TestCase):
+    def test_message_features(self):
+        # TAU request with several optional IEs
+        tau = bytes.fromhex('0748610bf602f8108003c8c2e65e9a5804e060c0405202f810c4c25c0a00570220003103e5e0341302f810040511035758a65d0100c1')
+        features = message_features(parse_nas_message(tau))
+        assert 'field:EMMTrackingAreaUpdateRequest.UENetCap.UENetCap.EEA0' in features
+        assert 'enum:EMMTrackingAreaUpdateRequest.EPSUpdateType.EPSUpdateType.Active=0' in features
+        assert 'tag:0x58' in features
+        # absent IEs don't count
+        assert not any('NonceUE' in feature for feature in features)
+        assert 'tag:0x55' not in features
+
+        # every label of an APN shares a path
+        info_resp = message_features(parse_nas_message(bytes.fromhex('0202da2807066f72616e6765')))
+        assert len([feature for feature in info_resp if feature.startswith('field:ESMInformationResponse.APN.APN.')]) > 0
+
+    def test_greedy_cover(self):
+        candidates = {
+            frozenset('abc'): b'\x00' * 4,
+            frozenset('cd'): b'\x00' * 2,
+            frozenset('de'): b'\x00' * 3,
+            frozenset('ab'): b'\x00',
+        }
+        assert greedy_cover(candidates) == [b'\x00' * 4, b'\x00' * 3]
+        assert greedy_cover({}) == []
+
+    def test_pool(self):
+        pool = CoveragePool(2)
+        pool.add(b'\x01\x02', frozenset('a'))
+        pool.add(b'\x01', frozenset('a'))
+        pool.add(b'\x03', frozenset('b'))
+        # the pool is full, so only new features get in
+        pool.add(b'\x04', frozenset('ab'))
+        pool.add(b'\x05', frozenset('bc'))
+        assert pool.candidates == {frozenset('a'): b'\x01', frozenset('b'): b'\x03', frozenset('bc'): b'\x05'}
+        assert pool.select() == [b'\x05', b'\x01']
+
+        other = CoveragePool(2)
+        other.add(b'\x06', frozenset('cd'))
+        pool.merge(other)
+        assert pool.seen == 6
+        assert pool.covered == set('abcd')
+        assert pool.report('Foo').startswith('Foo: 3 of 4 candidates (6 payloads) cover 4 features')
+
+
+if __name__ == "__main__":
+    unittest.main()
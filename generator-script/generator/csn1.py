@@ -0,0 +1,486 @@
+import unittest
+from typing import Any, Dict, Optional, Union
+
+from generator.util import indent, snake_case, upper_camel_case
+
+# pycrate_csn1 takes a while to import, so it's only imported once we're
+# actually walking CSN.1 definitions
+
+
+class Csn1Unsupported(Exception):
+    """Raised when a CSN.1 definition uses something we can't generate a
+    reader for, like a length or repetition count given by another field
+    """
+
+
+class Csn1Bits:
+    """An unsigned integer of a fixed number of bits"""
+
+    def __init__(self, bits: int) -> None:
+        if bits > 32:
+            raise Csn1Unsupported(f'{bits} bit field')
+        self.bits = bits
+
+    def rust_type_name(self) -> str:
+        if self.bits <= 8:
+            return 'u8'
+        elif self.bits <= 16:
+            return 'u16'
+        return 'u32'
+
+    def read_expr(self) -> str:
+        if self.rust_type_name() == 'u32':
+            return f'reader.read_bits({self.bits})?'
+        return f'reader.read_bits({self.bits})? as {self.rust_type_name()}'
+
+
+class Csn1Repeated:
+    """A value repeated either a fixed number of times, or for as long as
+    there are bits left to read it from
+    """
+
+    def __init__(self, element: 'Csn1Type', count: Optional[int]) -> None:
+        self.element = element
+        self.count = count
+
+    def rust_type_name(self) -> str:
+        return f'Vec<{self.element.rust_type_name()}>'
+
+    def read_expr(self) -> str:
+        read_element = f'|reader| Ok({self.element.read_expr()})'
+        if self.count is None:
+            return f'reader.read_until_end({read_element})?'
+        return f'reader.read_count({self.count}, {read_element})?'
+
+
+class Csn1Optional:
+    """An alternative between nothing and something else, selected by a
+    single bit, e.g. `{ 0 | 1 <R Support> }`. If the present alternative
+    holds more than one value, they're read into a struct of their own.
+    """
+
+    def __init__(self, key: str, inner: 'Csn1Type', holds_single_value: bool) -> None:
+        self.key = key
+        self.inner = inner
+        self.holds_single_value = holds_single_value
+
+    def rust_type_name(self) -> str:
+        return f'Option<{self.inner.rust_type_name()}>'
+
+    def read_expr(self) -> str:
+        return f'if reader.read_bits(1)? == {self.key} {{ Some({self.inner.read_expr()}) }} else {{ None }}'
+
+
+class Csn1Field:
+    """A value within a CSN.1 list, along with its index in pycrate's list
+    of values. Fixed values, like a `0` separating two fields, have no
+    type, since all there is to do is check them.
+    """
+
+    def __init__(self, name: str, type: 'Optional[Csn1Type]', index: int, fixed_value: str = '') -> None:
+        self.name = snake_case(name)
+        self.type = type
+        self.index = index
+        self.fixed_value = fixed_value
+
+    def read_lines(self, assign: str) -> list[str]:
+        """Returns the Rust statements which read this field, assigning its
+        value with the given format string
+        """
+        if self.type is None:
+            if self.fixed_value == '':
+                return []
+            return [f'reader.expect_bits({len(self.fixed_value)}, 0b{self.fixed_value})?;']
+        return [assign.format(name=self.name, value=self.type.read_expr())]
+
+
+def fix_duplicate_names(fields: list[Csn1Field]) -> None:
+    names = [field.name for field in fields if field.type is not None]
+    for name in set(names):
+        if names.count(name) > 1:
+            dupes = [field for field in fields if field.name == name and field.type is not None]
+            for i, dupe in enumerate(dupes):
+                dupe.name += f'_{i + 1}'
+
+
+class Csn1Struct:
+    """A CSN.1 list of values, read in order. Truncated lists stop at the
+    first value which runs out of bits, leaving it and the rest as None,
+    which is how optional trailing values are usually left off. Invalid
+    values are still errors.
+    """
+
+    def __init__(self, name: str, truncates: bool) -> None:
+        self.name = upper_camel_case(name)
+        self.fields: list[Csn1Field] = []
+        self.truncates = truncates
+        # whether this is the outermost value of an IE, which is read from
+        # a layer 3 container
+        self.is_ie = False
+
+    def add_field(self, field: Csn1Field) -> None:
+        self.fields.append(field)
+
+    def typed_fields(self) -> list[Csn1Field]:
+        return [field for field in self.fields if field.type is not None]
+
+    def rust_type_name(self) -> str:
+        return self.name
+
+    def is_big_endian(self) -> bool:
+        return False
+
+    def read_expr(self) -> str:
+        return f'{self.name}::read_csn1(reader)?'
+
+    def dependencies(self) -> list[str]:
+        return [name for field in self.typed_fields() for name in type_dependencies(field.type)]
+
+    def _field_type_name(self, field: Csn1Field) -> str:
+        assert field.type is not None
+        if self.truncates:
+            return f'Option<{field.type.rust_type_name()}>'
+        return field.type.rust_type_name()
+
+    def _read_body(self) -> str:
+        if self.truncates:
+            lines = []
+            for field in self.fields:
+                lines += field.read_lines('value.{name} = Some({value});')
+            return f'''\
+// values left off the end are None
+let mut value = Self::default();
+let result = (|| -> Result<(), Csn1Error> {{
+{indent('\n'.join(lines + ['Ok(())']))}
+}})();
+match result {{
+    // running out of bits just means the rest were left off, but a value
+    // which doesn't match its definition is still an error
+    Ok(()) | Err(Csn1Error::Truncated) => Ok(value),
+    Err(err) => Err(err),
+}}'''
+        lines = []
+        for field in self.fields:
+            lines += field.read_lines('let {name} = {value};')
+        field_names = ' '.join(f'{field.name},' for field in self.typed_fields())
+        lines.append(f'Ok(Self {{ {field_names} }})' if field_names else 'Ok(Self {})')
+        return '\n'.join(lines)
+
+    def to_rust(self) -> str:
+        fix_duplicate_names(self.fields)
+        traits = 'Debug, Serialize, Clone, Default' if self.truncates else 'Debug, Serialize, Clone'
+        fields = [indent(f'pub {field.name}: {self._field_type_name(field)},') for field in self.typed_fields()]
+        rust = f'''\
+#[derive({traits})]
+pub struct {self.name} {{
+{'\n'.join(fields)}
+}}
+
+impl Csn1Read for {self.name} {{
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {{
+{indent(self._read_body(), 2)}
+    }}
+}}'''
+        if self.is_ie:
+            rust += f'''
+
+impl<'a> DekuReader<'a, ByteSize> for {self.name} {{
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        byte_size: ByteSize,
+    ) -> Result<Self, DekuError> {{
+        read_csn1_ie(reader, byte_size)
+    }}
+}}'''
+        return rust
+
+
+class Csn1Variant:
+    """One of a Csn1Enum's alternatives, holding the values which follow
+    its key
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.name = f'B{key}'
+        self.fields: list[Csn1Field] = []
+
+    def to_rust(self) -> str:
+        fix_duplicate_names(self.fields)
+        if not any(field.type is not None for field in self.fields):
+            return f'{self.name},'
+        fields = [
+            indent(f'{field.name}: {field.type.rust_type_name()},')
+            for field in self.fields
+            if field.type is not None
+        ]
+        return f'{self.name} {{\n{'\n'.join(fields)}\n}},'
+
+    def read_lines(self) -> list[str]:
+        lines = [f'reader.skip_bits({len(self.key)})?;']
+        for field in self.fields:
+            lines += field.read_lines('let {name} = {value};')
+        field_names = [field.name for field in self.fields if field.type is not None]
+        if len(field_names):
+            lines.append(f'return Ok(Self::{self.name} {{ {', '.join(field_names)} }});')
+        else:
+            lines.append(f'return Ok(Self::{self.name});')
+        return lines
+
+
+class Csn1Enum:
+    """An alternative between lists of values, selected by the bits at the
+    start of the value. Variants are named after the bits which select
+    them, e.g. `B010`.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = upper_camel_case(name)
+        self.variants: list[Csn1Variant] = []
+
+    def rust_type_name(self) -> str:
+        return self.name
+
+    def read_expr(self) -> str:
+        return f'{self.name}::read_csn1(reader)?'
+
+    def dependencies(self) -> list[str]:
+        return [
+            name
+            for variant in self.variants
+            for field in variant.fields
+            if field.type is not None
+            for name in type_dependencies(field.type)
+        ]
+
+    def to_rust(self) -> str:
+        variants = [indent(variant.to_rust()) for variant in self.variants]
+        # like pycrate, try the shortest keys first
+        key_lengths = sorted(set(len(variant.key) for variant in self.variants))
+        matches = []
+        for key_length in key_lengths:
+            arms = []
+            for variant in self.variants:
+                if len(variant.key) == key_length:
+                    arms.append(f'0b{variant.key} => {{\n{indent('\n'.join(variant.read_lines()))}\n}}')
+            arms.append('_ => (),')
+            matches.append(f'match reader.peek_bits({key_length})? {{\n{indent('\n'.join(arms))}\n}}')
+        matches.append('Err(Csn1Error::InvalidValue)')
+        return f'''\
+#[derive(Debug, Serialize, Clone)]
+pub enum {self.name} {{
+{'\n'.join(variants)}
+}}
+
+impl Csn1Read for {self.name} {{
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {{
+{indent('\n'.join(matches), 2)}
+    }}
+}}'''
+
+
+Csn1Type = Union[Csn1Bits, Csn1Repeated, Csn1Optional, Csn1Struct, Csn1Enum]
+
+
+def type_dependencies(csn1_type: Csn1Type) -> list[str]:
+    """Returns the names of the generated types a CSN.1 type refers to"""
+    if isinstance(csn1_type, (Csn1Struct, Csn1Enum)):
+        return [csn1_type.name]
+    elif isinstance(csn1_type, Csn1Repeated):
+        return type_dependencies(csn1_type.element)
+    elif isinstance(csn1_type, Csn1Optional):
+        return type_dependencies(csn1_type.inner)
+    return []
+
+
+def csn1_name(obj: Any) -> str:
+    """Returns the name of a CSN.1 object. References and alternatives are
+    usually unnamed, so they're named after what they refer to, or
+    failing that, the first named value they hold.
+    """
+    from pycrate_csn1.csnobj import CSN1Alt, CSN1Ref
+
+    if obj._name:
+        return obj._name
+    if isinstance(obj, CSN1Ref):
+        return csn1_name(obj._obj)
+    if isinstance(obj, CSN1Alt):
+        for alt_name, _ in obj._alt.values():
+            if alt_name:
+                return alt_name
+        for _, items in obj._alt.values():
+            for item in items:
+                name = csn1_name(item)
+                if name:
+                    return name
+    return ''
+
+
+class Csn1Types:
+    """Walks a pycrate CSN.1 definition, generating the Rust types needed to
+    read it. Types are keyed by name, so that a list referred to from
+    several places is only generated once.
+    """
+
+    def __init__(self) -> None:
+        self.types: Dict[str, Csn1Struct | Csn1Enum] = {}
+
+    @staticmethod
+    def from_pycrate(obj: Any) -> 'Csn1Types':
+        """Generates the types for a CSN.1 IE, raising Csn1Unsupported if it
+        uses anything we can't read
+        """
+        from pycrate_csn1.csnobj import CSN1List
+
+        if not isinstance(obj, CSN1List) or obj._num != 1 or obj._lref is not None:
+            raise Csn1Unsupported(f'{obj._name} is not a plain list')
+        csn1_types = Csn1Types()
+        root = csn1_types._struct(obj._name, obj._list, obj._trunc)
+        root.is_ie = True
+        return csn1_types
+
+    def root(self) -> Csn1Struct:
+        """The IE's outermost struct, which is always generated last"""
+        root = list(self.types.values())[-1]
+        assert isinstance(root, Csn1Struct)
+        return root
+
+    def _struct(self, name: str, items: list, truncates: bool) -> Csn1Struct:
+        if not name:
+            raise Csn1Unsupported('unnamed list')
+        if upper_camel_case(name) in self.types:
+            existing = self.types[upper_camel_case(name)]
+            if not isinstance(existing, Csn1Struct):
+                raise Csn1Unsupported(f'{name} is both a list and an alternative')
+            return existing
+        struct = Csn1Struct(name, truncates)
+        for i, item in enumerate(items):
+            struct.add_field(self._field(item, i))
+        self.types[struct.name] = struct
+        return struct
+
+    def _field(self, obj: Any, index: int) -> Csn1Field:
+        from pycrate_csn1.csnobj import CSN1Val
+
+        if isinstance(obj, CSN1Val):
+            if obj._num != 1 or obj._lref is not None or obj._pad_gsm:
+                raise Csn1Unsupported(f'fixed value {obj._stat}')
+            fixed_value = '' if obj._stat == 'null' else obj._stat
+            return Csn1Field('', None, index, fixed_value)
+        name = csn1_name(obj)
+        if not name:
+            raise Csn1Unsupported('unnamed value')
+        return Csn1Field(name, self._type(obj), index)
+
+    def _type(self, obj: Any) -> Csn1Type:
+        if obj._lref is not None:
+            raise Csn1Unsupported(f'{obj._name} has a limited length')
+        if isinstance(obj._num, tuple):
+            raise Csn1Unsupported(f'{obj._name} is repeated depending on another field')
+        if obj._num == 1:
+            return self._single_type(obj)
+        return Csn1Repeated(self._single_type(obj), None if obj._num == -1 else obj._num)
+
+    def _single_type(self, obj: Any) -> Csn1Type:
+        from pycrate_csn1.csnobj import CSN1Alt, CSN1Bit, CSN1List, CSN1Ref
+
+        if isinstance(obj, CSN1Bit):
+            if not isinstance(obj._bit, int) or obj._bit < 0:
+                raise Csn1Unsupported(f'{obj._name} has a variable length')
+            return Csn1Bits(obj._bit)
+        elif isinstance(obj, CSN1Ref):
+            return self._type(obj._obj)
+        elif isinstance(obj, CSN1List):
+            return self._struct(obj._name, obj._list, obj._trunc)
+        elif isinstance(obj, CSN1Alt):
+            return self._alt(obj)
+        raise Csn1Unsupported(f'{type(obj).__name__} {obj._name}')
+
+    def _alt(self, obj: Any) -> Csn1Type:
+        keys = list(obj._alt)
+        if obj._trunc or obj._pad_gsm or None in keys or '' in keys:
+            raise Csn1Unsupported(f'alternative {csn1_name(obj)}')
+        name = csn1_name(obj)
+        if not name:
+            raise Csn1Unsupported('unnamed alternative')
+        # { 0 | 1 <Foo> } is by far the most common alternative, so it's read
+        # into an Option rather than an enum
+        present = [key for key in keys if len(obj._alt[key][1])]
+        if sorted(keys) == ['0', '1'] and len(present) == 1:
+            key = present[0]
+            items = obj._alt[key][1]
+            if len(items) == 1 and len(csn1_name(items[0])):
+                return Csn1Optional(key, self._type(items[0]), True)
+            return Csn1Optional(key, self._struct(name, items, False), False)
+        if upper_camel_case(name) in self.types:
+            raise Csn1Unsupported(f'{name} is defined twice')
+        rust_enum = Csn1Enum(name)
+        for key in sorted(keys, key=lambda key: (len(key), key)):
+            variant = Csn1Variant(key)
+            for i, item in enumerate(obj._alt[key][1]):
+                # pycrate's values for an alternative start with its key
+                variant.fields.append(self._field(item, i + 1))
+            rust_enum.variants.append(variant)
+        self.types[rust_enum.name] = rust_enum
+        return rust_enum
+
+
+class TestCsn1Types(unittest.TestCase):
+    def test_ms_network_capability(self):
+        from pycrate_csn1dir.ms_network_capability_value_part import ms_network_capability_value_part
+
+        csn1_types = Csn1Types.from_pycrate(ms_network_capability_value_part)
+        root = csn1_types.root()
+        assert root.name == 'MsNetworkCapabilityValuePart'
+        assert root.is_ie and root.truncates
+        assert root.dependencies() == ['ExtendedGeaBits']
+        names = [field.name for field in root.fields]
+        assert names[:3] == ['gea_1_bits', 'sm_capabilities_via_dedicated_channels', 'sm_capabilities_via_gprs_channels']
+        assert isinstance(root.fields[-1].type, Csn1Repeated)
+        rust = root.to_rust()
+        assert '#[derive(Debug, Serialize, Clone, Default)]' in rust
+        assert '    pub ss_screening_indicator: Option<u8>,' in rust
+        assert '            value.extended_gea_bits = Some(ExtendedGeaBits::read_csn1(reader)?);' in rust
+        assert '            value.spare_bits = Some(reader.read_until_end(|reader| Ok(reader.read_bits(1)? as u8))?);' in rust
+        # only running out of bits ends a truncated list
+        assert '            Ok(()) | Err(Csn1Error::Truncated) => Ok(value),\n            Err(err) => Err(err),' in rust
+        assert "impl<'a> DekuReader<'a, ByteSize> for MsNetworkCapabilityValuePart {" in rust
+        # nested lists aren't truncated, and are read directly
+        rust = csn1_types.types['ExtendedGeaBits'].to_rust()
+        assert '    pub gea_2: u8,' in rust
+        assert 'Ok(Self { gea_2, gea_3, gea_4, gea_5, gea_6, gea_7, })' in rust
+        assert 'DekuReader' not in rust
+
+    def test_alternatives(self):
+        from pycrate_csn1dir.classmark_3_value_part import classmark_3_value_part
+
+        csn1_types = Csn1Types.from_pycrate(classmark_3_value_part)
+        root = csn1_types.root()
+        fields = {field.name: field for field in root.typed_fields()}
+        # { 0 | 1 <R Support> }
+        r_support = fields['r_support'].type
+        assert isinstance(r_support, Csn1Optional) and r_support.holds_single_value
+        assert r_support.read_expr() == 'if reader.read_bits(1)? == 1 { Some(reader.read_bits(3)? as u8) } else { None }'
+        # alternatives holding several values get a struct of their own
+        dtm = fields['dtm_gprs_multi_slot_class'].type
+        assert isinstance(dtm, Csn1Optional) and not dtm.holds_single_value
+        assert dtm.inner.rust_type_name() == 'DtmGprsMultiSlotClass'
+        # anything else is an enum
+        rust = csn1_types.types['MultibandSupported'].to_rust()
+        assert '    B000 {\n        a_5_bits: A5Bits,\n    },' in rust
+        assert '        match reader.peek_bits(3)? {\n            0b000 => {\n                reader.skip_bits(3)?;' in rust
+        assert '                return Ok(Self::B001 { a_5_bits, spare_bit, associated_radio_capability_1 });' in rust
+        assert '            let spare_bit = reader.read_count(4, |reader| Ok(reader.read_bits(1)? as u8))?;' in rust
+        # fixed values are checked, but don't get a field
+        assert '            reader.expect_bits(1, 0b0)?;' in root.to_rust()
+
+    def test_unsupported(self):
+        from pycrate_csn1.csnobj import CSN1Bit, CSN1List
+
+        length = CSN1Bit(name='length', bit=4)
+        data = CSN1Bit(name='data', bit=8, num=([0], lambda x: x))
+        self.assertRaises(Csn1Unsupported, Csn1Types.from_pycrate, CSN1List(name='foo', list=[length, data]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,8 +17,11 @@ class DekuAttributes:
         self.is_big_endian = False
         self.is_optional = False
         self.needs_byte_size = False
+        self.is_borrowed = False
         self.is_wrapped = False
         self.size: Optional[Tuple[str, int]] = None
+        self.count: Optional[str] = None
+        self.bytes_read: Optional[str] = None
         self.tag: Optional[int] = None
 
     def set_tag(self, tag: int) -> None:
@@ -33,6 +36,18 @@ class DekuAttributes:
         else:
             self.size = ('bits', bits)
 
+    def set_count(self, count: str) -> None:
+        """Sets the number of elements (or bytes, for a buffer) to read, as
+        an expression which may refer to earlier fields
+        """
+        self.count = count
+
+    def set_bytes_read(self, bytes_read: str) -> None:
+        """Sets the number of bytes a list's elements take up, as an
+        expression which may refer to earlier fields
+        """
+        self.bytes_read = bytes_read
+
     def mark_as_buf(self, final_buf=False) -> None:
         self.is_buf = True
         self.is_final_buf = final_buf
@@ -43,6 +58,9 @@ class DekuAttributes:
     def set_needs_byte_size(self, needs_byte_size: bool) -> None:
         self.needs_byte_size = needs_byte_size
 
+    def set_borrowed(self, is_borrowed: bool) -> None:
+        self.is_borrowed = is_borrowed
+
     def _is_enum(self) -> bool:
         return self.default_enum_variant is not None
 
@@ -55,16 +73,50 @@ class DekuAttributes:
     def set_bit_padding(self, bit_padding: int) -> None:
         self.bit_padding = bit_padding
 
-    def _build_ctx(self, attrs: list[str]) -> None:
+    def _ctx_items(self) -> list[str]:
         ctx = []
         if self.tag is not None:
             ctx.append(f'Tag({self.tag})')
-        if self.needs_byte_size:
+        if self.is_borrowed:
+            # borrowed buffers always know their own size, so they only need
+            # the message's input passed down
+            ctx.append('input')
+        elif self.needs_byte_size:
             ctx.append("NeedsByteSize")
+        return ctx
+
+    def _build_ctx(self, attrs: list[str]) -> None:
+        ctx = self._ctx_items()
         if len(ctx):
             attrs.append(f'ctx = "{', '.join(ctx)}"')
 
+    def reader_ctx(self) -> str:
+        """Returns the ctx value deku would pass to a layer 3 wrapped
+        field's DekuReader impl given these attributes, so that hand-written
+        readers can call the same impl. Deku puts the endianness first,
+        followed by the bit or byte size, then any ctx items.
+        """
+        assert self.is_wrapped
+        args = []
+        if not self._is_enum() and self.is_big_endian:
+            args.append('Endian::Big')
+        if self.size:
+            units, value = self.size
+            args.append(f'ByteSize({value})' if units == 'bytes' else f'BitSize({value})')
+        args += self._ctx_items()
+        if len(args) == 0:
+            return '()'
+        if len(args) == 1:
+            return args[0]
+        return f'({', '.join(args)})'
+
     def _set_size_or_count(self, attrs: list[str]) -> None:
+        if self.count is not None:
+            attrs.append(f'count = "{self.count}"')
+            return
+        if self.bytes_read is not None:
+            attrs.append(f'bytes_read = "{self.bytes_read}"')
+            return
         if self.is_wrapped or not self._is_enum():
             if self.size:
                 units, value = self.size
@@ -116,6 +168,32 @@ class TestNamer(unittest.TestCase):
         attr.set_tag(10)
         assert attr.to_rust() == attrfy(['ctx = "Tag(10), NeedsByteSize"'])
 
+    def test_borrowed(self):
+        attr = DekuAttributes()
+        attr.set_needs_byte_size(True)
+        attr.set_borrowed(True)
+        assert attr.to_rust() == attrfy(['ctx = "input"'])
+
+        attr.set_tag(10)
+        attr.set_size(32)
+        assert attr.to_rust() == attrfy(['bytes = 4', 'ctx = "Tag(10), input"'])
+
+    def test_reader_ctx(self):
+        attr = DekuAttributes()
+        attr.mark_as_wrapped()
+        assert attr.reader_ctx() == '()'
+        attr.set_tag(10)
+        assert attr.reader_ctx() == 'Tag(10)'
+        attr.set_size(24)
+        attr.set_needs_byte_size(True)
+        assert attr.reader_ctx() == '(ByteSize(3), Tag(10), NeedsByteSize)'
+
+        attr = DekuAttributes()
+        attr.mark_as_wrapped()
+        attr.set_big_endian(True)
+        attr.set_tag(10)
+        assert attr.reader_ctx() == '(Endian::Big, Tag(10))'
+
     def test_is_optional(self):
         attr = DekuAttributes()
         attr.set_is_optional(True)
@@ -157,6 +235,17 @@ class TestNamer(unittest.TestCase):
         attr.set_size(7)
         assert attr.to_rust() == attrfy(['bits = 7'])
 
+    def test_count(self):
+        attr = DekuAttributes()
+        attr.set_size(0)
+        attr.mark_as_buf()
+        attr.set_count('len')
+        assert attr.to_rust() == attrfy(['count = "len"'])
+
+        attr = DekuAttributes()
+        attr.set_bytes_read('byte_size - deku::byte_offset')
+        assert attr.to_rust() == attrfy(['bytes_read = "byte_size - deku::byte_offset"'])
+
     def test_enum(self):
         attr = DekuAttributes()
         attr.mark_as_enum('EnumName', 'DefaultVariant')
@@ -0,0 +1,358 @@
+import binascii
+import json
+import os
+import re
+import subprocess
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from generator.modules import RustModule
+from generator.pcap import GSMTAP_TYPE_NAS, gsmtap_record, write_pcap
+from generator.rust_types import RustEnum, RustPrimitiveType, RustStructField
+from generator.tests import Assertion, AssertionPath, RustTestCase, RustTestCasePattern, RustTestCaseValue, RustValueAccess
+
+# the command which runs the nas-parse binary, relative to the repo root
+DEFAULT_NAS_PARSE_COMMAND = ['cargo', 'run', '--release', '--quiet', '--bin', 'nas-parse', '--']
+
+# stands in for taking a list's length in a path through a parsed message
+LEN = object()
+
+# accesses within a CSN.1 value's Rust expression: method calls, fields, and
+# indices
+CSN1_ACCESS_RE = re.compile(r'\.?(\w+)\(\)|\.?(\w+)|\[(\d+)\]')
+
+
+def json_path(path: AssertionPath) -> list[Any]:
+    """Translates an assertion's path into the keys, indices and list
+    lengths which lead to the same value in the nas-parse binary's JSON
+    output. Layer 3 containers are serialized with their value in `inner`,
+    and Options as the value itself or null.
+    """
+    steps: list[Any] = []
+    for part in path:
+        if isinstance(part, RustStructField):
+            steps.append(part.name)
+            if part.layer3_wrapper is not None:
+                steps.append('inner')
+            continue
+        # list accesses and CSN.1 values are both Rust expressions, like
+        # `items[2]` or `bands[0].a5_1.unwrap()`
+        for match in CSN1_ACCESS_RE.finditer(part.name):
+            method, field, index = match.groups()
+            if method == 'len':
+                steps.append(LEN)
+            elif method is not None:
+                # unwrapping an Option doesn't change its JSON
+                continue
+            elif field is not None:
+                steps.append(field)
+            else:
+                steps.append(int(index))
+    return steps
+
+
+def lookup(value: Any, steps: list[Any]) -> Tuple[bool, Any]:
+    """Follows a JSON path through a parsed message, returning whether it
+    led anywhere along with the value it found
+    """
+    for step in steps:
+        if step is LEN:
+            if not isinstance(value, list):
+                return False, None
+            value = len(value)
+        elif isinstance(step, int):
+            if not isinstance(value, list) or step >= len(value):
+                return False, None
+            value = value[step]
+        else:
+            if not isinstance(value, dict) or step not in value:
+                return False, None
+            value = value[step]
+    return True, value
+
+
+def matches(expected: RustTestCaseValue | RustTestCasePattern, actual: Any) -> bool:
+    """Checks a value from a parsed message against an assertion's expected
+    value or pattern
+    """
+    if isinstance(expected, RustTestCasePattern):
+        if expected.pattern == 'None':
+            return actual is None
+        # enum variants with fields, e.g. `Foo::B01 { .. }`, are serialized
+        # as an object keyed by the variant's name
+        variant = expected.pattern.split('::')[1].split(' ')[0]
+        return isinstance(actual, dict) and variant in actual
+    if isinstance(expected.type, RustEnum):
+        # enums without a matching variant land in the catchall Other
+        variant = expected.matching_enum_variant
+        return actual == ('Other' if variant is None else variant.name)
+    if expected.type == RustPrimitiveType.VecU8:
+        assert isinstance(expected.value, bytes)
+        # buffer IEs are held in a Layer3Buffer
+        if isinstance(actual, dict) and 'buf' in actual:
+            actual = actual['buf']
+        return actual == list(expected.value)
+    return actual == expected.value
+
+
+def find_message(record: dict, struct_name: str) -> Optional[dict]:
+    """Finds the parsed message struct in a line of nas-parse output, or None
+    if the Rust parser didn't parse it as the given type
+    """
+    message = record.get('message')
+    if not isinstance(message, dict) or len(message) != 1:
+        return None
+    kind, body = next(iter(message.items()))
+    if kind == 'SecurityProtected':
+        return body['header'] if struct_name == 'EMMSecProtNASMessage' else None
+    if kind == 'ServiceRequest':
+        return body if struct_name == 'EMMServiceRequest' else None
+    # EMM and ESM messages are held in an enum variant named after their type
+    variant, fields = next(iter(body.items()))
+    return fields if variant == struct_name else None
+
+
+class Mismatch:
+    """A single value which the Rust parser and pycrate disagree on"""
+
+    def __init__(self, path: str, expected: str, actual: str) -> None:
+        self.path = path
+        self.expected = expected
+        self.actual = actual
+
+
+def compare(assertions: list[Assertion], message: dict) -> list[Tuple[str, Mismatch]]:
+    """Checks each assertion against a parsed message, returning each
+    mismatch along with the name of the IE it's in
+    """
+    mismatches = []
+    for path, expected in assertions:
+        steps = json_path(path)
+        found, actual = lookup(message, steps)
+        if found and matches(expected, actual):
+            continue
+        path_str = '.'.join(str(step) if step is not LEN else 'len()' for step in steps)
+        mismatch = Mismatch(
+            path_str,
+            expected.to_rust(),
+            json.dumps(actual) if found else 'missing',
+        )
+        mismatches.append((path[0].name, mismatch))
+    return mismatches
+
+
+class MessageReport:
+    """Tallies the comparisons for a single message type, keeping a count of
+    mismatches and the first example of each per IE
+    """
+
+    def __init__(self) -> None:
+        self.payloads = 0
+        self.rust_errors = 0
+        self.rust_error_example: Optional[str] = None
+        self.mismatched_payloads = 0
+        self.ie_mismatches: Dict[str, int] = {}
+        self.ie_examples: Dict[str, Tuple[str, Mismatch]] = {}
+
+    def merge(self, other: 'MessageReport') -> None:
+        self.payloads += other.payloads
+        self.rust_errors += other.rust_errors
+        if self.rust_error_example is None:
+            self.rust_error_example = other.rust_error_example
+        self.mismatched_payloads += other.mismatched_payloads
+        for ie, count in other.ie_mismatches.items():
+            self.ie_mismatches[ie] = self.ie_mismatches.get(ie, 0) + count
+        for ie, example in other.ie_examples.items():
+            self.ie_examples.setdefault(ie, example)
+
+
+class DiffReport:
+    """The results of comparing a corpus, grouped by message type and IE"""
+
+    def __init__(self) -> None:
+        self.messages: Dict[str, MessageReport] = {}
+        # payloads pycrate couldn't parse, which there's nothing to compare to
+        self.pycrate_errors = 0
+
+    def message(self, type_name: str) -> MessageReport:
+        return self.messages.setdefault(type_name, MessageReport())
+
+    def merge(self, other: 'DiffReport') -> None:
+        for type_name, report in other.messages.items():
+            self.message(type_name).merge(report)
+        self.pycrate_errors += other.pycrate_errors
+
+    def is_clean(self) -> bool:
+        return all(
+            report.rust_errors == 0 and report.mismatched_payloads == 0
+            for report in self.messages.values()
+        )
+
+    def to_text(self) -> str:
+        lines = []
+        total = sum(report.payloads for report in self.messages.values())
+        lines.append(
+            f'compared {total} payloads across {len(self.messages)} message types '
+            f'({self.pycrate_errors} skipped since pycrate failed to parse them)'
+        )
+        for type_name, report in sorted(self.messages.items()):
+            lines.append(
+                f'{type_name}: {report.payloads} payloads, {report.mismatched_payloads} '
+                f'mismatched, {report.rust_errors} failed to parse in Rust'
+            )
+            if report.rust_error_example is not None:
+                lines.append(f'  e.g. {report.rust_error_example}')
+            for ie, count in sorted(report.ie_mismatches.items(), key=lambda item: -item[1]):
+                payload, mismatch = report.ie_examples[ie]
+                lines.append(
+                    f'  {ie}: {count} mismatches, e.g. {payload} at {mismatch.path}: '
+                    f'expected {mismatch.expected}, got {mismatch.actual}'
+                )
+        return '\n'.join(lines)
+
+
+# each worker process resolves a module per message type the first time it
+# sees one, and reuses it for the rest of its payloads
+_modules: Dict[str, RustModule] = {}
+
+
+def _module_for(clazz: Any) -> RustModule:
+    name = clazz.__name__
+    if name not in _modules:
+        module = RustModule(clazz())
+        module.resolve_types()
+        # rendering settles the final names of duplicate fields
+        module.render()
+        _modules[name] = module
+    return _modules[name]
+
+
+def compare_payloads(cases: list[Tuple[str, dict]]) -> DiffReport:
+    """Decodes each hex payload in pycrate and compares it field by field
+    with the Rust parser's output for it, using the same mapping between
+    Rust fields and pycrate elements that the generated unit tests use
+    """
+    from pycrate_mobile import NASLTE
+    report = DiffReport()
+    for payload_hex, record in cases:
+        payload = binascii.unhexlify(payload_hex)
+        # like render_modules, try the uplink form first
+        msg, err = NASLTE.parse_NASLTE_MO(payload)
+        if msg is None or (err != 0 and msg._name != 'EMMSecProtNASMessage'):
+            msg, err = NASLTE.parse_NASLTE_MT(payload)
+        if msg is None or (err != 0 and msg._name != 'EMMSecProtNASMessage'):
+            report.pycrate_errors += 1
+            continue
+        module = _module_for(type(msg))
+        message_report = report.message(module.base_struct.name)
+        message_report.payloads += 1
+        message = find_message(record, module.base_struct.name)
+        if message is None:
+            message_report.rust_errors += 1
+            if message_report.rust_error_example is None:
+                error = record.get('error') or f'parsed as {json.dumps(record["message"])[:80]}'
+                message_report.rust_error_example = f'{payload_hex}: {error}'
+            continue
+        pyobj = module.pyobj.__class__()
+        pyobj.from_bytes(payload)
+        assertions = RustTestCase('diff', payload_hex, module.base_struct, pyobj).assertions
+        mismatches = compare(assertions, message)
+        if len(mismatches):
+            message_report.mismatched_payloads += 1
+        for ie, mismatch in mismatches:
+            message_report.ie_mismatches[ie] = message_report.ie_mismatches.get(ie, 0) + 1
+            message_report.ie_examples.setdefault(ie, (payload_hex, mismatch))
+    return report
+
+
+def run_nas_parse(payloads: list[bytes], command: list[str], cwd: Optional[str] = None) -> list[dict]:
+    """Parses every payload with the nas-parse binary in a single run,
+    returning its output for each one in order
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pcap_filepath = os.path.join(tmpdir, 'corpus.pcap')
+        with open(pcap_filepath, 'wb') as f:
+            write_pcap(f, [gsmtap_record(GSMTAP_TYPE_NAS, payload) for payload in payloads])
+        output = subprocess.run(
+            command + [pcap_filepath],
+            cwd=cwd,
+            check=True,
+            stdout=subprocess.PIPE,
+        ).stdout
+    records = [json.loads(line) for line in output.splitlines()]
+    assert len(records) == len(payloads), 'nas-parse skipped some payloads'
+    return records
+
+
+def _chunks(cases: list[Tuple[str, dict]], size: int) -> Iterable[list[Tuple[str, dict]]]:
+    for i in range(0, len(cases), size):
+        yield cases[i:i + size]
+
+
+def diff_corpus(
+    payloads: list[bytes],
+    command: list[str] = DEFAULT_NAS_PARSE_COMMAND,
+    cwd: Optional[str] = None,
+    jobs: int = 1,
+    chunk_size: int = 256,
+) -> DiffReport:
+    """Parses a corpus with both the Rust parser and pycrate, and reports
+    every value they disagree on. The Rust parser handles the whole corpus
+    at once, while the much slower pycrate side is spread over a process
+    pool. Chunks are merged in order, so the report doesn't depend on the
+    number of workers.
+    """
+    records = run_nas_parse(payloads, command, cwd)
+    cases = [(payload.hex(), record) for payload, record in zip(payloads, records)]
+    report = DiffReport()
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for chunk_report in executor.map(compare_payloads, _chunks(cases, chunk_size)):
+                report.merge(chunk_report)
+    else:
+        for chunk in _chunks(cases, chunk_size):
+            report.merge(compare_payloads(chunk))
+    return report
+
+
+class TestDifferential(unittest.TestCase):
+    payload = '17a1b2c3d405074300035200c2'
+
+    def record(self, seqn: int) -> dict:
+        header = {'mac': [161, 178, 195, 212], 'seqn': seqn, 'nas_message': [7, 67, 0, 3, 82, 0, 194]}
+        return {'packet': 0, 'message': {'SecurityProtected': {
+            'sec_hdr': 'IntegrityProtected',
+            'header': header,
+            'inner': None,
+        }}}
+
+    def test_matching(self):
+        report = compare_payloads([(self.payload, self.record(5))])
+        message_report = report.messages['EMMSecProtNASMessage']
+        assert message_report.payloads == 1
+        assert message_report.mismatched_payloads == 0
+        assert report.is_clean()
+
+    def test_mismatch(self):
+        report = compare_payloads([(self.payload, self.record(6))])
+        message_report = report.messages['EMMSecProtNASMessage']
+        assert message_report.ie_mismatches == {'seqn': 1}
+        _, mismatch = message_report.ie_examples['seqn']
+        assert (mismatch.expected, mismatch.actual) == ('5', '6')
+        assert not report.is_clean()
+
+    def test_layer3(self):
+        record = {'message': {'EMMMessage': {'EMMIdentityRequest': {'id_type': {'inner': 'IMEI'}}}}}
+        report = compare_payloads([('075501', record)])
+        _, mismatch = report.messages['EMMIdentityRequest'].ie_examples['id_type']
+        assert (mismatch.path, mismatch.expected, mismatch.actual) == ('id_type.inner', 'IDTypeV::IMSI', '"IMEI"')
+
+    def test_json_path(self):
+        path = [RustValueAccess('bands[1].a5_1.unwrap()'), RustValueAccess('list.len()')]
+        assert json_path(path) == ['bands', 1, 'a5_1', 'list', LEN]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,250 @@
+import unittest
+from typing import Dict
+
+from generator.modules import RenderedModule
+from generator.util import indent, snake_case, upper_camel_case
+
+
+class DispatchEntry:
+    """A message type id, along with the names of the message structs it's
+    parsed as in the uplink and downlink directions. These are the same for
+    almost every type, except for a few which pycrate overloads, like EMM's
+    DetachRequest.
+    """
+
+    def __init__(self, type_id: int, type_name: str, uplink: str, downlink: str) -> None:
+        self.type_id = type_id
+        self.type_name = type_name
+        self.uplink = uplink
+        self.downlink = downlink
+
+    def is_overloaded(self) -> bool:
+        return self.uplink != self.downlink
+
+    def message_names(self) -> list[str]:
+        if self.is_overloaded():
+            return [self.uplink, self.downlink]
+        return [self.uplink]
+
+
+class RustDispatch:
+    """Generates a protocol's message type enum, the enum of all of its
+    parsed messages, and the function which parses a message body of a given
+    type. Generating these from pycrate's message class tables keeps them from
+    drifting out of sync with the generated message modules.
+    """
+
+    def __init__(self, protocol: str, entries: list[DispatchEntry], variant_prefix: str = '') -> None:
+        self.protocol = protocol
+        self.entries = entries
+        # message enum variants are named after their structs, minus this
+        # prefix
+        self.variant_prefix = variant_prefix
+
+    def _variant_name(self, message_name: str) -> str:
+        return message_name.removeprefix(self.variant_prefix)
+
+    def _ctx(self, module: RenderedModule) -> str:
+        # borrowed slices are located by the cursor's position, which is
+        # counted from the start of the input even after rewinding it
+        return 'Borrowed(input)' if module.borrows_input else '()'
+
+    def _parse_expr(self, module: RenderedModule) -> str:
+        variant = self._variant_name(module.message_name)
+        ctx = self._ctx(module)
+        return f'{self.protocol}Message::{variant}({module.message_name}::from_reader_with_ctx(&mut reader, {ctx})?)'
+
+    def _overloaded_arm(self, entry: DispatchEntry, modules: Dict[str, RenderedModule]) -> str:
+        uplink_module = modules[entry.uplink]
+        downlink_module = modules[entry.downlink]
+        return f'''\
+{self.protocol}Type::{entry.type_name} => match direction {{
+    Some(Direction::Uplink) => {self._parse_expr(uplink_module)},
+    Some(Direction::Downlink) => {self._parse_expr(downlink_module)},
+    // without a hint, try the uplink form first, then rewind and try the
+    // downlink form if that fails
+    None => {{
+        let cursor = reader.into_inner();
+        let bookmark = cursor
+            .seek(SeekFrom::Current(0))
+            .map_err(|err| DekuError::Io(err.kind()))?;
+        let mut reader = Reader::new(cursor);
+        if let Ok(message) = {entry.uplink}::from_reader_with_ctx(&mut reader, {self._ctx(uplink_module)}) {{
+            {self.protocol}Message::{self._variant_name(entry.uplink)}(message)
+        }} else {{
+            let cursor = reader.into_inner();
+            cursor
+                .seek(SeekFrom::Start(bookmark))
+                .map_err(|err| DekuError::Io(err.kind()))?;
+            let mut reader = Reader::new(cursor);
+            {self._parse_expr(downlink_module)}
+        }}
+    }}
+}},'''
+
+    def to_rust(self, rendered_modules: list[RenderedModule]) -> str:
+        modules = {module.message_name: module for module in rendered_modules}
+        message_names = [name for entry in self.entries for name in entry.message_names()]
+        borrows_input = any(modules[name].borrows_input for name in message_names)
+        lifetime = "<'a>" if borrows_input else ''
+
+        imports = [f'{modules[name].name}::{name},' for name in message_names]
+        type_variants = [f'#[deku(id = {entry.type_id})] {entry.type_name},' for entry in self.entries]
+        message_variants = []
+        for name in message_names:
+            message_lifetime = "<'a>" if modules[name].borrows_input else ''
+            message_variants.append(f'{self._variant_name(name)}({name}{message_lifetime}),')
+
+        arms = []
+        for entry in self.entries:
+            if entry.is_overloaded():
+                arms.append(self._overloaded_arm(entry, modules))
+            else:
+                arms.append(f'{self.protocol}Type::{entry.type_name} => {self._parse_expr(modules[entry.uplink])},')
+
+        type_arg = f'{self.protocol.lower()}_type'
+        direction_arg = 'direction' if any(entry.is_overloaded() for entry in self.entries) else '_direction'
+        if borrows_input:
+            generics = "'a, R: Read + Seek"
+            input_arg = "\n    input: &'a [u8],"
+        else:
+            generics = 'R: Read + Seek'
+            input_arg = ''
+        return f"""
+use deku::prelude::*;
+use serde::Serialize;
+use std::io::{{Read, Seek, SeekFrom}};
+use crate::nas::Direction;
+use crate::nas::layer3::*;
+use super::{{
+{indent('\n'.join(imports))}
+}};
+
+/// Autogenerated rust code, do not modify directly! Any changes should be
+/// made via the python generator scripts.
+
+#[derive(DekuRead, DekuWrite, Debug)]
+#[deku(id_type = "u8")]
+pub enum {self.protocol}Type {{
+{indent('\n'.join(type_variants))}
+}}
+
+#[derive(Debug, Clone, Serialize)]
+pub enum {self.protocol}Message{lifetime} {{
+{indent('\n'.join(message_variants))}
+}}
+
+/// Parses the body of a {self.protocol} message of the given type. Some types
+/// are formatted differently depending on which direction they were sent in,
+/// and passing the direction (if it's known) lets those be parsed just once.
+pub fn parse_{self.protocol.lower()}_nas<{generics}>(
+    {type_arg}: {self.protocol}Type,
+    mut reader: Reader<R>,
+    {direction_arg}: Option<Direction>,{input_arg}
+) -> Result<{self.protocol}Message{lifetime}, DekuError> {{
+    Ok(match {type_arg} {{
+{indent('\n'.join(arms), 2)}
+    }})
+}}
+"""
+
+
+def emm_dispatch() -> RustDispatch:
+    """Builds the EMM dispatch from pycrate's tables of MO and MT message
+    classes, naming each type after pycrate's description of it
+    """
+    from pycrate_mobile import NASLTE
+    from pycrate_mobile.TS24301_EMM import EMMHeader
+
+    type_names = EMMHeader()['Type']._dic
+    entries = []
+    for type_id, uplink in NASLTE.EMMTypeMOClasses.items():
+        downlink = NASLTE.EMMTypeMTClasses.get(type_id, uplink)
+        entries.append(DispatchEntry(
+            type_id,
+            upper_camel_case(type_names[type_id]),
+            uplink.__name__,
+            downlink.__name__,
+        ))
+    return RustDispatch('EMM', entries)
+
+
+def esm_dispatch() -> RustDispatch:
+    """Builds the ESM dispatch from pycrate's table of ESM message classes.
+    ESM types and messages are named after their classes without the ESM
+    prefix.
+    """
+    from pycrate_mobile import NASLTE
+
+    entries = []
+    for type_id, clazz in NASLTE.ESMTypeClasses.items():
+        name = clazz.__name__
+        entries.append(DispatchEntry(type_id, name.removeprefix('ESM'), name, name))
+    return RustDispatch('ESM', entries, 'ESM')
+
+
+class TestRustDispatch(unittest.TestCase):
+    def rendered_module(self, message_name: str, borrows_input=False) -> RenderedModule:
+        return RenderedModule(snake_case(message_name), message_name, borrows_input, [], [], '')
+
+    def test_overloaded(self):
+        dispatch = RustDispatch('EMM', [
+            DispatchEntry(65, 'AttachRequest', 'EMMAttachRequest', 'EMMAttachRequest'),
+            DispatchEntry(69, 'DetachRequest', 'EMMDetachRequestMO', 'EMMDetachRequestMT'),
+        ])
+        modules = [
+            self.rendered_module('EMMAttachRequest'),
+            self.rendered_module('EMMDetachRequestMO'),
+            self.rendered_module('EMMDetachRequestMT'),
+        ]
+        rust = dispatch.to_rust(modules)
+        assert '#[deku(id = 69)] DetachRequest,' in rust
+        assert 'EMMDetachRequestMT(EMMDetachRequestMT),' in rust
+        assert 'Some(Direction::Downlink) => EMMMessage::EMMDetachRequestMT(' in rust
+        assert 'direction: Option<Direction>,' in rust
+        assert "<'a>" not in rust
+
+    def test_borrowed(self):
+        dispatch = RustDispatch('ESM', [
+            DispatchEntry(232, 'Status', 'ESMStatus', 'ESMStatus'),
+            DispatchEntry(235, 'DataTransport', 'ESMDataTransport', 'ESMDataTransport'),
+        ], 'ESM')
+        modules = [
+            self.rendered_module('ESMStatus'),
+            self.rendered_module('ESMDataTransport', borrows_input=True),
+        ]
+        rust = dispatch.to_rust(modules)
+        assert "pub enum ESMMessage<'a> {" in rust
+        assert "    DataTransport(ESMDataTransport<'a>)," in rust
+        assert '    Status(ESMStatus),' in rust
+        assert 'ESMDataTransport::from_reader_with_ctx(&mut reader, Borrowed(input))' in rust
+        assert '_direction: Option<Direction>,' in rust
+
+    def test_borrowed_overloaded(self):
+        dispatch = RustDispatch('EMM', [
+            DispatchEntry(69, 'DetachRequest', 'EMMDetachRequestMO', 'EMMDetachRequestMT'),
+        ])
+        modules = [
+            self.rendered_module('EMMDetachRequestMO', borrows_input=True),
+            self.rendered_module('EMMDetachRequestMT', borrows_input=True),
+        ]
+        rust = dispatch.to_rust(modules)
+        # without a direction, both forms are read from a rewound cursor, but
+        # still get the whole input, since slices are located by the cursor's
+        # position
+        none_arm = rust[rust.index('None => {'):]
+        assert 'EMMDetachRequestMO::from_reader_with_ctx(&mut reader, Borrowed(input))' in none_arm
+        assert 'EMMDetachRequestMT::from_reader_with_ctx(&mut reader, Borrowed(input))' in none_arm
+        assert 'bookmark as usize' not in rust
+        assert rust.count('Borrowed(input)') == 4
+
+    def test_pycrate_tables(self):
+        emm = emm_dispatch()
+        assert len(emm.entries) == 32
+        detach = [entry for entry in emm.entries if entry.type_name == 'DetachRequest']
+        assert [entry.is_overloaded() for entry in detach] == [True]
+        assert [entry.is_overloaded() for entry in esm_dispatch().entries].count(True) == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,283 @@
+import json
+import unittest
+from enum import Enum
+from typing import Any, Dict, Optional, Type, TYPE_CHECKING
+
+from generator.csn1 import Csn1Bits, Csn1Enum, Csn1Field, Csn1Optional, Csn1Repeated, Csn1Struct, Csn1Variant
+from generator.dispatch import DispatchEntry, RustDispatch
+from generator.modules import RustModule, RustModuleIndex, RustTypeCache, map_modules, resolve_module, sort_test_cases
+from generator.parse_cache import ParseCache, pycrate_version
+from generator.rust_types import Layer3Type, Layer3Wrapper, RustEnum, RustEnumVariant, RustList, RustPrimitiveType, RustStruct, RustStructField
+from generator.tests import RustListAccess, RustTestCase, RustTestCasePattern, RustTestCaseValue, RustValueAccess
+from generator.util import write_if_changed
+
+if TYPE_CHECKING:
+    from pycrate_mobile.TS24007 import Layer3E
+
+# bumped whenever the IR's classes or their attributes change in a way that
+# older exports can't be rendered with
+IR_VERSION = 1
+
+# every class which can appear in the IR, keyed by name. objects of these
+# classes are stored as their attributes, and are recreated without calling
+# their constructors, which need pycrate objects.
+IR_CLASSES: Dict[str, Type] = {clazz.__name__: clazz for clazz in [
+    Csn1Bits,
+    Csn1Enum,
+    Csn1Field,
+    Csn1Optional,
+    Csn1Repeated,
+    Csn1Struct,
+    Csn1Variant,
+    DispatchEntry,
+    Layer3Wrapper,
+    RustDispatch,
+    RustEnum,
+    RustEnumVariant,
+    RustList,
+    RustListAccess,
+    RustModule,
+    RustStruct,
+    RustStructField,
+    RustTestCase,
+    RustTestCasePattern,
+    RustTestCaseValue,
+    RustTypeCache,
+    RustValueAccess,
+]}
+IR_ENUMS: Dict[str, Type[Enum]] = {clazz.__name__: clazz for clazz in [
+    Layer3Type,
+    RustPrimitiveType,
+]}
+
+# attributes which refer to pycrate objects, and are left out of the IR
+SKIPPED_ATTRS = {
+    'RustModule': ['pyobj'],
+}
+
+
+class IRWriter:
+    """Flattens a graph of IR objects into a list of nodes, each holding one
+    object's class and attributes. Objects referred to from several places,
+    like a struct used by more than one field, are stored once and referred
+    to by their index, so they're still shared once they're read back.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: list[dict] = []
+        # ids are only unique among live objects, so the objects themselves
+        # are kept alongside their indices
+        self.indices: Dict[int, tuple[int, Any]] = {}
+
+    def encode(self, value: Any) -> Any:
+        # StrEnums and IntEnums are strs and ints too, so they're checked
+        # first
+        if isinstance(value, Enum):
+            if IR_ENUMS.get(type(value).__name__) is not type(value):
+                raise TypeError(f"{type(value).__name__} can't be stored in the IR")
+            return {'enum': type(value).__name__, 'name': value.name}
+        if value is None or isinstance(value, (bool, int, str)):
+            return value
+        if isinstance(value, bytes):
+            return {'bytes': value.hex()}
+        if isinstance(value, list):
+            return [self.encode(item) for item in value]
+        if isinstance(value, tuple):
+            return {'tuple': [self.encode(item) for item in value]}
+        if isinstance(value, dict):
+            return {'dict': [[self.encode(k), self.encode(v)] for k, v in value.items()]}
+        class_name = type(value).__name__
+        if IR_CLASSES.get(class_name) is not type(value):
+            raise TypeError(f"{class_name} can't be stored in the IR")
+        if id(value) not in self.indices:
+            index = len(self.nodes)
+            self.indices[id(value)] = (index, value)
+            node: dict = {'class': class_name}
+            self.nodes.append(node)
+            skipped = SKIPPED_ATTRS.get(class_name, [])
+            node['attrs'] = {
+                name: self.encode(attr)
+                for name, attr in vars(value).items()
+                if name not in skipped
+            }
+        return {'ref': self.indices[id(value)][0]}
+
+
+class IRReader:
+    """Recreates the objects in a list of nodes written by an IRWriter"""
+
+    def __init__(self, nodes: list[dict]) -> None:
+        self.objects = []
+        for node in nodes:
+            clazz = IR_CLASSES[node['class']]
+            self.objects.append(clazz.__new__(clazz))
+        # every object exists before any attributes are set, so nodes can
+        # refer to ones which come after them
+        for obj, node in zip(self.objects, nodes):
+            for name in SKIPPED_ATTRS.get(node['class'], []):
+                setattr(obj, name, None)
+            for name, attr in node['attrs'].items():
+                setattr(obj, name, self.decode(attr))
+
+    def decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if 'ref' in value:
+            return self.objects[value['ref']]
+        if 'enum' in value:
+            return IR_ENUMS[value['enum']][value['name']]
+        if 'bytes' in value:
+            return bytes.fromhex(value['bytes'])
+        if 'tuple' in value:
+            return tuple(self.decode(item) for item in value['tuple'])
+        return {self.decode(k): self.decode(v) for k, v in value['dict']}
+
+
+def dump(obj: Any) -> dict:
+    """Returns a JSON-serializable graph of an IR object and everything it
+    refers to
+    """
+    writer = IRWriter()
+    root = writer.encode(obj)
+    return {'nodes': writer.nodes, 'root': root}
+
+
+def load(graph: dict) -> Any:
+    """Recreates an IR object from a graph returned by dump()"""
+    return IRReader(graph['nodes']).decode(graph['root'])
+
+
+def dump_module(module: RustModule) -> dict:
+    """Returns the IR of a resolved module, along with its test cases"""
+    if len(module.cache.unresolved_structs):
+        raise ValueError(f'{module.name} has unresolved structs')
+    return dump(module)
+
+
+def export_module(
+    clazz: Type['Layer3E'],
+    test_cases: list[str],
+    borrow_buffers: bool = False,
+) -> dict:
+    """Resolves a single pycrate class and its test cases, returning the
+    resulting IR. Like render_module, this can run in a worker process.
+    """
+    return dump_module(resolve_module(clazz, test_cases, borrow_buffers))
+
+
+def export_modules(
+    classes: list[Type['Layer3E']],
+    test_cases: list[str] = [],
+    cache: Optional[ParseCache] = None,
+    jobs: int = 1,
+    borrow_buffers: bool = False,
+) -> list[dict]:
+    """The same as render_modules, but returns each module's IR instead of
+    rendering it
+    """
+    if cache is None:
+        cache = ParseCache(None)
+    classes = list(classes)
+    cases_per_class = sort_test_cases(classes, test_cases, cache)
+    return map_modules(export_module, classes, cases_per_class, jobs, borrow_buffers)
+
+
+def dump_indices(
+    modules: Dict[str, list[dict]],
+    dispatches: Dict[str, RustDispatch],
+    standalone: set[str] = set(),
+) -> dict:
+    """Returns the versioned IR of every module index, given each index's
+    modules as returned by export_modules, and its dispatch if it has one.
+    Indices named in standalone are marked as such.
+    """
+    return {
+        'version': IR_VERSION,
+        # only informational, since the IR doesn't depend on which pycrate
+        # wrote it once it's been resolved
+        'pycrate': pycrate_version(),
+        'indices': {
+            name: {
+                'modules': index_modules,
+                'dispatch': dump(dispatches[name]) if name in dispatches else None,
+                'standalone': name in standalone,
+            }
+            for name, index_modules in modules.items()
+        },
+    }
+
+
+def load_indices(data: dict) -> Dict[str, RustModuleIndex]:
+    """Renders every module in the IR returned by dump_indices into module
+    indices, ready to be written with generate_modules
+    """
+    if data.get('version') != IR_VERSION:
+        raise ValueError(f"IR version {data.get('version')} isn't supported, expected {IR_VERSION}")
+    indices = {}
+    for name, index_data in data['indices'].items():
+        index = RustModuleIndex(index_data.get('standalone', False))
+        for graph in index_data['modules']:
+            index.add(load(graph).render())
+        if index_data['dispatch'] is not None:
+            index.set_dispatch(load(index_data['dispatch']))
+        indices[name] = index
+    return indices
+
+
+def write_ir(filepath: str, data: dict) -> bool:
+    """Writes the IR returned by dump_indices to a file, returning whether
+    it changed
+    """
+    return write_if_changed(filepath, json.dumps(data, separators=(',', ':')))
+
+
+def read_ir(filepath: str) -> dict:
+    with open(filepath) as f:
+        return json.load(f)
+
+
+class TestIR(unittest.TestCase):
+    def test_renders_identically(self):
+        import main
+        from generator.modules import render_module
+
+        classes = main.get_emm_classes() + main.get_esm_classes()
+        cases_per_class = sort_test_cases(classes, main.EMM_TEST_CASES + main.ESM_TEST_CASES, ParseCache(None))
+        for clazz, cases in zip(classes, cases_per_class):
+            for borrow_buffers in (False, True):
+                expected = render_module(clazz, cases, borrow_buffers)
+                # go through JSON, to make sure nothing is lost along the way
+                graph = json.loads(json.dumps(export_module(clazz, cases, borrow_buffers)))
+                module = load(graph)
+                assert module.pyobj is None
+                actual = module.render()
+                assert actual.to_rust() == expected.to_rust(), clazz.__name__
+                assert [vars(t) for t in actual.types()] == [vars(t) for t in expected.types()], clazz.__name__
+                assert actual.payloads == expected.payloads
+
+    def test_shared_objects(self):
+        enum = RustEnum('Foo', RustPrimitiveType.U8, 8)
+        enum.add_variant(RustEnumVariant('bar', 1))
+        struct = RustStruct('Baz')
+        struct.add_field(RustStructField('first', enum, None, 8, None), 0)
+        struct.add_field(RustStructField('second', enum, None, 8, None), 1)
+        loaded = load(json.loads(json.dumps(dump(struct))))
+        assert loaded.fields[0].type is loaded.fields[1].type
+        assert loaded.fields[0].type.variants[0].values == [1]
+        assert loaded.to_rust() == struct.to_rust()
+        self.assertRaises(TypeError, dump, object())
+
+    def test_version(self):
+        data = dump_indices({}, {})
+        assert load_indices(data) == {}
+        # a standalone index without a dispatch
+        indices = load_indices(dump_indices({'foo': []}, {}, {'foo'}))
+        assert indices['foo'].standalone and indices['foo'].dispatch is None
+        data['version'] = IR_VERSION + 1
+        self.assertRaises(ValueError, load_indices, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
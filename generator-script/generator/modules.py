@@ -1,18 +1,64 @@
 import binascii
 import os
-from typing import Dict, List, Tuple, Any, Type
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Dict, List, Optional, Tuple, Any, Type, TypeVar, TYPE_CHECKING, cast
 from pycrate_core import elt
 from pycrate_core.base import Uint, Buf
-from pycrate_csn1.csnobj import CSN1List
-from pycrate_mobile import NASLTE
-from pycrate_mobile.TS24301_EMM import EMMHeader
-from pycrate_mobile.TS24007 import Layer3E
-from pycrate_mobile.TS24301_ESM import ESMHeader
-from pycrate_mobile.TS24301_IE import LCSClientId
-
-from generator.rust_types import RustStruct, RustEnum, RustPrimitiveType, RustStructField, get_layer3_wrapper
+
+from generator.csn1 import Csn1Enum, Csn1Struct, Csn1Types, Csn1Unsupported
+from generator.parse_cache import ParseCache, Direction
+from generator.rust_types import RustStruct, RustEnum, RustList, RustPrimitiveType, RustStructField, get_layer3_wrapper
 from generator.tests import RustTestCase
-from generator.util import snake_case
+from generator.util import snake_case, write_if_changed
+
+# pycrate_mobile and pycrate_csn1 take a while to import, so they're only
+# imported once we actually start resolving types
+if TYPE_CHECKING:
+    from pycrate_mobile.TS24007 import Layer3E
+    from generator.dispatch import RustDispatch
+
+T = TypeVar('T')
+
+
+def length_from_sibling(items: list[elt.Element], index: int, auto: Any, unit_bits: int) -> Optional[str]:
+    """Given pycrate's automation for the length of items[index] (e.g. a
+    buffer's blauto), finds the earlier field it's computed from and returns
+    a Rust expression for the length in units of unit_bits. pycrate's
+    automations are opaque lambdas, so each candidate field is probed with a
+    couple of values to find one which the length follows exactly, give or
+    take a constant. Returns None if there isn't one.
+    """
+    for i in range(index):
+        sibling = items[i]
+        if not isinstance(sibling, Uint) or sibling._dic or sibling.get_bl() > 16:
+            continue
+        saved_val = sibling._val
+        lengths = []
+        try:
+            for val in (2, 6):
+                sibling.set_val(val)
+                lengths.append(auto())
+        except Exception:
+            # automations can refer to anything in the envelope, and not all
+            # of them cope with the values we probe with
+            continue
+        finally:
+            sibling._val = saved_val
+        if not all(isinstance(length, int) and length % unit_bits == 0 for length in lengths):
+            continue
+        low, high = [length // unit_bits for length in lengths]
+        if high - low != 4:
+            continue
+        name = snake_case(sibling._name)
+        offset = low - 2
+        if offset == 0:
+            return name
+        elif offset > 0:
+            return f'usize::from(*{name}) + {offset}'
+        return f'usize::from(*{name}).saturating_sub({-offset})'
+    return None
 
 
 class RustTypeCache:
@@ -20,9 +66,12 @@ class RustTypeCache:
     created them."""
 
     def __init__(self) -> None:
-        self.struct_cache: Dict[str, RustStruct] = {}
+        # CSN.1 types are rendered alongside structs, so they're kept here too
+        self.struct_cache: Dict[str, RustStruct | Csn1Struct | Csn1Enum] = {}
         self.enum_cache: Dict[str, RustEnum] = {}
-        self.unresolved_structs: List[Tuple[RustStruct, elt.Envelope]] = []
+        # wrapper structs are resolved from a list holding the single element
+        # they wrap
+        self.unresolved_structs: List[Tuple[RustStruct, 'elt.Envelope | list[elt.Element]']] = []
 
     def get_rust_struct(
         self,
@@ -34,53 +83,183 @@ class RustTypeCache:
         structs
         """
         if pyobj._name in self.struct_cache:
-            return self.struct_cache[pyobj._name]
+            return cast(RustStruct, self.struct_cache[pyobj._name])
         rust_struct = RustStruct.from_pycrate(pyobj)
         if add_to_unresolved:
             self.unresolved_structs.append((rust_struct, pyobj))
         self.struct_cache[rust_struct.name] = rust_struct
         return rust_struct
 
+    def get_wrapper_struct(self, pyobj: elt.Element) -> RustStruct:
+        """Get (or create) a RustStruct whose single field holds the given
+        pycrate element. This gives list IEs and atoms repeated in a list,
+        neither of which have fields of their own, a named type to parse.
+        """
+        if pyobj._name in self.struct_cache:
+            return cast(RustStruct, self.struct_cache[pyobj._name])
+        rust_struct = RustStruct(pyobj._name)
+        rust_struct.wraps_element = True
+        self.unresolved_structs.append((rust_struct, [pyobj]))
+        self.struct_cache[rust_struct.name] = rust_struct
+        return rust_struct
+
+    def _resolve_now(self, rust_struct: RustStruct) -> None:
+        """Resolves an unresolved struct, along with every struct it refers
+        to, without waiting for its turn on the stack
+        """
+        entries = [entry for entry in self.unresolved_structs if entry[0] is rust_struct]
+        if len(entries) == 0:
+            return
+        self.unresolved_structs.remove(entries[0])
+        self.unresolved_structs.append(entries[0])
+        depth = len(self.unresolved_structs)
+        while len(self.unresolved_structs) >= depth:
+            self.resolve_struct()
+
+    def _forget_new_types(self, struct_names: set[str], enum_names: set[str]) -> None:
+        """Drops every type created since the cache held the given names"""
+        for name in set(self.struct_cache) - struct_names:
+            del self.struct_cache[name]
+        for name in set(self.enum_cache) - enum_names:
+            del self.enum_cache[name]
+
+    def get_rust_list(self, items: list[elt.Element], index: int) -> Optional[RustList]:
+        """Returns a RustList for the Sequence or Array at items[index], or
+        None if we can't parse it. That's the case if we can't tell how long
+        it is, if it's only present depending on other fields, or if its
+        elements can't be read one after another.
+        """
+        pyobj = items[index]
+        if pyobj._transauto is not None:
+            return None
+        count = None
+        bytes_read = None
+        if pyobj._num is not None:
+            count = str(pyobj._num)
+        elif pyobj._numauto is not None:
+            count = length_from_sibling(items, index, pyobj._numauto, 1)
+            if count is None:
+                return None
+        elif pyobj._blauto is not None:
+            bytes_read = length_from_sibling(items, index, pyobj._blauto, 8)
+            if bytes_read is None:
+                return None
+        elif index != len(items) - 1:
+            # only the final field can consume the rest of the input
+            return None
+
+        struct_names = set(self.struct_cache)
+        enum_names = set(self.enum_cache)
+        tmpl = pyobj._tmpl
+        if isinstance(tmpl, elt.Envelope):
+            element = self.get_rust_struct(tmpl)
+        elif (isinstance(tmpl, Buf) and tmpl.get_bl() > 0) or (isinstance(tmpl, Uint) and not tmpl._dic):
+            element = self.get_wrapper_struct(tmpl)
+        else:
+            return None
+        self._resolve_now(element)
+        if not element.is_self_delimiting():
+            self._forget_new_types(struct_names, enum_names)
+            return None
+        return RustList(element, count, bytes_read)
+
+    def get_list_struct(self, pyobj: elt.Element) -> Optional[RustStruct]:
+        """Returns a RustStruct for a list IE, which reads elements until it
+        runs out of bytes, or None if we can't parse its elements
+        """
+        struct_names = set(self.struct_cache)
+        enum_names = set(self.enum_cache)
+        rust_struct = self.get_wrapper_struct(pyobj)
+        self._resolve_now(rust_struct)
+        if not isinstance(rust_struct.fields[0].type, RustList):
+            self._forget_new_types(struct_names, enum_names)
+            return None
+        return rust_struct
+
+    def get_csn1_struct(self, pyobj: Any) -> Optional[Csn1Struct]:
+        """Returns a Csn1Struct for a CSN.1 IE, generating it along with every
+        type it refers to, or None if it uses anything we can't read
+        """
+        try:
+            csn1_types = Csn1Types.from_pycrate(pyobj)
+        except Csn1Unsupported:
+            return None
+        for name, csn1_type in csn1_types.types.items():
+            self.struct_cache.setdefault(name, csn1_type)
+        return csn1_types.root()
+
     def resolve_struct(self):
         """Pop an unresolved struct off the stack and for each of its fields,
-        generate either a primitive type, enum, or struct. Other structs
+        generate either a primitive type, enum, struct, or list. Other structs
         generated this way are pushed onto the unresolved_structs stack.
         """
         rust_struct, pyobj = self.unresolved_structs.pop()
+        items = list(pyobj)
         bit_padding = None
-        for i, item in enumerate(pyobj):
-            bit_length = None
-            is_final_buf = False
+        for i, item in enumerate(items):
             if isinstance(item, elt.Atom):
-                if isinstance(item, Buf):
-                    rust_type = RustPrimitiveType.VecU8
-                    bit_length = item.get_bl()
-                    # if the given bitlength is 0, we're assuming that this
-                    # buffer is the final field in the struct, and ought to
-                    # consume all remaining bytes
-                    if bit_length == 0:
-                        is_final_buf = True
-                elif item._dic:
-                    rust_enum = self.get_rust_enum(item, rust_struct.name)
-                    bit_length = item.get_bl()
-                    rust_type = rust_enum
-                else:
-                    rust_type = RustPrimitiveType.from_pycrate(item)
-                    bit_length = item.get_bl()
-            elif isinstance(item, elt.Envelope):
+                rust_struct.add_field(self.get_atom_field(items, i, rust_struct.name, bit_padding), i)
+                continue
+            is_final_buf = False
+            if isinstance(item, elt.Envelope):
                 rust_type = self.get_rust_struct(item)
+            elif isinstance(item, (elt.Sequence, elt.Array)):
+                rust_type = self.get_rust_list(items, i)
+                is_final_buf = rust_type is not None and rust_type.is_final()
             else:
                 rust_type = None
             rust_field = RustStructField(
                 item._name,
                 rust_type,
                 None,
-                bit_length,
+                None,
                 bit_padding,
             )
             rust_field.is_final_buf = is_final_buf
             rust_struct.add_field(rust_field, i)
 
+    def get_atom_field(
+        self,
+        items: list[elt.Element],
+        index: int,
+        prefix: str,
+        bit_padding: Optional[int] = None,
+    ) -> RustStructField:
+        """Generates the field for a plain value (a buffer, enum, or
+        integer) in a list of sibling elements, which may be sized by one of
+        its siblings
+        """
+        item = items[index]
+        bit_length = item.get_bl()
+        is_final_buf = False
+        count = None
+        rust_type: RustPrimitiveType | RustEnum
+        if isinstance(item, Buf):
+            rust_type = RustPrimitiveType.VecU8
+            # buffers sized by an earlier length field read exactly
+            # that many bytes
+            if item._blauto is not None:
+                count = length_from_sibling(items, index, item._blauto, 8)
+            # otherwise if the given bitlength is 0, we're assuming
+            # that this buffer is the final field in the struct, and
+            # ought to consume all remaining bytes
+            if count is None and bit_length == 0:
+                is_final_buf = True
+        elif item._dic:
+            rust_type = self.get_rust_enum(item, prefix)
+        else:
+            rust_type = RustPrimitiveType.from_pycrate(item)
+        rust_field = RustStructField(
+            item._name,
+            rust_type,
+            None,
+            bit_length,
+            bit_padding,
+        )
+        rust_field.is_final_buf = is_final_buf
+        rust_field.count = count
+        return rust_field
+
     def get_rust_enum(self, pyobj: Any, prefix: str) -> RustEnum:
         """Get (or create) a RustEnum for the given pycrate object"""
         name = prefix + pyobj._name
@@ -94,15 +273,19 @@ class RustTypeCache:
 class RustModule:
     """A Rust module derived from a single pycrate class."""
 
-    def __init__(self, pyobj: Layer3E) -> None:
+    def __init__(self, pyobj: 'Layer3E', borrow_buffers: bool = False) -> None:
         self.cache = RustTypeCache()
         self.pyobj = pyobj
 
         # don't mark the base struct as unresolved, since we'll be manually
         # resolving it later
         self.base_struct = self.cache.get_rust_struct(self.pyobj, False)
+        self.base_struct.borrow_buffers = borrow_buffers
+        self.base_struct.is_message = True
         self.name = snake_case(self.base_struct.name)
         self.test_cases: list[RustTestCase] = []
+        # the hex payloads behind test_cases, which are also benchmarked
+        self.payloads: list[str] = []
 
     def resolve_types(self) -> None:
         """For every field in the pycrate class, generate a RustStruct or
@@ -110,20 +293,30 @@ class RustModule:
         generated, they'll be added to the module's RustTypeCache to be fully
         resolved later.
         """
+        from pycrate_csn1.csnobj import CSN1List
+        from pycrate_mobile.TS24301_EMM import EMMHeader, EMMHeaderSec, EMMHeaderServ
+        from pycrate_mobile.TS24301_ESM import ESMHeader
+        from pycrate_mobile.TS24301_IE import LCSClientId
+
         bit_padding = None
 
         for i, item in enumerate(self.pyobj._content):
             # skip the header
             if i == 0:
-                assert isinstance(item, (EMMHeader, ESMHeader))
+                assert isinstance(item, (EMMHeader, ESMHeader, EMMHeaderSec, EMMHeaderServ))
                 continue
 
-            # the only time we don't have a layer 3 TLV is bit padding
+            # outside of a layer 3 TLV, we either have bit padding or, after a
+            # security header, a plain value like the MAC
             layer3_wrapper = get_layer3_wrapper(item)
             if layer3_wrapper is None:
-                assert isinstance(item, Uint)
-                assert item._name == 'spare'
-                bit_padding = item.get_bl()
+                assert isinstance(item, elt.Atom)
+                if item._name == 'spare':
+                    bit_padding = item.get_bl()
+                    continue
+                field = self.cache.get_atom_field(self.pyobj._content, i, self.base_struct.name, bit_padding)
+                bit_padding = None
+                self.base_struct.add_field(field, i)
                 continue
 
             # prepare the layer 3 TLV's inner value. depending on the type of
@@ -135,6 +328,24 @@ class RustModule:
                 inner = item._V
 
             bit_length = None if layer3_wrapper.type.is_sized() else inner.get_bl()
+            # lists are read into a struct wrapping a Vec of their elements,
+            # and CSN.1 IEs into their own types, if we know how to parse them
+            list_struct: Optional[RustStruct | Csn1Struct] = None
+            if isinstance(inner, (elt.Sequence, elt.Array)):
+                list_struct = self.cache.get_list_struct(inner)
+            elif isinstance(inner, CSN1List):
+                list_struct = self.cache.get_csn1_struct(inner)
+            if list_struct is not None:
+                field = RustStructField(
+                    item._name,
+                    list_struct,
+                    layer3_wrapper,
+                    bit_length,
+                    bit_padding,
+                )
+                bit_padding = None
+                self.base_struct.add_field(field, i)
+                continue
             # check for unsupported types
             if isinstance(inner, (
                 elt.Sequence,
@@ -205,6 +416,7 @@ class RustModule:
         x = self.pyobj.__class__()
         x.from_bytes(input_bytes)
         name = f'case_{len(self.test_cases) + 1}'
+        self.payloads.append(input_hexstring)
         self.test_cases.append(RustTestCase(
             name,
             input_hexstring,
@@ -230,9 +442,10 @@ mod tests {{
 }}
 '''
 
-    def to_rust(self) -> str:
-        """Generates Rust code for this module's struct and enums, along with
-        any tests cases.
+    def render(self) -> 'RenderedModule':
+        """Renders Rust code for this module's structs and enums, along with
+        any test cases, keeping each type's definition separate so that types
+        shared with other modules can be pulled out later.
         """
         excluded_structs = [
             'EMMHeader',
@@ -252,35 +465,188 @@ mod tests {{
         excluded_enums = emm_header_names + esm_header_names
         structs = [struct for name, struct in self.cache.struct_cache.items() if name not in excluded_structs]
         enums = [enum for name, enum in self.cache.enum_cache.items() if name not in excluded_enums]
-        test_cases = self._tests_to_rust()
+        return RenderedModule(
+            self.name,
+            self.base_struct.name,
+            self.base_struct.borrows_input(),
+            [RenderedType(struct.name, struct.to_rust(), struct.dependencies()) for struct in structs],
+            [RenderedType(enum.name, enum.to_rust(), [], enum.pattern_counts()) for enum in enums],
+            self._tests_to_rust(),
+            self.payloads,
+        )
+
+    def to_rust(self) -> str:
+        """Generates Rust code for this module's struct and enums, along with
+        any tests cases.
+        """
+        return self.render().to_rust()
+
+
+class RenderedType:
+    """The Rust definition of a single struct or enum, along with the names
+    of the other generated types it refers to
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rust_code: str,
+        dependencies: list[str],
+        pattern_counts: Optional[Tuple[int, int, int]] = None,
+    ) -> None:
+        self.name = name
+        self.rust_code = rust_code
+        self.dependencies = dependencies
+        # for enums, the number of variant id pattern alternatives before and
+        # after merging them into ranges, and the number of Other's
+        self.pattern_counts = pattern_counts
+
+
+class RenderedModule:
+    """A RustModule's rendered types and tests, which can be assembled into
+    a Rust module once we know which types are defined in the shared ies
+    module
+    """
+
+    def __init__(
+        self,
+        name: str,
+        message_name: str,
+        borrows_input: bool,
+        structs: list[RenderedType],
+        enums: list[RenderedType],
+        test_cases: str,
+        payloads: Optional[list[str]] = None,
+    ) -> None:
+        self.name = name
+        # the name of the module's top-level message struct, and whether it
+        # has to be read with a Borrowed ctx
+        self.message_name = message_name
+        self.borrows_input = borrows_input
+        self.structs = structs
+        self.enums = enums
+        self.test_cases = test_cases
+        # hex payloads of this module's message type, for benchmarks
+        self.payloads = payloads or []
+
+    def types(self) -> list[RenderedType]:
+        return self.structs + self.enums
+
+    def to_rust(self, shared_types: set[str] = set()) -> str:
+        structs = [t.rust_code for t in self.structs if t.name not in shared_types]
+        enums = [t.rust_code for t in self.enums if t.name not in shared_types]
+        imported = [t.name for t in self.types() if t.name in shared_types]
+        shared_import = ''
+        if len(imported):
+            shared_import = f'\nuse crate::nas::generated::ies::{{{', '.join(imported)}}};'
+        return f"""
+use deku::prelude::*;
+use deku::ctx::{{BitSize, ByteSize, Endian}};
+use serde::Serialize;
+use std::io::{{Read, Seek}};
+use crate::nas::csn1::*;
+use crate::nas::layer3::*;{shared_import}
+
+/// Autogenerated rust code, do not modify directly! Any changes should be
+/// made via the python generator scripts.
+
+{'\n\n'.join(structs)}
+{'\n\n'.join(enums)}
+{self.test_cases}
+"""
+
+
+class TypeRegistry:
+    """Finds generated types which are defined identically in more than one
+    module, so they can be emitted once into a shared ies module rather than
+    being duplicated in every module which uses them.
+    """
+
+    def __init__(self) -> None:
+        # maps type names to each distinct definition seen for that name
+        self.definitions: Dict[str, set[str]] = {}
+        self.dependencies: Dict[str, list[str]] = {}
+        self.use_counts: Dict[str, int] = {}
+        self.first_seen: Dict[str, RenderedType] = {}
+        self.is_struct: Dict[str, bool] = {}
+
+    def add(self, module: RenderedModule) -> None:
+        for rendered_types, is_struct in ((module.structs, True), (module.enums, False)):
+            for t in rendered_types:
+                self.definitions.setdefault(t.name, set()).add(t.rust_code)
+                self.dependencies[t.name] = t.dependencies
+                self.use_counts[t.name] = self.use_counts.get(t.name, 0) + 1
+                self.first_seen.setdefault(t.name, t)
+                self.is_struct[t.name] = is_struct
+
+    def shared_types(self) -> set[str]:
+        """Returns the names of every type which is used by multiple modules
+        and defined identically in all of them. A type is only shared if
+        every type it depends on is shared too, otherwise the ies module
+        wouldn't be able to refer to them.
+        """
+        shared = {
+            name for name, definitions in self.definitions.items()
+            if len(definitions) == 1 and self.use_counts[name] > 1
+        }
+        changed = True
+        while changed:
+            changed = False
+            for name in list(shared):
+                if any(dep not in shared for dep in self.dependencies[name]):
+                    shared.remove(name)
+                    changed = True
+        return shared
+
+    def to_rust(self, shared_types: set[str]) -> str:
+        structs = [t.rust_code for name, t in self.first_seen.items() if name in shared_types and self.is_struct[name]]
+        enums = [t.rust_code for name, t in self.first_seen.items() if name in shared_types and not self.is_struct[name]]
         return f"""
+#![allow(unused_imports)]
+
 use deku::prelude::*;
 use deku::ctx::ByteSize;
 use serde::Serialize;
+use std::io::{{Read, Seek}};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-{'\n\n'.join([rust_struct.to_rust() for rust_struct in structs])}
-{'\n\n'.join([rust_enum.to_rust() for rust_enum in enums])}
-{test_cases}
+{'\n\n'.join(structs)}
+{'\n\n'.join(enums)}
 """
 
 
 class RustModuleIndex:
-    """Contains a number of RustModules, allowing us to output a mod.rs which
-    declares them all
+    """Contains a number of rendered RustModules, allowing us to output a
+    mod.rs which declares them all.
+
+    A standalone index holds extra renderings of types which other indices
+    already have, e.g. with borrowed buffers. Its types aren't shared through
+    ies.rs, so they can't change what's in it, and it isn't benchmarked.
     """
 
-    def __init__(self) -> None:
-        self.modules: List[RustModule] = []
+    def __init__(self, standalone: bool = False) -> None:
+        self.modules: List[RenderedModule] = []
+        self.dispatch: Optional['RustDispatch'] = None
+        self.standalone = standalone
 
-    def add(self, module: RustModule) -> None:
+    def add(self, module: RenderedModule) -> None:
         self.modules.append(module)
 
+    def set_dispatch(self, dispatch: 'RustDispatch') -> None:
+        """Adds a dispatch.rs to the index, which parses messages of any of
+        the index's types
+        """
+        self.dispatch = dispatch
+
     def to_rust(self) -> str:
-        module_text = '\n'.join(f'pub mod {mod.name};' for mod in self.modules)
+        module_names = [mod.name for mod in self.modules]
+        if self.dispatch is not None:
+            module_names.append('dispatch')
+        module_text = '\n'.join(f'pub mod {name};' for name in module_names)
         return f"""
 #![allow(unused_imports)]
 
@@ -289,47 +655,387 @@ class RustModuleIndex:
 
 {module_text}"""
 
-    def generate_module(self, filepath: str) -> None:
+    def generate_module(self, filepath: str, shared_types: set[str] = set()) -> None:
+        """Writes mod.rs and each module's file into the given directory.
+        Files whose contents haven't changed are left alone, so their mtimes
+        don't trigger a recompile, and stale modules are deleted.
+        """
         os.makedirs(filepath, exist_ok=True)
-        index_path = os.path.join(filepath, 'mod.rs')
-        with open(index_path, 'w') as f:
-            f.write(self.to_rust())
-
+        files = {'mod.rs': self.to_rust()}
         for mod in self.modules:
-            mod_path = os.path.join(filepath, f'{mod.name}.rs')
-            with open(mod_path, 'w') as f:
-                f.write(mod.to_rust())
+            files[f'{mod.name}.rs'] = mod.to_rust(shared_types)
+        if self.dispatch is not None:
+            files['dispatch.rs'] = self.dispatch.to_rust(self.modules)
 
+        written = []
+        unchanged = []
+        for filename, text in files.items():
+            if write_if_changed(os.path.join(filepath, filename), text):
+                written.append(filename)
+            else:
+                unchanged.append(filename)
 
-def generate_module(filepath: str, classes: list[Type[Layer3E]], test_cases: list[str]=[]) -> None:
-    """Given a set of pycrate classes, creates a directory containing a Rust
-    module for each class, as well as a mod.rs file declaring each of them. Also
-    appends a standard Rust unit test section to each module for each test case
-    provided.
+        deleted = []
+        for entry in os.scandir(filepath):
+            if entry.name.endswith('.rs') and entry.name not in files:
+                os.remove(entry.path)
+                deleted.append(entry.name)
+
+        print(f'{filepath}: {len(written)} written, {len(unchanged)} unchanged, {len(deleted)} deleted')
+        for filename in written:
+            print(f'  wrote {filename}')
+        for filename in sorted(deleted):
+            print(f'  deleted {filename}')
+
+
+def resolve_module(
+    clazz: Type['Layer3E'],
+    test_cases: list[str],
+    borrow_buffers: bool = False,
+) -> RustModule:
+    """Resolves the Rust types for a single pycrate class, along with its
+    test cases
     """
-    index = RustModuleIndex()
-    pycrate_names_to_modules = {}
-    for clazz in classes:
-        obj = clazz()
-        module = RustModule(obj)
-        module.resolve_types()
-        pycrate_names_to_modules[obj._name] = module
-        index.add(module)
+    module = RustModule(clazz(), borrow_buffers)
+    module.resolve_types()
+    for case_str in test_cases:
+        module.add_test_case(case_str, binascii.unhexlify(case_str))
+    return module
+
+
+def render_module(
+    clazz: Type['Layer3E'],
+    test_cases: list[str],
+    borrow_buffers: bool = False,
+) -> RenderedModule:
+    """Resolves and renders the Rust module for a single pycrate class, along
+    with its test cases. Every module has its own RustTypeCache, so this can
+    safely run in a worker process.
+    """
+    return resolve_module(clazz, test_cases, borrow_buffers).render()
+
+
+def sort_test_cases(
+    classes: list[Type['Layer3E']],
+    test_cases: list[str],
+    cache: ParseCache,
+) -> list[list[str]]:
+    """Sorts test cases into the modules of the classes they parse as,
+    returning each class's test cases in the same order as classes. Test
+    cases which don't parse as any of the classes are dropped.
+    """
+    # pycrate names message instances after their class
+    class_test_cases: Dict[str, list[str]] = {clazz.__name__: [] for clazz in classes}
 
-    # generate test cases
     for case_str in test_cases:
         # first, parse the payload in pycrate to determine which module this
         # will be added to
         case = binascii.unhexlify(case_str)
         # we don't know apriori whether this is MT or MO, so try both
-        m, e = NASLTE.parse_NASLTE_MO(case)
-        if e != 0:
-            m, e = NASLTE.parse_NASLTE_MT(case)
-            print(case_str, case, m, e)
+        type_name, e = cache.parse(case, Direction.MO)
+        # pycrate reports failing to decode the message inside a security
+        # protected message, but we only read the outer one
+        if e != 0 and type_name != 'EMMSecProtNASMessage':
+            type_name, e = cache.parse(case, Direction.MT)
+            print(case_str, case, type_name, e)
             assert e == 0
-        rust_module = pycrate_names_to_modules[m._name]
+        assert type_name is not None
+        # test cases of any other classes are left out, e.g. when only a few
+        # classes are rendered with borrowed buffers
+        if type_name in class_test_cases:
+            class_test_cases[type_name].append(case_str)
+
+    return [class_test_cases[clazz.__name__] for clazz in classes]
+
+
+def map_modules(
+    fn: Callable[[Type['Layer3E'], list[str], bool], T],
+    classes: list[Type['Layer3E']],
+    cases_per_class: list[list[str]],
+    jobs: int = 1,
+    borrow_buffers: bool = False,
+) -> list[T]:
+    """Calls fn with each class and its test cases, in a process pool if
+    jobs > 1, returning the results in class order
+    """
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # map() yields results in class order, so mod.rs and every module
+            # come out the same as they would serially
+            return list(executor.map(
+                fn,
+                classes,
+                cases_per_class,
+                repeat(borrow_buffers),
+            ))
+    return [
+        fn(clazz, cases, borrow_buffers)
+        for clazz, cases in zip(classes, cases_per_class)
+    ]
+
+
+def render_modules(
+    classes: list[Type['Layer3E']],
+    test_cases: list[str]=[],
+    cache: Optional[ParseCache]=None,
+    jobs: int=1,
+    borrow_buffers: bool=False,
+) -> RustModuleIndex:
+    """Given a set of pycrate classes, renders a Rust module for each class,
+    appending a standard Rust unit test section to each module for each test
+    case provided. With jobs > 1, modules are resolved and rendered in a
+    process pool, and the output is identical to a serial run.
+
+    With borrow_buffers, each message's buffer IEs are generated as
+    Layer3Slices which borrow from the input rather than copying it, and the
+    message takes the input as a Borrowed context. Byte arrays nested inside
+    the IEs' own structs are still copied into Vec<u8>s.
+    """
+    if cache is None:
+        cache = ParseCache(None)
+    classes = list(classes)
+    cases_per_class = sort_test_cases(classes, test_cases, cache)
+    rendered = map_modules(render_module, classes, cases_per_class, jobs, borrow_buffers)
+
+    index = RustModuleIndex()
+    for module in rendered:
+        index.add(module)
+    return index
+
+
+def report_enum_patterns(indices: Dict[str, RustModuleIndex], verbose=False) -> None:
+    """Prints how many id pattern alternatives the generated enums' variants
+    have before and after merging them into ranges, in total and, if
+    verbose, for each enum. The patterns spelling out the ids left to the
+    Other variants are counted separately, since they replace a single `_`
+    rather than anything which was merged.
+    """
+    pattern_counts: Dict[str, Tuple[int, int, int]] = {}
+    for index in indices.values():
+        for module in index.modules:
+            for enum in module.enums:
+                if enum.pattern_counts is not None:
+                    pattern_counts.setdefault(enum.name, enum.pattern_counts)
+    if verbose:
+        for name, (before, after, other) in sorted(pattern_counts.items()):
+            print(f'  {name}: {before} -> {after} patterns, {other or "_"} for Other')
+    total_before = sum(counts[0] for counts in pattern_counts.values())
+    total_after = sum(counts[1] for counts in pattern_counts.values())
+    total_other = sum(counts[2] for counts in pattern_counts.values())
+    print(
+        f'{len(pattern_counts)} enums have {total_before} variant id patterns, '
+        f'{total_after} after merging into ranges, plus {total_other} '
+        f'patterns spelling out the ids left to Other instead of `_`'
+    )
+
+
+def generate_modules(
+    filepath: str,
+    indices: Dict[str, RustModuleIndex],
+    enum_report: bool = False,
+) -> None:
+    """Writes each RustModuleIndex into its own directory under filepath.
+    Types which are defined identically in more than one module, even across
+    indices, are written once into a shared ies.rs and imported by the
+    modules which use them. Standalone indices only import from ies.rs, and
+    define everything else themselves.
+    """
+    registry = TypeRegistry()
+    for index in indices.values():
+        if index.standalone:
+            continue
+        for module in index.modules:
+            registry.add(module)
+    shared_types = registry.shared_types()
+
+    for dirname, index in indices.items():
+        index_shared_types = shared_types
+        if index.standalone:
+            # only import the shared types which are defined the same way
+            index_shared_types = {
+                t.name
+                for module in index.modules
+                for t in module.types()
+                if t.name in shared_types and registry.definitions[t.name] == {t.rust_code}
+            }
+        index.generate_module(os.path.join(filepath, dirname), index_shared_types)
+    ies_path = os.path.join(filepath, 'ies.rs')
+    if write_if_changed(ies_path, registry.to_rust(shared_types)):
+        print(f'wrote {ies_path}')
+
+    total_definitions = sum(registry.use_counts[name] for name in shared_types)
+    print(
+        f'deduplicated {total_definitions - len(shared_types)} definitions '
+        f'of {len(shared_types)} types shared between modules'
+    )
+    report_enum_patterns(indices, enum_report)
+
+
+class TestRustTypeCache(unittest.TestCase):
+    def test_list(self):
+        from pycrate_mobile.TS24008_IE import APN
+        cache = RustTypeCache()
+        apn = cache.get_list_struct(APN())
+        assert apn is not None
+        assert [field.rust_type_name() for field in apn.fields] == ['Vec<APNItem>']
+        assert apn.contains_final_buf()
+        # each label's length is given by the preceding length field
+        assert [field.count for field in cache.struct_cache['APNItem'].fields] == [None, 'len']
+
+    def test_length_offset(self):
+        from pycrate_mobile.TS24008_IE import EmergNumList
+        cache = RustTypeCache()
+        assert cache.get_list_struct(EmergNumList()) is not None
+        # the length field counts the service category octet too
+        num = cache.struct_cache['EmergNum'].fields[-1]
+        assert num.count == 'usize::from(*len).saturating_sub(1)'
+
+    def test_unsupported_list(self):
+        from pycrate_mobile.TS24301_IE import TAIList
+        cache = RustTypeCache()
+        # each partial TAI list's format depends on its type, which we can't
+        # parse yet, so nothing should be left behind
+        assert cache.get_list_struct(TAIList()) is None
+        assert cache.struct_cache == {}
+        assert cache.enum_cache == {}
+
+
+class TestRustModule(unittest.TestCase):
+    def test_security_header(self):
+        from pycrate_mobile.NASLTE import EMMSecProtNASMessage
+        module = RustModule(EMMSecProtNASMessage())
+        module.resolve_types()
+        # the security header is followed by plain values, and the protected
+        # message reads the rest of the input
+        assert [field.rust_type_name() for field in module.base_struct.fields] == ['Vec<u8>', 'u8', 'Vec<u8>']
+        assert module.base_struct.contains_final_buf()
+        module.add_test_case('17a1b2c3d405074300035200c2', binascii.unhexlify('17a1b2c3d405074300035200c2'))
+        rust = module.test_cases[0].to_rust()
+        assert 'unhexlify("a1b2c3d405074300035200c2")' in rust
+        assert 'from_reader_with_ctx(&mut reader, ByteSize(12))' in rust
+        assert 'assert_eq!(msg.seqn, 5);' in rust
+
+    def test_optional_ie_scan(self):
+        from pycrate_mobile.TS24301_EMM import EMMAttachAccept, EMMTrackingAreaUpdateComplete
+        from pycrate_mobile.TS24301_ESM import ESMInformationResponse
+
+        module = RustModule(EMMAttachAccept())
+        module.resolve_types()
+        rust = module.base_struct.to_rust()
+        assert 'DekuRead,' not in rust
+        # mandatory fields are read in order, and optional ones start out absent
+        assert 'let t_3412: Type3V<GPRSTimer> = DekuReader::from_reader_with_ctx(reader, ByteSize(1))?;' in rust
+        assert 'let mut t_3402: Type3TV<GPRSTimer> = Type3TV::absent(Tag(23));' in rust
+        assert 'while let Some(tag) = peek_tag(reader)? {' in rust
+        assert '23 => t_3402 = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(23)))?,' in rust
+        # type 1 IEs are matched on the high nibble, once no full tag matches,
+        # and only then are unknown IEs skipped
+        byte_arm = rust.index('23 => t_3402')
+        nibble_match = rust.index('_ => match tag >> 4 {')
+        nibble_arm = rust.index('12 => network_pol = DekuReader::from_reader_with_ctx(reader, Tag(12))?,')
+        skip_arm = rust.index('_ => if !skip_unknown_ie(reader, tag)? {')
+        assert byte_arm < nibble_match < nibble_arm < skip_arm
+        assert rust.count('skip_unknown_ie') == 1
+
+        # without any type 1 IEs, unknown IEs are skipped straight away
+        module = RustModule(ESMInformationResponse())
+        module.resolve_types()
+        rust = module.base_struct.to_rust()
+        assert 'tag >> 4' not in rust
+        assert '                _ => if !skip_unknown_ie(reader, tag)? {' in rust
+
+        # messages without any fields keep the derived reader
+        module = RustModule(EMMTrackingAreaUpdateComplete())
+        module.resolve_types()
+        rust = module.base_struct.to_rust()
+        assert '#[derive(DekuRead,' in rust
+        assert 'peek_tag' not in rust
+
+
+    def test_optional_ie_tag_clashes(self):
+        from pycrate_mobile.TS24301_EMM import EMMAttachAccept
+        from generator.rust_types import Layer3Type, Layer3Wrapper
+
+        def struct(*wrappers: tuple[Layer3Type, int]) -> RustStruct:
+            struct = RustStruct('Foo')
+            struct.is_message = True
+            for i, (layer3_type, tag) in enumerate(wrappers):
+                wrapper = Layer3Wrapper.__new__(Layer3Wrapper)
+                wrapper.type = layer3_type
+                wrapper.tag = tag
+                struct.add_field(RustStructField(f'ie_{i}', RustPrimitiveType.U8, wrapper, 8, None), i)
+            return struct
+
+        assert struct((Layer3Type.Type3TV, 0x23), (Layer3Type.Type1TV, 0xb)).scans_optional_ies()
+        # the same full tag twice would give the second IE an unreachable arm,
+        # even if the IEs are of different types
+        assert not struct((Layer3Type.Type3TV, 0x23), (Layer3Type.Type4TLV, 0x23)).scans_optional_ies()
+        assert not struct((Layer3Type.Type1TV, 0xb), (Layer3Type.Type1TV, 0xb)).scans_optional_ies()
+        # a full tag of 0xb3 would take the type 1 IE tagged 0xb's value 3
+        assert not struct((Layer3Type.Type3TV, 0xb3), (Layer3Type.Type1TV, 0xb)).scans_optional_ies()
+
+        # none of the real messages' tags clash
+        module = RustModule(EMMAttachAccept())
+        module.resolve_types()
+        assert module.base_struct.scans_optional_ies()
+
+
+class TestGenerateModules(unittest.TestCase):
+    def test_standalone_index(self):
+        import contextlib
+        import io
+        import tempfile
+
+        def module(name: str, foo: str) -> RenderedModule:
+            types = [RenderedType('Foo', foo, []), RenderedType('Bar', 'struct Bar;', [])]
+            return RenderedModule(name, name, False, types, [], '', ['00'])
+
+        index = RustModuleIndex()
+        index.add(module('first', 'struct Foo;'))
+        index.add(module('second', 'struct Foo;'))
+        standalone = RustModuleIndex(standalone=True)
+        standalone.add(module('third', "struct Foo<'a>;"))
+        with tempfile.TemporaryDirectory() as filepath:
+            with contextlib.redirect_stdout(io.StringIO()):
+                generate_modules(filepath, {'index': index, 'standalone': standalone})
+            with open(os.path.join(filepath, 'standalone', 'third.rs')) as f:
+                third = f.read()
+            with open(os.path.join(filepath, 'ies.rs')) as f:
+                ies = f.read()
+        # the standalone module's Foo doesn't stop the others' from being
+        # shared
+        assert 'struct Foo;' in ies
+        # but it defines its own Foo, and only imports Bar
+        assert 'use crate::nas::generated::ies::{Bar};' in third
+        assert "struct Foo<'a>;" in third
+        # and isn't benchmarked
+        from generator.benches import RustBenchSuite
+        assert '"third"' not in RustBenchSuite({'index': index, 'standalone': standalone}).to_rust()
+
+
+class TestReportEnumPatterns(unittest.TestCase):
+    def test_other_counted_separately(self):
+        import contextlib
+        import io
+        from generator.rust_types import RustEnumVariant
+
+        enum = RustEnum('Foo', RustPrimitiveType.U8, 3)
+        for value in (0, 1, 2):
+            enum.add_variant(RustEnumVariant('low', value))
+        enum.add_variant(RustEnumVariant('high', 5))
+        # low's ids merge into 0..=2, and Other spells out 3..=4 and 6..=7
+        assert enum.pattern_counts() == (4, 2, 2)
+        index = RustModuleIndex()
+        index.add(RenderedModule('foo', 'Foo', False, [], [RenderedType('Foo', '', [], enum.pattern_counts())], ''))
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            report_enum_patterns({'foo': index}, verbose=True)
+        assert out.getvalue() == (
+            '  Foo: 4 -> 2 patterns, 2 for Other\n'
+            '1 enums have 4 variant id patterns, 2 after merging into ranges, '
+            'plus 2 patterns spelling out the ids left to Other instead of `_`\n'
+        )
 
-        # now add the test case
-        rust_module.add_test_case(case_str, case)
 
-    index.generate_module(filepath)
+if __name__ == "__main__":
+    unittest.main()
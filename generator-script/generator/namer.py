@@ -1,5 +1,5 @@
 import unittest
-import inflect
+from functools import cache, lru_cache
 import re
 
 
@@ -7,16 +7,72 @@ def ignore_token(token: str) -> bool:
     return len(token) == 0 or not token.isalnum()
 
 
-inflect_engine = inflect.engine()
+TOKENS_RE = re.compile(r"([A-Z][a-z]*|0x[\d]+|[\d]+|[^A-Za-z\d])")
+
+ONES = [
+    'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight',
+    'nine', 'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen',
+    'sixteen', 'seventeen', 'eighteen', 'nineteen',
+]
+TENS = [
+    '', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty',
+    'ninety',
+]
+
+
+def _small_number_words(n: int) -> list[str]:
+    """Spells out 0 <= n < 1000 the same way inflect does, minus punctuation"""
+    words = []
+    hundreds, rest = divmod(n, 100)
+    if hundreds:
+        words += [ONES[hundreds], 'hundred']
+        if rest:
+            words.append('and')
+    if rest >= 20:
+        tens, ones = divmod(rest, 10)
+        words.append(TENS[tens])
+        if ones:
+            words.append(ONES[ones])
+    elif rest or not hundreds:
+        words.append(ONES[rest])
+    return words
+
+
+inflect_engine = None
+
+
+@cache
+def number_words(token: str) -> tuple[str, ...]:
+    """Returns the tokenized words for a number, e.g. "200" -> ("two",
+    "hundred"). Like inflect, "0x" prefixes and leading zeros are ignored.
+
+    Every number that currently leads a name is below 1000, and we spell
+    those out ourselves since importing inflect takes seconds. Anything else
+    falls back to inflect.
+    """
+    digits = token[2:] if token.startswith('0x') else token
+    if digits.isascii() and digits.isdigit() and int(digits) < 1000:
+        return tuple(_small_number_words(int(digits)))
+    global inflect_engine
+    if inflect_engine is None:
+        import inflect
+        inflect_engine = inflect.engine()
+    return _tokenize(inflect_engine.number_to_words(token))
+
+
 def tokenize(input: str) -> list[str]:
     """Splits an input string into a list of tokens, splitting not only on
     whitespace and punctuation, but also on camel-cased word boundaries (e.g.
     "FooBar" -> ["Foo", "Bar"])
     """
-    tokens_re = re.compile(r"([A-Z][a-z]*|0x[\d]+|[\d]+|[^A-Za-z\d])")
+    return list(_tokenize(input))
+
+
+@lru_cache(maxsize=8192)
+def _tokenize(input: str) -> tuple[str, ...]:
     acronym = None
-    tokens = []
-    for token in re.split(tokens_re, input):
+    tokens: list[str] = []
+    for token in TOKENS_RE.split(input):
         if ignore_token(token):
             if token == '+':
                 tokens.append('plus')
@@ -34,14 +90,12 @@ def tokenize(input: str) -> list[str]:
                 acronym = None
             is_number = token.startswith('0x') or token.isnumeric()
             if is_number and len(tokens) == 0:
-                number_word = inflect_engine.number_to_words(token)
-                for word in tokenize(number_word):
-                    tokens.append(word)
+                tokens.extend(number_words(token))
                 continue
             tokens.append(token)
     if acronym is not None:
         tokens.append(acronym)
-    return tokens
+    return tuple(tokens)
 
 
 class Name:
@@ -54,6 +108,16 @@ class Name:
         else:
             self.words = tokenize(raw)
 
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def camel_case(raw: str) -> str:
+        return Name(raw).cc()
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def snake_case(raw: str) -> str:
+        return Name(raw).sc()
+
     def cc(self):
         result = ''
         for word in self.words:
@@ -124,6 +188,25 @@ class TestNamer(unittest.TestCase):
         assert type.cc() == 'Type'
         assert type.sc() == 'typ'
 
+    def test_number_words(self):
+        import inflect
+        engine = inflect.engine()
+        for n in range(1000):
+            for token in [str(n), f'0x{n:04}', f'0{n}']:
+                expected = tokenize(engine.number_to_words(token))
+                assert list(number_words(token)) == expected, token
+        assert number_words('1234') == (
+            'one', 'thousand', 'two', 'hundred', 'and', 'thirty', 'four'
+        )
+
+    def test_cached(self):
+        for _ in range(2):
+            assert Name.camel_case('200 kbps') == 'TwoHundredKbps'
+            assert Name.snake_case('UERadioCapIDDelInd') == 'ue_radio_cap_id_del_ind'
+        # callers mutating the result mustn't affect later lookups
+        tokenize('TAIList').append('oops')
+        assert tokenize('TAIList') == ['TAI', 'List']
+
     def test_plus_minus(self):
         plus = Name('+')
         assert plus.cc() == 'Plus'
@@ -0,0 +1,215 @@
+import hashlib
+import importlib.metadata
+import multiprocessing
+import multiprocessing.synchronize
+import os
+import sqlite3
+import tempfile
+import unittest
+from enum import IntEnum
+from typing import Optional, Tuple
+
+
+class Direction(IntEnum):
+    """Which pycrate parser a payload was run through"""
+    MO = 0  # mobile originated, aka uplink
+    MT = 1  # mobile terminated, aka downlink
+
+
+def pycrate_version() -> str:
+    return importlib.metadata.version('pycrate')
+
+
+def default_cache_dir() -> str:
+    cache_home = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+    return os.path.join(cache_home, 'pycrate-rs')
+
+
+def cache_filepath(cache_dir: str) -> str:
+    return os.path.join(cache_dir, 'parse_results.sqlite3')
+
+
+def payload_digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+class ParseCache:
+    """A content-addressed, on-disk cache of pycrate's NAS parse results.
+
+    Each entry maps a payload's digest and parse direction to the resulting
+    pycrate message type name (or None, if the payload didn't parse) and
+    pycrate's error code. Entries are tagged with the installed pycrate
+    version, and any entries written by a different version are dropped when
+    the cache is opened.
+
+    Passing a filepath of None keeps the cache in memory, which still
+    deduplicates parses within a single run.
+
+    Every write is committed straight away, so that harvesting workers
+    sharing a cache file only hold its write lock for a single row at a time.
+    """
+
+    def __init__(self, filepath: Optional[str], timeout: float = 60) -> None:
+        self.version = pycrate_version()
+        self.hits = 0
+        self.misses = 0
+        if filepath is None:
+            filepath = ':memory:'
+        else:
+            os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        # several harvesting workers may share a cache file, so give writers
+        # some time to wait on each other. without isolation_level=None,
+        # sqlite3 would hold a transaction open from the first put until the
+        # next commit, locking every other worker out for a whole pcap
+        self.db = sqlite3.connect(filepath, timeout=timeout, isolation_level=None)
+        if filepath != ':memory:':
+            self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('''
+            CREATE TABLE IF NOT EXISTS parse_results (
+                digest BLOB NOT NULL,
+                direction INTEGER NOT NULL,
+                pycrate_version TEXT NOT NULL,
+                type_name TEXT,
+                error INTEGER NOT NULL,
+                PRIMARY KEY (digest, direction, pycrate_version)
+            ) WITHOUT ROWID
+        ''')
+        # only take the write lock to purge stale entries if there are any,
+        # which is only the case the first time a new pycrate version runs
+        stale = self.db.execute(
+            'SELECT 1 FROM parse_results WHERE pycrate_version != ? LIMIT 1',
+            (self.version,),
+        ).fetchone()
+        if stale is not None:
+            self.db.execute(
+                'DELETE FROM parse_results WHERE pycrate_version != ?',
+                (self.version,),
+            )
+
+    @staticmethod
+    def in_dir(cache_dir: str) -> 'ParseCache':
+        return ParseCache(cache_filepath(cache_dir))
+
+    def get(self, payload: bytes, direction: Direction) -> Optional[Tuple[Optional[str], int]]:
+        row = self.db.execute(
+            '''SELECT type_name, error FROM parse_results
+            WHERE digest = ? AND direction = ? AND pycrate_version = ?''',
+            (payload_digest(payload), int(direction), self.version),
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    def put(self, payload: bytes, direction: Direction, type_name: Optional[str], error: int) -> None:
+        self.db.execute(
+            'INSERT OR REPLACE INTO parse_results VALUES (?, ?, ?, ?, ?)',
+            (payload_digest(payload), int(direction), self.version, type_name, error),
+        )
+
+    def parse(self, payload: bytes, direction: Direction) -> Tuple[Optional[str], int]:
+        """Returns the pycrate type name and error code for parsing the
+        payload in the given direction, only running pycrate on a cache miss
+        """
+        cached = self.get(payload, direction)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        # pycrate is slow to import, so only pay for it once we actually need
+        # to parse something
+        from pycrate_mobile import NASLTE
+        if direction == Direction.MO:
+            msg, error = NASLTE.parse_NASLTE_MO(payload)
+        else:
+            msg, error = NASLTE.parse_NASLTE_MT(payload)
+        type_name = None if msg is None else msg._name
+        self.put(payload, direction, type_name, error)
+        return type_name, error
+
+    def commit(self) -> None:
+        # writes are already committed as they're made, this only matters
+        # if a caller opened a transaction of their own
+        self.db.commit()
+
+    def close(self) -> None:
+        self.db.commit()
+        self.db.close()
+
+
+def _harvest_concurrently(
+    filepath: str,
+    payloads: list[bytes],
+    wait_for: Optional[multiprocessing.synchronize.Event],
+    done: multiprocessing.synchronize.Event,
+) -> None:
+    """Parses payloads into a shared cache file, like a harvesting worker,
+    optionally waiting part way through for another worker to finish
+    """
+    cache = ParseCache(filepath, timeout=5)
+    cache.parse(payloads[0], Direction.MT)
+    if wait_for is not None:
+        # keep the connection open while the other worker writes
+        if not wait_for.wait(30):
+            raise TimeoutError('the other worker never finished')
+    for payload in payloads[1:]:
+        cache.parse(payload, Direction.MT)
+    cache.close()
+    done.set()
+
+
+class TestParseCache(unittest.TestCase):
+    def test_parse(self):
+        cache = ParseCache(None)
+        payload = bytes.fromhex('075501')
+        assert cache.parse(payload, Direction.MT) == ('EMMIdentityRequest', 0)
+        assert cache.parse(payload, Direction.MT) == ('EMMIdentityRequest', 0)
+        assert (cache.hits, cache.misses) == (1, 1)
+        type_name, error = cache.parse(b'\xff\xff', Direction.MO)
+        assert type_name is None and error != 0
+
+    def test_invalidation(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ParseCache.in_dir(cache_dir)
+            cache.put(b'foo', Direction.MO, 'Foo', 0)
+            cache.version = 'some-other-version'
+            cache.put(b'bar', Direction.MO, 'Bar', 0)
+            cache.close()
+
+            cache = ParseCache.in_dir(cache_dir)
+            assert cache.get(b'foo', Direction.MO) == ('Foo', 0)
+            assert cache.get(b'foo', Direction.MT) is None
+            cache.version = 'some-other-version'
+            assert cache.get(b'bar', Direction.MO) is None
+            cache.close()
+
+    def test_shared_file(self):
+        payloads = [bytes.fromhex(payload) for payload in ['075501', '074502', '0202d9', '074a']]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            filepath = cache_filepath(cache_dir)
+            first_done = multiprocessing.Event()
+            second_done = multiprocessing.Event()
+            # the first worker parses a payload, then waits for the second
+            # to open the cache and parse all of its payloads
+            first = multiprocessing.Process(
+                target=_harvest_concurrently,
+                args=(filepath, payloads[:2], second_done, first_done),
+            )
+            second = multiprocessing.Process(
+                target=_harvest_concurrently,
+                args=(filepath, payloads[2:], None, second_done),
+            )
+            first.start()
+            second.start()
+            second.join(30)
+            first.join(30)
+            assert second.exitcode == 0 and first.exitcode == 0
+            assert first_done.is_set() and second_done.is_set()
+
+            cache = ParseCache(filepath)
+            assert cache.get(payloads[0], Direction.MT) == ('EMMIdentityRequest', 0)
+            assert cache.get(payloads[2], Direction.MT) == ('ESMInformationRequest', 0)
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
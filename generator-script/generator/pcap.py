@@ -0,0 +1,234 @@
+import io
+import os
+import struct
+import unittest
+from typing import BinaryIO, Iterator, Optional
+
+
+# offsets of the GSMTAP header within a captured record, which is assumed to
+# be IPv4 (20 bytes) + UDP (8 bytes) + GSMTAP (16 bytes) + payload
+# these are mirrored by the nas-parse binary's reader in src/pcap.rs
+GSMTAP_HDR_START = 28
+GSMTAP_HDR_END = GSMTAP_HDR_START + 16
+GSMTAP_TYPE_OFFSET = GSMTAP_HDR_START + 2
+GSMTAP_TYPE_NAS = 18
+
+PCAP_MAGICS = {
+    b'\xd4\xc3\xb2\xa1': '<',  # microsecond resolution
+    b'\x4d\x3c\xb2\xa1': '<',  # nanosecond resolution
+    b'\xa1\xb2\xc3\xd4': '>',
+    b'\xa1\xb2\x3c\x4d': '>',
+}
+PCAP_GLOBAL_HDR_LEN = 24
+
+PCAPNG_SHB_TYPE = 0x0a0d0d0a
+PCAPNG_BYTE_ORDER_MAGIC = 0x1a2b3c4d
+PCAPNG_SPB_TYPE = 0x00000003
+PCAPNG_EPB_TYPE = 0x00000006
+
+
+class PcapFormatError(ValueError):
+    pass
+
+
+class GsmtapNASReader:
+    """Streams the NAS payloads out of a pcap or pcapng capture of GSMTAP
+    packets, one record at a time.
+
+    Only the record headers and the first GSMTAP_HDR_END bytes of each record
+    are read into a reusable buffer. Records which aren't GSMTAP NAS are
+    skipped over with a seek, so they never get allocated, and memory use
+    stays flat regardless of how large the capture is.
+    """
+
+    def __init__(self, f: BinaryIO) -> None:
+        self.f = f
+        self._hdr = bytearray(GSMTAP_HDR_END)
+        self._hdr_view = memoryview(self._hdr)
+
+    def __iter__(self) -> Iterator[bytes]:
+        magic = self.f.read(4)
+        if magic in PCAP_MAGICS:
+            return self._iter_pcap(PCAP_MAGICS[magic])
+        if len(magic) == 4 and struct.unpack('<I', magic)[0] == PCAPNG_SHB_TYPE:
+            return self._iter_pcapng(magic)
+        raise PcapFormatError(f'unrecognized capture magic {magic.hex()}')
+
+    def _read_record(self, captured_len: int) -> Optional[bytes]:
+        """Reads a single captured record of the given length, returning its
+        NAS payload or None if the record isn't a GSMTAP NAS packet. In either
+        case, the file is left positioned at the end of the record.
+        """
+        if captured_len < GSMTAP_HDR_END:
+            self.f.seek(captured_len, os.SEEK_CUR)
+            return None
+        if self.f.readinto(self._hdr_view) != GSMTAP_HDR_END:
+            raise EOFError
+        remaining = captured_len - GSMTAP_HDR_END
+        if self._hdr[GSMTAP_TYPE_OFFSET] != GSMTAP_TYPE_NAS:
+            self.f.seek(remaining, os.SEEK_CUR)
+            return None
+        payload = self.f.read(remaining)
+        if len(payload) != remaining:
+            raise EOFError
+        return payload
+
+    def _iter_pcap(self, endian: str) -> Iterator[bytes]:
+        self.f.seek(PCAP_GLOBAL_HDR_LEN - 4, os.SEEK_CUR)
+        record_hdr = struct.Struct(f'{endian}IIII')
+        buf = bytearray(record_hdr.size)
+        while self.f.readinto(buf) == record_hdr.size:
+            _, _, captured_len, _ = record_hdr.unpack(buf)
+            try:
+                payload = self._read_record(captured_len)
+            except EOFError:
+                # truncated capture, just stop at the last full record
+                return
+            if payload is not None:
+                yield payload
+
+    def _iter_pcapng(self, shb_type: bytes) -> Iterator[bytes]:
+        # every section header block declares the byte order for the blocks
+        # in its section, so we start off by reading the first one
+        endian = self._read_section_header(shb_type)
+        block_hdr = struct.Struct(f'{endian}II')
+        epb_hdr = struct.Struct(f'{endian}IIIII')
+        buf = bytearray(block_hdr.size)
+        while self.f.readinto(buf) == block_hdr.size:
+            block_start = self.f.tell() - block_hdr.size
+            block_type, block_len = block_hdr.unpack(buf)
+            if block_type == PCAPNG_SHB_TYPE:
+                self.f.seek(block_start)
+                endian = self._read_section_header(self.f.read(4))
+                block_hdr = struct.Struct(f'{endian}II')
+                epb_hdr = struct.Struct(f'{endian}IIIII')
+                continue
+            if block_type == PCAPNG_EPB_TYPE:
+                fields = self.f.read(epb_hdr.size)
+                if len(fields) != epb_hdr.size:
+                    return
+                captured_len = epb_hdr.unpack(fields)[3]
+            elif block_type == PCAPNG_SPB_TYPE:
+                original_len = self.f.read(4)
+                if len(original_len) != 4:
+                    return
+                # the packet data is padded out to 32 bits, and may have been
+                # cut short by the snap length
+                captured_len = min(struct.unpack(f'{endian}I', original_len)[0], block_len - 16)
+            else:
+                captured_len = None
+
+            if captured_len is not None:
+                try:
+                    payload = self._read_record(captured_len)
+                except EOFError:
+                    return
+                if payload is not None:
+                    yield payload
+            self.f.seek(block_start + block_len)
+
+    def _read_section_header(self, shb_type: bytes) -> str:
+        rest = self.f.read(8)
+        if len(rest) != 8:
+            raise PcapFormatError('truncated pcapng section header')
+        block_len_bytes, byte_order_magic = rest[:4], rest[4:]
+        if struct.unpack('<I', byte_order_magic)[0] == PCAPNG_BYTE_ORDER_MAGIC:
+            endian = '<'
+        elif struct.unpack('>I', byte_order_magic)[0] == PCAPNG_BYTE_ORDER_MAGIC:
+            endian = '>'
+        else:
+            raise PcapFormatError('bad pcapng byte order magic')
+        block_len = struct.unpack(f'{endian}I', block_len_bytes)[0]
+        # skip the rest of the section header (version, section length,
+        # options, and trailing block length)
+        self.f.seek(block_len - 12, os.SEEK_CUR)
+        return endian
+
+
+def iter_nas_payloads(f: BinaryIO) -> Iterator[bytes]:
+    """Yields the raw NAS payload of every GSMTAP NAS record in the given
+    pcap/pcapng file
+    """
+    return iter(GsmtapNASReader(f))
+
+
+def gsmtap_record(gsmtap_type: int, payload: bytes) -> bytes:
+    """Builds a fake IPv4/UDP/GSMTAP record around the given payload, mostly
+    useful for tests and benchmarks
+    """
+    gsmtap_hdr = bytes([2, 4, gsmtap_type]) + bytes(13)
+    return bytes(GSMTAP_HDR_START) + gsmtap_hdr + payload
+
+
+def write_pcap(f: BinaryIO, records: list[bytes], endian='<') -> None:
+    """Writes the given records as a classic pcap with a raw IPv4 linktype"""
+    f.write(struct.pack(f'{endian}IHHiIII', 0xa1b2c3d4, 2, 4, 0, 0, 65535, 228))
+    for i, record in enumerate(records):
+        f.write(struct.pack(f'{endian}IIII', i, 0, len(record), len(record)))
+        f.write(record)
+
+
+def write_pcapng(f: BinaryIO, records: list[bytes], endian='<', simple=False) -> None:
+    """Writes the given records as a pcapng of enhanced packet blocks, or
+    simple packet blocks if simple is set
+    """
+    f.write(struct.pack(f'{endian}IIIHHqI', PCAPNG_SHB_TYPE, 28, PCAPNG_BYTE_ORDER_MAGIC, 1, 0, -1, 28))
+    f.write(struct.pack(f'{endian}IIHHII', 1, 20, 228, 0, 65535, 20))
+    for record in records:
+        padding = bytes(-len(record) % 4)
+        if simple:
+            block_len = 16 + len(record) + len(padding)
+            f.write(struct.pack(f'{endian}III', PCAPNG_SPB_TYPE, block_len, len(record)))
+        else:
+            block_len = 32 + len(record) + len(padding)
+            f.write(struct.pack(f'{endian}IIIIIII', PCAPNG_EPB_TYPE, block_len, 0, 0, 0, len(record), len(record)))
+        f.write(record + padding)
+        f.write(struct.pack(f'{endian}I', block_len))
+
+
+class TestGsmtapNASReader(unittest.TestCase):
+    records = [
+        gsmtap_record(GSMTAP_TYPE_NAS, bytes.fromhex('075501')),
+        gsmtap_record(13, bytes.fromhex('deadbeef')),
+        b'short',
+        gsmtap_record(GSMTAP_TYPE_NAS, bytes.fromhex('0202da2807066f72616e6765')),
+    ]
+    expected = [bytes.fromhex('075501'), bytes.fromhex('0202da2807066f72616e6765')]
+
+    def test_pcap(self):
+        for endian in '<>':
+            f = io.BytesIO()
+            write_pcap(f, self.records, endian)
+            f.seek(0)
+            assert list(iter_nas_payloads(f)) == self.expected
+
+    def test_pcapng(self):
+        for endian in '<>':
+            f = io.BytesIO()
+            write_pcapng(f, self.records, endian)
+            f.seek(0)
+            assert list(iter_nas_payloads(f)) == self.expected
+
+    def test_pcapng_simple_packets(self):
+        # some of the records aren't a multiple of 4 bytes long, so their blocks
+        # are padded, which mustn't end up in the payloads
+        assert any(len(record) % 4 for record in self.records)
+        for endian in '<>':
+            f = io.BytesIO()
+            write_pcapng(f, self.records, endian, simple=True)
+            f.seek(0)
+            assert list(iter_nas_payloads(f)) == self.expected
+
+    def test_truncated(self):
+        f = io.BytesIO()
+        write_pcap(f, self.records)
+        f = io.BytesIO(f.getvalue()[:-3])
+        assert list(iter_nas_payloads(f)) == self.expected[:1]
+
+    def test_bad_magic(self):
+        f = io.BytesIO(b'nope' * 10)
+        self.assertRaises(PcapFormatError, lambda: list(iter_nas_payloads(f)))
+
+
+if __name__ == "__main__":
+    unittest.main()
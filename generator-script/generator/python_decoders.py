@@ -0,0 +1,990 @@
+import binascii
+import re
+import types
+import unittest
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TYPE_CHECKING
+
+from generator.csn1 import Csn1Struct
+from generator.modules import RustModule
+from generator.rust_types import Layer3Type, RustEnum, RustList, RustPrimitiveType, RustStruct, RustStructField
+from generator.util import indent
+
+if TYPE_CHECKING:
+    from pycrate_mobile.TS24007 import Layer3E
+    from generator.dispatch import RustDispatch
+
+# the width of each primitive type when it isn't given a bit length
+PRIMITIVE_BITS = {
+    RustPrimitiveType.U8: 8,
+    RustPrimitiveType.I8: 8,
+    RustPrimitiveType.U16: 16,
+    RustPrimitiveType.I16: 16,
+    RustPrimitiveType.U32: 32,
+    RustPrimitiveType.I32: 32,
+}
+
+# the Rust expressions length_from_sibling gives for a length field, with or
+# without a constant offset
+COUNT_RE = re.compile(r'^(?:(\w+)|usize::from\(\*(\w+)\)(?: \+ (\d+)|\.saturating_sub\((\d+)\)))$')
+
+
+class Unsupported(Exception):
+    """Raised when a type's layout can't be decoded by the generated
+    Python, in which case the IE holding it is returned as raw bytes
+    """
+
+
+def count_to_python(count: str) -> str:
+    """Translates a Rust count expression, e.g.
+    `usize::from(*len).saturating_sub(1)`, into the equivalent Python
+    expression over the struct's locals
+    """
+    if count.isdigit():
+        return count
+    match = COUNT_RE.match(count)
+    if match is None:
+        raise Unsupported(f'count expression {count}')
+    name, from_name, plus, minus = match.groups()
+    if name is not None:
+        return f'f_{name}'
+    if plus is not None:
+        return f'f_{from_name} + {plus}'
+    return f'max(f_{from_name} - {minus}, 0)'
+
+
+def int_expr(offset: int, bits: int, base: str = 'pos') -> str:
+    """Returns an expression for the big-endian unsigned integer made up of
+    the given number of bits, starting the given number of bits after
+    data[base]
+    """
+    if bits == 0:
+        return '0'
+    start = offset // 8
+    shift = -(offset + bits) % 8
+    num_bytes = (offset % 8 + bits + 7) // 8
+    index = base if start == 0 else f'{base} + {start}'
+    if num_bytes == 1:
+        expr = f'data[{index}]'
+    else:
+        expr = f"int.from_bytes(data[{index}:{base} + {start + num_bytes}], 'big')"
+    if shift:
+        expr = f'({expr} >> {shift})'
+    if bits != 8 * num_bytes:
+        expr = f'{expr} & {hex((1 << bits) - 1)}'
+    return expr
+
+
+def field_bits(field: RustStructField) -> Optional[int]:
+    """Returns how many bits a plain value takes up, or None if it isn't a
+    fixed size
+    """
+    if isinstance(field.type, RustEnum):
+        return field.type.bit_length
+    if field.type == RustPrimitiveType.VecU8:
+        if field.count is not None or field.is_final_buf or not field.bit_length:
+            return None
+        return field.bit_length
+    if isinstance(field.type, RustPrimitiveType):
+        return field.bit_length if field.bit_length is not None else PRIMITIVE_BITS[field.type]
+    return None
+
+
+class Column:
+    """A field at a fixed position in every message of a type, which can be
+    read from a whole batch of messages at once
+    """
+
+    def __init__(self, name: str, bit_offset: int, bits: int, enum_table: Optional[str] = None, is_bytes: bool = False) -> None:
+        self.name = name
+        self.bit_offset = bit_offset
+        self.bits = bits
+        # the identifier of the enum's variant names, for enum fields
+        self.enum_table = enum_table
+        self.is_bytes = is_bytes
+
+    def to_python(self) -> str:
+        return f'({self.name!r}, {self.bit_offset}, {self.bits}, {self.enum_table}, {self.is_bytes}),'
+
+
+class PythonDecoders:
+    """Renders a standalone Python module which decodes NAS messages using
+    the same type IR as the Rust modules. Each message and IE gets its own
+    decoder function which reads every field straight out of the payload
+    with precomputed slices and masks, so decoding never builds an object
+    per field like pycrate does.
+
+    Decoded messages are plain dicts keyed by the Rust field names. Layer 3
+    IEs hold their value directly, or None if they're absent, enums hold
+    their Rust variant name, and buffers hold bytes. IEs the Rust parser
+    can't read either, like CSN.1 IEs, hold their raw bytes.
+    """
+
+    def __init__(self) -> None:
+        # the source of each module level definition, in dependency order
+        self.definitions: Dict[str, str] = {}
+        self.enum_tables: Dict[str, str] = {}
+        self.messages: Dict[str, str] = {}
+        # each message's fixed position fields, for batch decoding
+        self.columns: Dict[str, list[Column]] = {}
+        self.dispatches: List['RustDispatch'] = []
+        # helpers already rendered for each IR type. keying on the types
+        # themselves keeps them alive, so their ids are never reused
+        self._rendered: Dict[Tuple[str, Any], str] = {}
+
+    @staticmethod
+    def from_classes(classes: list[Type['Layer3E']]) -> 'PythonDecoders':
+        decoders = PythonDecoders()
+        for clazz in classes:
+            module = RustModule(clazz())
+            module.resolve_types()
+            decoders.add_module(module)
+        return decoders
+
+    def _define(self, prefix: str, name: str, source: Callable[[str], str]) -> str:
+        """Adds a module level definition named after an IR type, returning
+        its identifier. Types with the same name but a different layout in
+        another module get a numbered identifier of their own.
+        """
+        identifier = f'{prefix}{name}'
+        suffix = 1
+        while True:
+            text = source(identifier)
+            existing = self.definitions.get(identifier)
+            if existing is None:
+                self.definitions[identifier] = text
+                return identifier
+            if existing == text:
+                return identifier
+            suffix += 1
+            identifier = f'{prefix}{name}_{suffix}'
+
+    def enum_table(self, enum: RustEnum) -> str:
+        key = ('enum', enum)
+        if key not in self._rendered:
+            values = [(value, variant.name) for variant in enum.variants for value in variant.values]
+            items = ''.join(f'\n    {value}: {name!r},' for value, name in sorted(values))
+            identifier = self._define('_ENUM_', enum.name, lambda ident: f'{ident} = {{{items}\n}}')
+            self.enum_tables.setdefault(enum.name, identifier)
+            self._rendered[key] = identifier
+        return self._rendered[key]
+
+    def _value_expr(self, field: RustStructField, expr: str, bits: int) -> str:
+        """Converts the integer read for a fixed size value into the value
+        itself
+        """
+        if isinstance(field.type, RustEnum):
+            return f"{self.enum_table(field.type)}.get({expr}, 'Other')"
+        if field.type == RustPrimitiveType.VecU8:
+            return f"({expr}).to_bytes({bits // 8}, 'big')"
+        return expr
+
+    def fixed_bits(self, struct: RustStruct) -> Optional[int]:
+        """Returns how many bits a struct takes up if every field in it is a
+        fixed size, so it can be unpacked from a single integer, or None
+        """
+        if struct.is_variable_bitfield or len(struct.fields) == 0:
+            return None
+        total = 0
+        for field in struct.fields:
+            total += field.bit_padding or 0
+            if isinstance(field.type, RustStruct):
+                bits = self.fixed_bits(field.type)
+            else:
+                bits = field_bits(field)
+                if field.type == RustPrimitiveType.VecU8 and total % 8:
+                    bits = None
+            if bits is None:
+                return None
+            total += bits
+        return total
+
+    def unpacker(self, struct: RustStruct) -> str:
+        """Renders a function unpacking a fixed size struct from the integer
+        made up of its bits
+        """
+        key = ('unpack', struct)
+        if key in self._rendered:
+            return self._rendered[key]
+        struct._fix_all_duplicates()
+        total = self.fixed_bits(struct)
+        assert total is not None
+        items = []
+        offset = 0
+        for field in struct.fields:
+            offset += field.bit_padding or 0
+            if isinstance(field.type, RustStruct):
+                bits = self.fixed_bits(field.type)
+                assert bits is not None
+                value = f'{self.unpacker(field.type)}({self._bits_of(total, offset, bits)})'
+            else:
+                bits = field_bits(field)
+                assert bits is not None
+                value = self._value_expr(field, self._bits_of(total, offset, bits), bits)
+            items.append(f'{field.name!r}: {value},')
+            offset += bits
+        body = indent('\n'.join(items), 2)
+        self._rendered[key] = self._define('_unpack_', struct.name, lambda ident: f'''\
+def {ident}(v):
+    return {{
+{body}
+    }}''')
+        return self._rendered[key]
+
+    @staticmethod
+    def _bits_of(total: int, offset: int, bits: int) -> str:
+        if bits == 0:
+            return '0'
+        shift = total - offset - bits
+        expr = f'v >> {shift}' if shift else 'v'
+        if offset:
+            if shift:
+                expr = f'({expr})'
+            expr = f'{expr} & {hex((1 << bits) - 1)}'
+        return expr
+
+    def decoder(self, struct: RustStruct) -> str:
+        """Renders a function decoding a struct from data[pos:end], which
+        returns the struct along with the position after it
+        """
+        key = ('decode', struct)
+        if key in self._rendered:
+            return self._rendered[key]
+        struct._fix_all_duplicates()
+        if struct.is_variable_bitfield:
+            lines = self._variable_bitfield_lines(struct)
+        else:
+            lines = self._struct_lines(struct)
+        lines.append(self._return_line(struct.fields, 'pos'))
+        body = indent('\n'.join(lines))
+        self._rendered[key] = self._define('_decode_', struct.name, lambda ident: f'''\
+def {ident}(data, pos, end):
+{body}''')
+        return self._rendered[key]
+
+    @staticmethod
+    def _return_line(fields: list[RustStructField], pos: Optional[str] = None) -> str:
+        items = ''.join(f'\n    {field.name!r}: f_{field.name},' for field in fields)
+        value = f'{{{items}\n}}' if len(fields) else '{}'
+        return f'return {value}, {pos}' if pos is not None else f'return {value}'
+
+    def _variable_bitfield_lines(self, struct: RustStruct) -> list[str]:
+        """Variable bitfields are read from however many of their bytes are
+        present, with the fields past the end left as None
+        """
+        fixed_fields = [field for field in struct.fields if not field.is_final_buf]
+        total = 0
+        offsets = []
+        for field in fixed_fields:
+            bits = field_bits(field)
+            if bits is None:
+                raise Unsupported(f'{struct.name}.{field.name}')
+            offsets.append(total)
+            total += bits
+        if total % 8:
+            raise Unsupported(f'{struct.name} is {total} bits')
+        num_bytes = total // 8
+        lines = [
+            'size = end - pos',
+            f'n = size if size < {num_bytes} else {num_bytes}',
+            f"v = int.from_bytes(data[pos:pos + n], 'big') << (8 * ({num_bytes} - n))",
+        ]
+        for field, offset in zip(fixed_fields, offsets):
+            bits = field_bits(field)
+            assert bits is not None
+            value = self._value_expr(field, self._bits_of(total, offset, bits), bits)
+            lines.append(f'f_{field.name} = {value} if n > {offset // 8} else None')
+        for field in struct.fields[len(fixed_fields):]:
+            lines.append(f'f_{field.name} = data[pos + {num_bytes}:end] if size > {num_bytes} else None')
+        lines.append('pos = end')
+        return lines
+
+    def _struct_lines(self, struct: RustStruct) -> list[str]:
+        """Reads each field in turn, tracking how many bits into the input
+        each fixed size field is at generation time, and only moving pos
+        along for fields whose size depends on the input
+        """
+        lines: list[str] = []
+        offset = 0
+        # how many bytes after pos are known to be there
+        checked = 0
+        fields = struct.fields
+        for i, field in enumerate(fields):
+            offset += field.bit_padding or 0
+            bits = self._fixed_field_bits(field)
+            if bits is not None:
+                if 8 * checked < offset + bits:
+                    run = offset + sum(
+                        (later.bit_padding or 0) + (self._fixed_field_bits(later) or 0)
+                        for later in self._fixed_run(fields[i:])
+                    )
+                    checked = (run + 7) // 8
+                    lines.append(f'if pos + {checked} > end:')
+                    lines.append(f"    raise DecodeError('{struct.name} is truncated')")
+                lines.append(f'f_{field.name} = {self._fixed_field_expr(field, offset, bits)}')
+                offset += bits
+                continue
+            if offset % 8:
+                raise Unsupported(f'{struct.name}.{field.name} is not byte aligned')
+            if offset:
+                lines.append(f'pos += {offset // 8}')
+            offset = 0
+            checked = 0
+            lines += self._dynamic_field_lines(struct, field)
+        if offset % 8:
+            raise Unsupported(f'{struct.name} is not a whole number of bytes')
+        if offset:
+            lines.append(f'pos += {offset // 8}')
+        return lines
+
+    def _fixed_run(self, fields: list[RustStructField]) -> list[RustStructField]:
+        run = []
+        for field in fields:
+            if self._fixed_field_bits(field) is None:
+                break
+            run.append(field)
+        return run
+
+    def _fixed_field_bits(self, field: RustStructField) -> Optional[int]:
+        if isinstance(field.type, RustStruct):
+            return self.fixed_bits(field.type)
+        return field_bits(field)
+
+    def _fixed_field_expr(self, field: RustStructField, offset: int, bits: int) -> str:
+        if isinstance(field.type, RustStruct):
+            return f'{self.unpacker(field.type)}({int_expr(offset, bits)})'
+        if field.type == RustPrimitiveType.VecU8:
+            if offset % 8:
+                raise Unsupported(f'{field.name} is not byte aligned')
+            start = offset // 8
+            start_expr = 'pos' if start == 0 else f'pos + {start}'
+            return f'data[{start_expr}:pos + {start + bits // 8}]'
+        return self._value_expr(field, int_expr(offset, bits), bits)
+
+    def _dynamic_field_lines(self, struct: RustStruct, field: RustStructField) -> list[str]:
+        name = f'f_{field.name}'
+        if field.type is None:
+            # like the Rust parser, skip over values we can't read without
+            # consuming anything
+            return [f'{name} = None']
+        if field.type == RustPrimitiveType.VecU8:
+            if field.is_final_buf:
+                return [f'{name} = data[pos:end]', 'pos = end']
+            if field.count is None:
+                raise Unsupported(f'{struct.name}.{field.name}')
+            return [
+                f'stop = pos + {count_to_python(field.count)}',
+                'if stop > end:',
+                f"    raise DecodeError('{struct.name} is truncated')",
+                f'{name} = data[pos:stop]',
+                'pos = stop',
+            ]
+        if isinstance(field.type, RustList):
+            return self._list_lines(struct, field, field.type)
+        if isinstance(field.type, RustStruct):
+            return [f'{name}, pos = {self.decoder(field.type)}(data, pos, end)']
+        raise Unsupported(f'{struct.name}.{field.name}')
+
+    def _list_lines(self, struct: RustStruct, field: RustStructField, rust_list: RustList) -> list[str]:
+        name = f'f_{field.name}'
+        element = rust_list.element
+        element_bits = self.fixed_bits(element)
+        if element_bits is not None and element_bits % 8 == 0:
+            element_bytes = element_bits // 8
+            read = [
+                f'if pos + {element_bytes} > stop:',
+                f"    raise DecodeError('{element.name} is truncated')",
+                f'{name}.append({self.unpacker(element)}({int_expr(0, element_bits)}))',
+                f'pos += {element_bytes}',
+            ]
+        else:
+            read = [
+                f'v, pos = {self.decoder(element)}(data, pos, stop)',
+                f'{name}.append(v)',
+            ]
+        lines = [f'{name} = []']
+        if rust_list.count is not None:
+            lines.append('stop = end')
+            lines.append(f'for _ in range({count_to_python(rust_list.count)}):')
+        else:
+            if rust_list.bytes_read is not None:
+                lines += [
+                    f'stop = pos + {count_to_python(rust_list.bytes_read)}',
+                    'if stop > end:',
+                    f"    raise DecodeError('{struct.name} is truncated')",
+                ]
+            else:
+                lines.append('stop = end')
+            lines.append('while pos < stop:')
+        lines += [indent(line) for line in read]
+        return lines
+
+    def _inner_value(self, field: RustStructField, start: int, size: Optional[int] = None) -> list[str]:
+        """Returns lines decoding a layer 3 IE's value from data[pos + start:vend]
+        into its local. If the value's size is known, there's no need to
+        check it's long enough for a fixed size type.
+        """
+        name = f'f_{field.name}'
+        rust_type = field.type
+        start_expr = 'pos' if start == 0 else f'pos + {start}'
+        try:
+            bits: Optional[int] = None
+            if isinstance(rust_type, RustEnum):
+                bits = rust_type.bit_length
+                value = self._value_expr(field, int_expr(8 * start, bits), bits)
+            elif isinstance(rust_type, RustPrimitiveType) and rust_type != RustPrimitiveType.VecU8:
+                bits = PRIMITIVE_BITS[rust_type]
+                value = int_expr(8 * start, bits)
+            elif isinstance(rust_type, RustStruct) and len(rust_type.fields):
+                bits = self.fixed_bits(rust_type)
+                if bits is None:
+                    return [f'{name} = {self.decoder(rust_type)}(data, {start_expr}, vend)[0]']
+                value = f'{self.unpacker(rust_type)}({int_expr(8 * start, bits)})'
+        except Unsupported:
+            bits = None
+        if bits is None:
+            # buffers, along with IEs we can't read, are left as raw bytes
+            return [f'{name} = data[{start_expr}:vend]']
+        num_bytes = (bits + 7) // 8
+        if size is not None and size >= num_bytes:
+            return [f'{name} = {value}']
+        return [
+            f'if vend - pos < {start + num_bytes}:',
+            f"    raise DecodeError('{field.name} is truncated')",
+            f'{name} = {value}',
+        ]
+
+    def _nibble_value(self, field: RustStructField, expr: str) -> str:
+        """Returns the value of a type 1 IE given an expression for its 4
+        bit value
+        """
+        if isinstance(field.type, RustEnum):
+            return self._value_expr(field, expr, 4)
+        if isinstance(field.type, RustStruct):
+            bits = self.fixed_bits(field.type)
+            if bits == 4:
+                return f'{self.unpacker(field.type)}({expr})'
+        return expr
+
+    def _message_lines(self, struct: RustStruct) -> list[str]:
+        """Reads a message's mandatory IEs in order, then scans its optional
+        IEs by tag the same way the Rust reader does
+        """
+        struct._fix_all_duplicates()
+        mandatory, optional = struct._split_optional_fields()
+        lines: list[str] = []
+        offset = 0
+        # how many bytes after pos are known to be there
+        checked = 0
+        for field in mandatory:
+            assert field.layer3_wrapper is not None
+            offset += field.bit_padding or 0
+            wrapper_type = field.layer3_wrapper.type
+            if wrapper_type == Layer3Type.Type1V:
+                if 8 * checked < offset + 4:
+                    checked = offset // 8 + 1
+                    lines.append(f'if pos + {checked} > end:')
+                    lines.append(f"    raise DecodeError('{field.name} is truncated')")
+                lines.append(f'f_{field.name} = {self._nibble_value(field, int_expr(offset, 4))}')
+                offset += 4
+                continue
+            if offset % 8:
+                raise Unsupported(f'{struct.name}.{field.name} is not byte aligned')
+            if offset:
+                lines.append(f'pos += {offset // 8}')
+                offset = 0
+            checked = 0
+            size = None
+            if wrapper_type == Layer3Type.Type3V:
+                assert field.bit_length is not None
+                size = field.bit_length // 8
+                lines.append(f'vend = pos + {size}')
+                start = 0
+            elif wrapper_type == Layer3Type.Type4LV:
+                lines.append('vend = pos + 1 + data[pos]')
+                start = 1
+            else:
+                assert wrapper_type == Layer3Type.Type6LVE
+                lines.append("vend = pos + 2 + int.from_bytes(data[pos:pos + 2], 'big')")
+                start = 2
+            lines.append('if vend > end:')
+            lines.append(f"    raise DecodeError('{field.name} is truncated')")
+            lines += self._inner_value(field, start, size)
+            lines.append('pos = vend')
+        if offset % 8:
+            raise Unsupported(f'{struct.name} is not a whole number of bytes')
+        if offset:
+            lines.append(f'pos += {offset // 8}')
+
+        if len(optional):
+            for field in optional:
+                lines.append(f'f_{field.name} = None')
+            byte_arms = []
+            nibble_arms = []
+            for field in optional:
+                assert field.layer3_wrapper is not None
+                wrapper = field.layer3_wrapper
+                if wrapper.type == Layer3Type.Type1TV:
+                    nibble_arms.append((wrapper.tag, [
+                        f'f_{field.name} = {self._nibble_value(field, "tag & 0xf")}',
+                        'pos += 1',
+                    ]))
+                    continue
+                size = None
+                if wrapper.type == Layer3Type.Type3TV:
+                    assert field.bit_length is not None
+                    size = field.bit_length // 8
+                    arm = [f'vend = pos + {1 + size}']
+                    start = 1
+                elif wrapper.type == Layer3Type.Type4TLV:
+                    arm = ['vend = pos + 2 + data[pos + 1]']
+                    start = 2
+                else:
+                    arm = ["vend = pos + 3 + int.from_bytes(data[pos + 1:pos + 3], 'big')"]
+                    start = 3
+                arm += [
+                    'if vend > end:',
+                    f"    raise DecodeError('{field.name} is truncated')",
+                ]
+                arm += self._inner_value(field, start, size)
+                arm.append('pos = vend')
+                byte_arms.append((wrapper.tag, arm))
+            skip = [
+                'pos = _skip_ie(data, pos, end, tag)',
+                'if pos < 0:',
+                '    break',
+            ]
+            if len(nibble_arms):
+                fallback = ['nibble = tag >> 4'] + self._if_chain('nibble', nibble_arms, skip)
+            else:
+                fallback = skip
+            lines.append('# optional IEs may arrive in any order, so read each one by looking up its tag')
+            lines.append('while pos < end:')
+            lines.append('    tag = data[pos]')
+            lines += [indent(line) for line in self._if_chain('tag', byte_arms, fallback)]
+        return lines
+
+    @staticmethod
+    def _if_chain(var: str, arms: list[Tuple[Optional[int], list[str]]], fallback: list[str]) -> list[str]:
+        if len(arms) == 0:
+            return fallback
+        lines = []
+        for i, (tag, arm) in enumerate(arms):
+            keyword = 'if' if i == 0 else 'elif'
+            lines.append(f'{keyword} {var} == {tag}:')
+            lines += [indent(line) for line in arm]
+        lines.append('else:')
+        lines += [indent(line) for line in fallback]
+        return lines
+
+    def add_module(self, module: RustModule) -> None:
+        """Renders the decoder for a module's message"""
+        struct = module.base_struct
+        struct._fix_all_duplicates()
+        if struct.scans_optional_ies():
+            lines = self._message_lines(struct)
+        else:
+            # messages without layer 3 IEs, i.e. the ones behind a security
+            # header, are read like any other struct
+            assert all(field.layer3_wrapper is None for field in struct.fields)
+            lines = self._struct_lines(struct)
+        lines.append(self._return_line(struct.fields))
+        self.messages[struct.name] = f'''\
+def _decode_{struct.name}(data, pos, end):
+{indent('\n'.join(lines))}'''
+        columns = self.fixed_columns(struct, module.pyobj[0].get_bl())
+        if len(columns):
+            self.columns[struct.name] = columns
+
+    def fixed_columns(self, struct: RustStruct, header_bits: int) -> list[Column]:
+        """Returns the fields at the same position in every message of a
+        type, i.e. those in its leading type 1 and type 3 IEs or plain
+        values, up until the first IE whose length depends on the message
+        """
+        if struct.scans_optional_ies():
+            fields, _ = struct._split_optional_fields()
+        else:
+            fields = struct.fields
+        columns = []
+        offset = header_bits
+        for field in fields:
+            offset += field.bit_padding or 0
+            wrapper = field.layer3_wrapper
+            if wrapper is None:
+                bits = self._fixed_field_bits(field)
+            elif wrapper.type == Layer3Type.Type1V:
+                bits = 4
+            elif wrapper.type == Layer3Type.Type3V:
+                bits = field.bit_length
+            else:
+                break
+            if bits is None:
+                break
+            columns += self._value_columns(field.name, field, offset, bits)
+            offset += bits
+        return columns
+
+    def _value_columns(self, name: str, field: RustStructField, offset: int, bits: int) -> list[Column]:
+        if field.name.startswith('spare'):
+            return []
+        if isinstance(field.type, RustEnum):
+            return [Column(name, offset, field.type.bit_length, self.enum_table(field.type))]
+        if field.type == RustPrimitiveType.VecU8:
+            if offset % 8 or bits % 8:
+                return []
+            return [Column(name, offset, bits, is_bytes=True)]
+        if isinstance(field.type, RustPrimitiveType):
+            if field.layer3_wrapper is not None and field.layer3_wrapper.type == Layer3Type.Type3V:
+                bits = PRIMITIVE_BITS[field.type]
+            return [Column(name, offset, bits)]
+        if isinstance(field.type, RustStruct) and self.fixed_bits(field.type) is not None:
+            field.type._fix_all_duplicates()
+            columns = []
+            for subfield in field.type.fields:
+                offset += subfield.bit_padding or 0
+                subfield_bits = self._fixed_field_bits(subfield)
+                assert subfield_bits is not None
+                columns += self._value_columns(f'{name}.{subfield.name}', subfield, offset, subfield_bits)
+                offset += subfield_bits
+            return columns
+        return []
+
+    def add_dispatch(self, dispatch: 'RustDispatch') -> None:
+        """Adds a protocol's message type table, which decode() looks
+        message decoders up in
+        """
+        self.dispatches.append(dispatch)
+
+    def _dispatch_table(self, dispatch: 'RustDispatch') -> str:
+        items = []
+        for entry in dispatch.entries:
+            if any(name not in self.messages for name in entry.message_names()):
+                continue
+            uplink = f"('{entry.uplink}', _decode_{entry.uplink})"
+            if entry.is_overloaded():
+                downlink = f"('{entry.downlink}', _decode_{entry.downlink})"
+                items.append(f'{entry.type_id}: ({uplink}, {downlink}),')
+            else:
+                items.append(f'{entry.type_id}: ({uplink},) * 2,')
+        return f'''\
+_{dispatch.protocol}_TYPES = {{
+{indent('\n'.join(items))}
+}}'''
+
+    def _column_headers(self) -> Dict[str, str]:
+        """Returns the header bytes each message type with columns must
+        have, as (index, mask, allowed values) checks
+        """
+        headers = {
+            # security protected messages have a security header of 1 to 4
+            'EMMSecProtNASMessage': '((0, 0xf, (7,)), (0, 0xf0, (0x10, 0x20, 0x30, 0x40)))',
+            'EMMServiceRequest': '((0, 0xff, (0xc7,)),)',
+        }
+        for dispatch in self.dispatches:
+            for entry in dispatch.entries:
+                for name in entry.message_names():
+                    if dispatch.protocol == 'EMM':
+                        headers[name] = f'((0, 0xff, (0x7,)), (1, 0xff, ({entry.type_id},)))'
+                    else:
+                        headers[name] = f'((0, 0xf, (2,)), (2, 0xff, ({entry.type_id},)))'
+        return headers
+
+    def _columns_table(self) -> str:
+        headers = self._column_headers()
+        items = []
+        for name, columns in self.columns.items():
+            if name not in headers:
+                continue
+            items.append(f'''\
+{name!r}: ({headers[name]}, (
+{indent('\n'.join(column.to_python() for column in columns))}
+)),''')
+        return f'''\
+# each message type's header checks and fixed position fields, as
+# (name, bit offset, bits, enum variant names, is bytes)
+COLUMNS = {{
+{indent('\n'.join(items))}
+}}'''
+
+    def to_python(self) -> str:
+        definitions = list(self.definitions.values()) + list(self.messages.values())
+        tables = [self._dispatch_table(dispatch) for dispatch in self.dispatches]
+        enums = ''.join(f'\n    {name!r}: {identifier},' for name, identifier in sorted(self.enum_tables.items()))
+        return f'''\
+"""Autogenerated NAS message decoders, do not modify directly! Any changes
+should be made via the python generator scripts.
+
+decode() returns a message's type name along with a dict of its fields,
+keyed the same way as the Rust parser's fields. Layer 3 IEs hold their value
+directly, or None if they're absent, enums hold their variant name, and
+buffers hold bytes. IEs the Rust parser can't read are left as raw bytes.
+"""
+
+UPLINK = 'uplink'
+DOWNLINK = 'downlink'
+
+
+class DecodeError(ValueError):
+    """Raised when a payload isn't a NAS message we can decode"""
+
+
+def _skip_ie(data, pos, end, tag):
+    # skips over an optional IE which the message doesn't declare, working
+    # out its format from the tag as described in 3GPP TS 24.007. returns -1
+    # if the IE was truncated, in which case there's nothing sensible left
+    # to read
+    if tag & 0x80:
+        return pos + 1
+    if tag & 0xf0 == 0x70:
+        if pos + 3 > end:
+            return -1
+        pos += 3 + int.from_bytes(data[pos + 1:pos + 3], 'big')
+    else:
+        if pos + 2 > end:
+            return -1
+        pos += 2 + data[pos + 1]
+    return pos if pos <= end else -1
+
+
+{'\n\n\n'.join(definitions)}
+
+
+# each enum's variant names by value, by the name of the Rust enum. values
+# without a variant are decoded as 'Other'
+ENUMS = {{{enums}
+}}
+
+{'\n\n'.join(tables)}
+
+{self._columns_table()}
+
+
+def _decode_typed(protocol, types, msg_type, data, pos, direction):
+    try:
+        uplink, downlink = types[msg_type]
+    except KeyError:
+        raise DecodeError(f'unknown {{protocol}} message type {{msg_type}}') from None
+    if direction == DOWNLINK:
+        name, decoder = downlink
+    elif direction == UPLINK or uplink is downlink:
+        name, decoder = uplink
+    else:
+        # without a hint, try the uplink form first, then the downlink form
+        # if that fails
+        try:
+            return uplink[0], uplink[1](data, pos, len(data))
+        except (DecodeError, IndexError):
+            name, decoder = downlink
+    return name, decoder(data, pos, len(data))
+
+
+def _decode(data, direction, null_cipher):
+    protocol = data[0] & 0xf
+    if protocol == 7:
+        sec_hdr = data[0] >> 4
+        if sec_hdr == 0:
+            return _decode_typed('EMM', _EMM_TYPES, data[1], data, 2, direction)
+        if 1 <= sec_hdr <= 4:
+            message = _decode_EMMSecProtNASMessage(data, 1, len(data))
+            message['sec_hdr'] = sec_hdr
+            message['inner'] = None
+            # the message inside is only readable if it was just integrity
+            # protected, or ciphered with the null ciphering algorithm
+            if null_cipher or sec_hdr in (1, 3):
+                try:
+                    message['inner'] = decode(message['nas_message'], direction, null_cipher)
+                except DecodeError:
+                    pass
+            return 'EMMSecProtNASMessage', message
+        if sec_hdr == 12:
+            return 'EMMServiceRequest', _decode_EMMServiceRequest(data, 1, len(data))
+        raise DecodeError(f'unknown EMM security header type {{sec_hdr}}')
+    if protocol == 2:
+        return _decode_typed('ESM', _ESM_TYPES, data[2], data, 3, direction)
+    raise DecodeError(f'unsupported NAS protocol {{protocol}}')
+
+
+def decode(data, direction=None, null_cipher=False):
+    """Decodes a NAS message, returning its type name and its fields. Some
+    types are formatted differently depending on which direction they were
+    sent in, which can be given as UPLINK or DOWNLINK. With null_cipher,
+    messages inside ciphered security protected messages are decoded too.
+    """
+    try:
+        return _decode(data, direction, null_cipher)
+    except IndexError:
+        raise DecodeError('message is truncated') from None
+
+
+class Columns:
+    """Fields read from a batch of messages of the same type, as arrays
+    with a row per message. Rows whose message was too short or of another
+    type are False in valid, and hold zeros.
+    """
+
+    def __init__(self, values, valid, labels):
+        self.values = values
+        self.valid = valid
+        # for enum fields, an array of variant names indexed by value
+        self.labels = labels
+
+    def __getitem__(self, name):
+        return self.values[name]
+
+    def variant_names(self, name):
+        """Returns an enum field's variant name for each row"""
+        return self.labels[name][self.values[name]]
+
+
+def decode_columns(name, buf, offsets):
+    """Reads the fixed position fields of a message type, i.e. those in its
+    leading type 1 and type 3 IEs, from a batch of messages of that type at
+    once. buf holds the messages back to back, with message i at
+    buf[offsets[i]:offsets[i + 1]]. Integer and enum fields are read into
+    unsigned integer columns, with each enum's variant names in the result's
+    labels, and buffers into a 2D column of bytes. Requires numpy.
+    """
+    import numpy as np
+
+    if name not in COLUMNS:
+        raise DecodeError(f'{{name}} has no fixed position fields')
+    headers, columns = COLUMNS[name]
+    buf = np.frombuffer(buf, dtype=np.uint8) if isinstance(buf, (bytes, bytearray)) else np.asarray(buf, dtype=np.uint8)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    starts = offsets[:-1]
+    if len(buf) == 0:
+        buf = np.zeros(1, dtype=np.uint8)
+    # rows which are too short read from the end of buf instead, and are
+    # zeroed once everything's been read
+    last = len(buf) - 1
+
+    def read(index):
+        return buf[np.minimum(starts + index, last)]
+
+    size = max((bit_offset + bits + 7) // 8 for _, bit_offset, bits, _, _ in columns)
+    valid = offsets[1:] - starts >= size
+    for index, mask, allowed in headers:
+        valid &= np.isin(read(index) & mask, allowed)
+
+    values = {{}}
+    labels = {{}}
+    for column, bit_offset, bits, enum, is_bytes in columns:
+        first = bit_offset // 8
+        num_bytes = (bit_offset % 8 + bits + 7) // 8
+        if is_bytes:
+            value = buf[np.minimum(starts[:, None] + np.arange(first, first + num_bytes), last)]
+        else:
+            value = np.zeros(len(starts), dtype=np.uint64)
+            for i in range(first, first + num_bytes):
+                value = (value << 8) | read(i)
+            value = (value >> -(bit_offset + bits) % 8) & ((1 << bits) - 1)
+            value = value.astype(np.min_scalar_type((1 << bits) - 1))
+        value[~valid] = 0
+        values[column] = value
+        if enum is not None:
+            labels[column] = np.array([enum.get(v, 'Other') for v in range(1 << bits)])
+    return Columns(values, valid, labels)
+'''
+
+
+def load(source: str, name: str = 'nas_decoders') -> types.ModuleType:
+    """Executes rendered decoders as a module, without writing them out"""
+    module = types.ModuleType(name)
+    exec(compile(source, f'<{name}>', 'exec'), module.__dict__)
+    return module
+
+
+class TestPythonDecoders(unittest.TestCase):
+    def test_int_expr(self):
+        assert int_expr(0, 8) == 'data[pos]'
+        assert int_expr(4, 4) == 'data[pos] & 0xf'
+        assert int_expr(0, 3) == '(data[pos] >> 5) & 0x7'
+        assert int_expr(12, 16) == "(int.from_bytes(data[pos + 1:pos + 4], 'big') >> 4) & 0xffff"
+        assert count_to_python('usize::from(*len).saturating_sub(1)') == 'max(f_len - 1, 0)'
+
+    @classmethod
+    def setUpClass(cls):
+        import main
+        from generator.dispatch import emm_dispatch, esm_dispatch
+
+        classes = main.get_emm_classes() + main.get_esm_classes()
+        cls.modules = {}
+        decoders = PythonDecoders()
+        for clazz in classes:
+            module = RustModule(clazz())
+            module.resolve_types()
+            decoders.add_module(module)
+            cls.modules[clazz.__name__] = module
+        decoders.add_dispatch(emm_dispatch())
+        decoders.add_dispatch(esm_dispatch())
+        cls.nas_decoders = load(decoders.to_python())
+
+    def test_matches_rust_tests(self):
+        import main
+        from generator.differential import json_path, lookup, matches
+        from generator.tests import RustTestCase
+
+        modules = self.modules
+        nas_decoders = self.nas_decoders
+        for case_str in main.EMM_TEST_CASES + main.ESM_TEST_CASES:
+            case = binascii.unhexlify(case_str)
+            name, message = nas_decoders.decode(case)
+            module = modules[name]
+            pyobj = module.pyobj.__class__()
+            pyobj.from_bytes(case)
+            for path, expected in RustTestCase('case', case_str, module.base_struct, pyobj).assertions:
+                # CSN.1 IEs are left as raw bytes
+                if any(isinstance(part, RustStructField) and isinstance(part.type, Csn1Struct) for part in path):
+                    continue
+                steps: list[Any] = []
+                for part in path:
+                    steps += [part.name] if isinstance(part, RustStructField) else json_path([part])
+                found, actual = lookup(message, steps)
+                if isinstance(actual, bytes):
+                    actual = list(actual)
+                assert found and matches(expected, actual), (case_str, steps, expected.to_rust(), actual)
+
+        _, message = nas_decoders.decode(binascii.unhexlify('17a1b2c3d405074300035200c2'))
+        assert message['inner'][0] == 'EMMAttachComplete'
+        with self.assertRaises(nas_decoders.DecodeError):
+            nas_decoders.decode(binascii.unhexlify('0748'))
+
+    def test_decode_columns(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest('numpy is not installed')
+        import main
+
+        nas_decoders = self.nas_decoders
+        checked = 0
+        for case_str in main.EMM_TEST_CASES + main.ESM_TEST_CASES:
+            case = binascii.unhexlify(case_str)
+            name, message = nas_decoders.decode(case)
+            if name not in nas_decoders.COLUMNS:
+                continue
+            # the message, a truncated copy, and a message of another type
+            other = binascii.unhexlify('075501' if case[:2] != b'\x07\x55' else '074401')
+            batch = [case, case[:1], other]
+            offsets = [0]
+            for payload in batch:
+                offsets.append(offsets[-1] + len(payload))
+            columns = nas_decoders.decode_columns(name, b''.join(batch), offsets)
+            assert list(columns.valid) == [True, False, False], case_str
+            for column, *_ in nas_decoders.COLUMNS[name][1]:
+                expected: Any = message
+                for step in column.split('.'):
+                    expected = expected[step]
+                values = columns[column]
+                assert not values[1:].any(), (case_str, column)
+                if column in columns.labels:
+                    assert columns.variant_names(column)[0] == expected, (case_str, column)
+                elif isinstance(expected, bytes):
+                    assert bytes(values[0]) == expected, (case_str, column)
+                else:
+                    assert values[0] == expected, (case_str, column)
+                checked += 1
+        assert checked > 10, checked
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -47,7 +47,25 @@ class Range:
         return [range_or_single(self.low, self.high)]
 
 
+def compact(values: list[int]) -> list[Range | Single]:
+    """Merges the given values into the fewest possible ranges"""
+    result: list[Range | Single] = []
+    for n in sorted(set(values)):
+        last = result[-1] if len(result) else None
+        if isinstance(last, Single) and last.n + 1 == n:
+            result[-1] = Range(last.n, n)
+        elif isinstance(last, Range) and last.high + 1 == n:
+            last.high = n
+        else:
+            result.append(Single(n))
+    return result
+
+
 class Ranger:
+    """Tracks which values of an n-bit id space haven't been claimed yet, as
+    a list of ranges
+    """
+
     def __init__(self, n_bits: int) -> None:
         self.n_bits = n_bits
         self.ranges: list[Range | Single]
@@ -86,6 +104,14 @@ class TestRanger(unittest.TestCase):
         r.remove(6)
         assert r.ranges == []
 
+    def test_compact(self):
+        def to_rust(values):
+            return ' | '.join(r.to_rust() for r in compact(values))
+        assert to_rust([]) == ''
+        assert to_rust([4]) == '4'
+        assert to_rust([3, 1, 2, 2]) == '1..=3'
+        assert to_rust([0, 1, 5, 7, 8, 9]) == '0..=1 | 5 | 7..=9'
+
     def test_zero_bits(self):
         r = Ranger(0)
         assert r.ranges == []
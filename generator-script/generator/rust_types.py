@@ -1,10 +1,12 @@
-from typing import List, Optional, cast
+from typing import List, Optional, Tuple, cast
 from pycrate_core import elt
 from pycrate_core.base import Uint, Buf, Uint8, Uint16
 from enum import StrEnum, IntEnum, auto
 
 from generator.util import indent, upper_camel_case, snake_case
+from generator.csn1 import Csn1Struct
 from generator.deku import DekuAttributes
+from generator.ranger import Range, Ranger, Single, compact
 
 
 class Layer3Type(StrEnum):
@@ -77,7 +79,7 @@ def get_layer3_wrapper(obj: elt.Envelope) -> Optional[Layer3Wrapper]:
         return None
 
 
-def derives(partial_eq=False) -> str:
+def derives(partial_eq=False, deku_read=True) -> str:
     traits = [
         'DekuRead',
         # 'DekuWrite', # TODO: implement DekuWrite for Layer3 types
@@ -85,6 +87,8 @@ def derives(partial_eq=False) -> str:
         'Serialize',
         'Clone',
     ]
+    if not deku_read:
+        traits.remove('DekuRead')
     if partial_eq:
         traits.append('PartialEq')
     return f'#[derive({', '.join(traits)})]'
@@ -132,11 +136,38 @@ class RustPrimitiveType(IntEnum):
         raise ValueError('unknown primtive type', obj)
 
 
+class RustList:
+    """A `Vec` of the repeated elements of a pycrate Sequence or Array. Its
+    length is given either as a number of elements or a number of bytes,
+    each as a Rust expression which may refer to earlier fields. With
+    neither, it consumes the rest of the input bytes.
+    """
+
+    def __init__(
+        self,
+        element: 'RustStruct',
+        count: Optional[str] = None,
+        bytes_read: Optional[str] = None,
+    ) -> None:
+        self.element = element
+        self.count = count
+        self.bytes_read = bytes_read
+
+    def is_final(self) -> bool:
+        return self.count is None and self.bytes_read is None
+
+    def rust_type_name(self) -> str:
+        return f'Vec<{self.element.name}>'
+
+    def is_big_endian(self) -> bool:
+        return False
+
+
 class RustStructField:
     def __init__(
         self,
         name: str,
-        type: 'Optional[RustPrimitiveType | RustStruct | RustEnum]',
+        type: 'Optional[RustPrimitiveType | RustStruct | RustEnum | RustList | Csn1Struct]',
         layer3_wrapper: Optional[Layer3Wrapper],
         bit_length: Optional[int],
         bit_padding: Optional[int],
@@ -151,11 +182,19 @@ class RustStructField:
         # bytes remain
         self.is_optional = False
 
-        # some structs have a `Vec<u8>` that should consume the rest of the
-        # input bytes
+        # some structs have a `Vec<u8>` (or a list) that should consume the
+        # rest of the input bytes
         self.is_final_buf = False
 
-    def _deku_attrs(self) -> str:
+        # for buffers whose size is given by an earlier field, a Rust
+        # expression for the number of bytes to read
+        self.count: Optional[str] = None
+
+        # whether this field is a layer 3 buffer which borrows from the
+        # message's input rather than copying it
+        self.is_borrowed = False
+
+    def _deku_attrs(self) -> DekuAttributes:
         attrs = DekuAttributes()
         if self.bit_length is not None:
             attrs.set_size(self.bit_length)
@@ -163,6 +202,15 @@ class RustStructField:
             attrs.mark_as_wrapped()
             if self.layer3_wrapper.tag is not None:
                 attrs.set_tag(self.layer3_wrapper.tag)
+        if self.count is not None:
+            attrs.set_count(self.count)
+        if isinstance(self.type, RustList):
+            if self.type.count is not None:
+                attrs.set_count(self.type.count)
+            elif self.type.bytes_read is not None:
+                attrs.set_bytes_read(self.type.bytes_read)
+            else:
+                attrs.set_bytes_read('byte_size - deku::byte_offset')
         if self.type == RustPrimitiveType.VecU8:
             attrs.mark_as_buf(self.is_final_buf)
         elif isinstance(self.type, RustEnum):
@@ -170,8 +218,12 @@ class RustStructField:
         if isinstance(self.type, RustStruct):
             if self.type.is_variable_bitfield or self.type.contains_final_buf():
                 attrs.set_needs_byte_size(True)
-        elif self._is_layer3_buffer():
+        elif isinstance(self.type, Csn1Struct):
+            # CSN.1 IEs are read bit by bit from their whole buffer
             attrs.set_needs_byte_size(True)
+        elif self.is_layer3_buffer():
+            attrs.set_needs_byte_size(True)
+            attrs.set_borrowed(self.is_borrowed)
 
         if self.bit_padding is not None:
             attrs.set_bit_padding(self.bit_padding)
@@ -180,17 +232,24 @@ class RustStructField:
             attrs.set_big_endian(self.type.is_big_endian())
 
         attrs.set_is_optional(self.is_optional)
-        return attrs.to_rust()
+        return attrs
 
-    def _is_layer3_buffer(self) -> bool:
+    def is_layer3_buffer(self) -> bool:
         is_wrapped = self.layer3_wrapper is not None
         is_buf = self.type == RustPrimitiveType.VecU8
         return is_wrapped and is_buf
 
-    def to_rust(self) -> str:
+    def reader_ctx(self) -> str:
+        """The ctx value to read this layer 3 wrapped field with"""
+        return self._deku_attrs().reader_ctx()
+
+    def is_tagged(self) -> bool:
+        return self.layer3_wrapper is not None and self.layer3_wrapper.type.is_tagged()
+
+    def rust_type_name(self) -> str:
         # special case for Type4TLV<Vec<u8>>
-        if self._is_layer3_buffer():
-            type_name = 'Layer3Buffer'
+        if self.is_layer3_buffer():
+            type_name = "Layer3Slice<'a>" if self.is_borrowed else 'Layer3Buffer'
         elif self.type is None:
             type_name = '()'
         else:
@@ -200,8 +259,11 @@ class RustStructField:
             wrapper_name = str(self.layer3_wrapper.type)
             type_name = f"{wrapper_name}<{type_name}>"
 
-        deku_part = self._deku_attrs()
-        return f'{deku_part}pub {self.name}: {type_name},'
+        return type_name
+
+    def to_rust(self, deku_attrs=True) -> str:
+        deku_part = self._deku_attrs().to_rust() if deku_attrs else ''
+        return f'{deku_part}pub {self.name}: {self.rust_type_name()},'
 
 
 class RustStruct:
@@ -222,6 +284,20 @@ class RustStruct:
             self.name == 'APNAMBR',
         ])
 
+        # whether this struct's layer 3 buffers should be borrowed from the
+        # input instead of copied. only the top-level message struct reads
+        # directly from the input, so this is only ever set there.
+        self.borrow_buffers = False
+
+        # whether this is the top-level struct of a NAS message, which gets a
+        # hand-written reader for its optional IEs when possible
+        self.is_message = False
+
+        # whether this struct wraps a single pycrate element which isn't an
+        # envelope, like a list IE or an atom repeated in a list, so that its
+        # only field corresponds to the element itself
+        self.wraps_element = False
+
     @staticmethod
     def from_pycrate(
         obj: elt.Envelope,
@@ -231,6 +307,8 @@ class RustStruct:
     def add_field(self, field: RustStructField, pyobj_index: Optional[int]) -> None:
         if self.is_variable_bitfield:
             field.is_optional = True
+        if self.borrow_buffers and field.is_layer3_buffer():
+            field.is_borrowed = True
         self.fields.append(field)
         self.pyobj_indices.append(pyobj_index)
 
@@ -255,23 +333,170 @@ class RustStruct:
     def is_big_endian(self) -> bool:
         return False
 
+    def dependencies(self) -> list[str]:
+        """Returns the names of the generated types this struct refers to"""
+        dependencies = []
+        for field in self.fields:
+            if isinstance(field.type, (RustStruct, RustEnum, Csn1Struct)):
+                dependencies.append(field.type.name)
+            elif isinstance(field.type, RustList):
+                dependencies.append(field.type.element.name)
+        return dependencies
+
+    def borrows_input(self) -> bool:
+        return any(field.is_borrowed for field in self.fields)
+
     def contains_final_buf(self) -> bool:
         if len(self.fields):
             return self.fields[-1].is_final_buf
         else:
             return False
 
+    def is_self_delimiting(self) -> bool:
+        """Whether this struct can be fully parsed without being told its
+        size, which is required of list elements since they're all read
+        from the same buffer. Structs with fields we don't have a parser for
+        don't count, since we can't know where they end.
+        """
+        if self.is_variable_bitfield:
+            return False
+        for field in self.fields:
+            if field.type is None or field.is_final_buf:
+                return False
+            if isinstance(field.type, RustStruct) and not field.type.is_self_delimiting():
+                return False
+        return True
+
     def to_rust(self) -> str:
         self._fix_all_duplicates()
+        if self.scans_optional_ies():
+            return self._message_to_rust()
         deku_ctx = ''
+        lifetime = ''
         if self.is_variable_bitfield or self.contains_final_buf():
             deku_ctx = '\n#[deku(ctx = "ByteSize(byte_size): ByteSize")]'
+        elif self.borrows_input():
+            deku_ctx = '\n#[deku(ctx = "input: Borrowed<\'a>")]'
+            lifetime = "<'a>"
         return f'''\
 {derives()}{deku_ctx}
-pub struct {self.name} {{
+pub struct {self.name}{lifetime} {{
 {self._fields_to_rust()}
 }}'''
 
+    def _split_optional_fields(self) -> Tuple[list[RustStructField], list[RustStructField]]:
+        """Splits a message's fields into its leading mandatory fields, and
+        the optional (tagged) fields that follow
+        """
+        tagged = [field.is_tagged() for field in self.fields]
+        num_mandatory = tagged.index(True) if True in tagged else len(tagged)
+        return self.fields[:num_mandatory], self.fields[num_mandatory:]
+
+    def scans_optional_ies(self) -> bool:
+        """Whether this struct gets a hand-written DekuReader impl, which reads
+        the mandatory fields in order and then reads the optional IEs in a
+        single pass, dispatching each one to its field by tag. That's only
+        possible for messages whose optional IEs all come after the
+        mandatory ones, have distinct tags, and don't need any padding.
+
+        Type 1 IEs are matched on the tag byte's high nibble, but only once
+        no full tag matches, so a full tag sharing a type 1 IE's nibble
+        would shadow some of its values, and rules the scan out too.
+        """
+        if not self.is_message or self.is_variable_bitfield or self.contains_final_buf():
+            return False
+        if len(self.fields) == 0 or any(field.layer3_wrapper is None for field in self.fields):
+            return False
+        _, optional = self._split_optional_fields()
+        if any(not field.is_tagged() or field.bit_padding is not None for field in optional):
+            return False
+        byte_tags: list[int] = []
+        nibble_tags: list[int] = []
+        for field in optional:
+            assert field.layer3_wrapper is not None and field.layer3_wrapper.tag is not None
+            if field.layer3_wrapper.type == Layer3Type.Type1TV:
+                nibble_tags.append(field.layer3_wrapper.tag)
+            else:
+                byte_tags.append(field.layer3_wrapper.tag)
+        if len(set(byte_tags)) != len(byte_tags) or len(set(nibble_tags)) != len(nibble_tags):
+            return False
+        return not any(tag >> 4 in nibble_tags for tag in byte_tags)
+
+    def _message_to_rust(self) -> str:
+        lifetime = "<'a>" if self.borrows_input() else ''
+        fields = [indent(field.to_rust(deku_attrs=False)) for field in self.fields]
+        return f'''\
+{derives(deku_read=False)}
+pub struct {self.name}{lifetime} {{
+{'\n'.join(fields)}
+}}
+
+{self._reader_to_rust()}'''
+
+    def _reader_to_rust(self) -> str:
+        mandatory, optional = self._split_optional_fields()
+        lines = []
+        for field in mandatory:
+            if field.bit_padding is not None:
+                lines.append(f'reader.skip_bits({field.bit_padding})?;')
+            lines.append(
+                f'let {field.name}: {field.rust_type_name()} = '
+                f'DekuReader::from_reader_with_ctx(reader, {field.reader_ctx()})?;'
+            )
+
+        if len(optional):
+            byte_arms = []
+            nibble_arms = []
+            for field in optional:
+                assert field.layer3_wrapper is not None
+                wrapper = field.layer3_wrapper
+                lines.append(
+                    f'let mut {field.name}: {field.rust_type_name()} = '
+                    f'{wrapper.type}::absent(Tag({wrapper.tag}));'
+                )
+                arm = f'{wrapper.tag} => {field.name} = DekuReader::from_reader_with_ctx(reader, {field.reader_ctx()})?,'
+                # type 1 IEs pack their tag and value into a single byte, so
+                # they're matched on the tag byte's high nibble
+                if wrapper.type == Layer3Type.Type1TV:
+                    nibble_arms.append(arm)
+                else:
+                    byte_arms.append(arm)
+            skip_arm = '_ => if !skip_unknown_ie(reader, tag)? {\n    break;\n},'
+            if len(nibble_arms):
+                nibble_match = '\n'.join(nibble_arms + [skip_arm])
+                byte_arms.append(f'_ => match tag >> 4 {{\n{indent(nibble_match)}\n}},')
+            else:
+                byte_arms.append(skip_arm)
+            lines.append(f'''\
+// optional IEs may arrive in any order, so read each one by looking up its tag
+while let Some(tag) = peek_tag(reader)? {{
+    match tag {{
+{indent('\n'.join(byte_arms), 2)}
+    }}
+}}''')
+
+        field_names = [indent(f'{field.name},') for field in self.fields]
+        lines.append(f'''\
+Ok(Self {{
+{'\n'.join(field_names)}
+}})''')
+
+        if self.borrows_input():
+            impl_part = f"impl<'a, 'b> DekuReader<'b, Borrowed<'a>> for {self.name}<'a>"
+            ctx_part = "input: Borrowed<'a>"
+        else:
+            impl_part = f"impl<'a> DekuReader<'a> for {self.name}"
+            ctx_part = '_: ()'
+        return f'''\
+{impl_part} {{
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        {ctx_part},
+    ) -> Result<Self, DekuError> {{
+{indent('\n'.join(lines), 2)}
+    }}
+}}'''
+
     def _fields_to_rust(self) -> str:
         fields = [field.to_rust() for field in self.fields]
         return '\n'.join([indent(field) for field in fields])
@@ -285,8 +510,12 @@ class RustEnumVariant:
         self.name = upper_camel_case(name)
         self.values = [value]
 
+    def patterns(self) -> list[Range | Single]:
+        # contiguous values are merged into ranges, e.g. `1..=3 | 5`
+        return compact(self.values)
+
     def to_rust(self) -> str:
-        id_pat = ' | '.join([str(v) for v in self.values])
+        id_pat = ' | '.join([pattern.to_rust() for pattern in self.patterns()])
         return f'#[deku(id_pat = "{id_pat}")] {self.name},'
 
 
@@ -327,6 +556,26 @@ class RustEnum:
     def rust_type_name(self) -> str:
         return self.name
 
+    def other_patterns(self) -> list[Range | Single]:
+        """Returns the ids which aren't claimed by any variant, and so are
+        matched by the Other variant
+        """
+        unclaimed = Ranger(self.bit_length)
+        for variant in self.variants:
+            for value in variant.values:
+                unclaimed.remove(value)
+        return unclaimed.ranges
+
+    def pattern_counts(self) -> Tuple[int, int, int]:
+        """Returns how many alternatives this enum's variants' id patterns
+        would have with every value listed separately, how many they actually
+        have once they're merged into ranges, and how many the Other variant
+        spells out, where 0 means it's just `_`
+        """
+        before = sum(len(variant.values) for variant in self.variants)
+        after = sum(len(variant.patterns()) for variant in self.variants)
+        return before, after, len(self.other_patterns())
+
     def to_rust(self) -> str:
         deku_attrs = [
             f'id_type = "{self.type.rust_type_name()}"',
@@ -338,7 +587,11 @@ class RustEnum:
         # until https://github.com/sharksforarms/deku/issues/533 is fixed
         # other_type_part = f'#[deku(bits = {self.bit_length})] {self.type.rust_type_name()}'
         # other_variant = f'#[deku(id_pat = "_")] Other({other_type_part}),'
-        other_variant = '#[deku(id_pat = "_")] Other,'
+        # spelling out the ids Other matches, rather than using `_`, gives
+        # rustc a complete picture of the id space. if the variants already
+        # cover every id, Other is unreachable but still needs a pattern.
+        other_pat = ' | '.join([pattern.to_rust() for pattern in self.other_patterns()])
+        other_variant = f'#[deku(id_pat = "{other_pat or "_"}")] Other,'
         return f'''\
 {derives(partial_eq=True)}
 #[deku({', '.join(deku_attrs)})]
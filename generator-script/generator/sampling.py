@@ -0,0 +1,158 @@
+import heapq
+import unittest
+from typing import Dict, Tuple
+
+from pycrate_core import elt
+
+from generator.rust_types import get_layer3_wrapper
+
+# a sample's rank, ordered so that the best sample is the greatest: the
+# number of IE tags it has, then its length, then its bytes to break ties
+SampleKey = Tuple[int, int, bytes]
+
+
+def ie_tags(msg: elt.Envelope) -> frozenset[int]:
+    """Returns the tags of the optional IEs present in a parsed message,
+    which is a cheap signature of its structure
+    """
+    tags = set()
+    for item in msg:
+        if item.get_trans() or not isinstance(item, elt.Envelope):
+            continue
+        layer3_wrapper = get_layer3_wrapper(item)
+        if layer3_wrapper is not None and layer3_wrapper.tag is not None:
+            tags.add(layer3_wrapper.tag)
+    return frozenset(tags)
+
+
+class TopKSampler:
+    """Keeps the top k payloads of a single message type, at most one per
+    structural signature, so that every kept payload has a different set of
+    IEs. Payloads with more IEs rank higher, then longer ones. The kept
+    payloads are held in a min-heap, so the lowest ranked one can be evicted
+    in O(log k). When a signature's payload is replaced by a better one, the
+    old heap entry is left behind and skipped once it reaches the top, and
+    the heap is rebuilt once there are more than k of those, so replacing is
+    O(log k) amortized too, and memory stays O(k) no matter how many
+    payloads are offered.
+
+    Since ties are broken by the payloads' bytes, which payloads are kept
+    doesn't depend on the order they were offered in.
+    """
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self.heap: list[Tuple[SampleKey, frozenset[int]]] = []
+        # the key of the payload kept for each signature. heap entries which
+        # don't match it have been replaced
+        self.keys: Dict[frozenset[int], SampleKey] = {}
+        # how many replaced entries are still in the heap
+        self.stale = 0
+        # how many payloads were offered to the sampler
+        self.seen = 0
+
+    def add(self, payload: bytes, tags: frozenset[int]) -> None:
+        self.seen += 1
+        self._offer((len(tags), len(payload), payload), tags)
+
+    def _offer(self, key: SampleKey, tags: frozenset[int]) -> None:
+        existing = self.keys.get(tags)
+        if existing is not None:
+            # only the best payload with a given signature is kept
+            if key > existing:
+                heapq.heappush(self.heap, (key, tags))
+                self.keys[tags] = key
+                self.stale += 1
+                if self.stale > self.k:
+                    self.heap = [(key, tags) for tags, key in self.keys.items()]
+                    heapq.heapify(self.heap)
+                    self.stale = 0
+            return
+        if len(self.keys) >= self.k:
+            self._drop_stale()
+            if key <= self.heap[0][0]:
+                return
+            _, evicted = heapq.heapreplace(self.heap, (key, tags))
+            del self.keys[evicted]
+        else:
+            heapq.heappush(self.heap, (key, tags))
+        self.keys[tags] = key
+
+    def _drop_stale(self) -> None:
+        """Pops replaced entries off the top of the heap, so that its top is
+        the lowest ranked payload which is still kept
+        """
+        while self.keys[self.heap[0][1]] != self.heap[0][0]:
+            heapq.heappop(self.heap)
+            self.stale -= 1
+
+    def merge(self, other: 'TopKSampler') -> None:
+        for tags, key in other.keys.items():
+            self._offer(key, tags)
+        self.seen += other.seen
+
+    def samples(self) -> list[bytes]:
+        """Returns the kept payloads, best first"""
+        return [key[2] for key in sorted(self.keys.values(), reverse=True)]
+
+
+class TestSampling(unittest.TestCase):
+    def test_ie_tags(self):
+        from generator.coverage import parse_nas_message
+
+        tau = bytes.fromhex('0748610bf602f8108003c8c2e65e9a5804e060c0405202f810c4c25c0a00570220003103e5e0341302f810040511035758a65d0100c1')
+        msg = parse_nas_message(tau)
+        assert {0x58, 0x52, 0x5c, 0x57, 0x31, 0x13} <= ie_tags(msg)
+        assert ie_tags(parse_nas_message(bytes.fromhex('075501'))) == frozenset()
+
+    def test_top_k(self):
+        sampler = TopKSampler(2)
+        sampler.add(b'\x01', frozenset())
+        sampler.add(b'\x01\x02', frozenset())
+        sampler.add(b'\x03', frozenset([1]))
+        # the longer payload replaces the other with the same signature
+        assert sampler.samples() == [b'\x03', b'\x01\x02']
+        sampler.add(b'\x04\x05', frozenset([1, 2]))
+        # which evicts the payload without any IEs
+        assert sampler.samples() == [b'\x04\x05', b'\x03']
+        sampler.add(b'\x06', frozenset())
+        assert sampler.samples() == [b'\x04\x05', b'\x03']
+        sampler.add(b'\x07\x08', frozenset([1]))
+        assert sampler.samples() == [b'\x04\x05', b'\x07\x08']
+        assert sampler.keys == {frozenset([1, 2]): (2, 2, b'\x04\x05'), frozenset([1]): (1, 2, b'\x07\x08')}
+        assert sampler.seen == 6
+
+    def test_stale_entries(self):
+        sampler = TopKSampler(2)
+        sampler.add(b'\x01', frozenset())
+        sampler.add(b'\x02', frozenset([1]))
+        for i in range(2, 10):
+            # each replaces the last payload without any IEs
+            sampler.add(bytes(i), frozenset())
+        assert sampler.samples() == [b'\x02', bytes(9)]
+        # the replaced entries never pile up past k
+        assert sampler.stale <= sampler.k
+        assert len(sampler.heap) <= 2 * sampler.k + 1
+        # so evicting still evicts the lowest ranked payload which is kept
+        sampler.add(b'\x03\x04', frozenset([1, 2]))
+        assert sampler.samples() == [b'\x03\x04', b'\x02']
+        assert len(sampler.keys) == 2
+
+    def test_merge_order(self):
+        payloads = [(bytes([i % 7]) * (i % 5 + 1), frozenset(range(i % 4))) for i in range(40)]
+        forwards = TopKSampler(3)
+        backwards = TopKSampler(3)
+        for payload, tags in payloads:
+            forwards.add(payload, tags)
+        other = TopKSampler(3)
+        for payload, tags in reversed(payloads[:20]):
+            backwards.add(payload, tags)
+        for payload, tags in reversed(payloads[20:]):
+            other.add(payload, tags)
+        backwards.merge(other)
+        assert forwards.samples() == backwards.samples()
+        assert backwards.seen == 40
+
+
+if __name__ == "__main__":
+    unittest.main()
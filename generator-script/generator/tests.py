@@ -1,8 +1,8 @@
-from enum import IntEnum, auto
-from typing import Tuple
+from typing import Any, Tuple, Union
 from pycrate_core import elt
 
-from generator.rust_types import RustStruct, RustEnum, RustPrimitiveType, RustStructField, get_layer3_wrapper
+from generator.csn1 import Csn1Bits, Csn1Enum, Csn1Optional, Csn1Repeated, Csn1Struct, Csn1Type
+from generator.rust_types import RustStruct, RustEnum, RustList, RustPrimitiveType, RustStructField, get_layer3_wrapper
 from generator.util import indent
 
 
@@ -51,9 +51,52 @@ class RustTestCaseValue:
             return f'{self.value}'
 
 
-class NASType(IntEnum):
-    EMM = auto()
-    ESM = auto()
+class RustListAccess:
+    """Stands in for a field in an assertion's path, accessing a list field
+    by index or taking its length
+    """
+
+    def __init__(self, field: RustStructField, index: int | None = None) -> None:
+        if index is None:
+            self.name = f'{field.name}.len()'
+        else:
+            self.name = f'{field.name}[{index}]'
+
+
+class RustTestCasePattern:
+    """A pattern the left-hand side of an assertion should match, for values
+    which can't be compared with assert_eq!(), like an absent Option or the
+    variant of an enum with fields
+    """
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+
+    def to_rust(self) -> str:
+        return self.pattern
+
+
+class RustValueAccess:
+    """Stands in for part of an assertion's path which isn't a struct
+    field, given as the Rust expression which accesses it, e.g. a CSN.1
+    field unwrapped from its Option
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+AssertionPath = list[Union[RustStructField, RustListAccess, RustValueAccess]]
+Assertion = Tuple[AssertionPath, Union[RustTestCaseValue, RustTestCasePattern]]
+
+
+def unwrap(access: str, csn1_type: Csn1Type) -> str:
+    """Returns a Rust expression unwrapping an Option holding a CSN.1 value.
+    Integers are copied out, and anything else is borrowed.
+    """
+    if isinstance(csn1_type, Csn1Bits):
+        return f'{access}.unwrap()'
+    return f'{access}.as_ref().unwrap()'
 
 
 class RustTestCase:
@@ -74,21 +117,22 @@ class RustTestCase:
         self.name = name
         self.struct = struct
         type_name = pyobj.__class__.__name__
-        if type_name.startswith('EMM'):
-            self.nas_type = NASType.EMM
-        elif type_name.startswith('ESM'):
-            self.nas_type = NASType.ESM
-        else:
+        if not type_name.startswith(('EMM', 'ESM')):
             raise ValueError(f'unknown test object type {type_name}')
+        # the NAS header is two bytes for EMM, three for ESM, and one for
+        # security headers
+        self.header_length = pyobj[0].get_len()
         self.assertions = self._build_assertions([], struct, pyobj)
 
     def _build_assertions(
         self,
-        ancestors: list[RustStructField],
+        ancestors: AssertionPath,
         struct: RustStruct,
-        pyobj: elt.Envelope,
-    ) -> list[Tuple[list[RustStructField], RustTestCaseValue]]:
-        assertions = []
+        pyobj: elt.Element,
+    ) -> list[Assertion]:
+        assertions: list[Assertion] = []
+        # a wrapper struct's only field is the element itself
+        items = [pyobj] if struct.wraps_element else pyobj
         for i in range(len(struct.fields)):
             field = struct.fields[i]
             # skip values we don't have a parser for, as well as spare bits
@@ -100,7 +144,7 @@ class RustTestCase:
             pyobj_index = struct.pyobj_indices[i]
             if pyobj_index is None:
                 continue
-            item = pyobj[pyobj_index]
+            item = items[pyobj_index]
 
             # if a value doesn't appear in the payload, pycrate sets its
             # "transparency" flag. skip these since our rust object won't have
@@ -120,25 +164,107 @@ class RustTestCase:
             # if we're on a literal value like a number, buffer, or enum,
             # simply add the assertion
             if isinstance(field.type, (RustPrimitiveType, RustEnum)):
+                value = item.get_val()
+                # pycrate decodes some buffers further depending on the value
+                # of other fields (e.g. PCO contents by their protocol id), but
+                # we read them as raw bytes
+                if field.type == RustPrimitiveType.VecU8 and not isinstance(value, bytes):
+                    value = item.to_bytes()
                 assertions.append(
-                    (fields, RustTestCaseValue(field.type, item.get_val()))
+                    (fields, RustTestCaseValue(field.type, value))
                 )
+            elif isinstance(field.type, RustList):
+                # check that we read as many elements as pycrate did, then
+                # check each one
+                assertions.append((
+                    ancestors + [RustListAccess(field)],
+                    RustTestCaseValue(RustPrimitiveType.U32, item.get_num()),
+                ))
+                for j, element in enumerate(item):
+                    assertions += self._build_assertions(
+                        ancestors + [RustListAccess(field, j)],
+                        field.type.element,
+                        element,
+                    )
+            elif isinstance(field.type, Csn1Struct):
+                # pycrate leaves the IE as a buffer if it fails to decode it
+                if not isinstance(item.get_val(), list):
+                    print(f'unexpected undecoded CSN.1 value for field {field.name}: {item}')
+                    continue
+                assertions += self._build_csn1_assertions(fields, '', field.type, item.get_val())
             else:
                 # seems that when pycrate fails to parse a struct, it'll leave the
                 # value as a buffer. skip this field
-                if not isinstance(item, elt.Envelope):
+                if not isinstance(item, elt.Envelope) and not field.type.wraps_element:
                     print(f'unexpected non-envelope for field {field.name}: {item}')
                     continue
                 assertions += self._build_assertions(fields, field.type, item)
 
         return assertions
 
+    def _build_csn1_assertions(
+        self,
+        ancestors: AssertionPath,
+        access: str,
+        csn1_type: Csn1Type,
+        value: Any,
+    ) -> list[Assertion]:
+        """Builds assertions for a CSN.1 value, where access is the Rust
+        expression accessing it from within its IE. pycrate's values for
+        CSN.1 lists are lists holding each of their values in turn, which
+        stop early if the list was truncated.
+        """
+        path: AssertionPath = ancestors + [RustValueAccess(access)]
+        if isinstance(csn1_type, Csn1Bits):
+            # bit strings are kept as strings of 0s and 1s
+            if isinstance(value, str):
+                value = int(value, 2)
+            return [(path, RustTestCaseValue(RustPrimitiveType[csn1_type.rust_type_name().upper()], value))]
+        elif isinstance(csn1_type, Csn1Repeated):
+            assertions: list[Assertion] = [(
+                ancestors + [RustValueAccess(f'{access}.len()')],
+                RustTestCaseValue(RustPrimitiveType.U32, len(value)),
+            )]
+            for i, element in enumerate(value):
+                assertions += self._build_csn1_assertions(ancestors, f'{access}[{i}]', csn1_type.element, element)
+            return assertions
+        elif isinstance(csn1_type, Csn1Optional):
+            # alternatives' values start with their key
+            if value[0] != csn1_type.key:
+                return [(path, RustTestCasePattern('None'))]
+            inner_value = value[1] if csn1_type.holds_single_value else value[1:]
+            return self._build_csn1_assertions(ancestors, unwrap(access, csn1_type.inner), csn1_type.inner, inner_value)
+        elif isinstance(csn1_type, Csn1Enum):
+            variant = [variant for variant in csn1_type.variants if variant.key == value[0]][0]
+            return [(path, RustTestCasePattern(f'{csn1_type.name}::{variant.name} {{ .. }}'))]
+
+        assertions = []
+        for field in csn1_type.typed_fields():
+            assert field.type is not None
+            if field.name.startswith('spare'):
+                continue
+            field_access = f'{access}.{field.name}' if access else field.name
+            if field.index >= len(value):
+                # the rest of a truncated list's fields should be absent
+                if csn1_type.truncates:
+                    assertions.append((ancestors + [RustValueAccess(field_access)], RustTestCasePattern('None')))
+                continue
+            if csn1_type.truncates:
+                field_access = unwrap(field_access, field.type)
+            assertions += self._build_csn1_assertions(ancestors, field_access, field.type, value[field.index])
+        return assertions
+
     def _assertions_to_rust(self, ident_name: str) -> str:
         lines = []
         unwrapped_layer3_idents = []
         for (fields, value) in self.assertions:
-            # every root field should be in a layer 3 container
-            assert fields[0].layer3_wrapper is not None
+            assert isinstance(fields[0], RustStructField)
+            # values following a security header aren't in layer 3
+            # containers, and are compared directly
+            if fields[0].layer3_wrapper is None:
+                fields = [RustValueAccess(f'{ident_name}.{fields[0].name}')] + fields[1:]
+                lines.append(self._assertion_to_rust('.'.join(field.name for field in fields), value))
+                continue
 
             # if this is the first assertion referencing the topmost field,
             # pull it out since fetching the inner value in every line gets
@@ -158,24 +284,41 @@ class RustTestCase:
 
             subfield_names = [field.name for field in fields[1:]]
             lhs = '.'.join([layer3_ident] + subfield_names)
-            rhs = value.to_rust()
-            lines.append(f'assert_eq!({lhs}, {rhs});')
+            lines.append(self._assertion_to_rust(lhs, value))
         return '\n'.join(lines)
 
+    def _assertion_to_rust(self, lhs: str, value: RustTestCaseValue | RustTestCasePattern) -> str:
+        rhs = value.to_rust()
+        if isinstance(value, RustTestCasePattern):
+            return f'assert!(matches!({lhs}, {rhs}));'
+        return f'assert_eq!({lhs}, {rhs});'
+
     def to_rust(self) -> str:
         """Generates the unit test function, to be held within a #[cfg(test)]
         module.
         """
 
         ident_name = 'msg'
-        # skip the NAS header (two bytes for EMM, three for ESM)
-        bytes_to_skip = 2 if self.nas_type == NASType.EMM else 3
-        test_case_bytes = self._input_hexstring[bytes_to_skip * 2:]
+        test_case_bytes = self._input_hexstring[self.header_length * 2:]
+        if self.struct.borrows_input():
+            # borrowed buffers are sliced out of the input, so it has to
+            # outlive the parsed message
+            parse_part = f'''let input = unhexlify("{test_case_bytes}");
+    let mut bytes = Cursor::new(input.as_slice());
+    let mut reader = Reader::new(&mut bytes);
+    let {ident_name} = {self.struct.name}::from_reader_with_ctx(&mut reader, Borrowed(input.as_slice()))'''
+        else:
+            # messages ending in a buffer read the rest of their input, so
+            # they're told how long it is
+            ctx = '()'
+            if self.struct.contains_final_buf():
+                ctx = f'ByteSize({len(test_case_bytes) // 2})'
+            parse_part = f'''let mut bytes = Cursor::new(unhexlify("{test_case_bytes}"));
+    let mut reader = Reader::new(&mut bytes);
+    let {ident_name} = {self.struct.name}::from_reader_with_ctx(&mut reader, {ctx})'''
         return indent(f'''#[test]
 fn test_{self.name}() {{
-    let mut bytes = Cursor::new(unhexlify("{test_case_bytes}"));
-    let mut reader = Reader::new(&mut bytes);
-    let {ident_name} = {self.struct.name}::from_reader_with_ctx(&mut reader, ())
+    {parse_part}
         .expect("failed to parse");
 {indent(self._assertions_to_rust(ident_name))}
 }}''')
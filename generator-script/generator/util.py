@@ -1,3 +1,7 @@
+import hashlib
+import os
+import tempfile
+
 from generator.namer import Name
 
 
@@ -12,11 +16,39 @@ def upper_camel_case(s: str) -> str:
     """Returns an upper-camel-cased version of the input, e.g.:
         upper_camel_case("foo bar (baz)") -> "FooBarBaz"
     """
-    return Name(s).cc()
+    return Name.camel_case(s)
 
 
 def snake_case(s: str) -> str:
     """Returns a lower-snake-cased version of the input, e.g.:
         snake_case("FooBar (baz)") -> "foo_bar_baz
     """
-    return Name(s).sc()
+    return Name.snake_case(s)
+
+
+def file_digest(filepath: str) -> bytes:
+    """Returns the sha256 digest of a file's contents"""
+    with open(filepath, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').digest()
+
+
+def write_if_changed(filepath: str, text: str) -> bool:
+    """Writes text to filepath, unless the file already holds exactly that
+    text. Writes go through a temporary file which is renamed into place, so
+    a partially written file is never observed. Returns whether the file was
+    written.
+    """
+    content = text.encode()
+    if os.path.exists(filepath):
+        if file_digest(filepath) == hashlib.sha256(content).digest():
+            return False
+    dirname = os.path.dirname(filepath) or '.'
+    with tempfile.NamedTemporaryFile(dir=dirname, delete=False) as f:
+        f.write(content)
+    # temporary files are created as 0600, so give the real file the same
+    # permissions open() would have
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(f.name, 0o666 & ~umask)
+    os.replace(f.name, filepath)
+    return True
@@ -0,0 +1,71 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+
+# modules which take long enough to import that main.py should only import
+# them once they're actually needed
+HEAVY_MODULES = [
+    'inflect',
+    'pycrate_csn1',
+    'pycrate_mobile',
+    'scapy',
+]
+
+
+def measure_import_time(module: str = 'main') -> dict[str, int]:
+    """Imports the given module in a fresh interpreter with `-X importtime`,
+    returning the cumulative import time in microseconds of every module it
+    pulled in
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative_us, name = line.split('|')
+        if not cumulative_us.strip().isdigit():
+            # the column header line
+            continue
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+def heavy_imports(times: dict[str, int]) -> list[str]:
+    return [
+        name for name in times
+        if name.split('.')[0] in HEAVY_MODULES
+    ]
+
+
+class TestImportTime(unittest.TestCase):
+    def test_no_heavy_imports(self):
+        # a generation-only run shouldn't pay for scapy, pycrate_mobile, or
+        # inflect just to start up
+        assert heavy_imports(measure_import_time('main')) == []
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Records the startup cost of importing main.py")
+    parser.add_argument('--json', help='write the per-module import times to this file')
+    args = parser.parse_args()
+    times = measure_import_time('main')
+    print(f"importing main took {times['main'] / 1000:.1f}ms")
+    heaviest = sorted(times.items(), key=lambda item: item[1], reverse=True)[1:11]
+    for name, cumulative_us in heaviest:
+        print(f'  {cumulative_us / 1000:8.1f}ms  {name}')
+    heavy = heavy_imports(times)
+    if heavy:
+        print(f'warning: main imported heavy modules at startup: {", ".join(heavy)}')
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump({'total_us': times['main'], 'modules_us': times}, f, indent=2)
@@ -1,95 +1,406 @@
+import argparse
+import hashlib
 import os
-from typing import Tuple, Dict, Optional
-from scapy.utils import rdpcap
-from pycrate_mobile import NASLTE
-from pycrate_core import elt
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Tuple, Dict, Optional
 
-from generator.modules import generate_module
+from generator.benches import RustBenchSuite
+from generator.coverage import CoveragePool, message_features, parse_nas_message
+from generator.dispatch import emm_dispatch, esm_dispatch
+from generator.ir import dump_indices, export_modules, load_indices, read_ir, write_ir
+from generator.modules import RustModuleIndex, render_modules, generate_modules
+from generator.parse_cache import ParseCache, Direction, cache_filepath, default_cache_dir
+from generator.pcap import iter_nas_payloads
+from generator.python_decoders import PythonDecoders
+from generator.sampling import TopKSampler, ie_tags
+from generator.util import write_if_changed
 
 
-def parse_nas_packet(data: bytes) -> elt.Envelope:
-    parsed = NASLTE.parse_NASLTE_MO(data)
-    if parsed[0] is None:
-        parsed = NASLTE.parse_NASLTE_MT(data)
-    if parsed[0] is None:  # Not a NAS Packet
+def parse_nas_packet(data: bytes, cache: ParseCache) -> str:
+    """Returns the pycrate type name of a NAS packet"""
+    type_name, _ = cache.parse(data, Direction.MO)
+    if type_name is None:
+        type_name, _ = cache.parse(data, Direction.MT)
+    if type_name is None:  # Not a NAS Packet
         raise TypeError("Not a nas packet")
-    return parsed[0]
+    return type_name
 
 
-GSMTAP_HDR_START = 28
-GSMTAP_HDR_END = GSMTAP_HDR_START + 16
-GSMTAP_TYPE_NAS = 18
+EMM_TEST_CASES = [
+    '075501', # EMM IMSI identity request
+    '0748610bf602f8108003c8c2e65e9a5804e060c0405202f810c4c25c0a00570220003103e5e0341302f810040511035758a65d0100c1', # EMM TAU Request
+    '075e23093395684292874145f0', # EMM SMCompl
+    '074300035200c2', # EMM Attach Complete
+    '0742014906201301846b0100b25201c101051703696d73066d6e63343830066d6363333131046770727309020000000016f6a0df5e02b5b5583327838080211003000010810600000000830600000000000110200148880002713a00a0010400000071000110200148880004fe0000b0010400000259000110200148880004fe0000b0010400000205000310200148880016ff0001e1000d00000000000310200148880017ff0001e4000d00000000001002059400050102ff000413018405500bf6130184fa6aaec191ee7d5302172c3404030019f16401036603aabbcc', # EMM Attach Accept with a UE radio capability ID
+    '0742014906201301846b0100030202d9172c9353162a020102c1790003010203500bf6130184fa6aaec191ee7d', # EMM Attach Accept with its optional IEs out of order, and unknown IEs
+    '074c6005f4c2e65e9a57022000', # EMM Ext Serv Request
+    '074a', # EMM TAU Complete
+    '07632009011d00010007913386094000f01101830a816000000000000005d4f29cae00', # EMM NAS transport + SMS CP-DATA
+    '0745630bf602f8108003c8c2e65e9a', # EMM Detach Request MO
+    '074d707800040200e86f6703091011570233c9d1', # EMM CP Service Request
+    '17a1b2c3d405074300035200c2', # EMM integrity protected Attach Complete
+    '27a1b2c3d40512345678', # EMM integrity protected and ciphered message
+    'c70a1b2c', # EMM Service Request
+]
+ESM_TEST_CASES = [
+    '0202d9', # ESM Info Req
+    '0202da2807066f72616e6765', # ESM Info Resp
+]
 
+# message types which are also generated with borrowed buffers into their own
+# standalone module, so that the borrowed readers get compiled and tested. the
+# rest of the parser copies its buffers, since NASMessage can't hold messages
+# which borrow from their input
+BORROWED_EXAMPLES = ['EMMAttachAccept']
 
-def get_test_cases(pcap_dir_filepath: str) -> Tuple[list[str], list[str]]:
-    types_to_skip = [
-        'EMMServiceRequest',
-        'EMMSecProtNASMessage',
-    ]
-    longest_testcase: Dict[str, str] = {}
-    for entry in os.scandir(pcap_dir_filepath):
-        with open(entry.path, 'rb') as f:
-            pcap_file = rdpcap(f)
-            for i, packet in enumerate(pcap_file):
-                gsmtap_hdr = packet.load[GSMTAP_HDR_START:GSMTAP_HDR_END]
-                gsmtap_type = gsmtap_hdr[2]
-                packet_data = packet.load[GSMTAP_HDR_END:]
-                packet_data_str = packet_data.hex()
-                if gsmtap_type == GSMTAP_TYPE_NAS:
-                    try:
-                        packet = parse_nas_packet(packet_data)
-                        type_name = packet.__class__.__name__
-                        existing_testcase = longest_testcase.get(type_name, '')
-                        if len(existing_testcase) < len(packet_data_str):
-                            longest_testcase[type_name] = packet_data_str
-                    except TypeError as e:
-                        print(f"err on packet {i}: {e}")
+
+def get_emm_classes() -> list:
+    from pycrate_mobile import NASLTE
+    emm_classes = list(NASLTE.EMMTypeMOClasses.values())
+    # add in the MT versions of types which are overloaded by direction, i.e.
+    # DetachRequest
+    for clazz in NASLTE.EMMTypeMTClasses.values():
+        if clazz not in emm_classes:
+            emm_classes.append(clazz)
+    # security protected messages and service requests are identified by
+    # their security header rather than a message type
+    emm_classes += [NASLTE.EMMSecProtNASMessage, NASLTE.EMMServiceRequest]
+    return emm_classes
+
+
+def get_esm_classes() -> list:
+    from pycrate_mobile import NASLTE
+    return list(NASLTE.ESMTypeClasses.values())
+
+
+class HarvestResult:
+    """The longest hex payload seen for each pycrate type name, along with
+    counters describing how many packets it took to find them
+    """
+
+    # whether add() needs the parsed pycrate message rather than only its
+    # type name, which the parse cache can't provide
+    needs_message = False
+
+    def __init__(self) -> None:
+        self.longest_testcase: Dict[str, str] = {}
+        self.packets = 0
+        self.duplicates = 0
+        self.errors = 0
+
+    def add(self, type_name: str, packet_data: bytes, msg: Optional[Any] = None) -> None:
+        existing_testcase = self.longest_testcase.get(type_name, '')
+        # only hexlify payloads which will actually replace the existing one
+        if len(existing_testcase) < 2 * len(packet_data):
+            self.longest_testcase[type_name] = packet_data.hex()
+
+    def merge(self, other: 'HarvestResult') -> None:
+        """Merges another harvest's results into this one, keeping the
+        longest payload per type. On ties the existing payload wins, so
+        merging per-file results in file order gives the same result as a
+        serial run.
+        """
+        for type_name, testcase in other.longest_testcase.items():
+            existing_testcase = self.longest_testcase.get(type_name, '')
+            if len(existing_testcase) < len(testcase):
+                self.longest_testcase[type_name] = testcase
+        self.packets += other.packets
+        self.duplicates += other.duplicates
+        self.errors += other.errors
+
+    def test_cases(self) -> Dict[str, list[str]]:
+        """Returns the hex payloads selected as test cases for each pycrate
+        type name
+        """
+        return {type_name: [testcase] for type_name, testcase in self.longest_testcase.items()}
+
+    def report(self) -> None:
+        """Prints how the test cases were selected, for selections which
+        have anything to say about it
+        """
+
+
+class CoverageHarvestResult(HarvestResult):
+    """Keeps a bounded pool of candidate payloads for each pycrate type name,
+    recording which fields, enum values and IE tags each one covers, and
+    selects a small set of them which covers everything the pool does
+    """
+
+    def __init__(self, pool_size: int = 256) -> None:
+        super().__init__()
+        self.pool_size = pool_size
+        self.pools: Dict[str, CoveragePool] = {}
+
+    needs_message = True
+
+    def add(self, type_name: str, packet_data: bytes, msg: Optional[Any] = None) -> None:
+        assert msg is not None
+        pool = self.pools.setdefault(type_name, CoveragePool(self.pool_size))
+        pool.add(packet_data, message_features(msg))
+
+    def merge(self, other: 'HarvestResult') -> None:
+        assert isinstance(other, CoverageHarvestResult)
+        for type_name, pool in other.pools.items():
+            self.pools.setdefault(type_name, CoveragePool(self.pool_size)).merge(pool)
+        self.packets += other.packets
+        self.duplicates += other.duplicates
+        self.errors += other.errors
+
+    def test_cases(self) -> Dict[str, list[str]]:
+        return {
+            type_name: [payload.hex() for payload in pool.select()]
+            for type_name, pool in self.pools.items()
+        }
+
+    def report(self) -> None:
+        for type_name, pool in sorted(self.pools.items()):
+            print(f'  {pool.report(type_name)}')
+
+
+class SampledHarvestResult(HarvestResult):
+    """Keeps the top k payloads for each pycrate type name, each with a
+    different set of optional IEs, in O(k) memory per type
+    """
+
+    def __init__(self, k: int = 8) -> None:
+        super().__init__()
+        self.k = k
+        self.samplers: Dict[str, TopKSampler] = {}
+
+    needs_message = True
+
+    def add(self, type_name: str, packet_data: bytes, msg: Optional[Any] = None) -> None:
+        assert msg is not None
+        self.samplers.setdefault(type_name, TopKSampler(self.k)).add(packet_data, ie_tags(msg))
+
+    def merge(self, other: 'HarvestResult') -> None:
+        assert isinstance(other, SampledHarvestResult)
+        for type_name, sampler in other.samplers.items():
+            self.samplers.setdefault(type_name, TopKSampler(self.k)).merge(sampler)
+        self.packets += other.packets
+        self.duplicates += other.duplicates
+        self.errors += other.errors
+
+    def test_cases(self) -> Dict[str, list[str]]:
+        return {
+            type_name: [payload.hex() for payload in sampler.samples()]
+            for type_name, sampler in self.samplers.items()
+        }
+
+    def report(self) -> None:
+        for type_name, sampler in sorted(self.samplers.items()):
+            print(f'  {type_name}: kept {len(sampler.keys)} of {sampler.seen} payloads')
+
+
+def harvest_pcap(
+    pcap_filepath: str,
+    cache_filepath: Optional[str] = None,
+    new_result: Callable[[], HarvestResult] = HarvestResult,
+) -> HarvestResult:
+    """Parses every distinct NAS packet in a single pcap, collecting them
+    into a new_result(), which by default keeps the longest payload seen for
+    each pycrate type name
+    """
+    result = new_result()
+    cache = ParseCache(cache_filepath)
+    # an identical payload always parses to the same type and can never be
+    # strictly longer than itself, so there's no need to parse it twice.
+    # short digests keep the set compact on captures full of periodic TAUs
+    seen: set[bytes] = set()
+    with open(pcap_filepath, 'rb') as f:
+        # non-NAS records are filtered out by the reader before they're ever
+        # read into memory
+        for i, packet_data in enumerate(iter_nas_payloads(f)):
+            result.packets += 1
+            digest = hashlib.blake2b(packet_data, digest_size=8).digest()
+            if digest in seen:
+                result.duplicates += 1
+                continue
+            seen.add(digest)
+            try:
+                if result.needs_message:
+                    # the cache only holds type names, so parse the message
+                    # once and take its type name from it, rather than
+                    # looking it up and then parsing it again
+                    msg = parse_nas_message(packet_data)
+                    if msg is None:
+                        raise TypeError("Not a nas packet")
+                    type_name = msg._name
+                else:
+                    msg = None
+                    type_name = parse_nas_packet(packet_data, cache)
+                result.add(type_name, packet_data, msg)
+            except TypeError as e:
+                result.errors += 1
+                print(f"err on NAS packet {i} of {pcap_filepath}: {e}")
+    cache.close()
+    return result
+
+
+def get_test_cases(
+    pcap_dir_filepath: str,
+    jobs: int = 1,
+    cache_filepath: Optional[str] = None,
+    new_result: Callable[[], HarvestResult] = HarvestResult,
+) -> Tuple[list[str], list[str]]:
+    # sort the pcaps so results don't depend on directory order or on how
+    # many workers we're using
+    pcap_filepaths = sorted(
+        entry.path for entry in os.scandir(pcap_dir_filepath) if entry.is_file()
+    )
+    result = new_result()
+    harvest = partial(harvest_pcap, cache_filepath=cache_filepath, new_result=new_result)
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # map() yields results in submission order, so merging stays
+            # deterministic no matter which worker finishes first
+            for file_result in executor.map(harvest, pcap_filepaths):
+                result.merge(file_result)
+    else:
+        for pcap_filepath in pcap_filepaths:
+            result.merge(harvest(pcap_filepath))
+    print(
+        f'harvested {result.packets} NAS packets, skipped {result.duplicates} '
+        f'duplicates, {result.errors} failed to parse'
+    )
+    result.report()
     emm_tests = []
     esm_tests = []
-    for type_name, testcase in longest_testcase.items():
-        if type_name in types_to_skip:
-            continue
+    for type_name, testcases in result.test_cases().items():
         if type_name.startswith("EMM"):
-            emm_tests.append(testcase)
+            emm_tests += testcases
         elif type_name.startswith("ESM"):
-            esm_tests.append(testcase)
+            esm_tests += testcases
         else:
             print(f'unexpected packet type {type_name}')
     return (emm_tests, esm_tests)
 
 
-def main(output_filepath: str, pcap_dir_filepath: Optional[str]):
+def resolve_indices(
+    pcap_dir_filepath: Optional[str],
+    jobs: int = 1,
+    cache_dir: Optional[str] = None,
+    ir_output_filepath: Optional[str] = None,
+    new_result: Callable[[], HarvestResult] = HarvestResult,
+) -> Dict[str, RustModuleIndex]:
+    """Resolves and renders the EMM and ESM modules with pycrate, along with
+    the test cases harvested from any pcaps. With ir_output_filepath, the
+    resolved types are written there first, and the modules are rendered
+    from them just as a later --from-ir run would.
+
+    The EMM and ESM modules always copy their buffers, since NASMessage
+    can't hold messages which borrow from their input. Only the
+    BORROWED_EXAMPLES are rendered with borrowed buffers, into a standalone
+    index which no dispatch uses.
+    """
     emm_tests: list[str]
     esm_tests: list[str]
+    # a cache_dir of None keeps each process's cache in memory
+    cache_path = None if cache_dir is None else cache_filepath(cache_dir)
     if pcap_dir_filepath is None:
         emm_tests, esm_tests = [], []
     else:
-        emm_tests, esm_tests = get_test_cases(pcap_dir_filepath)
-    emm_classes = list(NASLTE.EMMTypeMOClasses.values())
-    # add in the MT version of DetachRequest
-    emm_classes.append(NASLTE.EMMTypeMTClasses[69])
-    generate_module(os.path.join(output_filepath, 'emm'), emm_classes, [
-        '075501', # EMM IMSI identity request
-        '0748610bf602f8108003c8c2e65e9a5804e060c0405202f810c4c25c0a00570220003103e5e0341302f810040511035758a65d0100c1', # EMM TAU Request
-        '075e23093395684292874145f0', # EMM SMCompl
-        '074300035200c2', # EMM Attach Complete
-        '074c6005f4c2e65e9a57022000', # EMM Ext Serv Request
-        '074a', # EMM TAU Complete
-        '07632009011d00010007913386094000f01101830a816000000000000005d4f29cae00', # EMM NAS transport + SMS CP-DATA
-        '0745630bf602f8108003c8c2e65e9a', # EMM Detach Request MO
-        '074d707800040200e86f6703091011570233c9d1' # EMM CP Service Request
-    ] + emm_tests)
-    generate_module(os.path.join(output_filepath, 'esm'), NASLTE.ESMTypeClasses.values(), [
-        '0202d9', # ESM Info Req
-        '0202da2807066f72616e6765', # ESM Info Resp
-    ] + esm_tests)
+        emm_tests, esm_tests = get_test_cases(pcap_dir_filepath, jobs, cache_path, new_result)
+    cache = ParseCache(cache_path)
+    dispatches = {
+        'emm': emm_dispatch(),
+        'esm': esm_dispatch(),
+    }
+    borrowed_classes = [
+        clazz for clazz in get_emm_classes() + get_esm_classes()
+        if clazz.__name__ in BORROWED_EXAMPLES
+    ]
+    all_tests = EMM_TEST_CASES + ESM_TEST_CASES + emm_tests + esm_tests
+    if ir_output_filepath is not None:
+        data = dump_indices({
+            'emm': export_modules(get_emm_classes(), EMM_TEST_CASES + emm_tests, cache, jobs),
+            'esm': export_modules(get_esm_classes(), ESM_TEST_CASES + esm_tests, cache, jobs),
+            'borrowed': export_modules(borrowed_classes, all_tests, cache, jobs, True),
+        }, dispatches, {'borrowed'})
+        cache.close()
+        if write_ir(ir_output_filepath, data):
+            print(f'wrote {ir_output_filepath}')
+        return load_indices(data)
+    emm_index = render_modules(get_emm_classes(), EMM_TEST_CASES + emm_tests, cache, jobs)
+    esm_index = render_modules(get_esm_classes(), ESM_TEST_CASES + esm_tests, cache, jobs)
+    borrowed_index = render_modules(borrowed_classes, all_tests, cache, jobs, True)
+    cache.close()
+    emm_index.set_dispatch(dispatches['emm'])
+    esm_index.set_dispatch(dispatches['esm'])
+    borrowed_index.standalone = True
+    return {
+        'emm': emm_index,
+        'esm': esm_index,
+        'borrowed': borrowed_index,
+    }
 
 
-if __name__ == "__main__":
-    import sys
-    output_filepath = sys.argv[1]
-    if len(sys.argv) == 2:
-        pcap_dir_filepath = None
+def main(
+    output_filepath: str,
+    pcap_dir_filepath: Optional[str],
+    jobs: int = 1,
+    cache_dir: Optional[str] = None,
+    enum_report: bool = False,
+    bench_filepath: Optional[str] = None,
+    python_decoders_filepath: Optional[str] = None,
+    ir_output_filepath: Optional[str] = None,
+    ir_input_filepath: Optional[str] = None,
+    new_result: Callable[[], HarvestResult] = HarvestResult,
+):
+    if ir_input_filepath is not None:
+        # everything was already resolved, so there's no need for pycrate
+        indices = load_indices(read_ir(ir_input_filepath))
     else:
-        pcap_dir_filepath = sys.argv[2]
-    main(output_filepath, pcap_dir_filepath)
+        indices = resolve_indices(pcap_dir_filepath, jobs, cache_dir, ir_output_filepath, new_result)
+    generate_modules(output_filepath, indices, enum_report)
+    if bench_filepath is not None:
+        os.makedirs(os.path.dirname(bench_filepath) or '.', exist_ok=True)
+        if write_if_changed(bench_filepath, RustBenchSuite(indices).to_rust()):
+            print(f'wrote {bench_filepath}')
+    if python_decoders_filepath is not None:
+        decoders = PythonDecoders.from_classes(get_emm_classes() + get_esm_classes())
+        decoders.add_dispatch(emm_dispatch())
+        decoders.add_dispatch(esm_dispatch())
+        if write_if_changed(python_decoders_filepath, decoders.to_python()):
+            print(f'wrote {python_decoders_filepath}')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generates the Rust NAS parser and its tests')
+    parser.add_argument('output_filepath', help='directory to write the generated Rust modules to')
+    parser.add_argument('pcap_dir_filepath', nargs='?', default=None, help='directory of GSMTAP pcaps to harvest test cases from')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of worker processes to harvest pcaps and generate modules with')
+    parser.add_argument('--cache-dir', default=default_cache_dir(), help='directory for the persistent pycrate parse cache')
+    parser.add_argument('--no-cache', action='store_true', help="don't read or write the persistent parse cache")
+    parser.add_argument('--benches', metavar='PATH', help='also write a Criterion benchmark suite which parses every test case to this file, e.g. ../benches/nas_parse.rs')
+    parser.add_argument('--python-decoders', metavar='PATH', help='also write a standalone Python module which decodes the same messages to this file, e.g. nas_decoders.py')
+    parser.add_argument('--export-ir', metavar='PATH', help='also write the resolved types and test cases to this file, to render from later with --from-ir')
+    parser.add_argument('--from-ir', metavar='PATH', help="render from types written by --export-ir instead of resolving them with pycrate")
+    parser.add_argument('--select', choices=['longest', 'coverage', 'top-k'], default='longest', help="how to pick each message type's test cases from the pcaps: its longest payload, a small set of payloads covering every field, enum value and IE tag seen, or the top k payloads with distinct sets of IEs")
+    parser.add_argument('--coverage-pool-size', type=int, default=256, help='number of candidate payloads per message type to pick from with --select coverage')
+    parser.add_argument('-k', '--top-k', type=int, default=8, help='number of payloads per message type to keep with --select top-k')
+    parser.add_argument('--enum-report', action='store_true', help="print each enum's id pattern count before and after merging into ranges")
+    args = parser.parse_args()
+    if args.from_ir is not None:
+        # these all need pycrate
+        if args.pcap_dir_filepath is not None or args.export_ir or args.python_decoders:
+            parser.error('--from-ir cannot be used with pcaps, --export-ir, or --python-decoders')
+    cache_dir = None if args.no_cache else args.cache_dir
+    new_result: Callable[[], HarvestResult] = HarvestResult
+    if args.select == 'coverage':
+        new_result = partial(CoverageHarvestResult, args.coverage_pool_size)
+    elif args.select == 'top-k':
+        new_result = partial(SampledHarvestResult, args.top_k)
+    main(
+        args.output_filepath,
+        args.pcap_dir_filepath,
+        args.jobs,
+        cache_dir,
+        args.enum_report,
+        args.benches,
+        args.python_decoders,
+        args.export_ir,
+        args.from_ir,
+        new_result,
+    )
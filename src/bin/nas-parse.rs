@@ -0,0 +1,92 @@
+use clap::Parser;
+use log::warn;
+use pycrate_rs::nas::NASMessage;
+use pycrate_rs::pcap::GsmtapNASReader;
+use serde::Serialize;
+use std::error::Error;
+use std::fs::File;
+use std::io::{self, BufReader, BufWriter, Read, Write};
+use std::time::Instant;
+
+// large buffers keep the number of syscalls down on multi-GB captures
+const BUF_CAPACITY: usize = 1 << 20;
+
+/// Parses the NAS messages in a pcap or pcapng capture of GSMTAP packets,
+/// writing one JSON object per message to stdout.
+#[derive(Parser)]
+struct Args {
+    /// Capture to read, or - to read it from stdin
+    #[arg(default_value = "-")]
+    input: String,
+
+    /// Decode ciphered security protected messages too, for captures whose
+    /// security context uses the null ciphering algorithm (EEA0)
+    #[arg(long)]
+    null_cipher: bool,
+}
+
+// A single line of output. Messages which fail to parse are still written
+// out, with their payload and the error instead of the parsed message.
+#[derive(Serialize)]
+struct Record<'a> {
+    packet: u64,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    message: Option<NASMessage>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    payload: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    error: Option<&'a str>,
+}
+
+fn hexlify(data: &[u8]) -> String {
+    data.iter().map(|b| format!("{b:02x}")).collect()
+}
+
+fn main() -> Result<(), Box<dyn Error>> {
+    env_logger::init();
+    let args = Args::parse();
+    let input: Box<dyn Read> = if args.input == "-" {
+        Box::new(io::stdin().lock())
+    } else {
+        Box::new(File::open(&args.input)?)
+    };
+    let mut reader = GsmtapNASReader::new(BufReader::with_capacity(BUF_CAPACITY, input))?;
+    let mut out = BufWriter::with_capacity(BUF_CAPACITY, io::stdout().lock());
+
+    let start = Instant::now();
+    let mut packets: u64 = 0;
+    let mut failed: u64 = 0;
+    let mut bytes: u64 = 0;
+    while let Some(payload) = reader.next_payload()? {
+        bytes += payload.len() as u64;
+        let parsed = if args.null_cipher {
+            NASMessage::parse_null_ciphered(payload, None)
+        } else {
+            NASMessage::parse(payload)
+        };
+        let error = parsed.as_ref().err().map(|e| e.to_string());
+        if let Some(error) = &error {
+            warn!("failed to parse packet {packets}: {error}");
+            failed += 1;
+        }
+        let record = Record {
+            packet: packets,
+            payload: error.is_some().then(|| hexlify(payload)),
+            message: parsed.ok(),
+            error: error.as_deref(),
+        };
+        serde_json::to_writer(&mut out, &record)?;
+        out.write_all(b"\n")?;
+        packets += 1;
+    }
+    out.flush()?;
+
+    let elapsed = start.elapsed().as_secs_f64();
+    eprintln!(
+        "parsed {packets} NAS packets ({failed} failed, {bytes} bytes) in {elapsed:.3}s: \
+         {:.0} messages/s, {:.2} MB/s",
+        packets as f64 / elapsed,
+        bytes as f64 / elapsed / 1e6,
+    );
+    Ok(())
+}
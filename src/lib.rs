@@ -1 +1,2 @@
 pub mod nas;
+pub mod pcap;
@@ -0,0 +1,180 @@
+use std::io::{Read, Seek};
+
+use deku::ctx::ByteSize;
+use deku::prelude::*;
+use thiserror::Error;
+
+// Some IEs, like the MS network capability and classmark 3, aren't laid out
+// as a fixed series of fields but are described in CSN.1: their contents
+// depend on alternatives selected by leading bits, repetitions, and optional
+// trailing fields which are simply left off if the sender has nothing more to
+// say. Deku's derived readers can't express that (and can't rewind a failed
+// read), so the generated types for these IEs are read bit by bit from the
+// IE's buffer with a BitReader instead.
+
+#[derive(Debug, Error, Clone, Copy, PartialEq)]
+pub enum Csn1Error {
+    #[error("CSN.1 value ran out of bits")]
+    Truncated,
+    #[error("CSN.1 value had an unexpected fixed value or alternative")]
+    InvalidValue,
+}
+
+impl From<Csn1Error> for DekuError {
+    fn from(err: Csn1Error) -> DekuError {
+        DekuError::Parse(format!("{err}").into())
+    }
+}
+
+// A cursor over the bits of a CSN.1 encoded buffer, most significant bit
+// first.
+pub struct BitReader<'a> {
+    buf: &'a [u8],
+    pos: usize,
+}
+
+impl<'a> BitReader<'a> {
+    pub fn new(buf: &'a [u8]) -> Self {
+        Self { buf, pos: 0 }
+    }
+
+    pub fn remaining(&self) -> usize {
+        self.buf.len() * 8 - self.pos
+    }
+
+    // returns the value of the next `bits` bits without consuming them
+    pub fn peek_bits(&self, bits: usize) -> Result<u32, Csn1Error> {
+        if bits > self.remaining() {
+            return Err(Csn1Error::Truncated);
+        }
+        let mut value = 0;
+        for i in self.pos..self.pos + bits {
+            let bit = (self.buf[i / 8] >> (7 - i % 8)) & 1;
+            value = (value << 1) | u32::from(bit);
+        }
+        Ok(value)
+    }
+
+    pub fn skip_bits(&mut self, bits: usize) -> Result<(), Csn1Error> {
+        if bits > self.remaining() {
+            return Err(Csn1Error::Truncated);
+        }
+        self.pos += bits;
+        Ok(())
+    }
+
+    pub fn read_bits(&mut self, bits: usize) -> Result<u32, Csn1Error> {
+        let value = self.peek_bits(bits)?;
+        self.pos += bits;
+        Ok(value)
+    }
+
+    // reads a fixed value, e.g. a `0` separating two fields
+    pub fn expect_bits(&mut self, bits: usize, expected: u32) -> Result<(), Csn1Error> {
+        if self.read_bits(bits)? != expected {
+            return Err(Csn1Error::InvalidValue);
+        }
+        Ok(())
+    }
+
+    // reads a value repeated a fixed number of times
+    pub fn read_count<T, F>(&mut self, count: usize, mut read: F) -> Result<Vec<T>, Csn1Error>
+    where
+        F: FnMut(&mut Self) -> Result<T, Csn1Error>,
+    {
+        (0..count).map(|_| read(self)).collect()
+    }
+
+    // reads a value repeated for as long as it can be, rewinding past any
+    // partial value at the end. only running out of bits ends the list, so a
+    // value which doesn't match is still an error
+    pub fn read_until_end<T, F>(&mut self, mut read: F) -> Result<Vec<T>, Csn1Error>
+    where
+        F: FnMut(&mut Self) -> Result<T, Csn1Error>,
+    {
+        let mut values = Vec::new();
+        while self.remaining() > 0 {
+            let pos = self.pos;
+            match read(self) {
+                Ok(value) => values.push(value),
+                Err(Csn1Error::Truncated) => {
+                    self.pos = pos;
+                    break;
+                }
+                Err(err) => return Err(err),
+            }
+        }
+        Ok(values)
+    }
+}
+
+// Implemented by every generated CSN.1 type
+pub trait Csn1Read: Sized {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error>;
+}
+
+// Reads a CSN.1 IE from the next `byte_size` bytes. Generated CSN.1 IE types
+// implement DekuReader<ByteSize> with this, so that they can be held in a
+// layer 3 container like any other IE.
+pub fn read_csn1_ie<T: Csn1Read, R: Read + Seek>(
+    reader: &mut Reader<R>,
+    ByteSize(byte_size): ByteSize,
+) -> Result<T, DekuError> {
+    let mut buf = vec![0_u8; byte_size];
+    for chunk in buf.chunks_mut(16) {
+        reader.read_bytes(chunk.len(), chunk)?;
+    }
+    Ok(T::read_csn1(&mut BitReader::new(&buf))?)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_read_bits() {
+        let mut reader = BitReader::new(&[0b1011_0010, 0b1000_0000]);
+        assert_eq!(reader.read_bits(1), Ok(1));
+        assert_eq!(reader.peek_bits(3), Ok(0b011));
+        assert_eq!(reader.read_bits(9), Ok(0b0110_0101));
+        assert_eq!(reader.remaining(), 6);
+        assert_eq!(reader.expect_bits(1, 1), Err(Csn1Error::InvalidValue));
+        assert_eq!(reader.read_bits(6), Err(Csn1Error::Truncated));
+    }
+
+    #[test]
+    fn test_read_until_end() {
+        let mut reader = BitReader::new(&[0b1111_1111]);
+        // the last 2 bits aren't enough for another value, so they're left
+        // unread
+        let values = reader.read_until_end(|reader| reader.read_bits(3));
+        assert_eq!(values, Ok(vec![0b111, 0b111]));
+        assert_eq!(reader.remaining(), 2);
+
+        // values made up of a fixed 1 bit followed by 2 bits
+        let read = |reader: &mut BitReader| {
+            reader.expect_bits(1, 1)?;
+            reader.read_bits(2)
+        };
+        let mut reader = BitReader::new(&[0b1011_0010]);
+        assert_eq!(reader.read_until_end(read), Ok(vec![0b01, 0b00]));
+        assert_eq!(reader.remaining(), 2);
+        // the second value's fixed bit is 0, which doesn't end the list
+        let mut reader = BitReader::new(&[0b1010_1000]);
+        assert_eq!(reader.read_until_end(read), Err(Csn1Error::InvalidValue));
+    }
+
+    #[test]
+    fn test_truncated_list() {
+        use crate::nas::generated::ies::{Classmark3ValuePart, MultibandSupported};
+        // a truncated list ends at the first value which runs out of bits
+        let value = Classmark3ValuePart::read_csn1(&mut BitReader::new(&[0b0000_0000])).unwrap();
+        assert_eq!(value.spare_bit, Some(0));
+        assert!(matches!(value.multiband_supported, Some(MultibandSupported::B000 { .. })));
+        assert_eq!(value.r_support, None);
+        // but 0b011 isn't one of MultibandSupported's alternatives, which is
+        // an error rather than the end of the list
+        let result = Classmark3ValuePart::read_csn1(&mut BitReader::new(&[0b0011_0000]));
+        assert!(matches!(result, Err(Csn1Error::InvalidValue)));
+    }
+}
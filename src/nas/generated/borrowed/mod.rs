@@ -0,0 +1,7 @@
+
+#![allow(unused_imports)]
+
+/// Autogenerated rust code, do not modify directly! Any changes should be
+/// made via the python generator scripts.
+
+pub mod emm_attach_accept;
\ No newline at end of file
@@ -1,84 +1,58 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{GPRSTimer, ExtEMMCause, EMMCauseEMMCause, GPRSTimerUnit};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMAttachReject {
-    #[deku(bytes = 1)] pub emm_cause: Type3V<EMMCauseEMMCause>,
-    #[deku(ctx = "Tag(120), NeedsByteSize")] pub esm_container: Type6TLVE<Layer3Buffer>,
-    #[deku(ctx = "Tag(95)")] pub t_3346: Type4TLV<GPRSTimer>,
-    #[deku(ctx = "Tag(22)")] pub t_3402: Type4TLV<GPRSTimer>,
-    #[deku(ctx = "Tag(10)")] pub ext_emm_cause: Type1TV<ExtEMMCause>,
+    pub emm_cause: Type3V<EMMCauseEMMCause>,
+    pub esm_container: Type6TLVE<Layer3Buffer>,
+    pub t_3346: Type4TLV<GPRSTimer>,
+    pub t_3402: Type4TLV<GPRSTimer>,
+    pub ext_emm_cause: Type1TV<ExtEMMCause>,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct GPRSTimer {
-    pub unit: GPRSTimerUnit,
-    #[deku(bits = 5)] pub value: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ExtEMMCause {
-    #[deku(bits = 2)] pub spare: u8,
-    #[deku(bits = 1)] pub eps_optim_info: u8,
-    #[deku(bits = 1)] pub eutran_allowed: u8,
-}
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 8)]
-pub enum EMMCauseEMMCause {
-    #[deku(id_pat = "2")] IMSIUnknownInHSS,
-    #[deku(id_pat = "3")] IllegalUE,
-    #[deku(id_pat = "5")] IMEINotAccepted,
-    #[deku(id_pat = "6")] IllegalME,
-    #[deku(id_pat = "7")] EPSServicesNotAllowed,
-    #[deku(id_pat = "8")] EPSServicesAndNonEPSServicesNotAllowed,
-    #[deku(id_pat = "9")] UEIdentityCannotBeDerivedByTheNetwork,
-    #[deku(id_pat = "10")] ImplicitlyDetached,
-    #[deku(id_pat = "11")] PLMNNotAllowed,
-    #[deku(id_pat = "12")] TrackingAreaNotAllowed,
-    #[deku(id_pat = "13")] RoamingNotAllowedInThisTrackingArea,
-    #[deku(id_pat = "14")] EPSServicesNotAllowedInThisPLMN,
-    #[deku(id_pat = "15")] NoSuitableCellsInTrackingArea,
-    #[deku(id_pat = "16")] MSCTemporarilyNotReachable,
-    #[deku(id_pat = "17")] NetworkFailure,
-    #[deku(id_pat = "18")] CSDomainNotAvailable,
-    #[deku(id_pat = "19")] ESMFailure,
-    #[deku(id_pat = "20")] MACFailure,
-    #[deku(id_pat = "21")] SynchFailure,
-    #[deku(id_pat = "22")] Congestion,
-    #[deku(id_pat = "23")] UESecurityCapabilitiesMismatch,
-    #[deku(id_pat = "24")] SecurityModeRejectedUnspecified,
-    #[deku(id_pat = "25")] NotAuthorizedForThisCSG,
-    #[deku(id_pat = "26")] NonEPSAuthenticationUnacceptable,
-    #[deku(id_pat = "35")] RequestedServiceOptionNotAuthorizedInThisPLMN,
-    #[deku(id_pat = "39")] CSServiceTemporarilyNotAvailable,
-    #[deku(id_pat = "40")] NoEPSBearerContextActivated,
-    #[deku(id_pat = "42")] SevereNetworkFailure,
-    #[deku(id_pat = "95")] SemanticallyIncorrectMessage,
-    #[deku(id_pat = "96")] InvalidMandatoryInformation,
-    #[deku(id_pat = "97")] MessageTypeNonExistentOrNotImplemented,
-    #[deku(id_pat = "98")] MessageTypeNotCompatibleWithTheProtocolState,
-    #[deku(id_pat = "99")] InformationElementNonExistentOrNotImplemented,
-    #[deku(id_pat = "100")] ConditionalIEError,
-    #[deku(id_pat = "101")] MessageNotCompatibleWithTheProtocolState,
-    #[deku(id_pat = "111")] ProtocolErrorUnspecified,
-    #[deku(id_pat = "_")] Other,
+impl<'a> DekuReader<'a> for EMMAttachReject {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let emm_cause: Type3V<EMMCauseEMMCause> = DekuReader::from_reader_with_ctx(reader, ByteSize(1))?;
+        let mut esm_container: Type6TLVE<Layer3Buffer> = Type6TLVE::absent(Tag(120));
+        let mut t_3346: Type4TLV<GPRSTimer> = Type4TLV::absent(Tag(95));
+        let mut t_3402: Type4TLV<GPRSTimer> = Type4TLV::absent(Tag(22));
+        let mut ext_emm_cause: Type1TV<ExtEMMCause> = Type1TV::absent(Tag(10));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                120 => esm_container = DekuReader::from_reader_with_ctx(reader, (Tag(120), NeedsByteSize))?,
+                95 => t_3346 = DekuReader::from_reader_with_ctx(reader, Tag(95))?,
+                22 => t_3402 = DekuReader::from_reader_with_ctx(reader, Tag(22))?,
+                _ => match tag >> 4 {
+                    10 => ext_emm_cause = DekuReader::from_reader_with_ctx(reader, Tag(10))?,
+                    _ => if !skip_unknown_ie(reader, tag)? {
+                        break;
+                    },
+                },
+            }
+        }
+        Ok(Self {
+            emm_cause,
+            esm_container,
+            t_3346,
+            t_3402,
+            ext_emm_cause,
+        })
+    }
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum GPRSTimerUnit {
-    #[deku(id_pat = "0")] TwoSec,
-    #[deku(id_pat = "1")] OneMin,
-    #[deku(id_pat = "2")] SixMin,
-    #[deku(id_pat = "7")] TimerDeactivated,
-    #[deku(id_pat = "_")] Other,
-}
 
 #[cfg(test)]
 mod tests {
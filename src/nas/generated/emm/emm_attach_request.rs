@@ -1,299 +1,148 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{NASKSI, EPSID, UENetCap, TAI, DRXParam, ExtendedGeaBits, MsNetworkCapabilityValuePart, LAI, TMSIStatus, MSCm2, A5Bits, MultibandSupported, MsMeasurementCapability, EightPskStruct, Gsm400BandsSupported, DtmGprsMultiSlotClass, ExtendedDtmGprsMultiSlotClass, TGsm400BandsSupported, DtmGprsHighMultiSlotClass, Classmark3ValuePart, SuppCodecList, SuppCodec, AddUpdateType, VoiceDomPref, DeviceProp, GUTIType, MSNetFeatSupp, NRICont, GPRSTimer, GPRSTimer3, ExtDRXParam, UEAddSecCap, UEStatus, AddInfoReq, N1UENetCap, AddInfoReqCipherKey, UEStatusN1ModeReg, UEStatusS1ModeReg, GPRSTimer3Unit, GPRSTimerUnit, GUTITypeValue, VoiceDomPrefUEUsage, VoiceDomPrefVoiceDomPref, AddUpdateTypePNBCIoT, AddUpdateTypeSAF, AddUpdateTypeAUTV, MSCm2RevLevel, MSCm2RFClass, MSCm2SSScreeningCap, TMSIStatusFlag, DRXParamSPLITPGCYCLECODE, DRXParamDRXCycleLen, DRXParamNonDRXTimer, NASKSITSC, NASKSIValue};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMAttachRequest {
     pub nas_ksi: Type1V<NASKSI>,
     pub eps_attach_type: Type1V<EPSAttachTypeV>,
     pub epsid: Type4LV<EPSID>,
-    #[deku(ctx = "NeedsByteSize")] pub ue_net_cap: Type4LV<UENetCap>,
-    #[deku(ctx = "NeedsByteSize")] pub esm_container: Type6LVE<Layer3Buffer>,
-    #[deku(bytes = 3, ctx = "Tag(25), NeedsByteSize")] pub old_ptmsi_sign: Type3TV<Layer3Buffer>,
-    #[deku(ctx = "Tag(80)")] pub add_guti: Type4TLV<EPSID>,
-    #[deku(bytes = 5, ctx = "Tag(82)")] pub old_tai: Type3TV<TAI>,
-    #[deku(bytes = 2, ctx = "Tag(92)")] pub drx_param: Type3TV<DRXParam>,
-    #[deku(ctx = "Tag(49)")] pub ms_net_cap: Type4TLV<()>,
-    #[deku(bytes = 5, ctx = "Tag(19)")] pub old_lai: Type3TV<LAI>,
-    #[deku(ctx = "Tag(9)")] pub tmsi_status: Type1TV<TMSIStatus>,
-    #[deku(ctx = "Tag(17)")] pub ms_cm_2: Type4TLV<MSCm2>,
-    #[deku(ctx = "Tag(32)")] pub ms_cm_3: Type4TLV<()>,
-    #[deku(ctx = "Tag(64)")] pub supp_codecs: Type4TLV<()>,
-    #[deku(ctx = "Tag(15)")] pub add_update_type: Type1TV<AddUpdateType>,
-    #[deku(ctx = "Tag(93)")] pub voice_dom_pref: Type4TLV<VoiceDomPref>,
-    #[deku(ctx = "Tag(13)")] pub device_prop: Type1TV<DeviceProp>,
-    #[deku(ctx = "Tag(14)")] pub old_guti_type: Type1TV<GUTIType>,
-    #[deku(ctx = "Tag(12)")] pub ms_net_feat_supp: Type1TV<MSNetFeatSupp>,
-    #[deku(ctx = "Tag(16)")] pub tmsi_based_nri_cont: Type4TLV<NRICont>,
-    #[deku(ctx = "Tag(106)")] pub t_3324: Type4TLV<GPRSTimer>,
-    #[deku(ctx = "Tag(94)")] pub t_3412_ext: Type4TLV<GPRSTimer3>,
-    #[deku(ctx = "Tag(110)")] pub ext_drx_param: Type4TLV<ExtDRXParam>,
-    #[deku(ctx = "Tag(111), NeedsByteSize")] pub ue_add_sec_cap: Type4TLV<UEAddSecCap>,
-    #[deku(ctx = "Tag(109)")] pub ue_status: Type4TLV<UEStatus>,
-    #[deku(bytes = 1, ctx = "Tag(23)")] pub add_info_req: Type3TV<AddInfoReq>,
-    #[deku(ctx = "Tag(50), NeedsByteSize")] pub n_1_ue_net_cap: Type4TLV<N1UENetCap>,
-    #[deku(ctx = "Tag(11)")] pub ue_radio_cap_id_avail: Type1TV<UERadioCapIDAvail>,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct NASKSI {
-    pub tsc: NASKSITSC,
-    pub value: NASKSIValue,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct EPSID {
-
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-#[deku(ctx = "ByteSize(byte_size): ByteSize")]
-pub struct UENetCap {
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_0: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_1_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_2_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_3_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_4: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_6: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_7: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_0: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_1_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_2_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_3_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_4: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_6: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_7: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_0: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_1: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_2: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_3: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_4: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_6: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_7: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub ucs_2: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_1: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_2: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_3: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_4: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_6: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_7: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub pro_se_dd: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub pro_se: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub h_245_ash: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub acc_csfb: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub lpp: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub lcs: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub x_1_srvcc: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub nf: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub e_pco: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub hc_cp_c_io_t: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub e_rw_o_pdn: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub s_1_u_data: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub up_c_io_t: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub cp_c_io_t: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub pro_se_relay: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub pro_se_dc: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub ft_bearers: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub sgc: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub n_1_mode: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub dcnr: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub cp_back_off: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub restrict_ec: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub v_2_x_pc_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub multi_drb: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub rpr: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub piv: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub ncr: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub v_2_x_nrpc_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub up_mt_edt: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub cp_mt_edt: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub wusa: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub racs: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_1: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_2: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_3: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_4: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_6: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub ptcc: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub pr: u8,
-    #[deku(count = "byte_size - deku::byte_offset", cond = "deku::byte_offset < byte_size")] pub spare_7: Vec<u8>,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct TAI {
-    #[deku(count = "3")] pub plmn: Vec<u8>,
-    #[deku(bytes = 2, endian = "big")] pub tac: u16,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct DRXParam {
-    pub split_pg_cycle_code: DRXParamSPLITPGCYCLECODE,
-    pub drx_cycle_len: DRXParamDRXCycleLen,
-    #[deku(bits = 1)] pub spli_ton_ccch: u8,
-    pub non_drx_timer: DRXParamNonDRXTimer,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct LAI {
-    #[deku(count = "3")] pub plmn: Vec<u8>,
-    #[deku(bytes = 2, endian = "big")] pub lac: u16,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct TMSIStatus {
-    #[deku(bits = 3)] pub spare: u8,
-    pub flag: TMSIStatusFlag,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct MSCm2 {
-    #[deku(bits = 1)] pub spare_1: u8,
-    pub rev_level: MSCm2RevLevel,
-    #[deku(bits = 1)] pub early_cm_cap: u8,
-    #[deku(bits = 1)] pub no_a_51: u8,
-    pub rf_class: MSCm2RFClass,
-    #[deku(bits = 1)] pub spare_2: u8,
-    #[deku(bits = 1)] pub ps_cap: u8,
-    pub ss_screening_cap: MSCm2SSScreeningCap,
-    #[deku(bits = 1)] pub mtsms_cap: u8,
-    #[deku(bits = 1)] pub vbs_notif_cap: u8,
-    #[deku(bits = 1)] pub vgcs_notif_cap: u8,
-    #[deku(bits = 1)] pub fc_freq_cap: u8,
-    #[deku(bits = 1)] pub ms_cm_3_cap: u8,
-    #[deku(bits = 1)] pub spare_3: u8,
-    #[deku(bits = 1)] pub lcsva_cap: u8,
-    #[deku(bits = 1)] pub ucs_2: u8,
-    #[deku(bits = 1)] pub so_lsa_cap: u8,
-    #[deku(bits = 1)] pub cm_serv_prompt: u8,
-    #[deku(bits = 1)] pub a_53: u8,
-    #[deku(bits = 1)] pub a_52: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct AddUpdateType {
-    pub pnb_c_io_t: AddUpdateTypePNBCIoT,
-    pub saf: AddUpdateTypeSAF,
-    pub autv: AddUpdateTypeAUTV,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct VoiceDomPref {
-    #[deku(bits = 5)] pub spare: u8,
-    pub ue_usage: VoiceDomPrefUEUsage,
-    pub voice_dom_pref: VoiceDomPrefVoiceDomPref,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct DeviceProp {
-    #[deku(bits = 3)] pub spare: u8,
-    #[deku(bits = 1)] pub low_priority: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct GUTIType {
-    #[deku(bits = 3)] pub spare: u8,
-    pub value: GUTITypeValue,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct MSNetFeatSupp {
-    #[deku(bits = 3)] pub spare: u8,
-    #[deku(bits = 1)] pub ext_period_timers: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct NRICont {
-    #[deku(bits = 10, endian = "big")] pub value: u16,
-    #[deku(bits = 6)] pub spare: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct GPRSTimer {
-    pub unit: GPRSTimerUnit,
-    #[deku(bits = 5)] pub value: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct GPRSTimer3 {
-    pub unit: GPRSTimer3Unit,
-    #[deku(bits = 5)] pub value: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ExtDRXParam {
-    #[deku(bits = 4)] pub ptx: u8,
-    #[deku(bits = 4)] pub e_drx: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-#[deku(ctx = "ByteSize(byte_size): ByteSize")]
-pub struct UEAddSecCap {
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_0: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_1_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_2_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_3_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_4: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_6: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_7: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_8: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_9: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_10: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_11: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_12: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_13: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_14: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_15: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_0: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_1_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_2_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_3_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_4: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_6: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_7: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_8: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_9: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_10: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_11: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_12: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_13: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_14: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_15: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct UEStatus {
-    #[deku(bits = 6)] pub spare: u8,
-    pub n_1_mode_reg: UEStatusN1ModeReg,
-    pub s_1_mode_reg: UEStatusS1ModeReg,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct AddInfoReq {
-    #[deku(bits = 7)] pub spare: u8,
-    pub cipher_key: AddInfoReqCipherKey,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-#[deku(ctx = "ByteSize(byte_size): ByteSize")]
-pub struct N1UENetCap {
-    #[deku(bits = 2, cond = "deku::byte_offset < byte_size")] pub spare: u8,
-    #[deku(bits = 2, cond = "deku::byte_offset < byte_size")] pub five_gs_pnb_c_io_t: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_up_c_io_t: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_hc_cp_c_io_t: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub n_3_data: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_cp_c_io_t: u8,
+    pub ue_net_cap: Type4LV<UENetCap>,
+    pub esm_container: Type6LVE<Layer3Buffer>,
+    pub old_ptmsi_sign: Type3TV<Layer3Buffer>,
+    pub add_guti: Type4TLV<EPSID>,
+    pub old_tai: Type3TV<TAI>,
+    pub drx_param: Type3TV<DRXParam>,
+    pub ms_net_cap: Type4TLV<MsNetworkCapabilityValuePart>,
+    pub old_lai: Type3TV<LAI>,
+    pub tmsi_status: Type1TV<TMSIStatus>,
+    pub ms_cm_2: Type4TLV<MSCm2>,
+    pub ms_cm_3: Type4TLV<Classmark3ValuePart>,
+    pub supp_codecs: Type4TLV<SuppCodecList>,
+    pub add_update_type: Type1TV<AddUpdateType>,
+    pub voice_dom_pref: Type4TLV<VoiceDomPref>,
+    pub device_prop: Type1TV<DeviceProp>,
+    pub old_guti_type: Type1TV<GUTIType>,
+    pub ms_net_feat_supp: Type1TV<MSNetFeatSupp>,
+    pub tmsi_based_nri_cont: Type4TLV<NRICont>,
+    pub t_3324: Type4TLV<GPRSTimer>,
+    pub t_3412_ext: Type4TLV<GPRSTimer3>,
+    pub ext_drx_param: Type4TLV<ExtDRXParam>,
+    pub ue_add_sec_cap: Type4TLV<UEAddSecCap>,
+    pub ue_status: Type4TLV<UEStatus>,
+    pub add_info_req: Type3TV<AddInfoReq>,
+    pub n_1_ue_net_cap: Type4TLV<N1UENetCap>,
+    pub ue_radio_cap_id_avail: Type1TV<UERadioCapIDAvail>,
+}
+
+impl<'a> DekuReader<'a> for EMMAttachRequest {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let nas_ksi: Type1V<NASKSI> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let eps_attach_type: Type1V<EPSAttachTypeV> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let epsid: Type4LV<EPSID> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let ue_net_cap: Type4LV<UENetCap> = DekuReader::from_reader_with_ctx(reader, NeedsByteSize)?;
+        let esm_container: Type6LVE<Layer3Buffer> = DekuReader::from_reader_with_ctx(reader, NeedsByteSize)?;
+        let mut old_ptmsi_sign: Type3TV<Layer3Buffer> = Type3TV::absent(Tag(25));
+        let mut add_guti: Type4TLV<EPSID> = Type4TLV::absent(Tag(80));
+        let mut old_tai: Type3TV<TAI> = Type3TV::absent(Tag(82));
+        let mut drx_param: Type3TV<DRXParam> = Type3TV::absent(Tag(92));
+        let mut ms_net_cap: Type4TLV<MsNetworkCapabilityValuePart> = Type4TLV::absent(Tag(49));
+        let mut old_lai: Type3TV<LAI> = Type3TV::absent(Tag(19));
+        let mut tmsi_status: Type1TV<TMSIStatus> = Type1TV::absent(Tag(9));
+        let mut ms_cm_2: Type4TLV<MSCm2> = Type4TLV::absent(Tag(17));
+        let mut ms_cm_3: Type4TLV<Classmark3ValuePart> = Type4TLV::absent(Tag(32));
+        let mut supp_codecs: Type4TLV<SuppCodecList> = Type4TLV::absent(Tag(64));
+        let mut add_update_type: Type1TV<AddUpdateType> = Type1TV::absent(Tag(15));
+        let mut voice_dom_pref: Type4TLV<VoiceDomPref> = Type4TLV::absent(Tag(93));
+        let mut device_prop: Type1TV<DeviceProp> = Type1TV::absent(Tag(13));
+        let mut old_guti_type: Type1TV<GUTIType> = Type1TV::absent(Tag(14));
+        let mut ms_net_feat_supp: Type1TV<MSNetFeatSupp> = Type1TV::absent(Tag(12));
+        let mut tmsi_based_nri_cont: Type4TLV<NRICont> = Type4TLV::absent(Tag(16));
+        let mut t_3324: Type4TLV<GPRSTimer> = Type4TLV::absent(Tag(106));
+        let mut t_3412_ext: Type4TLV<GPRSTimer3> = Type4TLV::absent(Tag(94));
+        let mut ext_drx_param: Type4TLV<ExtDRXParam> = Type4TLV::absent(Tag(110));
+        let mut ue_add_sec_cap: Type4TLV<UEAddSecCap> = Type4TLV::absent(Tag(111));
+        let mut ue_status: Type4TLV<UEStatus> = Type4TLV::absent(Tag(109));
+        let mut add_info_req: Type3TV<AddInfoReq> = Type3TV::absent(Tag(23));
+        let mut n_1_ue_net_cap: Type4TLV<N1UENetCap> = Type4TLV::absent(Tag(50));
+        let mut ue_radio_cap_id_avail: Type1TV<UERadioCapIDAvail> = Type1TV::absent(Tag(11));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                25 => old_ptmsi_sign = DekuReader::from_reader_with_ctx(reader, (ByteSize(3), Tag(25), NeedsByteSize))?,
+                80 => add_guti = DekuReader::from_reader_with_ctx(reader, Tag(80))?,
+                82 => old_tai = DekuReader::from_reader_with_ctx(reader, (ByteSize(5), Tag(82)))?,
+                92 => drx_param = DekuReader::from_reader_with_ctx(reader, (ByteSize(2), Tag(92)))?,
+                49 => ms_net_cap = DekuReader::from_reader_with_ctx(reader, (Tag(49), NeedsByteSize))?,
+                19 => old_lai = DekuReader::from_reader_with_ctx(reader, (ByteSize(5), Tag(19)))?,
+                17 => ms_cm_2 = DekuReader::from_reader_with_ctx(reader, Tag(17))?,
+                32 => ms_cm_3 = DekuReader::from_reader_with_ctx(reader, (Tag(32), NeedsByteSize))?,
+                64 => supp_codecs = DekuReader::from_reader_with_ctx(reader, (Tag(64), NeedsByteSize))?,
+                93 => voice_dom_pref = DekuReader::from_reader_with_ctx(reader, Tag(93))?,
+                16 => tmsi_based_nri_cont = DekuReader::from_reader_with_ctx(reader, Tag(16))?,
+                106 => t_3324 = DekuReader::from_reader_with_ctx(reader, Tag(106))?,
+                94 => t_3412_ext = DekuReader::from_reader_with_ctx(reader, Tag(94))?,
+                110 => ext_drx_param = DekuReader::from_reader_with_ctx(reader, Tag(110))?,
+                111 => ue_add_sec_cap = DekuReader::from_reader_with_ctx(reader, (Tag(111), NeedsByteSize))?,
+                109 => ue_status = DekuReader::from_reader_with_ctx(reader, Tag(109))?,
+                23 => add_info_req = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(23)))?,
+                50 => n_1_ue_net_cap = DekuReader::from_reader_with_ctx(reader, (Tag(50), NeedsByteSize))?,
+                _ => match tag >> 4 {
+                    9 => tmsi_status = DekuReader::from_reader_with_ctx(reader, Tag(9))?,
+                    15 => add_update_type = DekuReader::from_reader_with_ctx(reader, Tag(15))?,
+                    13 => device_prop = DekuReader::from_reader_with_ctx(reader, Tag(13))?,
+                    14 => old_guti_type = DekuReader::from_reader_with_ctx(reader, Tag(14))?,
+                    12 => ms_net_feat_supp = DekuReader::from_reader_with_ctx(reader, Tag(12))?,
+                    11 => ue_radio_cap_id_avail = DekuReader::from_reader_with_ctx(reader, Tag(11))?,
+                    _ => if !skip_unknown_ie(reader, tag)? {
+                        break;
+                    },
+                },
+            }
+        }
+        Ok(Self {
+            nas_ksi,
+            eps_attach_type,
+            epsid,
+            ue_net_cap,
+            esm_container,
+            old_ptmsi_sign,
+            add_guti,
+            old_tai,
+            drx_param,
+            ms_net_cap,
+            old_lai,
+            tmsi_status,
+            ms_cm_2,
+            ms_cm_3,
+            supp_codecs,
+            add_update_type,
+            voice_dom_pref,
+            device_prop,
+            old_guti_type,
+            ms_net_feat_supp,
+            tmsi_based_nri_cont,
+            t_3324,
+            t_3412_ext,
+            ext_drx_param,
+            ue_add_sec_cap,
+            ue_status,
+            add_info_req,
+            n_1_ue_net_cap,
+            ue_radio_cap_id_avail,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -308,7 +157,7 @@ pub enum EPSAttachTypeV {
     #[deku(id_pat = "2")] CombinedEPSIMSIAttach,
     #[deku(id_pat = "6")] EPSEmergencyAttach,
     #[deku(id_pat = "7")] Reserved,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "0 | 3..=5 | 8..=15")] Other,
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
@@ -316,225 +165,7 @@ pub enum EPSAttachTypeV {
 pub enum UERadioCapIDAvailValue {
     #[deku(id_pat = "0")] UERadioCapabilityIDNotAvailable,
     #[deku(id_pat = "1")] UERadioCapabilityIDAvailable,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum AddInfoReqCipherKey {
-    #[deku(id_pat = "0")] CipheringKeysForCipheredBroadcastAssistanceDataNotRequested,
-    #[deku(id_pat = "1")] CipheringKeysForCipheredBroadcastAssistanceDataRequested,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum UEStatusN1ModeReg {
-    #[deku(id_pat = "0")] UENotIn5GMMREGISTEREDState,
-    #[deku(id_pat = "1")] UEIn5GMMREGISTEREDState,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum UEStatusS1ModeReg {
-    #[deku(id_pat = "0")] UENotInEMMREGISTEREDState,
-    #[deku(id_pat = "1")] UEInEMMREGISTEREDState,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum GPRSTimer3Unit {
-    #[deku(id_pat = "0")] TenMin,
-    #[deku(id_pat = "1")] OneHour,
-    #[deku(id_pat = "2")] TenHours,
-    #[deku(id_pat = "3")] TwoSec,
-    #[deku(id_pat = "4")] ThirtySec,
-    #[deku(id_pat = "5")] OneMin,
-    #[deku(id_pat = "6")] ThreeHundredAndTwentyHours,
-    #[deku(id_pat = "7")] TimerDeactivated,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum GPRSTimerUnit {
-    #[deku(id_pat = "0")] TwoSec,
-    #[deku(id_pat = "1")] OneMin,
-    #[deku(id_pat = "2")] SixMin,
-    #[deku(id_pat = "7")] TimerDeactivated,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum GUTITypeValue {
-    #[deku(id_pat = "0")] NativeGUTI,
-    #[deku(id_pat = "1")] MappedGUTI,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum VoiceDomPrefUEUsage {
-    #[deku(id_pat = "0")] VoiceCentric,
-    #[deku(id_pat = "1")] DataCentric,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 2)]
-pub enum VoiceDomPrefVoiceDomPref {
-    #[deku(id_pat = "0")] CSVoiceOnly,
-    #[deku(id_pat = "1")] IMSPSVoiceOnly,
-    #[deku(id_pat = "2")] CSVoicePreferredIMSPSVoiceAsSecondary,
-    #[deku(id_pat = "3")] IMSPSVoicePreferredCSVoiceAsSecondary,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 2)]
-pub enum AddUpdateTypePNBCIoT {
-    #[deku(id_pat = "0")] NoAdditionalInformation,
-    #[deku(id_pat = "1")] ControlPlaneCIoTEPSOptimization,
-    #[deku(id_pat = "2")] UserPlaneCIoTEPSOptimization,
-    #[deku(id_pat = "3")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum AddUpdateTypeSAF {
-    #[deku(id_pat = "0")] NASSignallingNotRequiredAfterCompletionOfTAU,
-    #[deku(id_pat = "1")] NASSignallingRequiredAfterCompletionOfTAU,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum AddUpdateTypeAUTV {
-    #[deku(id_pat = "1")] SMSOnly,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 2)]
-pub enum MSCm2RevLevel {
-    #[deku(id_pat = "0")] ReservedForGSMPhase1,
-    #[deku(id_pat = "1")] GSMPhase2MS,
-    #[deku(id_pat = "2")] MSSupportingR99OrLater,
-    #[deku(id_pat = "3")] FFU,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum MSCm2RFClass {
-    #[deku(id_pat = "0")] Class1,
-    #[deku(id_pat = "1")] Class2,
-    #[deku(id_pat = "2")] Class3,
-    #[deku(id_pat = "3")] Class4,
-    #[deku(id_pat = "4")] Class5,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 2)]
-pub enum MSCm2SSScreeningCap {
-    #[deku(id_pat = "0")] DefaultValueOfPhase1,
-    #[deku(id_pat = "1")] CapabilityOfHandlingOfEllipsisNotationAndPhase2ErrorHandling,
-    #[deku(id_pat = "2 | 3")] Ffu,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum TMSIStatusFlag {
-    #[deku(id_pat = "0")] NoValidTMSIAvailable,
-    #[deku(id_pat = "1")] ValidTMSIAvailable,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 8)]
-pub enum DRXParamSPLITPGCYCLECODE {
-    #[deku(id_pat = "0")] SevenHundredAndFourNoDRX,
-    #[deku(id_pat = "65")] SeventyOne,
-    #[deku(id_pat = "66")] SeventyTwo,
-    #[deku(id_pat = "67")] SeventyFour,
-    #[deku(id_pat = "68")] SeventyFive,
-    #[deku(id_pat = "69")] SeventySeven,
-    #[deku(id_pat = "70")] SeventyNine,
-    #[deku(id_pat = "71")] Eighty,
-    #[deku(id_pat = "72")] EightyThree,
-    #[deku(id_pat = "73")] EightySix,
-    #[deku(id_pat = "74")] EightyEight,
-    #[deku(id_pat = "75")] Ninety,
-    #[deku(id_pat = "76")] NinetyTwo,
-    #[deku(id_pat = "77")] NinetySix,
-    #[deku(id_pat = "78")] OneHundredAndOne,
-    #[deku(id_pat = "79")] OneHundredAndThree,
-    #[deku(id_pat = "80")] OneHundredAndSeven,
-    #[deku(id_pat = "81")] OneHundredAndTwelve,
-    #[deku(id_pat = "82")] OneHundredAndSixteen,
-    #[deku(id_pat = "83")] OneHundredAndEighteen,
-    #[deku(id_pat = "84")] OneHundredAndTwentyEight,
-    #[deku(id_pat = "85")] OneHundredAndFortyOne,
-    #[deku(id_pat = "86")] OneHundredAndFortyFour,
-    #[deku(id_pat = "87")] OneHundredAndFifty,
-    #[deku(id_pat = "88")] OneHundredAndSixty,
-    #[deku(id_pat = "89")] OneHundredAndSeventyOne,
-    #[deku(id_pat = "90")] OneHundredAndSeventySix,
-    #[deku(id_pat = "91")] OneHundredAndNinetyTwo,
-    #[deku(id_pat = "92")] TwoHundredAndFourteen,
-    #[deku(id_pat = "93")] TwoHundredAndTwentyFour,
-    #[deku(id_pat = "94")] TwoHundredAndThirtyFive,
-    #[deku(id_pat = "95")] TwoHundredAndFiftySix,
-    #[deku(id_pat = "96")] TwoHundredAndEightyEight,
-    #[deku(id_pat = "97")] ThreeHundredAndTwenty,
-    #[deku(id_pat = "98")] ThreeHundredAndFiftyTwo,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 4)]
-pub enum DRXParamDRXCycleLen {
-    #[deku(id_pat = "0")] DRXNotSpecifiedByTheMS,
-    #[deku(id_pat = "6")] IuCoeff6AndS1T32,
-    #[deku(id_pat = "7")] IuCoeff7AndS1T64,
-    #[deku(id_pat = "8")] IuCoeff8AndS1T128,
-    #[deku(id_pat = "9")] IuCoeff9AndS1T256,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum DRXParamNonDRXTimer {
-    #[deku(id_pat = "0")] NoNonDRXModeAfterTransferState,
-    #[deku(id_pat = "1")] Max1SecNonDRXModeAfterTransferState,
-    #[deku(id_pat = "2")] Max2SecNonDRXModeAfterTransferState,
-    #[deku(id_pat = "3")] Max4SecNonDRXModeAfterTransferState,
-    #[deku(id_pat = "4")] Max8SecNonDRXModeAfterTransferState,
-    #[deku(id_pat = "5")] Max16SecNonDRXModeAfterTransferState,
-    #[deku(id_pat = "6")] Max32SecNonDRXModeAfterTransferState,
-    #[deku(id_pat = "7")] Max64SecNonDRXModeAfterTransferState,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum NASKSITSC {
-    #[deku(id_pat = "0")] NativeSecurityContext,
-    #[deku(id_pat = "1")] MappedSecurityContext,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum NASKSIValue {
-    #[deku(id_pat = "7")] NoKeyAvailable,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "2..=7")] Other,
 }
 
 #[cfg(test)]
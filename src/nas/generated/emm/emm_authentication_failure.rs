@@ -1,56 +1,42 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{EMMCauseEMMCause};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMAuthenticationFailure {
-    #[deku(bytes = 1)] pub emm_cause: Type3V<EMMCauseEMMCause>,
-    #[deku(ctx = "Tag(48), NeedsByteSize")] pub auts: Type4TLV<Layer3Buffer>,
+    pub emm_cause: Type3V<EMMCauseEMMCause>,
+    pub auts: Type4TLV<Layer3Buffer>,
 }
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 8)]
-pub enum EMMCauseEMMCause {
-    #[deku(id_pat = "2")] IMSIUnknownInHSS,
-    #[deku(id_pat = "3")] IllegalUE,
-    #[deku(id_pat = "5")] IMEINotAccepted,
-    #[deku(id_pat = "6")] IllegalME,
-    #[deku(id_pat = "7")] EPSServicesNotAllowed,
-    #[deku(id_pat = "8")] EPSServicesAndNonEPSServicesNotAllowed,
-    #[deku(id_pat = "9")] UEIdentityCannotBeDerivedByTheNetwork,
-    #[deku(id_pat = "10")] ImplicitlyDetached,
-    #[deku(id_pat = "11")] PLMNNotAllowed,
-    #[deku(id_pat = "12")] TrackingAreaNotAllowed,
-    #[deku(id_pat = "13")] RoamingNotAllowedInThisTrackingArea,
-    #[deku(id_pat = "14")] EPSServicesNotAllowedInThisPLMN,
-    #[deku(id_pat = "15")] NoSuitableCellsInTrackingArea,
-    #[deku(id_pat = "16")] MSCTemporarilyNotReachable,
-    #[deku(id_pat = "17")] NetworkFailure,
-    #[deku(id_pat = "18")] CSDomainNotAvailable,
-    #[deku(id_pat = "19")] ESMFailure,
-    #[deku(id_pat = "20")] MACFailure,
-    #[deku(id_pat = "21")] SynchFailure,
-    #[deku(id_pat = "22")] Congestion,
-    #[deku(id_pat = "23")] UESecurityCapabilitiesMismatch,
-    #[deku(id_pat = "24")] SecurityModeRejectedUnspecified,
-    #[deku(id_pat = "25")] NotAuthorizedForThisCSG,
-    #[deku(id_pat = "26")] NonEPSAuthenticationUnacceptable,
-    #[deku(id_pat = "35")] RequestedServiceOptionNotAuthorizedInThisPLMN,
-    #[deku(id_pat = "39")] CSServiceTemporarilyNotAvailable,
-    #[deku(id_pat = "40")] NoEPSBearerContextActivated,
-    #[deku(id_pat = "42")] SevereNetworkFailure,
-    #[deku(id_pat = "95")] SemanticallyIncorrectMessage,
-    #[deku(id_pat = "96")] InvalidMandatoryInformation,
-    #[deku(id_pat = "97")] MessageTypeNonExistentOrNotImplemented,
-    #[deku(id_pat = "98")] MessageTypeNotCompatibleWithTheProtocolState,
-    #[deku(id_pat = "99")] InformationElementNonExistentOrNotImplemented,
-    #[deku(id_pat = "100")] ConditionalIEError,
-    #[deku(id_pat = "101")] MessageNotCompatibleWithTheProtocolState,
-    #[deku(id_pat = "111")] ProtocolErrorUnspecified,
-    #[deku(id_pat = "_")] Other,
+
+impl<'a> DekuReader<'a> for EMMAuthenticationFailure {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let emm_cause: Type3V<EMMCauseEMMCause> = DekuReader::from_reader_with_ctx(reader, ByteSize(1))?;
+        let mut auts: Type4TLV<Layer3Buffer> = Type4TLV::absent(Tag(48));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                48 => auts = DekuReader::from_reader_with_ctx(reader, (Tag(48), NeedsByteSize))?,
+                _ => if !skip_unknown_ie(reader, tag)? {
+                    break;
+                },
+            }
+        }
+        Ok(Self {
+            emm_cause,
+            auts,
+        })
+    }
 }
 
+
@@ -1,23 +1,37 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{NASKSI, NASKSITSC, NASKSIValue};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMAuthenticationRequest {
-    #[deku(pad_bits_before = "4")] pub nas_ksi: Type1V<NASKSI>,
-    #[deku(bytes = 16, ctx = "NeedsByteSize")] pub rand: Type3V<Layer3Buffer>,
+    pub nas_ksi: Type1V<NASKSI>,
+    pub rand: Type3V<Layer3Buffer>,
     pub autn: Type4LV<AUTN>,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct NASKSI {
-    pub tsc: NASKSITSC,
-    pub value: NASKSIValue,
+impl<'a> DekuReader<'a> for EMMAuthenticationRequest {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        reader.skip_bits(4)?;
+        let nas_ksi: Type1V<NASKSI> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let rand: Type3V<Layer3Buffer> = DekuReader::from_reader_with_ctx(reader, (ByteSize(16), NeedsByteSize))?;
+        let autn: Type4LV<AUTN> = DekuReader::from_reader_with_ctx(reader, ())?;
+        Ok(Self {
+            nas_ksi,
+            rand,
+            autn,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -26,20 +40,7 @@ pub struct AUTN {
     #[deku(count = "2")] pub amf: Vec<u8>,
     #[deku(count = "8")] pub mac: Vec<u8>,
 }
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum NASKSITSC {
-    #[deku(id_pat = "0")] NativeSecurityContext,
-    #[deku(id_pat = "1")] MappedSecurityContext,
-    #[deku(id_pat = "_")] Other,
-}
 
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum NASKSIValue {
-    #[deku(id_pat = "7")] NoKeyAvailable,
-    #[deku(id_pat = "_")] Other,
-}
 
 #[cfg(test)]
 mod tests {
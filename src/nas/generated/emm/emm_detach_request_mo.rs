@@ -1,23 +1,36 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{NASKSI, EPSID, NASKSITSC, NASKSIValue};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMDetachRequestMO {
     pub nas_ksi: Type1V<NASKSI>,
     pub eps_detach_type: Type1V<EPSDetachTypeMO>,
     pub epsid: Type4LV<EPSID>,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct NASKSI {
-    pub tsc: NASKSITSC,
-    pub value: NASKSIValue,
+impl<'a> DekuReader<'a> for EMMDetachRequestMO {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let nas_ksi: Type1V<NASKSI> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let eps_detach_type: Type1V<EPSDetachTypeMO> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let epsid: Type4LV<EPSID> = DekuReader::from_reader_with_ctx(reader, ())?;
+        Ok(Self {
+            nas_ksi,
+            eps_detach_type,
+            epsid,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -25,33 +38,13 @@ pub struct EPSDetachTypeMO {
     #[deku(bits = 1)] pub switch_off: u8,
     pub typ: EPSDetachTypeMOType,
 }
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct EPSID {
-
-}
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
 #[deku(id_type = "u8", bits = 3)]
 pub enum EPSDetachTypeMOType {
-    #[deku(id_pat = "0 | 3 | 4 | 5")] CombinedEPSIMSIDetach,
+    #[deku(id_pat = "0 | 3..=5")] CombinedEPSIMSIDetach,
     #[deku(id_pat = "1")] EPSDetach,
     #[deku(id_pat = "2")] IMSIDetach,
-    #[deku(id_pat = "6 | 7")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum NASKSITSC {
-    #[deku(id_pat = "0")] NativeSecurityContext,
-    #[deku(id_pat = "1")] MappedSecurityContext,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum NASKSIValue {
-    #[deku(id_pat = "7")] NoKeyAvailable,
+    #[deku(id_pat = "6..=7")] Reserved,
     #[deku(id_pat = "_")] Other,
 }
 
@@ -1,16 +1,43 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{EMMCauseEMMCause};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMDetachRequestMT {
-    #[deku(pad_bits_before = "4")] pub eps_detach_type: Type1V<EPSDetachTypeMT>,
-    #[deku(bytes = 1, ctx = "Tag(83)")] pub emm_cause: Type3TV<EMMCauseEMMCause>,
+    pub eps_detach_type: Type1V<EPSDetachTypeMT>,
+    pub emm_cause: Type3TV<EMMCauseEMMCause>,
+}
+
+impl<'a> DekuReader<'a> for EMMDetachRequestMT {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        reader.skip_bits(4)?;
+        let eps_detach_type: Type1V<EPSDetachTypeMT> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let mut emm_cause: Type3TV<EMMCauseEMMCause> = Type3TV::absent(Tag(83));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                83 => emm_cause = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(83)))?,
+                _ => if !skip_unknown_ie(reader, tag)? {
+                    break;
+                },
+            }
+        }
+        Ok(Self {
+            eps_detach_type,
+            emm_cause,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -18,55 +45,13 @@ pub struct EPSDetachTypeMT {
     #[deku(bits = 1)] pub spare: u8,
     pub typ: EPSDetachTypeMTType,
 }
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 8)]
-pub enum EMMCauseEMMCause {
-    #[deku(id_pat = "2")] IMSIUnknownInHSS,
-    #[deku(id_pat = "3")] IllegalUE,
-    #[deku(id_pat = "5")] IMEINotAccepted,
-    #[deku(id_pat = "6")] IllegalME,
-    #[deku(id_pat = "7")] EPSServicesNotAllowed,
-    #[deku(id_pat = "8")] EPSServicesAndNonEPSServicesNotAllowed,
-    #[deku(id_pat = "9")] UEIdentityCannotBeDerivedByTheNetwork,
-    #[deku(id_pat = "10")] ImplicitlyDetached,
-    #[deku(id_pat = "11")] PLMNNotAllowed,
-    #[deku(id_pat = "12")] TrackingAreaNotAllowed,
-    #[deku(id_pat = "13")] RoamingNotAllowedInThisTrackingArea,
-    #[deku(id_pat = "14")] EPSServicesNotAllowedInThisPLMN,
-    #[deku(id_pat = "15")] NoSuitableCellsInTrackingArea,
-    #[deku(id_pat = "16")] MSCTemporarilyNotReachable,
-    #[deku(id_pat = "17")] NetworkFailure,
-    #[deku(id_pat = "18")] CSDomainNotAvailable,
-    #[deku(id_pat = "19")] ESMFailure,
-    #[deku(id_pat = "20")] MACFailure,
-    #[deku(id_pat = "21")] SynchFailure,
-    #[deku(id_pat = "22")] Congestion,
-    #[deku(id_pat = "23")] UESecurityCapabilitiesMismatch,
-    #[deku(id_pat = "24")] SecurityModeRejectedUnspecified,
-    #[deku(id_pat = "25")] NotAuthorizedForThisCSG,
-    #[deku(id_pat = "26")] NonEPSAuthenticationUnacceptable,
-    #[deku(id_pat = "35")] RequestedServiceOptionNotAuthorizedInThisPLMN,
-    #[deku(id_pat = "39")] CSServiceTemporarilyNotAvailable,
-    #[deku(id_pat = "40")] NoEPSBearerContextActivated,
-    #[deku(id_pat = "42")] SevereNetworkFailure,
-    #[deku(id_pat = "95")] SemanticallyIncorrectMessage,
-    #[deku(id_pat = "96")] InvalidMandatoryInformation,
-    #[deku(id_pat = "97")] MessageTypeNonExistentOrNotImplemented,
-    #[deku(id_pat = "98")] MessageTypeNotCompatibleWithTheProtocolState,
-    #[deku(id_pat = "99")] InformationElementNonExistentOrNotImplemented,
-    #[deku(id_pat = "100")] ConditionalIEError,
-    #[deku(id_pat = "101")] MessageNotCompatibleWithTheProtocolState,
-    #[deku(id_pat = "111")] ProtocolErrorUnspecified,
-    #[deku(id_pat = "_")] Other,
-}
-
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
 #[deku(id_type = "u8", bits = 3)]
 pub enum EPSDetachTypeMTType {
-    #[deku(id_pat = "0 | 2 | 4 | 5")] ReAttachNotRequired,
+    #[deku(id_pat = "0 | 2 | 4..=5")] ReAttachNotRequired,
     #[deku(id_pat = "1")] ReAttachRequired,
     #[deku(id_pat = "3")] IMSIDetach,
-    #[deku(id_pat = "6 | 7")] Reserved,
+    #[deku(id_pat = "6..=7")] Reserved,
     #[deku(id_pat = "_")] Other,
 }
 
@@ -1,31 +1,58 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{NASKSI, ID, EPSBearerCtxtStat, DeviceProp, EPSBearerCtxtStatEBI7, EPSBearerCtxtStatEBI6, EPSBearerCtxtStatEBI5, EPSBearerCtxtStatEBI15, EPSBearerCtxtStatEBI14, EPSBearerCtxtStatEBI13, EPSBearerCtxtStatEBI12, EPSBearerCtxtStatEBI11, EPSBearerCtxtStatEBI10, EPSBearerCtxtStatEBI9, EPSBearerCtxtStatEBI8, NASKSITSC, NASKSIValue};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMExtServiceRequest {
     pub nas_ksi: Type1V<NASKSI>,
     pub service_type: Type1V<ServiceTypeV>,
     pub mtmsi: Type4LV<ID>,
-    #[deku(ctx = "Tag(11)")] pub csfb_response: Type1TV<CSFBResponse>,
-    #[deku(ctx = "Tag(87)")] pub eps_bearer_ctxt_stat: Type4TLV<EPSBearerCtxtStat>,
-    #[deku(ctx = "Tag(13)")] pub device_prop: Type1TV<DeviceProp>,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct NASKSI {
-    pub tsc: NASKSITSC,
-    pub value: NASKSIValue,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ID {
-
+    pub csfb_response: Type1TV<CSFBResponse>,
+    pub eps_bearer_ctxt_stat: Type4TLV<EPSBearerCtxtStat>,
+    pub device_prop: Type1TV<DeviceProp>,
+}
+
+impl<'a> DekuReader<'a> for EMMExtServiceRequest {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let nas_ksi: Type1V<NASKSI> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let service_type: Type1V<ServiceTypeV> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let mtmsi: Type4LV<ID> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let mut csfb_response: Type1TV<CSFBResponse> = Type1TV::absent(Tag(11));
+        let mut eps_bearer_ctxt_stat: Type4TLV<EPSBearerCtxtStat> = Type4TLV::absent(Tag(87));
+        let mut device_prop: Type1TV<DeviceProp> = Type1TV::absent(Tag(13));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                87 => eps_bearer_ctxt_stat = DekuReader::from_reader_with_ctx(reader, Tag(87))?,
+                _ => match tag >> 4 {
+                    11 => csfb_response = DekuReader::from_reader_with_ctx(reader, Tag(11))?,
+                    13 => device_prop = DekuReader::from_reader_with_ctx(reader, Tag(13))?,
+                    _ => if !skip_unknown_ie(reader, tag)? {
+                        break;
+                    },
+                },
+            }
+        }
+        Ok(Self {
+            nas_ksi,
+            service_type,
+            mtmsi,
+            csfb_response,
+            eps_bearer_ctxt_stat,
+            device_prop,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -33,130 +60,16 @@ pub struct CSFBResponse {
     #[deku(bits = 1)] pub spare: u8,
     pub value: CSFBResponseValue,
 }
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct EPSBearerCtxtStat {
-    pub ebi_7: EPSBearerCtxtStatEBI7,
-    pub ebi_6: EPSBearerCtxtStatEBI6,
-    pub ebi_5: EPSBearerCtxtStatEBI5,
-    #[deku(bits = 1)] pub ebi_4: u8,
-    #[deku(bits = 1)] pub ebi_3: u8,
-    #[deku(bits = 1)] pub ebi_2: u8,
-    #[deku(bits = 1)] pub ebi_1: u8,
-    #[deku(bits = 1)] pub ebi_0: u8,
-    pub ebi_15: EPSBearerCtxtStatEBI15,
-    pub ebi_14: EPSBearerCtxtStatEBI14,
-    pub ebi_13: EPSBearerCtxtStatEBI13,
-    pub ebi_12: EPSBearerCtxtStatEBI12,
-    pub ebi_11: EPSBearerCtxtStatEBI11,
-    pub ebi_10: EPSBearerCtxtStatEBI10,
-    pub ebi_9: EPSBearerCtxtStatEBI9,
-    pub ebi_8: EPSBearerCtxtStatEBI8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct DeviceProp {
-    #[deku(bits = 3)] pub spare: u8,
-    #[deku(bits = 1)] pub low_priority: u8,
-}
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
 #[deku(id_type = "u8", bits = 4)]
 pub enum ServiceTypeV {
     #[deku(id_pat = "0")] MobileOriginatingCSFallbackOr1XCSFallback,
     #[deku(id_pat = "1")] MobileTerminatingCSFallbackOr1XCSFallback,
     #[deku(id_pat = "2")] MobileOriginatingCSFallbackEmergencyCallOr1XCSFallbackEmergencyCall,
-    #[deku(id_pat = "3 | 4")] UnusedShallBeInterpretedAsMobileOriginatingCSFallbackOr1XCSFallbackIfReceivedByTheNetwork,
+    #[deku(id_pat = "3..=4")] UnusedShallBeInterpretedAsMobileOriginatingCSFallbackOr1XCSFallbackIfReceivedByTheNetwork,
     #[deku(id_pat = "8")] PacketServicesViaS1,
-    #[deku(id_pat = "9 | 10 | 11")] UnusedShallBeInterpretedAsPacketServicesViaS1IfReceivedByTheNetwork,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI7 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI6 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI5 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI15 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI14 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI13 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI12 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI11 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI10 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI9 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI8 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "9..=11")] UnusedShallBeInterpretedAsPacketServicesViaS1IfReceivedByTheNetwork,
+    #[deku(id_pat = "5..=7 | 12..=15")] Other,
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
@@ -164,22 +77,7 @@ pub enum EPSBearerCtxtStatEBI8 {
 pub enum CSFBResponseValue {
     #[deku(id_pat = "0")] CSFallbackRejectedByTheUE,
     #[deku(id_pat = "1")] CSFallbackAcceptedByTheUE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum NASKSITSC {
-    #[deku(id_pat = "0")] NativeSecurityContext,
-    #[deku(id_pat = "1")] MappedSecurityContext,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum NASKSIValue {
-    #[deku(id_pat = "7")] NoKeyAvailable,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "2..=7")] Other,
 }
 
 #[cfg(test)]
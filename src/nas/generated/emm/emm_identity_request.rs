@@ -1,15 +1,30 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMIdentityRequest {
-    #[deku(pad_bits_before = "4")] pub id_type: Type1V<IDTypeV>,
+    pub id_type: Type1V<IDTypeV>,
+}
+
+impl<'a> DekuReader<'a> for EMMIdentityRequest {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        reader.skip_bits(4)?;
+        let id_type: Type1V<IDTypeV> = DekuReader::from_reader_with_ctx(reader, ())?;
+        Ok(Self {
+            id_type,
+        })
+    }
 }
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
 #[deku(id_type = "u8", bits = 4)]
@@ -21,7 +36,7 @@ pub enum IDTypeV {
     #[deku(id_pat = "4")] TMSI,
     #[deku(id_pat = "5")] TMGI,
     #[deku(id_pat = "6")] Ffu,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "7..=15")] Other,
 }
 
 #[cfg(test)]
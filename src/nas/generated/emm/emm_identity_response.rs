@@ -1,20 +1,30 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{ID};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMIdentityResponse {
     pub id: Type4LV<ID>,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ID {
-
+impl<'a> DekuReader<'a> for EMMIdentityResponse {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let id: Type4LV<ID> = DekuReader::from_reader_with_ctx(reader, ())?;
+        Ok(Self {
+            id,
+        })
+    }
 }
 
 
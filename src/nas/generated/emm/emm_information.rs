@@ -1,19 +1,54 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMInformation {
-    #[deku(ctx = "Tag(67), NeedsByteSize")] pub net_full_name: Type4TLV<NetworkName>,
-    #[deku(ctx = "Tag(69), NeedsByteSize")] pub net_short_name: Type4TLV<NetworkName>,
-    #[deku(bytes = 1, ctx = "Tag(70)")] pub local_time_zone: Type3TV<TimeZone>,
-    #[deku(bytes = 7, ctx = "Tag(71)")] pub univ_time_and_time_zone: Type3TV<TimeZoneTime>,
-    #[deku(ctx = "Tag(73)")] pub dl_saving_time: Type4TLV<DLSavingTime>,
+    pub net_full_name: Type4TLV<NetworkName>,
+    pub net_short_name: Type4TLV<NetworkName>,
+    pub local_time_zone: Type3TV<TimeZone>,
+    pub univ_time_and_time_zone: Type3TV<TimeZoneTime>,
+    pub dl_saving_time: Type4TLV<DLSavingTime>,
+}
+
+impl<'a> DekuReader<'a> for EMMInformation {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let mut net_full_name: Type4TLV<NetworkName> = Type4TLV::absent(Tag(67));
+        let mut net_short_name: Type4TLV<NetworkName> = Type4TLV::absent(Tag(69));
+        let mut local_time_zone: Type3TV<TimeZone> = Type3TV::absent(Tag(70));
+        let mut univ_time_and_time_zone: Type3TV<TimeZoneTime> = Type3TV::absent(Tag(71));
+        let mut dl_saving_time: Type4TLV<DLSavingTime> = Type4TLV::absent(Tag(73));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                67 => net_full_name = DekuReader::from_reader_with_ctx(reader, (Tag(67), NeedsByteSize))?,
+                69 => net_short_name = DekuReader::from_reader_with_ctx(reader, (Tag(69), NeedsByteSize))?,
+                70 => local_time_zone = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(70)))?,
+                71 => univ_time_and_time_zone = DekuReader::from_reader_with_ctx(reader, (ByteSize(7), Tag(71)))?,
+                73 => dl_saving_time = DekuReader::from_reader_with_ctx(reader, Tag(73))?,
+                _ => if !skip_unknown_ie(reader, tag)? {
+                    break;
+                },
+            }
+        }
+        Ok(Self {
+            net_full_name,
+            net_short_name,
+            local_time_zone,
+            univ_time_and_time_zone,
+            dl_saving_time,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -108,7 +143,7 @@ pub enum TimeZoneTZS {
 pub enum NetworkNameCoding {
     #[deku(id_pat = "0")] GSM7BitDefaultAlphabet,
     #[deku(id_pat = "1")] UCS216Bit,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "2..=7")] Other,
 }
 
 #[cfg(test)]
@@ -0,0 +1,50 @@
+
+use deku::prelude::*;
+use deku::ctx::{BitSize, ByteSize, Endian};
+use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
+use crate::nas::layer3::*;
+
+/// Autogenerated rust code, do not modify directly! Any changes should be
+/// made via the python generator scripts.
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct EMMSecProtNASMessage {
+    #[deku(count = "4")] pub mac: Vec<u8>,
+    #[deku(bytes = 1)] pub seqn: u8,
+    #[deku(count = "byte_size - deku::byte_offset")] pub nas_message: Vec<u8>,
+}
+
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::nas::test_utils::*;
+    use deku::prelude::*;
+    use std::io::Cursor;
+
+    #[test]
+    fn test_case_1() {
+        let mut bytes = Cursor::new(unhexlify("a1b2c3d405074300035200c2"));
+        let mut reader = Reader::new(&mut bytes);
+        let msg = EMMSecProtNASMessage::from_reader_with_ctx(&mut reader, ByteSize(12))
+            .expect("failed to parse");
+        assert_eq!(msg.mac, vec![161, 178, 195, 212]);
+        assert_eq!(msg.seqn, 5);
+        assert_eq!(msg.nas_message, vec![7, 67, 0, 3, 82, 0, 194]);
+    }
+
+    #[test]
+    fn test_case_2() {
+        let mut bytes = Cursor::new(unhexlify("a1b2c3d40512345678"));
+        let mut reader = Reader::new(&mut bytes);
+        let msg = EMMSecProtNASMessage::from_reader_with_ctx(&mut reader, ByteSize(9))
+            .expect("failed to parse");
+        assert_eq!(msg.mac, vec![161, 178, 195, 212]);
+        assert_eq!(msg.seqn, 5);
+        assert_eq!(msg.nas_message, vec![18, 52, 86, 120]);
+    }
+}
+
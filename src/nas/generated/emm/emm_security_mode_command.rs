@@ -1,23 +1,71 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{NASKSI, UEAddSecCap, NASKSITSC, NASKSIValue};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMSecurityModeCommand {
-    #[deku(bytes = 1)] pub nas_sec_algo: Type3V<NASSecAlgo>,
-    #[deku(pad_bits_before = "4")] pub nas_ksi: Type1V<NASKSI>,
-    #[deku(ctx = "NeedsByteSize")] pub ue_sec_cap: Type4LV<UESecCap>,
-    #[deku(ctx = "Tag(12)")] pub imeisv_req: Type1TV<IMEISVReq>,
-    #[deku(bytes = 4, ctx = "Tag(85), NeedsByteSize")] pub nonce_ue: Type3TV<Layer3Buffer>,
-    #[deku(bytes = 4, ctx = "Tag(86), NeedsByteSize")] pub nonce_mme: Type3TV<Layer3Buffer>,
-    #[deku(ctx = "Tag(79), NeedsByteSize")] pub hash_mme: Type4TLV<Layer3Buffer>,
-    #[deku(ctx = "Tag(111), NeedsByteSize")] pub ue_add_sec_cap: Type4TLV<UEAddSecCap>,
-    #[deku(ctx = "Tag(13)")] pub ue_radio_cap_id_req: Type1TV<UERadioCapIDReq>,
+    pub nas_sec_algo: Type3V<NASSecAlgo>,
+    pub nas_ksi: Type1V<NASKSI>,
+    pub ue_sec_cap: Type4LV<UESecCap>,
+    pub imeisv_req: Type1TV<IMEISVReq>,
+    pub nonce_ue: Type3TV<Layer3Buffer>,
+    pub nonce_mme: Type3TV<Layer3Buffer>,
+    pub hash_mme: Type4TLV<Layer3Buffer>,
+    pub ue_add_sec_cap: Type4TLV<UEAddSecCap>,
+    pub ue_radio_cap_id_req: Type1TV<UERadioCapIDReq>,
+}
+
+impl<'a> DekuReader<'a> for EMMSecurityModeCommand {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let nas_sec_algo: Type3V<NASSecAlgo> = DekuReader::from_reader_with_ctx(reader, ByteSize(1))?;
+        reader.skip_bits(4)?;
+        let nas_ksi: Type1V<NASKSI> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let ue_sec_cap: Type4LV<UESecCap> = DekuReader::from_reader_with_ctx(reader, NeedsByteSize)?;
+        let mut imeisv_req: Type1TV<IMEISVReq> = Type1TV::absent(Tag(12));
+        let mut nonce_ue: Type3TV<Layer3Buffer> = Type3TV::absent(Tag(85));
+        let mut nonce_mme: Type3TV<Layer3Buffer> = Type3TV::absent(Tag(86));
+        let mut hash_mme: Type4TLV<Layer3Buffer> = Type4TLV::absent(Tag(79));
+        let mut ue_add_sec_cap: Type4TLV<UEAddSecCap> = Type4TLV::absent(Tag(111));
+        let mut ue_radio_cap_id_req: Type1TV<UERadioCapIDReq> = Type1TV::absent(Tag(13));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                85 => nonce_ue = DekuReader::from_reader_with_ctx(reader, (ByteSize(4), Tag(85), NeedsByteSize))?,
+                86 => nonce_mme = DekuReader::from_reader_with_ctx(reader, (ByteSize(4), Tag(86), NeedsByteSize))?,
+                79 => hash_mme = DekuReader::from_reader_with_ctx(reader, (Tag(79), NeedsByteSize))?,
+                111 => ue_add_sec_cap = DekuReader::from_reader_with_ctx(reader, (Tag(111), NeedsByteSize))?,
+                _ => match tag >> 4 {
+                    12 => imeisv_req = DekuReader::from_reader_with_ctx(reader, Tag(12))?,
+                    13 => ue_radio_cap_id_req = DekuReader::from_reader_with_ctx(reader, Tag(13))?,
+                    _ => if !skip_unknown_ie(reader, tag)? {
+                        break;
+                    },
+                },
+            }
+        }
+        Ok(Self {
+            nas_sec_algo,
+            nas_ksi,
+            ue_sec_cap,
+            imeisv_req,
+            nonce_ue,
+            nonce_mme,
+            hash_mme,
+            ue_add_sec_cap,
+            ue_radio_cap_id_req,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -28,12 +76,6 @@ pub struct NASSecAlgo {
     pub integ_algo: NASSecAlgoIntegAlgo,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct NASKSI {
-    pub tsc: NASKSITSC,
-    pub value: NASKSIValue,
-}
-
 #[derive(DekuRead, Debug, Serialize, Clone)]
 #[deku(ctx = "ByteSize(byte_size): ByteSize")]
 pub struct UESecCap {
@@ -85,43 +127,6 @@ pub struct IMEISVReq {
     pub value: IMEISVReqValue,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-#[deku(ctx = "ByteSize(byte_size): ByteSize")]
-pub struct UEAddSecCap {
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_0: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_1_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_2_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_3_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_4: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_6: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_7: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_8: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_9: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_10: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_11: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_12: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_13: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_14: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_15: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_0: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_1_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_2_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_3_128: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_4: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_5: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_6: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_7: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_8: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_9: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_10: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_11: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_12: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_13: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_14: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_15: u8,
-}
-
 #[derive(DekuRead, Debug, Serialize, Clone)]
 pub struct UERadioCapIDReq {
     #[deku(bits = 1)] pub spare: u8,
@@ -132,7 +137,7 @@ pub struct UERadioCapIDReq {
 pub enum UERadioCapIDReqValue {
     #[deku(id_pat = "0")] UERadioCapabilityIDNotRequested,
     #[deku(id_pat = "1")] UERadioCapabilityIDRequested,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "2..=7")] Other,
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
@@ -140,22 +145,7 @@ pub enum UERadioCapIDReqValue {
 pub enum IMEISVReqValue {
     #[deku(id_pat = "0")] IMEISVNotRequested,
     #[deku(id_pat = "1")] IMEISVRequested,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum NASKSITSC {
-    #[deku(id_pat = "0")] NativeSecurityContext,
-    #[deku(id_pat = "1")] MappedSecurityContext,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum NASKSIValue {
-    #[deku(id_pat = "7")] NoKeyAvailable,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "2..=7")] Other,
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
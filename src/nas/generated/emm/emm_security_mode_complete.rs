@@ -1,22 +1,47 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{ID};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMSecurityModeComplete {
-    #[deku(ctx = "Tag(35)")] pub imeisv: Type4TLV<ID>,
-    #[deku(ctx = "Tag(121), NeedsByteSize")] pub nas_message: Type6TLVE<Layer3Buffer>,
-    #[deku(ctx = "Tag(102), NeedsByteSize")] pub ue_radio_cap_id: Type4TLV<Layer3Buffer>,
+    pub imeisv: Type4TLV<ID>,
+    pub nas_message: Type6TLVE<Layer3Buffer>,
+    pub ue_radio_cap_id: Type4TLV<Layer3Buffer>,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ID {
-
+impl<'a> DekuReader<'a> for EMMSecurityModeComplete {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let mut imeisv: Type4TLV<ID> = Type4TLV::absent(Tag(35));
+        let mut nas_message: Type6TLVE<Layer3Buffer> = Type6TLVE::absent(Tag(121));
+        let mut ue_radio_cap_id: Type4TLV<Layer3Buffer> = Type4TLV::absent(Tag(102));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                35 => imeisv = DekuReader::from_reader_with_ctx(reader, Tag(35))?,
+                121 => nas_message = DekuReader::from_reader_with_ctx(reader, (Tag(121), NeedsByteSize))?,
+                102 => ue_radio_cap_id = DekuReader::from_reader_with_ctx(reader, (Tag(102), NeedsByteSize))?,
+                _ => if !skip_unknown_ie(reader, tag)? {
+                    break;
+                },
+            }
+        }
+        Ok(Self {
+            imeisv,
+            nas_message,
+            ue_radio_cap_id,
+        })
+    }
 }
 
 
@@ -0,0 +1,43 @@
+
+use deku::prelude::*;
+use deku::ctx::{BitSize, ByteSize, Endian};
+use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
+use crate::nas::layer3::*;
+
+/// Autogenerated rust code, do not modify directly! Any changes should be
+/// made via the python generator scripts.
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct EMMServiceRequest {
+    pub ksi: EMMServiceRequestKSI,
+    #[deku(bits = 5)] pub seqn_short: u8,
+    #[deku(count = "2")] pub mac_short: Vec<u8>,
+}
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum EMMServiceRequestKSI {
+    #[deku(id_pat = "7")] NoKeyAvailable,
+    #[deku(id_pat = "0..=6")] Other,
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::nas::test_utils::*;
+    use deku::prelude::*;
+    use std::io::Cursor;
+
+    #[test]
+    fn test_case_1() {
+        let mut bytes = Cursor::new(unhexlify("0a1b2c"));
+        let mut reader = Reader::new(&mut bytes);
+        let msg = EMMServiceRequest::from_reader_with_ctx(&mut reader, ())
+            .expect("failed to parse");
+        assert_eq!(msg.ksi, EMMServiceRequestKSI::Other);
+        assert_eq!(msg.seqn_short, 10);
+        assert_eq!(msg.mac_short, vec![27, 44]);
+    }
+}
+
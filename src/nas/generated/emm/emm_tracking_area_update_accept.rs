@@ -1,119 +1,149 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{GPRSTimer, EPSID, EPSBearerCtxtStat, LAI, ID, PLMNList, PLMN, EmergNumList, EmergNum, ServiceCat, EPSNetFeat, AddUpdateRes, GPRSTimer3, ExtDRXParam, SMSServStat, Non3GPPNWProvPol, NetworkPol, ExtEmergNumList, UERadioCapIDDelInd, EMMCauseEMMCause, UERadioCapIDDelIndDelRequest, ExtEmergNumListEENLValidity, NetworkPolValue, Non3GPPNWProvPolValue, SMSServStatValue, GPRSTimer3Unit, AddUpdateResValue, EPSNetFeatCSLCS, EPSBearerCtxtStatEBI7, EPSBearerCtxtStatEBI6, EPSBearerCtxtStatEBI5, EPSBearerCtxtStatEBI15, EPSBearerCtxtStatEBI14, EPSBearerCtxtStatEBI13, EPSBearerCtxtStatEBI12, EPSBearerCtxtStatEBI11, EPSBearerCtxtStatEBI10, EPSBearerCtxtStatEBI9, EPSBearerCtxtStatEBI8, GPRSTimerUnit};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMTrackingAreaUpdateAccept {
-    #[deku(pad_bits_before = "4")] pub eps_update_result: Type1V<EPSUpdateResultV>,
-    #[deku(bytes = 1, ctx = "Tag(90)")] pub t_3412: Type3TV<GPRSTimer>,
-    #[deku(ctx = "Tag(80)")] pub guti: Type4TLV<EPSID>,
-    #[deku(ctx = "Tag(84)")] pub tai_list: Type4TLV<()>,
-    #[deku(ctx = "Tag(87)")] pub eps_bearer_ctxt_stat: Type4TLV<EPSBearerCtxtStat>,
-    #[deku(bytes = 5, ctx = "Tag(19)")] pub lai: Type3TV<LAI>,
-    #[deku(ctx = "Tag(35)")] pub id: Type4TLV<ID>,
-    #[deku(bytes = 1, ctx = "Tag(83)")] pub emm_cause: Type3TV<EMMCauseEMMCause>,
-    #[deku(bytes = 1, ctx = "Tag(23)")] pub t_3402: Type3TV<GPRSTimer>,
-    #[deku(bytes = 1, ctx = "Tag(89)")] pub t_3423: Type3TV<GPRSTimer>,
-    #[deku(ctx = "Tag(74)")] pub equiv_plmn_list: Type4TLV<()>,
-    #[deku(ctx = "Tag(52)")] pub emerg_num_list: Type4TLV<()>,
-    #[deku(ctx = "Tag(100), NeedsByteSize")] pub eps_net_feat: Type4TLV<EPSNetFeat>,
-    #[deku(ctx = "Tag(15)")] pub add_update_res: Type1TV<AddUpdateRes>,
-    #[deku(ctx = "Tag(94)")] pub t_3412_ext: Type4TLV<GPRSTimer3>,
-    #[deku(ctx = "Tag(106)")] pub t_3324: Type4TLV<GPRSTimer>,
-    #[deku(ctx = "Tag(110)")] pub ext_drx_param: Type4TLV<ExtDRXParam>,
-    #[deku(ctx = "Tag(104)")] pub hdr_comp_config_stat: Type4TLV<HdrCompConfigStat>,
-    #[deku(endian = "big", ctx = "Tag(101)")] pub dcnid: Type4TLV<u16>,
-    #[deku(ctx = "Tag(14)")] pub sms_serv_stat: Type1TV<SMSServStat>,
-    #[deku(ctx = "Tag(13)")] pub non_3_gppnw_prov_pol: Type1TV<Non3GPPNWProvPol>,
-    #[deku(ctx = "Tag(107)")] pub t_3448: Type4TLV<GPRSTimer>,
-    #[deku(ctx = "Tag(12)")] pub network_pol: Type1TV<NetworkPol>,
-    #[deku(ctx = "Tag(108)")] pub t_3447: Type4TLV<GPRSTimer3>,
-    #[deku(ctx = "Tag(122)")] pub ext_emerg_num_list: Type6TLVE<ExtEmergNumList>,
-    #[deku(ctx = "Tag(124)")] pub cipher_key_data: Type6TLVE<()>,
-    #[deku(ctx = "Tag(102), NeedsByteSize")] pub ue_radio_cap_id: Type4TLV<Layer3Buffer>,
-    #[deku(ctx = "Tag(11)")] pub ue_radio_cap_id_del_ind: Type1TV<UERadioCapIDDelInd>,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct GPRSTimer {
-    pub unit: GPRSTimerUnit,
-    #[deku(bits = 5)] pub value: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct EPSID {
-
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct EPSBearerCtxtStat {
-    pub ebi_7: EPSBearerCtxtStatEBI7,
-    pub ebi_6: EPSBearerCtxtStatEBI6,
-    pub ebi_5: EPSBearerCtxtStatEBI5,
-    #[deku(bits = 1)] pub ebi_4: u8,
-    #[deku(bits = 1)] pub ebi_3: u8,
-    #[deku(bits = 1)] pub ebi_2: u8,
-    #[deku(bits = 1)] pub ebi_1: u8,
-    #[deku(bits = 1)] pub ebi_0: u8,
-    pub ebi_15: EPSBearerCtxtStatEBI15,
-    pub ebi_14: EPSBearerCtxtStatEBI14,
-    pub ebi_13: EPSBearerCtxtStatEBI13,
-    pub ebi_12: EPSBearerCtxtStatEBI12,
-    pub ebi_11: EPSBearerCtxtStatEBI11,
-    pub ebi_10: EPSBearerCtxtStatEBI10,
-    pub ebi_9: EPSBearerCtxtStatEBI9,
-    pub ebi_8: EPSBearerCtxtStatEBI8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct LAI {
-    #[deku(count = "3")] pub plmn: Vec<u8>,
-    #[deku(bytes = 2, endian = "big")] pub lac: u16,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ID {
-
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-#[deku(ctx = "ByteSize(byte_size): ByteSize")]
-pub struct EPSNetFeat {
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub cp_c_io_t: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub e_rwo_pdn: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub esr_ps: u8,
-    #[deku(cond = "deku::byte_offset < byte_size", default = "EPSNetFeatCSLCS::NoInfo")] pub cs_lcs: EPSNetFeatCSLCS,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub epc_lcs: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub emc_bs: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub ims_vo_ps: u8,
-    #[deku(bits = 4, cond = "deku::byte_offset < byte_size")] pub spare: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub epco: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub hc_cp_c_io_t: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub s_1_u_data: u8,
-    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub up_c_io_t: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct AddUpdateRes {
-    #[deku(bits = 2)] pub spare: u8,
-    pub value: AddUpdateResValue,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct GPRSTimer3 {
-    pub unit: GPRSTimer3Unit,
-    #[deku(bits = 5)] pub value: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ExtDRXParam {
-    #[deku(bits = 4)] pub ptx: u8,
-    #[deku(bits = 4)] pub e_drx: u8,
+    pub eps_update_result: Type1V<EPSUpdateResultV>,
+    pub t_3412: Type3TV<GPRSTimer>,
+    pub guti: Type4TLV<EPSID>,
+    pub tai_list: Type4TLV<()>,
+    pub eps_bearer_ctxt_stat: Type4TLV<EPSBearerCtxtStat>,
+    pub lai: Type3TV<LAI>,
+    pub id: Type4TLV<ID>,
+    pub emm_cause: Type3TV<EMMCauseEMMCause>,
+    pub t_3402: Type3TV<GPRSTimer>,
+    pub t_3423: Type3TV<GPRSTimer>,
+    pub equiv_plmn_list: Type4TLV<PLMNList>,
+    pub emerg_num_list: Type4TLV<EmergNumList>,
+    pub eps_net_feat: Type4TLV<EPSNetFeat>,
+    pub add_update_res: Type1TV<AddUpdateRes>,
+    pub t_3412_ext: Type4TLV<GPRSTimer3>,
+    pub t_3324: Type4TLV<GPRSTimer>,
+    pub ext_drx_param: Type4TLV<ExtDRXParam>,
+    pub hdr_comp_config_stat: Type4TLV<HdrCompConfigStat>,
+    pub dcnid: Type4TLV<u16>,
+    pub sms_serv_stat: Type1TV<SMSServStat>,
+    pub non_3_gppnw_prov_pol: Type1TV<Non3GPPNWProvPol>,
+    pub t_3448: Type4TLV<GPRSTimer>,
+    pub network_pol: Type1TV<NetworkPol>,
+    pub t_3447: Type4TLV<GPRSTimer3>,
+    pub ext_emerg_num_list: Type6TLVE<ExtEmergNumList>,
+    pub cipher_key_data: Type6TLVE<()>,
+    pub ue_radio_cap_id: Type4TLV<Layer3Buffer>,
+    pub ue_radio_cap_id_del_ind: Type1TV<UERadioCapIDDelInd>,
+}
+
+impl<'a> DekuReader<'a> for EMMTrackingAreaUpdateAccept {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        reader.skip_bits(4)?;
+        let eps_update_result: Type1V<EPSUpdateResultV> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let mut t_3412: Type3TV<GPRSTimer> = Type3TV::absent(Tag(90));
+        let mut guti: Type4TLV<EPSID> = Type4TLV::absent(Tag(80));
+        let mut tai_list: Type4TLV<()> = Type4TLV::absent(Tag(84));
+        let mut eps_bearer_ctxt_stat: Type4TLV<EPSBearerCtxtStat> = Type4TLV::absent(Tag(87));
+        let mut lai: Type3TV<LAI> = Type3TV::absent(Tag(19));
+        let mut id: Type4TLV<ID> = Type4TLV::absent(Tag(35));
+        let mut emm_cause: Type3TV<EMMCauseEMMCause> = Type3TV::absent(Tag(83));
+        let mut t_3402: Type3TV<GPRSTimer> = Type3TV::absent(Tag(23));
+        let mut t_3423: Type3TV<GPRSTimer> = Type3TV::absent(Tag(89));
+        let mut equiv_plmn_list: Type4TLV<PLMNList> = Type4TLV::absent(Tag(74));
+        let mut emerg_num_list: Type4TLV<EmergNumList> = Type4TLV::absent(Tag(52));
+        let mut eps_net_feat: Type4TLV<EPSNetFeat> = Type4TLV::absent(Tag(100));
+        let mut add_update_res: Type1TV<AddUpdateRes> = Type1TV::absent(Tag(15));
+        let mut t_3412_ext: Type4TLV<GPRSTimer3> = Type4TLV::absent(Tag(94));
+        let mut t_3324: Type4TLV<GPRSTimer> = Type4TLV::absent(Tag(106));
+        let mut ext_drx_param: Type4TLV<ExtDRXParam> = Type4TLV::absent(Tag(110));
+        let mut hdr_comp_config_stat: Type4TLV<HdrCompConfigStat> = Type4TLV::absent(Tag(104));
+        let mut dcnid: Type4TLV<u16> = Type4TLV::absent(Tag(101));
+        let mut sms_serv_stat: Type1TV<SMSServStat> = Type1TV::absent(Tag(14));
+        let mut non_3_gppnw_prov_pol: Type1TV<Non3GPPNWProvPol> = Type1TV::absent(Tag(13));
+        let mut t_3448: Type4TLV<GPRSTimer> = Type4TLV::absent(Tag(107));
+        let mut network_pol: Type1TV<NetworkPol> = Type1TV::absent(Tag(12));
+        let mut t_3447: Type4TLV<GPRSTimer3> = Type4TLV::absent(Tag(108));
+        let mut ext_emerg_num_list: Type6TLVE<ExtEmergNumList> = Type6TLVE::absent(Tag(122));
+        let mut cipher_key_data: Type6TLVE<()> = Type6TLVE::absent(Tag(124));
+        let mut ue_radio_cap_id: Type4TLV<Layer3Buffer> = Type4TLV::absent(Tag(102));
+        let mut ue_radio_cap_id_del_ind: Type1TV<UERadioCapIDDelInd> = Type1TV::absent(Tag(11));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                90 => t_3412 = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(90)))?,
+                80 => guti = DekuReader::from_reader_with_ctx(reader, Tag(80))?,
+                84 => tai_list = DekuReader::from_reader_with_ctx(reader, Tag(84))?,
+                87 => eps_bearer_ctxt_stat = DekuReader::from_reader_with_ctx(reader, Tag(87))?,
+                19 => lai = DekuReader::from_reader_with_ctx(reader, (ByteSize(5), Tag(19)))?,
+                35 => id = DekuReader::from_reader_with_ctx(reader, Tag(35))?,
+                83 => emm_cause = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(83)))?,
+                23 => t_3402 = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(23)))?,
+                89 => t_3423 = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(89)))?,
+                74 => equiv_plmn_list = DekuReader::from_reader_with_ctx(reader, (Tag(74), NeedsByteSize))?,
+                52 => emerg_num_list = DekuReader::from_reader_with_ctx(reader, (Tag(52), NeedsByteSize))?,
+                100 => eps_net_feat = DekuReader::from_reader_with_ctx(reader, (Tag(100), NeedsByteSize))?,
+                94 => t_3412_ext = DekuReader::from_reader_with_ctx(reader, Tag(94))?,
+                106 => t_3324 = DekuReader::from_reader_with_ctx(reader, Tag(106))?,
+                110 => ext_drx_param = DekuReader::from_reader_with_ctx(reader, Tag(110))?,
+                104 => hdr_comp_config_stat = DekuReader::from_reader_with_ctx(reader, Tag(104))?,
+                101 => dcnid = DekuReader::from_reader_with_ctx(reader, (Endian::Big, Tag(101)))?,
+                107 => t_3448 = DekuReader::from_reader_with_ctx(reader, Tag(107))?,
+                108 => t_3447 = DekuReader::from_reader_with_ctx(reader, Tag(108))?,
+                122 => ext_emerg_num_list = DekuReader::from_reader_with_ctx(reader, Tag(122))?,
+                124 => cipher_key_data = DekuReader::from_reader_with_ctx(reader, Tag(124))?,
+                102 => ue_radio_cap_id = DekuReader::from_reader_with_ctx(reader, (Tag(102), NeedsByteSize))?,
+                _ => match tag >> 4 {
+                    15 => add_update_res = DekuReader::from_reader_with_ctx(reader, Tag(15))?,
+                    14 => sms_serv_stat = DekuReader::from_reader_with_ctx(reader, Tag(14))?,
+                    13 => non_3_gppnw_prov_pol = DekuReader::from_reader_with_ctx(reader, Tag(13))?,
+                    12 => network_pol = DekuReader::from_reader_with_ctx(reader, Tag(12))?,
+                    11 => ue_radio_cap_id_del_ind = DekuReader::from_reader_with_ctx(reader, Tag(11))?,
+                    _ => if !skip_unknown_ie(reader, tag)? {
+                        break;
+                    },
+                },
+            }
+        }
+        Ok(Self {
+            eps_update_result,
+            t_3412,
+            guti,
+            tai_list,
+            eps_bearer_ctxt_stat,
+            lai,
+            id,
+            emm_cause,
+            t_3402,
+            t_3423,
+            equiv_plmn_list,
+            emerg_num_list,
+            eps_net_feat,
+            add_update_res,
+            t_3412_ext,
+            t_3324,
+            ext_drx_param,
+            hdr_comp_config_stat,
+            dcnid,
+            sms_serv_stat,
+            non_3_gppnw_prov_pol,
+            t_3448,
+            network_pol,
+            t_3447,
+            ext_emerg_num_list,
+            cipher_key_data,
+            ue_radio_cap_id,
+            ue_radio_cap_id_del_ind,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -135,37 +165,6 @@ pub struct HdrCompConfigStat {
     pub ebi_9: HdrCompConfigStatEBI9,
     pub ebi_8: HdrCompConfigStatEBI8,
 }
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct SMSServStat {
-    #[deku(bits = 1)] pub spare: u8,
-    pub value: SMSServStatValue,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct Non3GPPNWProvPol {
-    #[deku(bits = 3)] pub spare: u8,
-    pub value: Non3GPPNWProvPolValue,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct NetworkPol {
-    #[deku(bits = 3)] pub spare: u8,
-    pub value: NetworkPolValue,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ExtEmergNumList {
-    #[deku(bits = 7)] pub spare: u8,
-    pub eenl_validity: ExtEmergNumListEENLValidity,
-    pub eenl: (),
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct UERadioCapIDDelInd {
-    #[deku(bits = 1)] pub spare: u8,
-    pub del_request: UERadioCapIDDelIndDelRequest,
-}
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
 #[deku(id_type = "u8", bits = 4)]
 pub enum EPSUpdateResultV {
@@ -173,91 +172,7 @@ pub enum EPSUpdateResultV {
     #[deku(id_pat = "1")] CombinedTALAUpdated,
     #[deku(id_pat = "4")] TAUpdatedAndISRActivated,
     #[deku(id_pat = "5")] CombinedTALAUpdatedAndISRActivated,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 8)]
-pub enum EMMCauseEMMCause {
-    #[deku(id_pat = "2")] IMSIUnknownInHSS,
-    #[deku(id_pat = "3")] IllegalUE,
-    #[deku(id_pat = "5")] IMEINotAccepted,
-    #[deku(id_pat = "6")] IllegalME,
-    #[deku(id_pat = "7")] EPSServicesNotAllowed,
-    #[deku(id_pat = "8")] EPSServicesAndNonEPSServicesNotAllowed,
-    #[deku(id_pat = "9")] UEIdentityCannotBeDerivedByTheNetwork,
-    #[deku(id_pat = "10")] ImplicitlyDetached,
-    #[deku(id_pat = "11")] PLMNNotAllowed,
-    #[deku(id_pat = "12")] TrackingAreaNotAllowed,
-    #[deku(id_pat = "13")] RoamingNotAllowedInThisTrackingArea,
-    #[deku(id_pat = "14")] EPSServicesNotAllowedInThisPLMN,
-    #[deku(id_pat = "15")] NoSuitableCellsInTrackingArea,
-    #[deku(id_pat = "16")] MSCTemporarilyNotReachable,
-    #[deku(id_pat = "17")] NetworkFailure,
-    #[deku(id_pat = "18")] CSDomainNotAvailable,
-    #[deku(id_pat = "19")] ESMFailure,
-    #[deku(id_pat = "20")] MACFailure,
-    #[deku(id_pat = "21")] SynchFailure,
-    #[deku(id_pat = "22")] Congestion,
-    #[deku(id_pat = "23")] UESecurityCapabilitiesMismatch,
-    #[deku(id_pat = "24")] SecurityModeRejectedUnspecified,
-    #[deku(id_pat = "25")] NotAuthorizedForThisCSG,
-    #[deku(id_pat = "26")] NonEPSAuthenticationUnacceptable,
-    #[deku(id_pat = "35")] RequestedServiceOptionNotAuthorizedInThisPLMN,
-    #[deku(id_pat = "39")] CSServiceTemporarilyNotAvailable,
-    #[deku(id_pat = "40")] NoEPSBearerContextActivated,
-    #[deku(id_pat = "42")] SevereNetworkFailure,
-    #[deku(id_pat = "95")] SemanticallyIncorrectMessage,
-    #[deku(id_pat = "96")] InvalidMandatoryInformation,
-    #[deku(id_pat = "97")] MessageTypeNonExistentOrNotImplemented,
-    #[deku(id_pat = "98")] MessageTypeNotCompatibleWithTheProtocolState,
-    #[deku(id_pat = "99")] InformationElementNonExistentOrNotImplemented,
-    #[deku(id_pat = "100")] ConditionalIEError,
-    #[deku(id_pat = "101")] MessageNotCompatibleWithTheProtocolState,
-    #[deku(id_pat = "111")] ProtocolErrorUnspecified,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum UERadioCapIDDelIndDelRequest {
-    #[deku(id_pat = "0")] UERadioCapabilityIDDeletionNotRequested,
-    #[deku(id_pat = "1")] NetworkAssignedUERadioCapabilityIDsDeletionRequested,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum ExtEmergNumListEENLValidity {
-    #[deku(id_pat = "0")] CountryWideList,
-    #[deku(id_pat = "1")] PLMNWideList,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum NetworkPolValue {
-    #[deku(id_pat = "0")] UnsecuredRedirectionToGERANAllowed,
-    #[deku(id_pat = "1")] UnsecuredRedirectionToGERANNotAllowed,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum Non3GPPNWProvPolValue {
-    #[deku(id_pat = "0")] UseOfNon3GPPEmergencyNumbersNotPermitted,
-    #[deku(id_pat = "1")] UseOfNon3GPPEmergencyNumbersPermitted,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum SMSServStatValue {
-    #[deku(id_pat = "0")] SMSServicesNotAvailable,
-    #[deku(id_pat = "1")] SMSServicesNotAvailableInThisPLMN,
-    #[deku(id_pat = "2")] NetworkFailure,
-    #[deku(id_pat = "3")] Congestion,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "2..=3 | 6..=15")] Other,
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
@@ -348,137 +263,6 @@ pub enum HdrCompConfigStatEBI8 {
     #[deku(id_pat = "_")] Other,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum GPRSTimer3Unit {
-    #[deku(id_pat = "0")] TenMin,
-    #[deku(id_pat = "1")] OneHour,
-    #[deku(id_pat = "2")] TenHours,
-    #[deku(id_pat = "3")] TwoSec,
-    #[deku(id_pat = "4")] ThirtySec,
-    #[deku(id_pat = "5")] OneMin,
-    #[deku(id_pat = "6")] ThreeHundredAndTwentyHours,
-    #[deku(id_pat = "7")] TimerDeactivated,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 2)]
-pub enum AddUpdateResValue {
-    #[deku(id_pat = "0")] NoAdditionalInformation,
-    #[deku(id_pat = "1")] CSFallbackNotPreferred,
-    #[deku(id_pat = "2")] SMSOnly,
-    #[deku(id_pat = "3")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 2)]
-pub enum EPSNetFeatCSLCS {
-    #[deku(id_pat = "0")] NoInfo,
-    #[deku(id_pat = "1")] Supported,
-    #[deku(id_pat = "2")] NotSupported,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI7 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI6 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI5 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI15 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI14 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI13 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI12 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI11 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI10 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI9 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI8 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum GPRSTimerUnit {
-    #[deku(id_pat = "0")] TwoSec,
-    #[deku(id_pat = "1")] OneMin,
-    #[deku(id_pat = "2")] SixMin,
-    #[deku(id_pat = "7")] TimerDeactivated,
-    #[deku(id_pat = "_")] Other,
-}
-
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -517,6 +301,15 @@ mod tests {
         let t_3402 = msg.t_3402.inner.unwrap();
         assert_eq!(t_3402.unit, GPRSTimerUnit::OneMin);
         assert_eq!(t_3402.value, 12);
+        let emerg_num_list = msg.emerg_num_list.inner.unwrap();
+        assert_eq!(emerg_num_list.emerg_num_list.len(), 1);
+        assert_eq!(emerg_num_list.emerg_num_list[0].len, 3);
+        assert_eq!(emerg_num_list.emerg_num_list[0].service_cat.police, 0);
+        assert_eq!(emerg_num_list.emerg_num_list[0].service_cat.ambulance, 0);
+        assert_eq!(emerg_num_list.emerg_num_list[0].service_cat.fire, 0);
+        assert_eq!(emerg_num_list.emerg_num_list[0].service_cat.marine, 0);
+        assert_eq!(emerg_num_list.emerg_num_list[0].service_cat.mountain, 0);
+        assert_eq!(emerg_num_list.emerg_num_list[0].num, vec![25, 241]);
         let eps_net_feat = msg.eps_net_feat.inner.unwrap();
         assert_eq!(eps_net_feat.cp_c_io_t, 0);
         assert_eq!(eps_net_feat.e_rwo_pdn, 0);
@@ -1,26 +1,59 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{NASKSI, EPSBearerCtxtStat, DeviceProp, EPSBearerCtxtStatEBI7, EPSBearerCtxtStatEBI6, EPSBearerCtxtStatEBI5, EPSBearerCtxtStatEBI15, EPSBearerCtxtStatEBI14, EPSBearerCtxtStatEBI13, EPSBearerCtxtStatEBI12, EPSBearerCtxtStatEBI11, EPSBearerCtxtStatEBI10, EPSBearerCtxtStatEBI9, EPSBearerCtxtStatEBI8, NASKSITSC, NASKSIValue};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMCPServiceRequest {
     pub nas_ksi: Type1V<NASKSI>,
     pub cp_service_type: Type1V<CPServiceType>,
-    #[deku(ctx = "Tag(120), NeedsByteSize")] pub esm_container: Type6TLVE<Layer3Buffer>,
-    #[deku(ctx = "Tag(103), NeedsByteSize")] pub nas_container: Type4TLV<Layer3Buffer>,
-    #[deku(ctx = "Tag(87)")] pub eps_bearer_ctxt_stat: Type4TLV<EPSBearerCtxtStat>,
-    #[deku(ctx = "Tag(13)")] pub device_prop: Type1TV<DeviceProp>,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct NASKSI {
-    pub tsc: NASKSITSC,
-    pub value: NASKSIValue,
+    pub esm_container: Type6TLVE<Layer3Buffer>,
+    pub nas_container: Type4TLV<Layer3Buffer>,
+    pub eps_bearer_ctxt_stat: Type4TLV<EPSBearerCtxtStat>,
+    pub device_prop: Type1TV<DeviceProp>,
+}
+
+impl<'a> DekuReader<'a> for EMMCPServiceRequest {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let nas_ksi: Type1V<NASKSI> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let cp_service_type: Type1V<CPServiceType> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let mut esm_container: Type6TLVE<Layer3Buffer> = Type6TLVE::absent(Tag(120));
+        let mut nas_container: Type4TLV<Layer3Buffer> = Type4TLV::absent(Tag(103));
+        let mut eps_bearer_ctxt_stat: Type4TLV<EPSBearerCtxtStat> = Type4TLV::absent(Tag(87));
+        let mut device_prop: Type1TV<DeviceProp> = Type1TV::absent(Tag(13));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                120 => esm_container = DekuReader::from_reader_with_ctx(reader, (Tag(120), NeedsByteSize))?,
+                103 => nas_container = DekuReader::from_reader_with_ctx(reader, (Tag(103), NeedsByteSize))?,
+                87 => eps_bearer_ctxt_stat = DekuReader::from_reader_with_ctx(reader, Tag(87))?,
+                _ => match tag >> 4 {
+                    13 => device_prop = DekuReader::from_reader_with_ctx(reader, Tag(13))?,
+                    _ => if !skip_unknown_ie(reader, tag)? {
+                        break;
+                    },
+                },
+            }
+        }
+        Ok(Self {
+            nas_ksi,
+            cp_service_type,
+            esm_container,
+            nas_container,
+            eps_bearer_ctxt_stat,
+            device_prop,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -28,120 +61,6 @@ pub struct CPServiceType {
     pub active: CPServiceTypeActive,
     pub value: CPServiceTypeValue,
 }
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct EPSBearerCtxtStat {
-    pub ebi_7: EPSBearerCtxtStatEBI7,
-    pub ebi_6: EPSBearerCtxtStatEBI6,
-    pub ebi_5: EPSBearerCtxtStatEBI5,
-    #[deku(bits = 1)] pub ebi_4: u8,
-    #[deku(bits = 1)] pub ebi_3: u8,
-    #[deku(bits = 1)] pub ebi_2: u8,
-    #[deku(bits = 1)] pub ebi_1: u8,
-    #[deku(bits = 1)] pub ebi_0: u8,
-    pub ebi_15: EPSBearerCtxtStatEBI15,
-    pub ebi_14: EPSBearerCtxtStatEBI14,
-    pub ebi_13: EPSBearerCtxtStatEBI13,
-    pub ebi_12: EPSBearerCtxtStatEBI12,
-    pub ebi_11: EPSBearerCtxtStatEBI11,
-    pub ebi_10: EPSBearerCtxtStatEBI10,
-    pub ebi_9: EPSBearerCtxtStatEBI9,
-    pub ebi_8: EPSBearerCtxtStatEBI8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct DeviceProp {
-    #[deku(bits = 3)] pub spare: u8,
-    #[deku(bits = 1)] pub low_priority: u8,
-}
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI7 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI6 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI5 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI15 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI14 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI13 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI12 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI11 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI10 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI9 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum EPSBearerCtxtStatEBI8 {
-    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
-    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
-    #[deku(id_pat = "_")] Other,
-}
-
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
 #[deku(id_type = "u8", bits = 1)]
 pub enum CPServiceTypeActive {
@@ -155,22 +74,7 @@ pub enum CPServiceTypeActive {
 pub enum CPServiceTypeValue {
     #[deku(id_pat = "0")] MobileOriginatingRequest,
     #[deku(id_pat = "1")] MobileTerminatingRequest,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum NASKSITSC {
-    #[deku(id_pat = "0")] NativeSecurityContext,
-    #[deku(id_pat = "1")] MappedSecurityContext,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum NASKSIValue {
-    #[deku(id_pat = "7")] NoKeyAvailable,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "2..=7")] Other,
 }
 
 #[cfg(test)]
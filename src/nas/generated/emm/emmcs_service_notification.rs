@@ -1,19 +1,53 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMCSServiceNotification {
-    #[deku(bytes = 1)] pub paging_identity: Type3V<PagingIdentity>,
-    #[deku(ctx = "Tag(96), NeedsByteSize")] pub cli: Type4TLV<CallingPartyBCDNumber>,
-    #[deku(bytes = 1, ctx = "Tag(97)")] pub ss_code: Type3TV<SSCodeSSCode>,
-    #[deku(bytes = 1, ctx = "Tag(98)")] pub lcs_ind: Type3TV<LCSIndLCSInd>,
-    #[deku(ctx = "Tag(99)")] pub lcs_client_id: Type4TLV<()>,
+    pub paging_identity: Type3V<PagingIdentity>,
+    pub cli: Type4TLV<CallingPartyBCDNumber>,
+    pub ss_code: Type3TV<SSCodeSSCode>,
+    pub lcs_ind: Type3TV<LCSIndLCSInd>,
+    pub lcs_client_id: Type4TLV<()>,
+}
+
+impl<'a> DekuReader<'a> for EMMCSServiceNotification {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let paging_identity: Type3V<PagingIdentity> = DekuReader::from_reader_with_ctx(reader, ByteSize(1))?;
+        let mut cli: Type4TLV<CallingPartyBCDNumber> = Type4TLV::absent(Tag(96));
+        let mut ss_code: Type3TV<SSCodeSSCode> = Type3TV::absent(Tag(97));
+        let mut lcs_ind: Type3TV<LCSIndLCSInd> = Type3TV::absent(Tag(98));
+        let mut lcs_client_id: Type4TLV<()> = Type4TLV::absent(Tag(99));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                96 => cli = DekuReader::from_reader_with_ctx(reader, (Tag(96), NeedsByteSize))?,
+                97 => ss_code = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(97)))?,
+                98 => lcs_ind = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(98)))?,
+                99 => lcs_client_id = DekuReader::from_reader_with_ctx(reader, Tag(99))?,
+                _ => if !skip_unknown_ie(reader, tag)? {
+                    break;
+                },
+            }
+        }
+        Ok(Self {
+            paging_identity,
+            cli,
+            ss_code,
+            lcs_ind,
+            lcs_client_id,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -105,14 +139,14 @@ pub enum SSCodeSSCode {
     #[deku(id_pat = "193")] BasicSelfLocation,
     #[deku(id_pat = "194")] AutonomousSelfLocation,
     #[deku(id_pat = "195")] TransferToThirdParty,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "1..=15 | 22..=23 | 26..=31 | 34..=35 | 37..=39 | 44..=47 | 51..=63 | 70..=79 | 82..=95 | 98..=111 | 115..=127 | 132..=143 | 149..=152 | 156..=159 | 162..=175 | 182..=191 | 196..=239")] Other,
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
 #[deku(id_type = "u8", bits = 8)]
 pub enum LCSIndLCSInd {
     #[deku(id_pat = "1")] MTLR,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "0 | 2..=255")] Other,
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
@@ -137,13 +171,13 @@ pub enum CallingPartyBCDNumberNumberingPlan {
     #[deku(id_pat = "2")] GenericNumberingPlan,
     #[deku(id_pat = "3")] DataNumberingPlanX121,
     #[deku(id_pat = "4")] TelexNumberingPlanF69,
-    #[deku(id_pat = "5 | 6")] ServiceCenterSpecific,
+    #[deku(id_pat = "5..=6")] ServiceCenterSpecific,
     #[deku(id_pat = "8")] NationalNumberingPlan,
     #[deku(id_pat = "9")] PrivateNumberingPlan,
     #[deku(id_pat = "10")] ERMESNumberingPlan,
     #[deku(id_pat = "11")] ReservedForCTS,
     #[deku(id_pat = "15")] Reserved,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "7 | 12..=14")] Other,
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
@@ -1,23 +1,45 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{GenericContTypeGenericContType};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMDLGenericNASTransport {
-    #[deku(bytes = 1)] pub generic_cont_type: Type3V<GenericContTypeGenericContType>,
-    #[deku(ctx = "NeedsByteSize")] pub generic_container: Type6LVE<Layer3Buffer>,
-    #[deku(ctx = "Tag(101), NeedsByteSize")] pub add_info: Type4TLV<Layer3Buffer>,
+    pub generic_cont_type: Type3V<GenericContTypeGenericContType>,
+    pub generic_container: Type6LVE<Layer3Buffer>,
+    pub add_info: Type4TLV<Layer3Buffer>,
 }
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 8)]
-pub enum GenericContTypeGenericContType {
-    #[deku(id_pat = "1")] LTEPositioningProtocolLPPMessageContainer,
-    #[deku(id_pat = "2")] LocationServicesMessageContainer,
-    #[deku(id_pat = "_")] Other,
+
+impl<'a> DekuReader<'a> for EMMDLGenericNASTransport {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let generic_cont_type: Type3V<GenericContTypeGenericContType> = DekuReader::from_reader_with_ctx(reader, ByteSize(1))?;
+        let generic_container: Type6LVE<Layer3Buffer> = DekuReader::from_reader_with_ctx(reader, NeedsByteSize)?;
+        let mut add_info: Type4TLV<Layer3Buffer> = Type4TLV::absent(Tag(101));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                101 => add_info = DekuReader::from_reader_with_ctx(reader, (Tag(101), NeedsByteSize))?,
+                _ => if !skip_unknown_ie(reader, tag)? {
+                    break;
+                },
+            }
+        }
+        Ok(Self {
+            generic_cont_type,
+            generic_container,
+            add_info,
+        })
+    }
 }
 
+
@@ -1,15 +1,29 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMDLNASTransport {
-    #[deku(ctx = "NeedsByteSize")] pub nas_container: Type4LV<Layer3Buffer>,
+    pub nas_container: Type4LV<Layer3Buffer>,
+}
+
+impl<'a> DekuReader<'a> for EMMDLNASTransport {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let nas_container: Type4LV<Layer3Buffer> = DekuReader::from_reader_with_ctx(reader, NeedsByteSize)?;
+        Ok(Self {
+            nas_container,
+        })
+    }
 }
 
 
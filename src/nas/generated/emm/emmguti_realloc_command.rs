@@ -1,36 +1,56 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{EPSID, UERadioCapIDDelInd, UERadioCapIDDelIndDelRequest};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct EMMGUTIReallocCommand {
     pub guti: Type4LV<EPSID>,
-    #[deku(ctx = "Tag(84)")] pub tai_list: Type4TLV<()>,
-    #[deku(endian = "big", ctx = "Tag(101)")] pub dcnid: Type4TLV<u16>,
-    #[deku(ctx = "Tag(102), NeedsByteSize")] pub ue_radio_cap_id: Type4TLV<Layer3Buffer>,
-    #[deku(ctx = "Tag(11)")] pub ue_radio_cap_id_del_ind: Type1TV<UERadioCapIDDelInd>,
+    pub tai_list: Type4TLV<()>,
+    pub dcnid: Type4TLV<u16>,
+    pub ue_radio_cap_id: Type4TLV<Layer3Buffer>,
+    pub ue_radio_cap_id_del_ind: Type1TV<UERadioCapIDDelInd>,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct EPSID {
-
+impl<'a> DekuReader<'a> for EMMGUTIReallocCommand {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let guti: Type4LV<EPSID> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let mut tai_list: Type4TLV<()> = Type4TLV::absent(Tag(84));
+        let mut dcnid: Type4TLV<u16> = Type4TLV::absent(Tag(101));
+        let mut ue_radio_cap_id: Type4TLV<Layer3Buffer> = Type4TLV::absent(Tag(102));
+        let mut ue_radio_cap_id_del_ind: Type1TV<UERadioCapIDDelInd> = Type1TV::absent(Tag(11));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                84 => tai_list = DekuReader::from_reader_with_ctx(reader, Tag(84))?,
+                101 => dcnid = DekuReader::from_reader_with_ctx(reader, (Endian::Big, Tag(101)))?,
+                102 => ue_radio_cap_id = DekuReader::from_reader_with_ctx(reader, (Tag(102), NeedsByteSize))?,
+                _ => match tag >> 4 {
+                    11 => ue_radio_cap_id_del_ind = DekuReader::from_reader_with_ctx(reader, Tag(11))?,
+                    _ => if !skip_unknown_ie(reader, tag)? {
+                        break;
+                    },
+                },
+            }
+        }
+        Ok(Self {
+            guti,
+            tai_list,
+            dcnid,
+            ue_radio_cap_id,
+            ue_radio_cap_id_del_ind,
+        })
+    }
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct UERadioCapIDDelInd {
-    #[deku(bits = 1)] pub spare: u8,
-    pub del_request: UERadioCapIDDelIndDelRequest,
-}
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum UERadioCapIDDelIndDelRequest {
-    #[deku(id_pat = "0")] UERadioCapabilityIDDeletionNotRequested,
-    #[deku(id_pat = "1")] NetworkAssignedUERadioCapabilityIDsDeletionRequested,
-    #[deku(id_pat = "_")] Other,
-}
 
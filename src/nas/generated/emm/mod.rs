@@ -36,4 +36,7 @@ pub mod emmulnas_transport;
 pub mod emmcs_service_notification;
 pub mod emmdl_generic_nas_transport;
 pub mod emmul_generic_nas_transport;
-pub mod emm_detach_request_mt;
\ No newline at end of file
+pub mod emm_detach_request_mt;
+pub mod emm_sec_prot_nas_message;
+pub mod emm_service_request;
+pub mod dispatch;
\ No newline at end of file
@@ -1,29 +1,43 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{ProtConfig, ProtConfigElt, ProtConfigProt, ProtConfigEltID};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct ESMActDefaultEPSBearerCtxtAccept {
-    #[deku(ctx = "Tag(39)")] pub prot_config: Type4TLV<ProtConfig>,
-    #[deku(ctx = "Tag(123)")] pub ext_prot_config: Type6TLVE<ProtConfig>,
+    pub prot_config: Type4TLV<ProtConfig>,
+    pub ext_prot_config: Type6TLVE<ProtConfig>,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ProtConfig {
-    #[deku(bits = 1)] pub ext: u8,
-    #[deku(bits = 4)] pub spare: u8,
-    pub prot: ProtConfigProt,
-    pub config: (),
-}
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum ProtConfigProt {
-    #[deku(id_pat = "0")] PPPWithIPPDP,
-    #[deku(id_pat = "_")] Other,
+impl<'a> DekuReader<'a> for ESMActDefaultEPSBearerCtxtAccept {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let mut prot_config: Type4TLV<ProtConfig> = Type4TLV::absent(Tag(39));
+        let mut ext_prot_config: Type6TLVE<ProtConfig> = Type6TLVE::absent(Tag(123));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                39 => prot_config = DekuReader::from_reader_with_ctx(reader, (Tag(39), NeedsByteSize))?,
+                123 => ext_prot_config = DekuReader::from_reader_with_ctx(reader, (Tag(123), NeedsByteSize))?,
+                _ => if !skip_unknown_ie(reader, tag)? {
+                    break;
+                },
+            }
+        }
+        Ok(Self {
+            prot_config,
+            ext_prot_config,
+        })
+    }
 }
 
+
@@ -1,16 +1,43 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct ESMDataTransport {
-    #[deku(ctx = "NeedsByteSize")] pub user_data: Type6LVE<Layer3Buffer>,
-    #[deku(ctx = "Tag(15)")] pub release_assist_ind: Type1TV<ReleaseAssistInd>,
+    pub user_data: Type6LVE<Layer3Buffer>,
+    pub release_assist_ind: Type1TV<ReleaseAssistInd>,
+}
+
+impl<'a> DekuReader<'a> for ESMDataTransport {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let user_data: Type6LVE<Layer3Buffer> = DekuReader::from_reader_with_ctx(reader, NeedsByteSize)?;
+        let mut release_assist_ind: Type1TV<ReleaseAssistInd> = Type1TV::absent(Tag(15));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                _ => match tag >> 4 {
+                    15 => release_assist_ind = DekuReader::from_reader_with_ctx(reader, Tag(15))?,
+                    _ => if !skip_unknown_ie(reader, tag)? {
+                        break;
+                    },
+                },
+            }
+        }
+        Ok(Self {
+            user_data,
+            release_assist_ind,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
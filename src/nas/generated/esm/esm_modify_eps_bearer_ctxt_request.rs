@@ -1,468 +1,93 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{EPSQoS, TFT, QoS, LLCSAPI, RadioPriority, PacketFlowId, APNAMBR, ProtConfig, WLANOffloadAccept, NBIFOMContainer, NBIFOMParameter, HdrCompConfig, ExtAPNAMBR, ExtEPSQoS, ProtConfigElt, NBIFOMParameterParamID, ExtEPSQoSUnitMaxBitrate, ExtEPSQoSUnitGuaranteedBitrate, ExtAPNAMBRUnitDL, ExtAPNAMBRUnitUL, HdrCompConfigParamsType, WLANOffloadAcceptUTRANOffloadAccept, WLANOffloadAcceptEUTRANOffloadAccept, ProtConfigProt, ProtConfigEltID, PacketFlowIdValue, RadioPriorityValue, LLCSAPIValue, QoSDelayClass, QoSReliabilityClass, QoSPeakThroughput, QoSPrecedenceClass, QoSMeanThroughput, QoSTrafficClass, QoSDeliveryOrder, QoSErroneousSDU, QoSSignallingInd, QoSSourceStatsDesc, TFTOpcode, TFTE};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct ESMModifyEPSBearerCtxtRequest {
-    #[deku(ctx = "Tag(91)")] pub eps_qo_s: Type4TLV<EPSQoS>,
-    #[deku(ctx = "Tag(54)")] pub tft: Type4TLV<TFT>,
-    #[deku(ctx = "Tag(48)")] pub qo_s: Type4TLV<QoS>,
-    #[deku(bytes = 1, ctx = "Tag(50)")] pub llc_sapi: Type3TV<LLCSAPI>,
-    #[deku(ctx = "Tag(8)")] pub radio_priority: Type1TV<RadioPriority>,
-    #[deku(ctx = "Tag(52)")] pub packet_flow_id: Type4TLV<PacketFlowId>,
-    #[deku(ctx = "Tag(94), NeedsByteSize")] pub apn_ambr: Type4TLV<APNAMBR>,
-    #[deku(ctx = "Tag(39)")] pub prot_config: Type4TLV<ProtConfig>,
-    #[deku(ctx = "Tag(12)")] pub wlan_offload_ind: Type1TV<WLANOffloadAccept>,
-    #[deku(ctx = "Tag(51)")] pub nbifom_container: Type4TLV<()>,
-    #[deku(ctx = "Tag(102), NeedsByteSize")] pub hdr_comp_config: Type4TLV<HdrCompConfig>,
-    #[deku(ctx = "Tag(123)")] pub ext_prot_config: Type6TLVE<ProtConfig>,
-    #[deku(ctx = "Tag(95)")] pub ext_apn_ambr: Type4TLV<ExtAPNAMBR>,
-    #[deku(ctx = "Tag(92)")] pub ext_eps_qo_s: Type4TLV<ExtEPSQoS>,
+    pub eps_qo_s: Type4TLV<EPSQoS>,
+    pub tft: Type4TLV<TFT>,
+    pub qo_s: Type4TLV<QoS>,
+    pub llc_sapi: Type3TV<LLCSAPI>,
+    pub radio_priority: Type1TV<RadioPriority>,
+    pub packet_flow_id: Type4TLV<PacketFlowId>,
+    pub apn_ambr: Type4TLV<APNAMBR>,
+    pub prot_config: Type4TLV<ProtConfig>,
+    pub wlan_offload_ind: Type1TV<WLANOffloadAccept>,
+    pub nbifom_container: Type4TLV<NBIFOMContainer>,
+    pub hdr_comp_config: Type4TLV<HdrCompConfig>,
+    pub ext_prot_config: Type6TLVE<ProtConfig>,
+    pub ext_apn_ambr: Type4TLV<ExtAPNAMBR>,
+    pub ext_eps_qo_s: Type4TLV<ExtEPSQoS>,
+}
+
+impl<'a> DekuReader<'a> for ESMModifyEPSBearerCtxtRequest {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let mut eps_qo_s: Type4TLV<EPSQoS> = Type4TLV::absent(Tag(91));
+        let mut tft: Type4TLV<TFT> = Type4TLV::absent(Tag(54));
+        let mut qo_s: Type4TLV<QoS> = Type4TLV::absent(Tag(48));
+        let mut llc_sapi: Type3TV<LLCSAPI> = Type3TV::absent(Tag(50));
+        let mut radio_priority: Type1TV<RadioPriority> = Type1TV::absent(Tag(8));
+        let mut packet_flow_id: Type4TLV<PacketFlowId> = Type4TLV::absent(Tag(52));
+        let mut apn_ambr: Type4TLV<APNAMBR> = Type4TLV::absent(Tag(94));
+        let mut prot_config: Type4TLV<ProtConfig> = Type4TLV::absent(Tag(39));
+        let mut wlan_offload_ind: Type1TV<WLANOffloadAccept> = Type1TV::absent(Tag(12));
+        let mut nbifom_container: Type4TLV<NBIFOMContainer> = Type4TLV::absent(Tag(51));
+        let mut hdr_comp_config: Type4TLV<HdrCompConfig> = Type4TLV::absent(Tag(102));
+        let mut ext_prot_config: Type6TLVE<ProtConfig> = Type6TLVE::absent(Tag(123));
+        let mut ext_apn_ambr: Type4TLV<ExtAPNAMBR> = Type4TLV::absent(Tag(95));
+        let mut ext_eps_qo_s: Type4TLV<ExtEPSQoS> = Type4TLV::absent(Tag(92));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                91 => eps_qo_s = DekuReader::from_reader_with_ctx(reader, Tag(91))?,
+                54 => tft = DekuReader::from_reader_with_ctx(reader, Tag(54))?,
+                48 => qo_s = DekuReader::from_reader_with_ctx(reader, Tag(48))?,
+                50 => llc_sapi = DekuReader::from_reader_with_ctx(reader, (ByteSize(1), Tag(50)))?,
+                52 => packet_flow_id = DekuReader::from_reader_with_ctx(reader, Tag(52))?,
+                94 => apn_ambr = DekuReader::from_reader_with_ctx(reader, (Tag(94), NeedsByteSize))?,
+                39 => prot_config = DekuReader::from_reader_with_ctx(reader, (Tag(39), NeedsByteSize))?,
+                51 => nbifom_container = DekuReader::from_reader_with_ctx(reader, (Tag(51), NeedsByteSize))?,
+                102 => hdr_comp_config = DekuReader::from_reader_with_ctx(reader, (Tag(102), NeedsByteSize))?,
+                123 => ext_prot_config = DekuReader::from_reader_with_ctx(reader, (Tag(123), NeedsByteSize))?,
+                95 => ext_apn_ambr = DekuReader::from_reader_with_ctx(reader, Tag(95))?,
+                92 => ext_eps_qo_s = DekuReader::from_reader_with_ctx(reader, Tag(92))?,
+                _ => match tag >> 4 {
+                    8 => radio_priority = DekuReader::from_reader_with_ctx(reader, Tag(8))?,
+                    12 => wlan_offload_ind = DekuReader::from_reader_with_ctx(reader, Tag(12))?,
+                    _ => if !skip_unknown_ie(reader, tag)? {
+                        break;
+                    },
+                },
+            }
+        }
+        Ok(Self {
+            eps_qo_s,
+            tft,
+            qo_s,
+            llc_sapi,
+            radio_priority,
+            packet_flow_id,
+            apn_ambr,
+            prot_config,
+            wlan_offload_ind,
+            nbifom_container,
+            hdr_comp_config,
+            ext_prot_config,
+            ext_apn_ambr,
+            ext_eps_qo_s,
+        })
+    }
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct EPSQoS {
-    #[deku(bytes = 1)] pub qci: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct TFT {
-    pub opcode: TFTOpcode,
-    pub e: TFTE,
-    #[deku(bits = 4)] pub num_pkt_filters: u8,
-    pub pkt_filters: (),
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct QoS {
-    #[deku(bits = 2)] pub spare_1: u8,
-    pub delay_class: QoSDelayClass,
-    pub reliability_class: QoSReliabilityClass,
-    pub peak_throughput: QoSPeakThroughput,
-    #[deku(bits = 1)] pub spare_2: u8,
-    pub precedence_class: QoSPrecedenceClass,
-    #[deku(bits = 3)] pub spare_3: u8,
-    pub mean_throughput: QoSMeanThroughput,
-    pub traffic_class: QoSTrafficClass,
-    pub delivery_order: QoSDeliveryOrder,
-    pub erroneous_sdu: QoSErroneousSDU,
-    #[deku(bytes = 1)] pub max_sdu_size: u8,
-    #[deku(bytes = 1)] pub max_ul_bitrate: u8,
-    #[deku(bytes = 1)] pub max_dl_bitrate: u8,
-    #[deku(bits = 4)] pub residual_ber: u8,
-    #[deku(bits = 4)] pub sdu_error_ratio: u8,
-    #[deku(bits = 6)] pub transfer_delay: u8,
-    #[deku(bits = 2)] pub traffic_handling_priority: u8,
-    #[deku(bytes = 1)] pub guaranteed_ul_bitrate: u8,
-    #[deku(bytes = 1)] pub guaranteed_dl_bitrate: u8,
-    #[deku(bits = 3)] pub spare_4: u8,
-    pub signalling_ind: QoSSignallingInd,
-    pub source_stats_desc: QoSSourceStatsDesc,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct LLCSAPI {
-    #[deku(bits = 4)] pub spare: u8,
-    pub value: LLCSAPIValue,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct RadioPriority {
-    #[deku(bits = 1)] pub spare: u8,
-    pub value: RadioPriorityValue,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct PacketFlowId {
-    #[deku(bits = 1)] pub spare: u8,
-    pub value: PacketFlowIdValue,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-#[deku(ctx = "ByteSize(byte_size): ByteSize")]
-pub struct APNAMBR {
-    #[deku(bytes = 1, cond = "deku::byte_offset < byte_size")] pub dl: u8,
-    #[deku(bytes = 1, cond = "deku::byte_offset < byte_size")] pub ul: u8,
-    #[deku(bytes = 0, cond = "deku::byte_offset < byte_size")] pub dl_ext: u8,
-    #[deku(bytes = 0, cond = "deku::byte_offset < byte_size")] pub ul_ext: u8,
-    #[deku(bytes = 0, cond = "deku::byte_offset < byte_size")] pub dl_ext_2: u8,
-    #[deku(bytes = 0, cond = "deku::byte_offset < byte_size")] pub ul_ext_2: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ProtConfig {
-    #[deku(bits = 1)] pub ext: u8,
-    #[deku(bits = 4)] pub spare: u8,
-    pub prot: ProtConfigProt,
-    pub config: (),
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct WLANOffloadAccept {
-    #[deku(bits = 2)] pub spare: u8,
-    pub utran_offload_accept: WLANOffloadAcceptUTRANOffloadAccept,
-    pub eutran_offload_accept: WLANOffloadAcceptEUTRANOffloadAccept,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-#[deku(ctx = "ByteSize(byte_size): ByteSize")]
-pub struct HdrCompConfig {
-    #[deku(bits = 1)] pub spare: u8,
-    #[deku(bits = 1)] pub p_0x0104: u8,
-    #[deku(bits = 1)] pub p_0x0103: u8,
-    #[deku(bits = 1)] pub p_0x0102: u8,
-    #[deku(bits = 1)] pub p_0x0006: u8,
-    #[deku(bits = 1)] pub p_0x0004: u8,
-    #[deku(bits = 1)] pub p_0x0003: u8,
-    #[deku(bits = 1)] pub p_0x0002: u8,
-    #[deku(bytes = 2, endian = "big")] pub max_cid: u16,
-    pub params_type: HdrCompConfigParamsType,
-    #[deku(count = "byte_size - deku::byte_offset")] pub params_container: Vec<u8>,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ExtAPNAMBR {
-    pub unit_dl: ExtAPNAMBRUnitDL,
-    #[deku(bytes = 2, endian = "big")] pub dl: u16,
-    pub unit_ul: ExtAPNAMBRUnitUL,
-    #[deku(bytes = 2, endian = "big")] pub ul: u16,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ExtEPSQoS {
-    pub unit_max_bitrate: ExtEPSQoSUnitMaxBitrate,
-    #[deku(bytes = 2, endian = "big")] pub max_ul_bitrate: u16,
-    #[deku(bytes = 2, endian = "big")] pub max_dl_bitrate: u16,
-    pub unit_guaranteed_bitrate: ExtEPSQoSUnitGuaranteedBitrate,
-    #[deku(bytes = 2, endian = "big")] pub guaranteed_ul_bitrate: u16,
-    #[deku(bytes = 2, endian = "big")] pub guaranteed_dl_bitrate: u16,
-}
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 8)]
-pub enum ExtEPSQoSUnitMaxBitrate {
-    #[deku(id_pat = "1")] TwoHundredKbps,
-    #[deku(id_pat = "2")] OneMbps,
-    #[deku(id_pat = "3")] FourMbps,
-    #[deku(id_pat = "4")] SixteenMbps,
-    #[deku(id_pat = "5")] SixtyFourMbps,
-    #[deku(id_pat = "6")] TwoHundredAndFiftySixMbps,
-    #[deku(id_pat = "7")] OneGbps,
-    #[deku(id_pat = "8")] FourGbps,
-    #[deku(id_pat = "9")] SixteenGbps,
-    #[deku(id_pat = "10")] SixtyFourGbps,
-    #[deku(id_pat = "11")] TwoHundredAndFiftySixGbps,
-    #[deku(id_pat = "12")] OneTbps,
-    #[deku(id_pat = "13")] FourTbps,
-    #[deku(id_pat = "14")] SixteenTbps,
-    #[deku(id_pat = "15")] SixtyFourTbps,
-    #[deku(id_pat = "16")] TwoHundredAndFiftySixTbps,
-    #[deku(id_pat = "17")] OnePbps,
-    #[deku(id_pat = "18")] FourPbps,
-    #[deku(id_pat = "19")] SixteenPbps,
-    #[deku(id_pat = "20")] SixtyFourPbps,
-    #[deku(id_pat = "21")] TwoHundredAndFiftySixPbps,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 8)]
-pub enum ExtEPSQoSUnitGuaranteedBitrate {
-    #[deku(id_pat = "1")] TwoHundredKbps,
-    #[deku(id_pat = "2")] OneMbps,
-    #[deku(id_pat = "3")] FourMbps,
-    #[deku(id_pat = "4")] SixteenMbps,
-    #[deku(id_pat = "5")] SixtyFourMbps,
-    #[deku(id_pat = "6")] TwoHundredAndFiftySixMbps,
-    #[deku(id_pat = "7")] OneGbps,
-    #[deku(id_pat = "8")] FourGbps,
-    #[deku(id_pat = "9")] SixteenGbps,
-    #[deku(id_pat = "10")] SixtyFourGbps,
-    #[deku(id_pat = "11")] TwoHundredAndFiftySixGbps,
-    #[deku(id_pat = "12")] OneTbps,
-    #[deku(id_pat = "13")] FourTbps,
-    #[deku(id_pat = "14")] SixteenTbps,
-    #[deku(id_pat = "15")] SixtyFourTbps,
-    #[deku(id_pat = "16")] TwoHundredAndFiftySixTbps,
-    #[deku(id_pat = "17")] OnePbps,
-    #[deku(id_pat = "18")] FourPbps,
-    #[deku(id_pat = "19")] SixteenPbps,
-    #[deku(id_pat = "20")] SixtyFourPbps,
-    #[deku(id_pat = "21")] TwoHundredAndFiftySixPbps,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 8)]
-pub enum ExtAPNAMBRUnitDL {
-    #[deku(id_pat = "1")] TwoHundredKbps,
-    #[deku(id_pat = "2")] OneMbps,
-    #[deku(id_pat = "3")] FourMbps,
-    #[deku(id_pat = "4")] SixteenMbps,
-    #[deku(id_pat = "5")] SixtyFourMbps,
-    #[deku(id_pat = "6")] TwoHundredAndFiftySixMbps,
-    #[deku(id_pat = "7")] OneGbps,
-    #[deku(id_pat = "8")] FourGbps,
-    #[deku(id_pat = "9")] SixteenGbps,
-    #[deku(id_pat = "10")] SixtyFourGbps,
-    #[deku(id_pat = "11")] TwoHundredAndFiftySixGbps,
-    #[deku(id_pat = "12")] OneTbps,
-    #[deku(id_pat = "13")] FourTbps,
-    #[deku(id_pat = "14")] SixteenTbps,
-    #[deku(id_pat = "15")] SixtyFourTbps,
-    #[deku(id_pat = "16")] TwoHundredAndFiftySixTbps,
-    #[deku(id_pat = "17")] OnePbps,
-    #[deku(id_pat = "18")] FourPbps,
-    #[deku(id_pat = "19")] SixteenPbps,
-    #[deku(id_pat = "20")] SixtyFourPbps,
-    #[deku(id_pat = "21")] TwoHundredAndFiftySixPbps,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 8)]
-pub enum ExtAPNAMBRUnitUL {
-    #[deku(id_pat = "1")] TwoHundredKbps,
-    #[deku(id_pat = "2")] OneMbps,
-    #[deku(id_pat = "3")] FourMbps,
-    #[deku(id_pat = "4")] SixteenMbps,
-    #[deku(id_pat = "5")] SixtyFourMbps,
-    #[deku(id_pat = "6")] TwoHundredAndFiftySixMbps,
-    #[deku(id_pat = "7")] OneGbps,
-    #[deku(id_pat = "8")] FourGbps,
-    #[deku(id_pat = "9")] SixteenGbps,
-    #[deku(id_pat = "10")] SixtyFourGbps,
-    #[deku(id_pat = "11")] TwoHundredAndFiftySixGbps,
-    #[deku(id_pat = "12")] OneTbps,
-    #[deku(id_pat = "13")] FourTbps,
-    #[deku(id_pat = "14")] SixteenTbps,
-    #[deku(id_pat = "15")] SixtyFourTbps,
-    #[deku(id_pat = "16")] TwoHundredAndFiftySixTbps,
-    #[deku(id_pat = "17")] OnePbps,
-    #[deku(id_pat = "18")] FourPbps,
-    #[deku(id_pat = "19")] SixteenPbps,
-    #[deku(id_pat = "20")] SixtyFourPbps,
-    #[deku(id_pat = "21")] TwoHundredAndFiftySixPbps,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 0)]
-pub enum HdrCompConfigParamsType {
-    #[deku(id_pat = "0")] ZeroNoCompression,
-    #[deku(id_pat = "1")] TwoUDPIP,
-    #[deku(id_pat = "2")] ThreeESPIP,
-    #[deku(id_pat = "3")] FourIP,
-    #[deku(id_pat = "4")] SixTCPIP,
-    #[deku(id_pat = "5")] OneHundredAndTwoUDPIP,
-    #[deku(id_pat = "6")] OneHundredAndThreeESPIP,
-    #[deku(id_pat = "7")] OneHundredAndFourIP,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum WLANOffloadAcceptUTRANOffloadAccept {
-    #[deku(id_pat = "0")] OffloadingTheTrafficOfThePDNConnectionViaAWLANWhenInIuModeIsNotAcceptable,
-    #[deku(id_pat = "1")] OffloadingTheTrafficOfThePDNConnectionViaAWLANWhenInIuModeIsAcceptable,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum WLANOffloadAcceptEUTRANOffloadAccept {
-    #[deku(id_pat = "0")] OffloadingTheTrafficOfThePDNConnectionViaAWLANWhenInS1ModeIsNotAcceptable,
-    #[deku(id_pat = "1")] OffloadingTheTrafficOfThePDNConnectionViaAWLANWhenInS1ModeIsAcceptable,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum ProtConfigProt {
-    #[deku(id_pat = "0")] PPPWithIPPDP,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 7)]
-pub enum PacketFlowIdValue {
-    #[deku(id_pat = "0")] BestEffort,
-    #[deku(id_pat = "1")] Signaling,
-    #[deku(id_pat = "2")] SMS,
-    #[deku(id_pat = "3")] TOM8,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum RadioPriorityValue {
-    #[deku(id_pat = "1")] PriorityLevel1Highest,
-    #[deku(id_pat = "2")] PriorityLevel2,
-    #[deku(id_pat = "3")] PriorityLevel3,
-    #[deku(id_pat = "4")] PriorityLevel4Lowest,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 4)]
-pub enum LLCSAPIValue {
-    #[deku(id_pat = "0")] NotAssigned,
-    #[deku(id_pat = "1 | 2 | 4 | 6 | 7 | 8 | 10 | 11 | 12 | 13 | 14 | 15")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum QoSDelayClass {
-    #[deku(id_pat = "0")] SubscribedDelayClass,
-    #[deku(id_pat = "1")] DelayClass1,
-    #[deku(id_pat = "2")] DelayClass2,
-    #[deku(id_pat = "3")] DelayClass3,
-    #[deku(id_pat = "4")] DelayClass4BestEffort,
-    #[deku(id_pat = "7")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum QoSReliabilityClass {
-    #[deku(id_pat = "0")] SubscribedReliabilityClass,
-    #[deku(id_pat = "1")] UnusedInterpretedAsUnackGTPAckLLCAndRLCProtectedData,
-    #[deku(id_pat = "2")] UnackGTPAckLLCAndRLCProtectedData,
-    #[deku(id_pat = "3")] UnackGTPAndLLCAckRLCProtectedData,
-    #[deku(id_pat = "4")] UnackGTPLLCAndRLCProtectedData,
-    #[deku(id_pat = "5")] UnackGTPLLCAndRLCUnprotectedData,
-    #[deku(id_pat = "6")] UnackGTPAndRLCAckLLCProtectedData,
-    #[deku(id_pat = "7")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 4)]
-pub enum QoSPeakThroughput {
-    #[deku(id_pat = "0")] SubscribedPeakThroughput,
-    #[deku(id_pat = "1")] UpTo1000OctetS,
-    #[deku(id_pat = "2")] UpTo2000OctetS,
-    #[deku(id_pat = "3")] UpTo4000OctetS,
-    #[deku(id_pat = "4")] UpTo8000OctetS,
-    #[deku(id_pat = "5")] UpTo16000OctetS,
-    #[deku(id_pat = "6")] UpTo32000OctetS,
-    #[deku(id_pat = "7")] UpTo64000OctetS,
-    #[deku(id_pat = "8")] UpTo128000OctetS,
-    #[deku(id_pat = "9")] UpTo256000OctetS,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum QoSPrecedenceClass {
-    #[deku(id_pat = "0")] SubscribedPrecedence,
-    #[deku(id_pat = "1")] HighPriority,
-    #[deku(id_pat = "2 | 4")] NormalPriority,
-    #[deku(id_pat = "3")] LowPriority,
-    #[deku(id_pat = "7")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 5)]
-pub enum QoSMeanThroughput {
-    #[deku(id_pat = "0")] SubscribedMeanThroughput,
-    #[deku(id_pat = "1")] OneHundredOctetH,
-    #[deku(id_pat = "2")] TwoHundredOctetH,
-    #[deku(id_pat = "3")] FiveHundredOctetH,
-    #[deku(id_pat = "4")] One000OctetH,
-    #[deku(id_pat = "5")] Two000OctetH,
-    #[deku(id_pat = "6")] Five000OctetH,
-    #[deku(id_pat = "7")] Ten000OctetH,
-    #[deku(id_pat = "8")] Twenty000OctetH,
-    #[deku(id_pat = "9")] Fifty000OctetH,
-    #[deku(id_pat = "10")] OneHundred000OctetH,
-    #[deku(id_pat = "11")] TwoHundred000OctetH,
-    #[deku(id_pat = "12")] FiveHundred000OctetH,
-    #[deku(id_pat = "13")] One000000OctetH,
-    #[deku(id_pat = "14")] Two000000OctetH,
-    #[deku(id_pat = "15")] Five000000OctetH,
-    #[deku(id_pat = "16")] Ten000000OctetH,
-    #[deku(id_pat = "17")] Twenty000000OctetH,
-    #[deku(id_pat = "18")] Fifty000000OctetH,
-    #[deku(id_pat = "30")] Reserved,
-    #[deku(id_pat = "31")] BestEffort,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum QoSTrafficClass {
-    #[deku(id_pat = "0")] SubscribedTrafficClass,
-    #[deku(id_pat = "1")] ConversationalClass,
-    #[deku(id_pat = "2")] StreamingClass,
-    #[deku(id_pat = "3")] InteractiveClass,
-    #[deku(id_pat = "4")] BackgroundClass,
-    #[deku(id_pat = "7")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 2)]
-pub enum QoSDeliveryOrder {
-    #[deku(id_pat = "0")] SubscribedDeliveryOrder,
-    #[deku(id_pat = "1")] WithDeliveryOrder,
-    #[deku(id_pat = "2")] WithoutDeliveryOrder,
-    #[deku(id_pat = "3")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum QoSErroneousSDU {
-    #[deku(id_pat = "0")] SubscribedDeliveryOfErroneousSDUs,
-    #[deku(id_pat = "1")] NoDetect,
-    #[deku(id_pat = "2")] ErroneousSDUsAreDelivered,
-    #[deku(id_pat = "3")] ErroneousSDUsAreNotDelivered,
-    #[deku(id_pat = "7")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum QoSSignallingInd {
-    #[deku(id_pat = "0")] NotOptimisedForSignalling,
-    #[deku(id_pat = "1")] OptimisedForSignalling,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 4)]
-pub enum QoSSourceStatsDesc {
-    #[deku(id_pat = "0")] Unknown,
-    #[deku(id_pat = "1")] Speech,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum TFTOpcode {
-    #[deku(id_pat = "0")] IgnoreThisIE,
-    #[deku(id_pat = "1")] CreateNewTFT,
-    #[deku(id_pat = "2")] DeleteExistingTFT,
-    #[deku(id_pat = "3")] AddPacketFiltersToExistingTFT,
-    #[deku(id_pat = "4")] ReplacePacketFiltersInExistingTFT,
-    #[deku(id_pat = "5")] DeletePacketFiltersFromExistingTFT,
-    #[deku(id_pat = "6")] NoTFTOperation,
-    #[deku(id_pat = "7")] Reserved,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 1)]
-pub enum TFTE {
-    #[deku(id_pat = "0")] NoParametersList,
-    #[deku(id_pat = "1")] ParametersListIncluded,
-    #[deku(id_pat = "_")] Other,
-}
 
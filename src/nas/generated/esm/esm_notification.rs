@@ -1,20 +1,34 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct ESMNotification {
     pub notification_ind: Type4LV<NotificationIndNotificationInd>,
 }
+
+impl<'a> DekuReader<'a> for ESMNotification {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let notification_ind: Type4LV<NotificationIndNotificationInd> = DekuReader::from_reader_with_ctx(reader, ())?;
+        Ok(Self {
+            notification_ind,
+        })
+    }
+}
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
 #[deku(id_type = "u8", bits = 8)]
 pub enum NotificationIndNotificationInd {
     #[deku(id_pat = "0")] SRVCCHandoverCancelledIMSSessionReEstablishmentRequired,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "1..=255")] Other,
 }
 
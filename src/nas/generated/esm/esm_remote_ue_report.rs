@@ -1,17 +1,46 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct ESMRemoteUEReport {
-    #[deku(ctx = "Tag(121)")] pub remote_ue_connected: Type6TLVE<RemoteUECtxtList>,
-    #[deku(ctx = "Tag(122)")] pub remote_ue_disconnected: Type6TLVE<RemoteUECtxtList>,
-    #[deku(ctx = "Tag(111), NeedsByteSize")] pub pkmf_addr: Type4TLV<PKMFAddr>,
+    pub remote_ue_connected: Type6TLVE<RemoteUECtxtList>,
+    pub remote_ue_disconnected: Type6TLVE<RemoteUECtxtList>,
+    pub pkmf_addr: Type4TLV<PKMFAddr>,
+}
+
+impl<'a> DekuReader<'a> for ESMRemoteUEReport {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let mut remote_ue_connected: Type6TLVE<RemoteUECtxtList> = Type6TLVE::absent(Tag(121));
+        let mut remote_ue_disconnected: Type6TLVE<RemoteUECtxtList> = Type6TLVE::absent(Tag(122));
+        let mut pkmf_addr: Type4TLV<PKMFAddr> = Type4TLV::absent(Tag(111));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                121 => remote_ue_connected = DekuReader::from_reader_with_ctx(reader, Tag(121))?,
+                122 => remote_ue_disconnected = DekuReader::from_reader_with_ctx(reader, Tag(122))?,
+                111 => pkmf_addr = DekuReader::from_reader_with_ctx(reader, (Tag(111), NeedsByteSize))?,
+                _ => if !skip_unknown_ie(reader, tag)? {
+                    break;
+                },
+            }
+        }
+        Ok(Self {
+            remote_ue_connected,
+            remote_ue_disconnected,
+            pkmf_addr,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
@@ -32,6 +61,6 @@ pub struct PKMFAddr {
 pub enum PKMFAddrType {
     #[deku(id_pat = "1")] IPv4,
     #[deku(id_pat = "2")] IPv6,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "0 | 3..=7")] Other,
 }
 
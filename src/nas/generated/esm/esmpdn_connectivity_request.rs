@@ -1,59 +1,77 @@
 
 use deku::prelude::*;
-use deku::ctx::ByteSize;
+use deku::ctx::{BitSize, ByteSize, Endian};
 use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
 use crate::nas::layer3::*;
+use crate::nas::generated::ies::{APN, APNItem, ProtConfig, DeviceProp, NBIFOMContainer, NBIFOMParameter, HdrCompConfig, ProtConfigElt, NBIFOMParameterParamID, HdrCompConfigParamsType, ProtConfigProt, ProtConfigEltID};
 
 /// Autogenerated rust code, do not modify directly! Any changes should be
 /// made via the python generator scripts.
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
+#[derive(Debug, Serialize, Clone)]
 pub struct ESMPDNConnectivityRequest {
     pub pdn_type: Type1V<PDNTypeV>,
     pub request_type: Type1V<RequestTypeV>,
-    #[deku(ctx = "Tag(13)")] pub esm_info_transfer_flag: Type1TV<ESMInfoTransferFlag>,
-    #[deku(ctx = "Tag(40)")] pub apn: Type4TLV<()>,
-    #[deku(ctx = "Tag(39)")] pub prot_config: Type4TLV<ProtConfig>,
-    #[deku(ctx = "Tag(12)")] pub device_prop: Type1TV<DeviceProp>,
-    #[deku(ctx = "Tag(51)")] pub nbifom_container: Type4TLV<()>,
-    #[deku(ctx = "Tag(102), NeedsByteSize")] pub hdr_comp_config: Type4TLV<HdrCompConfig>,
-    #[deku(ctx = "Tag(123)")] pub ext_prot_config: Type6TLVE<ProtConfig>,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ESMInfoTransferFlag {
-    #[deku(bits = 3)] pub spare: u8,
-    pub value: ESMInfoTransferFlagValue,
+    pub esm_info_transfer_flag: Type1TV<ESMInfoTransferFlag>,
+    pub apn: Type4TLV<APN>,
+    pub prot_config: Type4TLV<ProtConfig>,
+    pub device_prop: Type1TV<DeviceProp>,
+    pub nbifom_container: Type4TLV<NBIFOMContainer>,
+    pub hdr_comp_config: Type4TLV<HdrCompConfig>,
+    pub ext_prot_config: Type6TLVE<ProtConfig>,
 }
 
-#[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct ProtConfig {
-    #[deku(bits = 1)] pub ext: u8,
-    #[deku(bits = 4)] pub spare: u8,
-    pub prot: ProtConfigProt,
-    pub config: (),
+impl<'a> DekuReader<'a> for ESMPDNConnectivityRequest {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        _: (),
+    ) -> Result<Self, DekuError> {
+        let pdn_type: Type1V<PDNTypeV> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let request_type: Type1V<RequestTypeV> = DekuReader::from_reader_with_ctx(reader, ())?;
+        let mut esm_info_transfer_flag: Type1TV<ESMInfoTransferFlag> = Type1TV::absent(Tag(13));
+        let mut apn: Type4TLV<APN> = Type4TLV::absent(Tag(40));
+        let mut prot_config: Type4TLV<ProtConfig> = Type4TLV::absent(Tag(39));
+        let mut device_prop: Type1TV<DeviceProp> = Type1TV::absent(Tag(12));
+        let mut nbifom_container: Type4TLV<NBIFOMContainer> = Type4TLV::absent(Tag(51));
+        let mut hdr_comp_config: Type4TLV<HdrCompConfig> = Type4TLV::absent(Tag(102));
+        let mut ext_prot_config: Type6TLVE<ProtConfig> = Type6TLVE::absent(Tag(123));
+        // optional IEs may arrive in any order, so read each one by looking up its tag
+        while let Some(tag) = peek_tag(reader)? {
+            match tag {
+                40 => apn = DekuReader::from_reader_with_ctx(reader, (Tag(40), NeedsByteSize))?,
+                39 => prot_config = DekuReader::from_reader_with_ctx(reader, (Tag(39), NeedsByteSize))?,
+                51 => nbifom_container = DekuReader::from_reader_with_ctx(reader, (Tag(51), NeedsByteSize))?,
+                102 => hdr_comp_config = DekuReader::from_reader_with_ctx(reader, (Tag(102), NeedsByteSize))?,
+                123 => ext_prot_config = DekuReader::from_reader_with_ctx(reader, (Tag(123), NeedsByteSize))?,
+                _ => match tag >> 4 {
+                    13 => esm_info_transfer_flag = DekuReader::from_reader_with_ctx(reader, Tag(13))?,
+                    12 => device_prop = DekuReader::from_reader_with_ctx(reader, Tag(12))?,
+                    _ => if !skip_unknown_ie(reader, tag)? {
+                        break;
+                    },
+                },
+            }
+        }
+        Ok(Self {
+            pdn_type,
+            request_type,
+            esm_info_transfer_flag,
+            apn,
+            prot_config,
+            device_prop,
+            nbifom_container,
+            hdr_comp_config,
+            ext_prot_config,
+        })
+    }
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone)]
-pub struct DeviceProp {
+pub struct ESMInfoTransferFlag {
     #[deku(bits = 3)] pub spare: u8,
-    #[deku(bits = 1)] pub low_priority: u8,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone)]
-#[deku(ctx = "ByteSize(byte_size): ByteSize")]
-pub struct HdrCompConfig {
-    #[deku(bits = 1)] pub spare: u8,
-    #[deku(bits = 1)] pub p_0x0104: u8,
-    #[deku(bits = 1)] pub p_0x0103: u8,
-    #[deku(bits = 1)] pub p_0x0102: u8,
-    #[deku(bits = 1)] pub p_0x0006: u8,
-    #[deku(bits = 1)] pub p_0x0004: u8,
-    #[deku(bits = 1)] pub p_0x0003: u8,
-    #[deku(bits = 1)] pub p_0x0002: u8,
-    #[deku(bytes = 2, endian = "big")] pub max_cid: u16,
-    pub params_type: HdrCompConfigParamsType,
-    #[deku(count = "byte_size - deku::byte_offset")] pub params_container: Vec<u8>,
+    pub value: ESMInfoTransferFlagValue,
 }
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
 #[deku(id_type = "u8", bits = 4)]
@@ -62,7 +80,7 @@ pub enum PDNTypeV {
     #[deku(id_pat = "2")] IPv6,
     #[deku(id_pat = "3")] IPv4V6,
     #[deku(id_pat = "4")] NonIP,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "0 | 5..=15")] Other,
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
@@ -72,28 +90,7 @@ pub enum RequestTypeV {
     #[deku(id_pat = "2")] Handover,
     #[deku(id_pat = "3")] UnusedInterpretedAsInitialRequest,
     #[deku(id_pat = "4")] Emergency,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 0)]
-pub enum HdrCompConfigParamsType {
-    #[deku(id_pat = "0")] ZeroNoCompression,
-    #[deku(id_pat = "1")] TwoUDPIP,
-    #[deku(id_pat = "2")] ThreeESPIP,
-    #[deku(id_pat = "3")] FourIP,
-    #[deku(id_pat = "4")] SixTCPIP,
-    #[deku(id_pat = "5")] OneHundredAndTwoUDPIP,
-    #[deku(id_pat = "6")] OneHundredAndThreeESPIP,
-    #[deku(id_pat = "7")] OneHundredAndFourIP,
-    #[deku(id_pat = "_")] Other,
-}
-
-#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
-#[deku(id_type = "u8", bits = 3)]
-pub enum ProtConfigProt {
-    #[deku(id_pat = "0")] PPPWithIPPDP,
-    #[deku(id_pat = "_")] Other,
+    #[deku(id_pat = "0 | 5..=15")] Other,
 }
 
 #[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
@@ -121,9 +118,35 @@ mod tests {
         assert_eq!(pdn_type, PDNTypeV::IPv4V6);
         let request_type = msg.request_type.inner;
         assert_eq!(request_type, RequestTypeV::InitialRequest);
+        let apn = msg.apn.inner.unwrap();
+        assert_eq!(apn.apn.len(), 1);
+        assert_eq!(apn.apn[0].len, 11);
+        assert_eq!(apn.apn[0].value, vec![86, 90, 87, 73, 78, 84, 69, 82, 78, 69, 84]);
         let prot_config = msg.prot_config.inner.unwrap();
         assert_eq!(prot_config.ext, 1);
         assert_eq!(prot_config.prot, ProtConfigProt::PPPWithIPPDP);
+        assert_eq!(prot_config.config.len(), 7);
+        assert_eq!(prot_config.config[0].id, ProtConfigEltID::IPCP);
+        assert_eq!(prot_config.config[0].len, 16);
+        assert_eq!(prot_config.config[0].cont, vec![1, 0, 0, 16, 129, 6, 0, 0, 0, 0, 131, 6, 0, 0, 0, 0]);
+        assert_eq!(prot_config.config[1].id, ProtConfigEltID::DNSServerIPv4Addr);
+        assert_eq!(prot_config.config[1].len, 0);
+        assert_eq!(prot_config.config[1].cont, vec![]);
+        assert_eq!(prot_config.config[2].id, ProtConfigEltID::DNSServerIPv6Addr);
+        assert_eq!(prot_config.config[2].len, 0);
+        assert_eq!(prot_config.config[2].cont, vec![]);
+        assert_eq!(prot_config.config[3].id, ProtConfigEltID::Other);
+        assert_eq!(prot_config.config[3].len, 3);
+        assert_eq!(prot_config.config[3].cont, vec![19, 1, 132]);
+        assert_eq!(prot_config.config[4].id, ProtConfigEltID::IPAddrAllocationViaNASSignalling);
+        assert_eq!(prot_config.config[4].len, 0);
+        assert_eq!(prot_config.config[4].cont, vec![]);
+        assert_eq!(prot_config.config[5].id, ProtConfigEltID::SelectedBearerControlMode);
+        assert_eq!(prot_config.config[5].len, 0);
+        assert_eq!(prot_config.config[5].cont, vec![]);
+        assert_eq!(prot_config.config[6].id, ProtConfigEltID::IPv4LinkMTU);
+        assert_eq!(prot_config.config[6].len, 0);
+        assert_eq!(prot_config.config[6].cont, vec![]);
     }
 }
 
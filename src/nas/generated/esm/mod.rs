@@ -30,4 +30,5 @@ pub mod esm_dummy_message;
 pub mod esm_status;
 pub mod esm_remote_ue_report;
 pub mod esm_remote_ue_response;
-pub mod esm_data_transport;
\ No newline at end of file
+pub mod esm_data_transport;
+pub mod dispatch;
\ No newline at end of file
@@ -0,0 +1,1939 @@
+
+#![allow(unused_imports)]
+
+use deku::prelude::*;
+use deku::ctx::ByteSize;
+use serde::Serialize;
+use std::io::{Read, Seek};
+use crate::nas::csn1::*;
+use crate::nas::layer3::*;
+
+/// Autogenerated rust code, do not modify directly! Any changes should be
+/// made via the python generator scripts.
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct NASKSI {
+    pub tsc: NASKSITSC,
+    pub value: NASKSIValue,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct EPSID {
+
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct UENetCap {
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_0: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_1_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_2_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_3_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_4: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_5: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_6: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eea_7: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_0: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_1_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_2_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_3_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_4: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_5: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_6: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub eia_7: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_0: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_1: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_2: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_3: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_4: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_5: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_6: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uea_7: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub ucs_2: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_1: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_2: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_3: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_4: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_5: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_6: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub uia_7: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub pro_se_dd: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub pro_se: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub h_245_ash: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub acc_csfb: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub lpp: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub lcs: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub x_1_srvcc: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub nf: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub e_pco: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub hc_cp_c_io_t: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub e_rw_o_pdn: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub s_1_u_data: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub up_c_io_t: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub cp_c_io_t: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub pro_se_relay: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub pro_se_dc: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub ft_bearers: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub sgc: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub n_1_mode: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub dcnr: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub cp_back_off: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub restrict_ec: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub v_2_x_pc_5: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub multi_drb: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub rpr: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub piv: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub ncr: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub v_2_x_nrpc_5: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub up_mt_edt: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub cp_mt_edt: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub wusa: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub racs: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_1: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_2: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_3: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_4: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_5: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub spare_6: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub ptcc: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub pr: u8,
+    #[deku(count = "byte_size - deku::byte_offset", cond = "deku::byte_offset < byte_size")] pub spare_7: Vec<u8>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct TAI {
+    #[deku(count = "3")] pub plmn: Vec<u8>,
+    #[deku(bytes = 2, endian = "big")] pub tac: u16,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct DRXParam {
+    pub split_pg_cycle_code: DRXParamSPLITPGCYCLECODE,
+    pub drx_cycle_len: DRXParamDRXCycleLen,
+    #[deku(bits = 1)] pub spli_ton_ccch: u8,
+    pub non_drx_timer: DRXParamNonDRXTimer,
+}
+
+#[derive(Debug, Serialize, Clone)]
+pub struct ExtendedGeaBits {
+    pub gea_2: u8,
+    pub gea_3: u8,
+    pub gea_4: u8,
+    pub gea_5: u8,
+    pub gea_6: u8,
+    pub gea_7: u8,
+}
+
+impl Csn1Read for ExtendedGeaBits {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        let gea_2 = reader.read_bits(1)? as u8;
+        let gea_3 = reader.read_bits(1)? as u8;
+        let gea_4 = reader.read_bits(1)? as u8;
+        let gea_5 = reader.read_bits(1)? as u8;
+        let gea_6 = reader.read_bits(1)? as u8;
+        let gea_7 = reader.read_bits(1)? as u8;
+        Ok(Self { gea_2, gea_3, gea_4, gea_5, gea_6, gea_7, })
+    }
+}
+
+#[derive(Debug, Serialize, Clone, Default)]
+pub struct MsNetworkCapabilityValuePart {
+    pub gea_1_bits: Option<u8>,
+    pub sm_capabilities_via_dedicated_channels: Option<u8>,
+    pub sm_capabilities_via_gprs_channels: Option<u8>,
+    pub ucs_2_support: Option<u8>,
+    pub ss_screening_indicator: Option<u8>,
+    pub solsa_capability: Option<u8>,
+    pub revision_level_indicator: Option<u8>,
+    pub pfc_feature_mode: Option<u8>,
+    pub extended_gea_bits: Option<ExtendedGeaBits>,
+    pub lcs_va_capability: Option<u8>,
+    pub ps_inter_rat_ho_from_geran_to_utran_iu_mode_capability: Option<u8>,
+    pub ps_inter_rat_ho_from_geran_to_e_utran_s_1_mode_capability: Option<u8>,
+    pub emm_combined_procedures_capability: Option<u8>,
+    pub isr_support: Option<u8>,
+    pub srvcc_to_geran_utran_capability: Option<u8>,
+    pub epc_capability: Option<u8>,
+    pub nf_capability: Option<u8>,
+    pub geran_network_sharing_capability: Option<u8>,
+    pub user_plane_integrity_protection_support: Option<u8>,
+    pub gia_4: Option<u8>,
+    pub gia_5: Option<u8>,
+    pub gia_6: Option<u8>,
+    pub gia_7: Option<u8>,
+    pub spare_bits: Option<Vec<u8>>,
+}
+
+impl Csn1Read for MsNetworkCapabilityValuePart {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        // values left off the end are None
+        let mut value = Self::default();
+        let result = (|| -> Result<(), Csn1Error> {
+            value.gea_1_bits = Some(reader.read_bits(1)? as u8);
+            value.sm_capabilities_via_dedicated_channels = Some(reader.read_bits(1)? as u8);
+            value.sm_capabilities_via_gprs_channels = Some(reader.read_bits(1)? as u8);
+            value.ucs_2_support = Some(reader.read_bits(1)? as u8);
+            value.ss_screening_indicator = Some(reader.read_bits(2)? as u8);
+            value.solsa_capability = Some(reader.read_bits(1)? as u8);
+            value.revision_level_indicator = Some(reader.read_bits(1)? as u8);
+            value.pfc_feature_mode = Some(reader.read_bits(1)? as u8);
+            value.extended_gea_bits = Some(ExtendedGeaBits::read_csn1(reader)?);
+            value.lcs_va_capability = Some(reader.read_bits(1)? as u8);
+            value.ps_inter_rat_ho_from_geran_to_utran_iu_mode_capability = Some(reader.read_bits(1)? as u8);
+            value.ps_inter_rat_ho_from_geran_to_e_utran_s_1_mode_capability = Some(reader.read_bits(1)? as u8);
+            value.emm_combined_procedures_capability = Some(reader.read_bits(1)? as u8);
+            value.isr_support = Some(reader.read_bits(1)? as u8);
+            value.srvcc_to_geran_utran_capability = Some(reader.read_bits(1)? as u8);
+            value.epc_capability = Some(reader.read_bits(1)? as u8);
+            value.nf_capability = Some(reader.read_bits(1)? as u8);
+            value.geran_network_sharing_capability = Some(reader.read_bits(1)? as u8);
+            value.user_plane_integrity_protection_support = Some(reader.read_bits(1)? as u8);
+            value.gia_4 = Some(reader.read_bits(1)? as u8);
+            value.gia_5 = Some(reader.read_bits(1)? as u8);
+            value.gia_6 = Some(reader.read_bits(1)? as u8);
+            value.gia_7 = Some(reader.read_bits(1)? as u8);
+            value.spare_bits = Some(reader.read_until_end(|reader| Ok(reader.read_bits(1)? as u8))?);
+            Ok(())
+        })();
+        match result {
+            // running out of bits just means the rest were left off, but a value
+            // which doesn't match its definition is still an error
+            Ok(()) | Err(Csn1Error::Truncated) => Ok(value),
+            Err(err) => Err(err),
+        }
+    }
+}
+
+impl<'a> DekuReader<'a, ByteSize> for MsNetworkCapabilityValuePart {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        byte_size: ByteSize,
+    ) -> Result<Self, DekuError> {
+        read_csn1_ie(reader, byte_size)
+    }
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct LAI {
+    #[deku(count = "3")] pub plmn: Vec<u8>,
+    #[deku(bytes = 2, endian = "big")] pub lac: u16,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct TMSIStatus {
+    #[deku(bits = 3)] pub spare: u8,
+    pub flag: TMSIStatusFlag,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct MSCm2 {
+    #[deku(bits = 1)] pub spare_1: u8,
+    pub rev_level: MSCm2RevLevel,
+    #[deku(bits = 1)] pub early_cm_cap: u8,
+    #[deku(bits = 1)] pub no_a_51: u8,
+    pub rf_class: MSCm2RFClass,
+    #[deku(bits = 1)] pub spare_2: u8,
+    #[deku(bits = 1)] pub ps_cap: u8,
+    pub ss_screening_cap: MSCm2SSScreeningCap,
+    #[deku(bits = 1)] pub mtsms_cap: u8,
+    #[deku(bits = 1)] pub vbs_notif_cap: u8,
+    #[deku(bits = 1)] pub vgcs_notif_cap: u8,
+    #[deku(bits = 1)] pub fc_freq_cap: u8,
+    #[deku(bits = 1)] pub ms_cm_3_cap: u8,
+    #[deku(bits = 1)] pub spare_3: u8,
+    #[deku(bits = 1)] pub lcsva_cap: u8,
+    #[deku(bits = 1)] pub ucs_2: u8,
+    #[deku(bits = 1)] pub so_lsa_cap: u8,
+    #[deku(bits = 1)] pub cm_serv_prompt: u8,
+    #[deku(bits = 1)] pub a_53: u8,
+    #[deku(bits = 1)] pub a_52: u8,
+}
+
+#[derive(Debug, Serialize, Clone)]
+pub struct A5Bits {
+    pub a_5_7: u8,
+    pub a_5_6: u8,
+    pub a_5_5: u8,
+    pub a_5_4: u8,
+}
+
+impl Csn1Read for A5Bits {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        let a_5_7 = reader.read_bits(1)? as u8;
+        let a_5_6 = reader.read_bits(1)? as u8;
+        let a_5_5 = reader.read_bits(1)? as u8;
+        let a_5_4 = reader.read_bits(1)? as u8;
+        Ok(Self { a_5_7, a_5_6, a_5_5, a_5_4, })
+    }
+}
+
+#[derive(Debug, Serialize, Clone)]
+pub enum MultibandSupported {
+    B000 {
+        a_5_bits: A5Bits,
+    },
+    B001 {
+        a_5_bits: A5Bits,
+        spare_bit: Vec<u8>,
+        associated_radio_capability_1: u8,
+    },
+    B010 {
+        a_5_bits: A5Bits,
+        spare_bit: Vec<u8>,
+        associated_radio_capability_1: u8,
+    },
+    B100 {
+        a_5_bits: A5Bits,
+        spare_bit: Vec<u8>,
+        associated_radio_capability_1: u8,
+    },
+    B101 {
+        a_5_bits: A5Bits,
+        associated_radio_capability_2: u8,
+        associated_radio_capability_1: u8,
+    },
+    B110 {
+        a_5_bits: A5Bits,
+        associated_radio_capability_2: u8,
+        associated_radio_capability_1: u8,
+    },
+}
+
+impl Csn1Read for MultibandSupported {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        match reader.peek_bits(3)? {
+            0b000 => {
+                reader.skip_bits(3)?;
+                let a_5_bits = A5Bits::read_csn1(reader)?;
+                return Ok(Self::B000 { a_5_bits });
+            }
+            0b001 => {
+                reader.skip_bits(3)?;
+                let a_5_bits = A5Bits::read_csn1(reader)?;
+                let spare_bit = reader.read_count(4, |reader| Ok(reader.read_bits(1)? as u8))?;
+                let associated_radio_capability_1 = reader.read_bits(4)? as u8;
+                return Ok(Self::B001 { a_5_bits, spare_bit, associated_radio_capability_1 });
+            }
+            0b010 => {
+                reader.skip_bits(3)?;
+                let a_5_bits = A5Bits::read_csn1(reader)?;
+                let spare_bit = reader.read_count(4, |reader| Ok(reader.read_bits(1)? as u8))?;
+                let associated_radio_capability_1 = reader.read_bits(4)? as u8;
+                return Ok(Self::B010 { a_5_bits, spare_bit, associated_radio_capability_1 });
+            }
+            0b100 => {
+                reader.skip_bits(3)?;
+                let a_5_bits = A5Bits::read_csn1(reader)?;
+                let spare_bit = reader.read_count(4, |reader| Ok(reader.read_bits(1)? as u8))?;
+                let associated_radio_capability_1 = reader.read_bits(4)? as u8;
+                return Ok(Self::B100 { a_5_bits, spare_bit, associated_radio_capability_1 });
+            }
+            0b101 => {
+                reader.skip_bits(3)?;
+                let a_5_bits = A5Bits::read_csn1(reader)?;
+                let associated_radio_capability_2 = reader.read_bits(4)? as u8;
+                let associated_radio_capability_1 = reader.read_bits(4)? as u8;
+                return Ok(Self::B101 { a_5_bits, associated_radio_capability_2, associated_radio_capability_1 });
+            }
+            0b110 => {
+                reader.skip_bits(3)?;
+                let a_5_bits = A5Bits::read_csn1(reader)?;
+                let associated_radio_capability_2 = reader.read_bits(4)? as u8;
+                let associated_radio_capability_1 = reader.read_bits(4)? as u8;
+                return Ok(Self::B110 { a_5_bits, associated_radio_capability_2, associated_radio_capability_1 });
+            }
+            _ => (),
+        }
+        Err(Csn1Error::InvalidValue)
+    }
+}
+
+#[derive(Debug, Serialize, Clone)]
+pub struct MsMeasurementCapability {
+    pub sms_value: u8,
+    pub sm_value: u8,
+}
+
+impl Csn1Read for MsMeasurementCapability {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        let sms_value = reader.read_bits(4)? as u8;
+        let sm_value = reader.read_bits(4)? as u8;
+        Ok(Self { sms_value, sm_value, })
+    }
+}
+
+#[derive(Debug, Serialize, Clone)]
+pub struct EightPskStruct {
+    pub modulation_capability: u8,
+    pub eight_psk_rf_power_capability_1: Option<u8>,
+    pub eight_psk_rf_power_capability_2: Option<u8>,
+}
+
+impl Csn1Read for EightPskStruct {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        let modulation_capability = reader.read_bits(1)? as u8;
+        let eight_psk_rf_power_capability_1 = if reader.read_bits(1)? == 1 { Some(reader.read_bits(2)? as u8) } else { None };
+        let eight_psk_rf_power_capability_2 = if reader.read_bits(1)? == 1 { Some(reader.read_bits(2)? as u8) } else { None };
+        Ok(Self { modulation_capability, eight_psk_rf_power_capability_1, eight_psk_rf_power_capability_2, })
+    }
+}
+
+#[derive(Debug, Serialize, Clone)]
+pub struct Gsm400BandsSupported {
+    pub gsm_400_bands_supported: Gsm400BandsSupported,
+    pub gsm_400_associated_radio_capability: u8,
+}
+
+impl Csn1Read for Gsm400BandsSupported {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        let gsm_400_bands_supported = Gsm400BandsSupported::read_csn1(reader)?;
+        let gsm_400_associated_radio_capability = reader.read_bits(4)? as u8;
+        Ok(Self { gsm_400_bands_supported, gsm_400_associated_radio_capability, })
+    }
+}
+
+#[derive(Debug, Serialize, Clone)]
+pub struct DtmGprsMultiSlotClass {
+    pub dtm_gprs_multi_slot_class: u8,
+    pub single_slot_dtm: u8,
+    pub dtm_egprs_multi_slot_class: Option<u8>,
+}
+
+impl Csn1Read for DtmGprsMultiSlotClass {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        let dtm_gprs_multi_slot_class = reader.read_bits(2)? as u8;
+        let single_slot_dtm = reader.read_bits(1)? as u8;
+        let dtm_egprs_multi_slot_class = if reader.read_bits(1)? == 1 { Some(reader.read_bits(2)? as u8) } else { None };
+        Ok(Self { dtm_gprs_multi_slot_class, single_slot_dtm, dtm_egprs_multi_slot_class, })
+    }
+}
+
+#[derive(Debug, Serialize, Clone)]
+pub struct ExtendedDtmGprsMultiSlotClass {
+    pub extended_dtm_gprs_multi_slot_class: u8,
+    pub extended_dtm_egprs_multi_slot_class: u8,
+}
+
+impl Csn1Read for ExtendedDtmGprsMultiSlotClass {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        let extended_dtm_gprs_multi_slot_class = reader.read_bits(2)? as u8;
+        let extended_dtm_egprs_multi_slot_class = reader.read_bits(2)? as u8;
+        Ok(Self { extended_dtm_gprs_multi_slot_class, extended_dtm_egprs_multi_slot_class, })
+    }
+}
+
+#[derive(Debug, Serialize, Clone)]
+pub struct TGsm400BandsSupported {
+    pub t_gsm_400_bands_supported: TGsm400BandsSupported,
+    pub t_gsm_400_associated_radio_capability: u8,
+}
+
+impl Csn1Read for TGsm400BandsSupported {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        let t_gsm_400_bands_supported = TGsm400BandsSupported::read_csn1(reader)?;
+        let t_gsm_400_associated_radio_capability = reader.read_bits(4)? as u8;
+        Ok(Self { t_gsm_400_bands_supported, t_gsm_400_associated_radio_capability, })
+    }
+}
+
+#[derive(Debug, Serialize, Clone)]
+pub struct DtmGprsHighMultiSlotClass {
+    pub dtm_gprs_high_multi_slot_class: u8,
+    pub offset_required: u8,
+    pub dtm_egprs_high_multi_slot_class: Option<u8>,
+}
+
+impl Csn1Read for DtmGprsHighMultiSlotClass {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        let dtm_gprs_high_multi_slot_class = reader.read_bits(3)? as u8;
+        let offset_required = reader.read_bits(1)? as u8;
+        let dtm_egprs_high_multi_slot_class = if reader.read_bits(1)? == 1 { Some(reader.read_bits(3)? as u8) } else { None };
+        Ok(Self { dtm_gprs_high_multi_slot_class, offset_required, dtm_egprs_high_multi_slot_class, })
+    }
+}
+
+#[derive(Debug, Serialize, Clone, Default)]
+pub struct Classmark3ValuePart {
+    pub spare_bit: Option<u8>,
+    pub multiband_supported: Option<MultibandSupported>,
+    pub r_support: Option<Option<u8>>,
+    pub hscsd_multi_slot_capability: Option<Option<u8>>,
+    pub ucs_2_treatment: Option<u8>,
+    pub extended_measurement_capability: Option<u8>,
+    pub ms_measurement_capability: Option<Option<MsMeasurementCapability>>,
+    pub ms_positioning_method_capability: Option<Option<u8>>,
+    pub ecsd_multi_slot_capability: Option<Option<u8>>,
+    pub eight_psk_struct: Option<Option<EightPskStruct>>,
+    pub gsm_400_bands_supported: Option<Option<Gsm400BandsSupported>>,
+    pub gsm_850_associated_radio_capability: Option<Option<u8>>,
+    pub gsm_1900_associated_radio_capability: Option<Option<u8>>,
+    pub umts_fdd_radio_access_technology_capability: Option<u8>,
+    pub umts_3_84_mcps_tdd_radio_access_technology_capability: Option<u8>,
+    pub cdma_2000_radio_access_technology_capability: Option<u8>,
+    pub dtm_gprs_multi_slot_class: Option<Option<DtmGprsMultiSlotClass>>,
+    pub single_band_support: Option<Option<u8>>,
+    pub gsm_750_associated_radio_capability: Option<Option<u8>>,
+    pub umts_1_28_mcps_tdd_radio_access_technology_capability: Option<u8>,
+    pub geran_feature_package_1: Option<u8>,
+    pub extended_dtm_gprs_multi_slot_class: Option<Option<ExtendedDtmGprsMultiSlotClass>>,
+    pub high_multislot_capability: Option<Option<u8>>,
+    pub geran_feature_package_2: Option<u8>,
+    pub gmsk_multislot_power_profile: Option<u8>,
+    pub eight_psk_multislot_power_profile: Option<u8>,
+    pub t_gsm_400_bands_supported: Option<Option<TGsm400BandsSupported>>,
+    pub downlink_advanced_receiver_performance: Option<u8>,
+    pub dtm_enhancements_capability: Option<u8>,
+    pub dtm_gprs_high_multi_slot_class: Option<Option<DtmGprsHighMultiSlotClass>>,
+    pub repeated_acch_capability: Option<u8>,
+    pub gsm_710_associated_radio_capability: Option<Option<u8>>,
+    pub t_gsm_810_associated_radio_capability: Option<Option<u8>>,
+    pub ciphering_mode_setting_capability: Option<u8>,
+    pub additional_positioning_capabilities: Option<u8>,
+    pub e_utra_fdd_support: Option<u8>,
+    pub e_utra_tdd_support: Option<u8>,
+    pub e_utra_measurement_and_reporting_support: Option<u8>,
+    pub priority_based_reselection_support: Option<u8>,
+    pub utra_csg_cells_reporting: Option<u8>,
+    pub vamos_level: Option<u8>,
+    pub tighter_capability: Option<u8>,
+    pub selective_ciphering_of_downlink_sacch: Option<u8>,
+    pub cs_to_ps_srvcc_from_geran_to_utra: Option<u8>,
+    pub cs_to_ps_srvcc_from_geran_to_e_utra: Option<u8>,
+    pub geran_network_sharing_support: Option<u8>,
+    pub e_utra_wideband_rsrq_measurements_support: Option<u8>,
+    pub er_band_support: Option<u8>,
+    pub utra_multiple_frequency_band_indicators_support: Option<u8>,
+    pub e_utra_multiple_frequency_band_indicators_support: Option<u8>,
+    pub extended_tsc_set_capability_support: Option<u8>,
+    pub extended_earfcn_value_range: Option<u8>,
+    pub spare_bits: Option<Vec<u8>>,
+}
+
+impl Csn1Read for Classmark3ValuePart {
+    fn read_csn1(reader: &mut BitReader) -> Result<Self, Csn1Error> {
+        // values left off the end are None
+        let mut value = Self::default();
+        let result = (|| -> Result<(), Csn1Error> {
+            value.spare_bit = Some(reader.read_bits(1)? as u8);
+            value.multiband_supported = Some(MultibandSupported::read_csn1(reader)?);
+            value.r_support = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(3)? as u8) } else { None });
+            value.hscsd_multi_slot_capability = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(5)? as u8) } else { None });
+            value.ucs_2_treatment = Some(reader.read_bits(1)? as u8);
+            value.extended_measurement_capability = Some(reader.read_bits(1)? as u8);
+            value.ms_measurement_capability = Some(if reader.read_bits(1)? == 1 { Some(MsMeasurementCapability::read_csn1(reader)?) } else { None });
+            value.ms_positioning_method_capability = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(5)? as u8) } else { None });
+            value.ecsd_multi_slot_capability = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(5)? as u8) } else { None });
+            value.eight_psk_struct = Some(if reader.read_bits(1)? == 1 { Some(EightPskStruct::read_csn1(reader)?) } else { None });
+            value.gsm_400_bands_supported = Some(if reader.read_bits(1)? == 1 { Some(Gsm400BandsSupported::read_csn1(reader)?) } else { None });
+            value.gsm_850_associated_radio_capability = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(4)? as u8) } else { None });
+            value.gsm_1900_associated_radio_capability = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(4)? as u8) } else { None });
+            value.umts_fdd_radio_access_technology_capability = Some(reader.read_bits(1)? as u8);
+            value.umts_3_84_mcps_tdd_radio_access_technology_capability = Some(reader.read_bits(1)? as u8);
+            value.cdma_2000_radio_access_technology_capability = Some(reader.read_bits(1)? as u8);
+            value.dtm_gprs_multi_slot_class = Some(if reader.read_bits(1)? == 1 { Some(DtmGprsMultiSlotClass::read_csn1(reader)?) } else { None });
+            value.single_band_support = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(4)? as u8) } else { None });
+            value.gsm_750_associated_radio_capability = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(4)? as u8) } else { None });
+            value.umts_1_28_mcps_tdd_radio_access_technology_capability = Some(reader.read_bits(1)? as u8);
+            value.geran_feature_package_1 = Some(reader.read_bits(1)? as u8);
+            value.extended_dtm_gprs_multi_slot_class = Some(if reader.read_bits(1)? == 1 { Some(ExtendedDtmGprsMultiSlotClass::read_csn1(reader)?) } else { None });
+            value.high_multislot_capability = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(2)? as u8) } else { None });
+            reader.expect_bits(1, 0b0)?;
+            value.geran_feature_package_2 = Some(reader.read_bits(1)? as u8);
+            value.gmsk_multislot_power_profile = Some(reader.read_bits(2)? as u8);
+            value.eight_psk_multislot_power_profile = Some(reader.read_bits(2)? as u8);
+            value.t_gsm_400_bands_supported = Some(if reader.read_bits(1)? == 1 { Some(TGsm400BandsSupported::read_csn1(reader)?) } else { None });
+            reader.expect_bits(1, 0b0)?;
+            value.downlink_advanced_receiver_performance = Some(reader.read_bits(2)? as u8);
+            value.dtm_enhancements_capability = Some(reader.read_bits(1)? as u8);
+            value.dtm_gprs_high_multi_slot_class = Some(if reader.read_bits(1)? == 1 { Some(DtmGprsHighMultiSlotClass::read_csn1(reader)?) } else { None });
+            value.repeated_acch_capability = Some(reader.read_bits(1)? as u8);
+            value.gsm_710_associated_radio_capability = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(4)? as u8) } else { None });
+            value.t_gsm_810_associated_radio_capability = Some(if reader.read_bits(1)? == 1 { Some(reader.read_bits(4)? as u8) } else { None });
+            value.ciphering_mode_setting_capability = Some(reader.read_bits(1)? as u8);
+            value.additional_positioning_capabilities = Some(reader.read_bits(1)? as u8);
+            value.e_utra_fdd_support = Some(reader.read_bits(1)? as u8);
+            value.e_utra_tdd_support = Some(reader.read_bits(1)? as u8);
+            value.e_utra_measurement_and_reporting_support = Some(reader.read_bits(1)? as u8);
+            value.priority_based_reselection_support = Some(reader.read_bits(1)? as u8);
+            value.utra_csg_cells_reporting = Some(reader.read_bits(1)? as u8);
+            value.vamos_level = Some(reader.read_bits(2)? as u8);
+            value.tighter_capability = Some(reader.read_bits(2)? as u8);
+            value.selective_ciphering_of_downlink_sacch = Some(reader.read_bits(1)? as u8);
+            value.cs_to_ps_srvcc_from_geran_to_utra = Some(reader.read_bits(2)? as u8);
+            value.cs_to_ps_srvcc_from_geran_to_e_utra = Some(reader.read_bits(2)? as u8);
+            value.geran_network_sharing_support = Some(reader.read_bits(1)? as u8);
+            value.e_utra_wideband_rsrq_measurements_support = Some(reader.read_bits(1)? as u8);
+            value.er_band_support = Some(reader.read_bits(1)? as u8);
+            value.utra_multiple_frequency_band_indicators_support = Some(reader.read_bits(1)? as u8);
+            value.e_utra_multiple_frequency_band_indicators_support = Some(reader.read_bits(1)? as u8);
+            value.extended_tsc_set_capability_support = Some(reader.read_bits(1)? as u8);
+            value.extended_earfcn_value_range = Some(reader.read_bits(1)? as u8);
+            value.spare_bits = Some(reader.read_until_end(|reader| Ok(reader.read_bits(1)? as u8))?);
+            Ok(())
+        })();
+        match result {
+            // running out of bits just means the rest were left off, but a value
+            // which doesn't match its definition is still an error
+            Ok(()) | Err(Csn1Error::Truncated) => Ok(value),
+            Err(err) => Err(err),
+        }
+    }
+}
+
+impl<'a> DekuReader<'a, ByteSize> for Classmark3ValuePart {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        byte_size: ByteSize,
+    ) -> Result<Self, DekuError> {
+        read_csn1_ie(reader, byte_size)
+    }
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct SuppCodecList {
+    #[deku(bytes_read = "byte_size - deku::byte_offset")] pub supp_codec_list: Vec<SuppCodec>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct SuppCodec {
+    #[deku(bytes = 1)] pub sys_id: u8,
+    #[deku(bytes = 1)] pub bm_len: u8,
+    #[deku(count = "bm_len")] pub codec_bm: Vec<u8>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct AddUpdateType {
+    pub pnb_c_io_t: AddUpdateTypePNBCIoT,
+    pub saf: AddUpdateTypeSAF,
+    pub autv: AddUpdateTypeAUTV,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct VoiceDomPref {
+    #[deku(bits = 5)] pub spare: u8,
+    pub ue_usage: VoiceDomPrefUEUsage,
+    pub voice_dom_pref: VoiceDomPrefVoiceDomPref,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct DeviceProp {
+    #[deku(bits = 3)] pub spare: u8,
+    #[deku(bits = 1)] pub low_priority: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct GUTIType {
+    #[deku(bits = 3)] pub spare: u8,
+    pub value: GUTITypeValue,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct MSNetFeatSupp {
+    #[deku(bits = 3)] pub spare: u8,
+    #[deku(bits = 1)] pub ext_period_timers: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct NRICont {
+    #[deku(bits = 10, endian = "big")] pub value: u16,
+    #[deku(bits = 6)] pub spare: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct GPRSTimer {
+    pub unit: GPRSTimerUnit,
+    #[deku(bits = 5)] pub value: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct GPRSTimer3 {
+    pub unit: GPRSTimer3Unit,
+    #[deku(bits = 5)] pub value: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct ExtDRXParam {
+    #[deku(bits = 4)] pub ptx: u8,
+    #[deku(bits = 4)] pub e_drx: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct UEAddSecCap {
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_0: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_1_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_2_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_3_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_4: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_5: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_6: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_7: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_8: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_9: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_10: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_11: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_12: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_13: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_14: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ea_15: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_0: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_1_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_2_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_3_128: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_4: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_5: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_6: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_7: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_8: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_9: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_10: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_11: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_12: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_13: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_14: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_ia_15: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct UEStatus {
+    #[deku(bits = 6)] pub spare: u8,
+    pub n_1_mode_reg: UEStatusN1ModeReg,
+    pub s_1_mode_reg: UEStatusS1ModeReg,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct AddInfoReq {
+    #[deku(bits = 7)] pub spare: u8,
+    pub cipher_key: AddInfoReqCipherKey,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct N1UENetCap {
+    #[deku(bits = 2, cond = "deku::byte_offset < byte_size")] pub spare: u8,
+    #[deku(bits = 2, cond = "deku::byte_offset < byte_size")] pub five_gs_pnb_c_io_t: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_up_c_io_t: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_hc_cp_c_io_t: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub n_3_data: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub five_g_cp_c_io_t: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct ID {
+
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct PLMNList {
+    #[deku(bytes_read = "byte_size - deku::byte_offset")] pub plmn_list: Vec<PLMN>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct PLMN {
+    #[deku(count = "3")] pub plmn: Vec<u8>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct EmergNumList {
+    #[deku(bytes_read = "byte_size - deku::byte_offset")] pub emerg_num_list: Vec<EmergNum>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct EmergNum {
+    #[deku(bytes = 1)] pub len: u8,
+    #[deku(bits = 3)] pub spare: u8,
+    pub service_cat: ServiceCat,
+    #[deku(count = "usize::from(*len).saturating_sub(1)")] pub num: Vec<u8>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct ServiceCat {
+    #[deku(bits = 1)] pub police: u8,
+    #[deku(bits = 1)] pub ambulance: u8,
+    #[deku(bits = 1)] pub fire: u8,
+    #[deku(bits = 1)] pub marine: u8,
+    #[deku(bits = 1)] pub mountain: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct EPSNetFeat {
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub cp_c_io_t: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub e_rwo_pdn: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub esr_ps: u8,
+    #[deku(cond = "deku::byte_offset < byte_size", default = "EPSNetFeatCSLCS::NoInfo")] pub cs_lcs: EPSNetFeatCSLCS,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub epc_lcs: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub emc_bs: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub ims_vo_ps: u8,
+    #[deku(bits = 4, cond = "deku::byte_offset < byte_size")] pub spare: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub epco: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub hc_cp_c_io_t: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub s_1_u_data: u8,
+    #[deku(bits = 1, cond = "deku::byte_offset < byte_size")] pub up_c_io_t: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct AddUpdateRes {
+    #[deku(bits = 2)] pub spare: u8,
+    pub value: AddUpdateResValue,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct SMSServStat {
+    #[deku(bits = 1)] pub spare: u8,
+    pub value: SMSServStatValue,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct Non3GPPNWProvPol {
+    #[deku(bits = 3)] pub spare: u8,
+    pub value: Non3GPPNWProvPolValue,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct NetworkPol {
+    #[deku(bits = 3)] pub spare: u8,
+    pub value: NetworkPolValue,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct ExtEmergNumList {
+    #[deku(bits = 7)] pub spare: u8,
+    pub eenl_validity: ExtEmergNumListEENLValidity,
+    pub eenl: (),
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct UERadioCapIDDelInd {
+    #[deku(bits = 1)] pub spare: u8,
+    pub del_request: UERadioCapIDDelIndDelRequest,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct ExtEMMCause {
+    #[deku(bits = 2)] pub spare: u8,
+    #[deku(bits = 1)] pub eps_optim_info: u8,
+    #[deku(bits = 1)] pub eutran_allowed: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct EPSBearerCtxtStat {
+    pub ebi_7: EPSBearerCtxtStatEBI7,
+    pub ebi_6: EPSBearerCtxtStatEBI6,
+    pub ebi_5: EPSBearerCtxtStatEBI5,
+    #[deku(bits = 1)] pub ebi_4: u8,
+    #[deku(bits = 1)] pub ebi_3: u8,
+    #[deku(bits = 1)] pub ebi_2: u8,
+    #[deku(bits = 1)] pub ebi_1: u8,
+    #[deku(bits = 1)] pub ebi_0: u8,
+    pub ebi_15: EPSBearerCtxtStatEBI15,
+    pub ebi_14: EPSBearerCtxtStatEBI14,
+    pub ebi_13: EPSBearerCtxtStatEBI13,
+    pub ebi_12: EPSBearerCtxtStatEBI12,
+    pub ebi_11: EPSBearerCtxtStatEBI11,
+    pub ebi_10: EPSBearerCtxtStatEBI10,
+    pub ebi_9: EPSBearerCtxtStatEBI9,
+    pub ebi_8: EPSBearerCtxtStatEBI8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct EPSQoS {
+    #[deku(bytes = 1)] pub qci: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct APN {
+    #[deku(bytes_read = "byte_size - deku::byte_offset")] pub apn: Vec<APNItem>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct APNItem {
+    #[deku(bytes = 1)] pub len: u8,
+    #[deku(count = "len")] pub value: Vec<u8>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct TI {
+    pub ti_flag: TITIFlag,
+    #[deku(bits = 3)] pub tio: u8,
+    #[deku(bits = 4)] pub spare: u8,
+    #[deku(bytes = 0)] pub ext: u8,
+    #[deku(bytes = 0)] pub tie: u8,
+    #[deku(bytes = 0)] pub ti: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct QoS {
+    #[deku(bits = 2)] pub spare_1: u8,
+    pub delay_class: QoSDelayClass,
+    pub reliability_class: QoSReliabilityClass,
+    pub peak_throughput: QoSPeakThroughput,
+    #[deku(bits = 1)] pub spare_2: u8,
+    pub precedence_class: QoSPrecedenceClass,
+    #[deku(bits = 3)] pub spare_3: u8,
+    pub mean_throughput: QoSMeanThroughput,
+    pub traffic_class: QoSTrafficClass,
+    pub delivery_order: QoSDeliveryOrder,
+    pub erroneous_sdu: QoSErroneousSDU,
+    #[deku(bytes = 1)] pub max_sdu_size: u8,
+    #[deku(bytes = 1)] pub max_ul_bitrate: u8,
+    #[deku(bytes = 1)] pub max_dl_bitrate: u8,
+    #[deku(bits = 4)] pub residual_ber: u8,
+    #[deku(bits = 4)] pub sdu_error_ratio: u8,
+    #[deku(bits = 6)] pub transfer_delay: u8,
+    #[deku(bits = 2)] pub traffic_handling_priority: u8,
+    #[deku(bytes = 1)] pub guaranteed_ul_bitrate: u8,
+    #[deku(bytes = 1)] pub guaranteed_dl_bitrate: u8,
+    #[deku(bits = 3)] pub spare_4: u8,
+    pub signalling_ind: QoSSignallingInd,
+    pub source_stats_desc: QoSSourceStatsDesc,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct LLCSAPI {
+    #[deku(bits = 4)] pub spare: u8,
+    pub value: LLCSAPIValue,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct RadioPriority {
+    #[deku(bits = 1)] pub spare: u8,
+    pub value: RadioPriorityValue,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct PacketFlowId {
+    #[deku(bits = 1)] pub spare: u8,
+    pub value: PacketFlowIdValue,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct APNAMBR {
+    #[deku(bytes = 1, cond = "deku::byte_offset < byte_size")] pub dl: u8,
+    #[deku(bytes = 1, cond = "deku::byte_offset < byte_size")] pub ul: u8,
+    #[deku(bytes = 0, cond = "deku::byte_offset < byte_size")] pub dl_ext: u8,
+    #[deku(bytes = 0, cond = "deku::byte_offset < byte_size")] pub ul_ext: u8,
+    #[deku(bytes = 0, cond = "deku::byte_offset < byte_size")] pub dl_ext_2: u8,
+    #[deku(bytes = 0, cond = "deku::byte_offset < byte_size")] pub ul_ext_2: u8,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct ProtConfig {
+    #[deku(bits = 1)] pub ext: u8,
+    #[deku(bits = 4)] pub spare: u8,
+    pub prot: ProtConfigProt,
+    #[deku(bytes_read = "byte_size - deku::byte_offset")] pub config: Vec<ProtConfigElt>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct WLANOffloadAccept {
+    #[deku(bits = 2)] pub spare: u8,
+    pub utran_offload_accept: WLANOffloadAcceptUTRANOffloadAccept,
+    pub eutran_offload_accept: WLANOffloadAcceptEUTRANOffloadAccept,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct NBIFOMContainer {
+    #[deku(bytes_read = "byte_size - deku::byte_offset")] pub nbifom_container: Vec<NBIFOMParameter>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct NBIFOMParameter {
+    pub param_id: NBIFOMParameterParamID,
+    #[deku(bytes = 1)] pub param_len: u8,
+    #[deku(count = "param_len")] pub param: Vec<u8>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+#[deku(ctx = "ByteSize(byte_size): ByteSize")]
+pub struct HdrCompConfig {
+    #[deku(bits = 1)] pub spare: u8,
+    #[deku(bits = 1)] pub p_0x0104: u8,
+    #[deku(bits = 1)] pub p_0x0103: u8,
+    #[deku(bits = 1)] pub p_0x0102: u8,
+    #[deku(bits = 1)] pub p_0x0006: u8,
+    #[deku(bits = 1)] pub p_0x0004: u8,
+    #[deku(bits = 1)] pub p_0x0003: u8,
+    #[deku(bits = 1)] pub p_0x0002: u8,
+    #[deku(bytes = 2, endian = "big")] pub max_cid: u16,
+    pub params_type: HdrCompConfigParamsType,
+    #[deku(count = "byte_size - deku::byte_offset")] pub params_container: Vec<u8>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct ExtAPNAMBR {
+    pub unit_dl: ExtAPNAMBRUnitDL,
+    #[deku(bytes = 2, endian = "big")] pub dl: u16,
+    pub unit_ul: ExtAPNAMBRUnitUL,
+    #[deku(bytes = 2, endian = "big")] pub ul: u16,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct ProtConfigElt {
+    pub id: ProtConfigEltID,
+    #[deku(bytes = 1)] pub len: u8,
+    #[deku(count = "len")] pub cont: Vec<u8>,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct TFT {
+    pub opcode: TFTOpcode,
+    pub e: TFTE,
+    #[deku(bits = 4)] pub num_pkt_filters: u8,
+    pub pkt_filters: (),
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct ExtEPSQoS {
+    pub unit_max_bitrate: ExtEPSQoSUnitMaxBitrate,
+    #[deku(bytes = 2, endian = "big")] pub max_ul_bitrate: u16,
+    #[deku(bytes = 2, endian = "big")] pub max_dl_bitrate: u16,
+    pub unit_guaranteed_bitrate: ExtEPSQoSUnitGuaranteedBitrate,
+    #[deku(bytes = 2, endian = "big")] pub guaranteed_ul_bitrate: u16,
+    #[deku(bytes = 2, endian = "big")] pub guaranteed_dl_bitrate: u16,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct ReattemptInd {
+    #[deku(bits = 6)] pub spare: u8,
+    pub eplmnc: ReattemptIndEPLMNC,
+    pub ratc: ReattemptIndRATC,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone)]
+pub struct TFAggregate {
+    pub opcode: TFAggregateOpcode,
+    pub e: TFAggregateE,
+    #[deku(bits = 4)] pub num_pkt_filters: u8,
+    pub pkt_filters: (),
+}
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum AddInfoReqCipherKey {
+    #[deku(id_pat = "0")] CipheringKeysForCipheredBroadcastAssistanceDataNotRequested,
+    #[deku(id_pat = "1")] CipheringKeysForCipheredBroadcastAssistanceDataRequested,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum UEStatusN1ModeReg {
+    #[deku(id_pat = "0")] UENotIn5GMMREGISTEREDState,
+    #[deku(id_pat = "1")] UEIn5GMMREGISTEREDState,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum UEStatusS1ModeReg {
+    #[deku(id_pat = "0")] UENotInEMMREGISTEREDState,
+    #[deku(id_pat = "1")] UEInEMMREGISTEREDState,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum GPRSTimer3Unit {
+    #[deku(id_pat = "0")] TenMin,
+    #[deku(id_pat = "1")] OneHour,
+    #[deku(id_pat = "2")] TenHours,
+    #[deku(id_pat = "3")] TwoSec,
+    #[deku(id_pat = "4")] ThirtySec,
+    #[deku(id_pat = "5")] OneMin,
+    #[deku(id_pat = "6")] ThreeHundredAndTwentyHours,
+    #[deku(id_pat = "7")] TimerDeactivated,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum GPRSTimerUnit {
+    #[deku(id_pat = "0")] TwoSec,
+    #[deku(id_pat = "1")] OneMin,
+    #[deku(id_pat = "2")] SixMin,
+    #[deku(id_pat = "7")] TimerDeactivated,
+    #[deku(id_pat = "3..=6")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum GUTITypeValue {
+    #[deku(id_pat = "0")] NativeGUTI,
+    #[deku(id_pat = "1")] MappedGUTI,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum VoiceDomPrefUEUsage {
+    #[deku(id_pat = "0")] VoiceCentric,
+    #[deku(id_pat = "1")] DataCentric,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 2)]
+pub enum VoiceDomPrefVoiceDomPref {
+    #[deku(id_pat = "0")] CSVoiceOnly,
+    #[deku(id_pat = "1")] IMSPSVoiceOnly,
+    #[deku(id_pat = "2")] CSVoicePreferredIMSPSVoiceAsSecondary,
+    #[deku(id_pat = "3")] IMSPSVoicePreferredCSVoiceAsSecondary,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 2)]
+pub enum AddUpdateTypePNBCIoT {
+    #[deku(id_pat = "0")] NoAdditionalInformation,
+    #[deku(id_pat = "1")] ControlPlaneCIoTEPSOptimization,
+    #[deku(id_pat = "2")] UserPlaneCIoTEPSOptimization,
+    #[deku(id_pat = "3")] Reserved,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum AddUpdateTypeSAF {
+    #[deku(id_pat = "0")] NASSignallingNotRequiredAfterCompletionOfTAU,
+    #[deku(id_pat = "1")] NASSignallingRequiredAfterCompletionOfTAU,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum AddUpdateTypeAUTV {
+    #[deku(id_pat = "1")] SMSOnly,
+    #[deku(id_pat = "0")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 2)]
+pub enum MSCm2RevLevel {
+    #[deku(id_pat = "0")] ReservedForGSMPhase1,
+    #[deku(id_pat = "1")] GSMPhase2MS,
+    #[deku(id_pat = "2")] MSSupportingR99OrLater,
+    #[deku(id_pat = "3")] FFU,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum MSCm2RFClass {
+    #[deku(id_pat = "0")] Class1,
+    #[deku(id_pat = "1")] Class2,
+    #[deku(id_pat = "2")] Class3,
+    #[deku(id_pat = "3")] Class4,
+    #[deku(id_pat = "4")] Class5,
+    #[deku(id_pat = "5..=7")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 2)]
+pub enum MSCm2SSScreeningCap {
+    #[deku(id_pat = "0")] DefaultValueOfPhase1,
+    #[deku(id_pat = "1")] CapabilityOfHandlingOfEllipsisNotationAndPhase2ErrorHandling,
+    #[deku(id_pat = "2..=3")] Ffu,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum TMSIStatusFlag {
+    #[deku(id_pat = "0")] NoValidTMSIAvailable,
+    #[deku(id_pat = "1")] ValidTMSIAvailable,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 8)]
+pub enum DRXParamSPLITPGCYCLECODE {
+    #[deku(id_pat = "0")] SevenHundredAndFourNoDRX,
+    #[deku(id_pat = "65")] SeventyOne,
+    #[deku(id_pat = "66")] SeventyTwo,
+    #[deku(id_pat = "67")] SeventyFour,
+    #[deku(id_pat = "68")] SeventyFive,
+    #[deku(id_pat = "69")] SeventySeven,
+    #[deku(id_pat = "70")] SeventyNine,
+    #[deku(id_pat = "71")] Eighty,
+    #[deku(id_pat = "72")] EightyThree,
+    #[deku(id_pat = "73")] EightySix,
+    #[deku(id_pat = "74")] EightyEight,
+    #[deku(id_pat = "75")] Ninety,
+    #[deku(id_pat = "76")] NinetyTwo,
+    #[deku(id_pat = "77")] NinetySix,
+    #[deku(id_pat = "78")] OneHundredAndOne,
+    #[deku(id_pat = "79")] OneHundredAndThree,
+    #[deku(id_pat = "80")] OneHundredAndSeven,
+    #[deku(id_pat = "81")] OneHundredAndTwelve,
+    #[deku(id_pat = "82")] OneHundredAndSixteen,
+    #[deku(id_pat = "83")] OneHundredAndEighteen,
+    #[deku(id_pat = "84")] OneHundredAndTwentyEight,
+    #[deku(id_pat = "85")] OneHundredAndFortyOne,
+    #[deku(id_pat = "86")] OneHundredAndFortyFour,
+    #[deku(id_pat = "87")] OneHundredAndFifty,
+    #[deku(id_pat = "88")] OneHundredAndSixty,
+    #[deku(id_pat = "89")] OneHundredAndSeventyOne,
+    #[deku(id_pat = "90")] OneHundredAndSeventySix,
+    #[deku(id_pat = "91")] OneHundredAndNinetyTwo,
+    #[deku(id_pat = "92")] TwoHundredAndFourteen,
+    #[deku(id_pat = "93")] TwoHundredAndTwentyFour,
+    #[deku(id_pat = "94")] TwoHundredAndThirtyFive,
+    #[deku(id_pat = "95")] TwoHundredAndFiftySix,
+    #[deku(id_pat = "96")] TwoHundredAndEightyEight,
+    #[deku(id_pat = "97")] ThreeHundredAndTwenty,
+    #[deku(id_pat = "98")] ThreeHundredAndFiftyTwo,
+    #[deku(id_pat = "1..=64 | 99..=255")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 4)]
+pub enum DRXParamDRXCycleLen {
+    #[deku(id_pat = "0")] DRXNotSpecifiedByTheMS,
+    #[deku(id_pat = "6")] IuCoeff6AndS1T32,
+    #[deku(id_pat = "7")] IuCoeff7AndS1T64,
+    #[deku(id_pat = "8")] IuCoeff8AndS1T128,
+    #[deku(id_pat = "9")] IuCoeff9AndS1T256,
+    #[deku(id_pat = "1..=5 | 10..=15")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum DRXParamNonDRXTimer {
+    #[deku(id_pat = "0")] NoNonDRXModeAfterTransferState,
+    #[deku(id_pat = "1")] Max1SecNonDRXModeAfterTransferState,
+    #[deku(id_pat = "2")] Max2SecNonDRXModeAfterTransferState,
+    #[deku(id_pat = "3")] Max4SecNonDRXModeAfterTransferState,
+    #[deku(id_pat = "4")] Max8SecNonDRXModeAfterTransferState,
+    #[deku(id_pat = "5")] Max16SecNonDRXModeAfterTransferState,
+    #[deku(id_pat = "6")] Max32SecNonDRXModeAfterTransferState,
+    #[deku(id_pat = "7")] Max64SecNonDRXModeAfterTransferState,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum NASKSITSC {
+    #[deku(id_pat = "0")] NativeSecurityContext,
+    #[deku(id_pat = "1")] MappedSecurityContext,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum NASKSIValue {
+    #[deku(id_pat = "7")] NoKeyAvailable,
+    #[deku(id_pat = "0..=6")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 8)]
+pub enum EMMCauseEMMCause {
+    #[deku(id_pat = "2")] IMSIUnknownInHSS,
+    #[deku(id_pat = "3")] IllegalUE,
+    #[deku(id_pat = "5")] IMEINotAccepted,
+    #[deku(id_pat = "6")] IllegalME,
+    #[deku(id_pat = "7")] EPSServicesNotAllowed,
+    #[deku(id_pat = "8")] EPSServicesAndNonEPSServicesNotAllowed,
+    #[deku(id_pat = "9")] UEIdentityCannotBeDerivedByTheNetwork,
+    #[deku(id_pat = "10")] ImplicitlyDetached,
+    #[deku(id_pat = "11")] PLMNNotAllowed,
+    #[deku(id_pat = "12")] TrackingAreaNotAllowed,
+    #[deku(id_pat = "13")] RoamingNotAllowedInThisTrackingArea,
+    #[deku(id_pat = "14")] EPSServicesNotAllowedInThisPLMN,
+    #[deku(id_pat = "15")] NoSuitableCellsInTrackingArea,
+    #[deku(id_pat = "16")] MSCTemporarilyNotReachable,
+    #[deku(id_pat = "17")] NetworkFailure,
+    #[deku(id_pat = "18")] CSDomainNotAvailable,
+    #[deku(id_pat = "19")] ESMFailure,
+    #[deku(id_pat = "20")] MACFailure,
+    #[deku(id_pat = "21")] SynchFailure,
+    #[deku(id_pat = "22")] Congestion,
+    #[deku(id_pat = "23")] UESecurityCapabilitiesMismatch,
+    #[deku(id_pat = "24")] SecurityModeRejectedUnspecified,
+    #[deku(id_pat = "25")] NotAuthorizedForThisCSG,
+    #[deku(id_pat = "26")] NonEPSAuthenticationUnacceptable,
+    #[deku(id_pat = "35")] RequestedServiceOptionNotAuthorizedInThisPLMN,
+    #[deku(id_pat = "39")] CSServiceTemporarilyNotAvailable,
+    #[deku(id_pat = "40")] NoEPSBearerContextActivated,
+    #[deku(id_pat = "42")] SevereNetworkFailure,
+    #[deku(id_pat = "95")] SemanticallyIncorrectMessage,
+    #[deku(id_pat = "96")] InvalidMandatoryInformation,
+    #[deku(id_pat = "97")] MessageTypeNonExistentOrNotImplemented,
+    #[deku(id_pat = "98")] MessageTypeNotCompatibleWithTheProtocolState,
+    #[deku(id_pat = "99")] InformationElementNonExistentOrNotImplemented,
+    #[deku(id_pat = "100")] ConditionalIEError,
+    #[deku(id_pat = "101")] MessageNotCompatibleWithTheProtocolState,
+    #[deku(id_pat = "111")] ProtocolErrorUnspecified,
+    #[deku(id_pat = "0..=1 | 4 | 27..=34 | 36..=38 | 41 | 43..=94 | 102..=110 | 112..=255")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum UERadioCapIDDelIndDelRequest {
+    #[deku(id_pat = "0")] UERadioCapabilityIDDeletionNotRequested,
+    #[deku(id_pat = "1")] NetworkAssignedUERadioCapabilityIDsDeletionRequested,
+    #[deku(id_pat = "2..=7")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum ExtEmergNumListEENLValidity {
+    #[deku(id_pat = "0")] CountryWideList,
+    #[deku(id_pat = "1")] PLMNWideList,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum NetworkPolValue {
+    #[deku(id_pat = "0")] UnsecuredRedirectionToGERANAllowed,
+    #[deku(id_pat = "1")] UnsecuredRedirectionToGERANNotAllowed,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum Non3GPPNWProvPolValue {
+    #[deku(id_pat = "0")] UseOfNon3GPPEmergencyNumbersNotPermitted,
+    #[deku(id_pat = "1")] UseOfNon3GPPEmergencyNumbersPermitted,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum SMSServStatValue {
+    #[deku(id_pat = "0")] SMSServicesNotAvailable,
+    #[deku(id_pat = "1")] SMSServicesNotAvailableInThisPLMN,
+    #[deku(id_pat = "2")] NetworkFailure,
+    #[deku(id_pat = "3")] Congestion,
+    #[deku(id_pat = "4..=7")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 2)]
+pub enum AddUpdateResValue {
+    #[deku(id_pat = "0")] NoAdditionalInformation,
+    #[deku(id_pat = "1")] CSFallbackNotPreferred,
+    #[deku(id_pat = "2")] SMSOnly,
+    #[deku(id_pat = "3")] Reserved,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 2)]
+pub enum EPSNetFeatCSLCS {
+    #[deku(id_pat = "0")] NoInfo,
+    #[deku(id_pat = "1")] Supported,
+    #[deku(id_pat = "2")] NotSupported,
+    #[deku(id_pat = "3")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI7 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI6 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI5 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI15 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI14 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI13 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI12 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI11 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI10 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI9 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum EPSBearerCtxtStatEBI8 {
+    #[deku(id_pat = "0")] BEARERCONTEXTINACTIVE,
+    #[deku(id_pat = "1")] BEARERCONTEXTACTIVE,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 8)]
+pub enum GenericContTypeGenericContType {
+    #[deku(id_pat = "1")] LTEPositioningProtocolLPPMessageContainer,
+    #[deku(id_pat = "2")] LocationServicesMessageContainer,
+    #[deku(id_pat = "0 | 3..=255")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 8)]
+pub enum ESMCauseESMCause {
+    #[deku(id_pat = "8")] OperatorDeterminedBarring,
+    #[deku(id_pat = "26")] InsufficientResources,
+    #[deku(id_pat = "27")] MissingOrUnknownAPN,
+    #[deku(id_pat = "28")] UnknownPDNType,
+    #[deku(id_pat = "29")] UserAuthenticationFailed,
+    #[deku(id_pat = "30")] RequestRejectedByServingGWOrPDNGW,
+    #[deku(id_pat = "31")] RequestRejectedUnspecified,
+    #[deku(id_pat = "32")] ServiceOptionNotSupported,
+    #[deku(id_pat = "33")] RequestedServiceOptionNotSubscribed,
+    #[deku(id_pat = "34")] ServiceOptionTemporarilyOutOfOrder,
+    #[deku(id_pat = "35")] PTIAlreadyInUse,
+    #[deku(id_pat = "36")] RegularDeactivation,
+    #[deku(id_pat = "37")] EPSQoSNotAccepted,
+    #[deku(id_pat = "38")] NetworkFailure,
+    #[deku(id_pat = "39")] ReactivationRequested,
+    #[deku(id_pat = "41")] SemanticErrorInTheTFTOperation,
+    #[deku(id_pat = "42")] SyntacticalErrorInTheTFTOperation,
+    #[deku(id_pat = "43")] InvalidEPSBearerIdentity,
+    #[deku(id_pat = "44")] SemanticErrorsInPacketFilterS,
+    #[deku(id_pat = "45")] SyntacticalErrorsInPacketFilterS,
+    #[deku(id_pat = "46")] UnusedSeeNOTE2,
+    #[deku(id_pat = "47")] PTIMismatch,
+    #[deku(id_pat = "49")] LastPDNDisconnectionNotAllowed,
+    #[deku(id_pat = "50")] PDNTypeIPv4OnlyAllowed,
+    #[deku(id_pat = "51")] PDNTypeIPv6OnlyAllowed,
+    #[deku(id_pat = "52")] SingleAddressBearersOnlyAllowed,
+    #[deku(id_pat = "53")] ESMInformationNotReceived,
+    #[deku(id_pat = "54")] PDNConnectionDoesNotExist,
+    #[deku(id_pat = "55")] MultiplePDNConnectionsForAGivenAPNNotAllowed,
+    #[deku(id_pat = "56")] CollisionWithNetworkInitiatedRequest,
+    #[deku(id_pat = "59")] UnsupportedQCIValue,
+    #[deku(id_pat = "60")] BearerHandlingNotSupported,
+    #[deku(id_pat = "65")] MaximumNumberOfEPSBearersReached,
+    #[deku(id_pat = "66")] RequestedAPNNotSupportedInCurrentRATAndPLMNCombination,
+    #[deku(id_pat = "81")] InvalidPTIValue,
+    #[deku(id_pat = "95")] SemanticallyIncorrectMessage,
+    #[deku(id_pat = "96")] InvalidMandatoryInformation,
+    #[deku(id_pat = "97")] MessageTypeNonExistentOrNotImplemented,
+    #[deku(id_pat = "98")] MessageTypeNotCompatibleWithTheProtocolState,
+    #[deku(id_pat = "99")] InformationElementNonExistentOrNotImplemented,
+    #[deku(id_pat = "100")] ConditionalIEError,
+    #[deku(id_pat = "101")] MessageNotCompatibleWithTheProtocolState,
+    #[deku(id_pat = "111")] ProtocolErrorUnspecified,
+    #[deku(id_pat = "112")] APNRestrictionValueIncompatibleWithActiveEPSBearerContext,
+    #[deku(id_pat = "0..=7 | 9..=25 | 40 | 48 | 57..=58 | 61..=64 | 67..=80 | 82..=94 | 102..=110 | 113..=255")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 8)]
+pub enum NBIFOMParameterParamID {
+    #[deku(id_pat = "0")] NotAssigned,
+    #[deku(id_pat = "1")] NBIFOMMode,
+    #[deku(id_pat = "2")] NBIFOMDefaultAccess,
+    #[deku(id_pat = "3")] NBIFOMStatus,
+    #[deku(id_pat = "4")] NBIFOMRoutingRules,
+    #[deku(id_pat = "5")] NBIFOMIPFlowMapping,
+    #[deku(id_pat = "6")] NBIFOMRANRulesHandling,
+    #[deku(id_pat = "7")] NBIFOMAccessStratumStatus,
+    #[deku(id_pat = "8")] NBIFOMAccessUsabilityIndication,
+    #[deku(id_pat = "9..=255")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 8)]
+pub enum ExtAPNAMBRUnitDL {
+    #[deku(id_pat = "1")] TwoHundredKbps,
+    #[deku(id_pat = "2")] OneMbps,
+    #[deku(id_pat = "3")] FourMbps,
+    #[deku(id_pat = "4")] SixteenMbps,
+    #[deku(id_pat = "5")] SixtyFourMbps,
+    #[deku(id_pat = "6")] TwoHundredAndFiftySixMbps,
+    #[deku(id_pat = "7")] OneGbps,
+    #[deku(id_pat = "8")] FourGbps,
+    #[deku(id_pat = "9")] SixteenGbps,
+    #[deku(id_pat = "10")] SixtyFourGbps,
+    #[deku(id_pat = "11")] TwoHundredAndFiftySixGbps,
+    #[deku(id_pat = "12")] OneTbps,
+    #[deku(id_pat = "13")] FourTbps,
+    #[deku(id_pat = "14")] SixteenTbps,
+    #[deku(id_pat = "15")] SixtyFourTbps,
+    #[deku(id_pat = "16")] TwoHundredAndFiftySixTbps,
+    #[deku(id_pat = "17")] OnePbps,
+    #[deku(id_pat = "18")] FourPbps,
+    #[deku(id_pat = "19")] SixteenPbps,
+    #[deku(id_pat = "20")] SixtyFourPbps,
+    #[deku(id_pat = "21")] TwoHundredAndFiftySixPbps,
+    #[deku(id_pat = "0 | 22..=255")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 8)]
+pub enum ExtAPNAMBRUnitUL {
+    #[deku(id_pat = "1")] TwoHundredKbps,
+    #[deku(id_pat = "2")] OneMbps,
+    #[deku(id_pat = "3")] FourMbps,
+    #[deku(id_pat = "4")] SixteenMbps,
+    #[deku(id_pat = "5")] SixtyFourMbps,
+    #[deku(id_pat = "6")] TwoHundredAndFiftySixMbps,
+    #[deku(id_pat = "7")] OneGbps,
+    #[deku(id_pat = "8")] FourGbps,
+    #[deku(id_pat = "9")] SixteenGbps,
+    #[deku(id_pat = "10")] SixtyFourGbps,
+    #[deku(id_pat = "11")] TwoHundredAndFiftySixGbps,
+    #[deku(id_pat = "12")] OneTbps,
+    #[deku(id_pat = "13")] FourTbps,
+    #[deku(id_pat = "14")] SixteenTbps,
+    #[deku(id_pat = "15")] SixtyFourTbps,
+    #[deku(id_pat = "16")] TwoHundredAndFiftySixTbps,
+    #[deku(id_pat = "17")] OnePbps,
+    #[deku(id_pat = "18")] FourPbps,
+    #[deku(id_pat = "19")] SixteenPbps,
+    #[deku(id_pat = "20")] SixtyFourPbps,
+    #[deku(id_pat = "21")] TwoHundredAndFiftySixPbps,
+    #[deku(id_pat = "0 | 22..=255")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 0)]
+pub enum HdrCompConfigParamsType {
+    #[deku(id_pat = "0")] ZeroNoCompression,
+    #[deku(id_pat = "1")] TwoUDPIP,
+    #[deku(id_pat = "2")] ThreeESPIP,
+    #[deku(id_pat = "3")] FourIP,
+    #[deku(id_pat = "4")] SixTCPIP,
+    #[deku(id_pat = "5")] OneHundredAndTwoUDPIP,
+    #[deku(id_pat = "6")] OneHundredAndThreeESPIP,
+    #[deku(id_pat = "7")] OneHundredAndFourIP,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum WLANOffloadAcceptUTRANOffloadAccept {
+    #[deku(id_pat = "0")] OffloadingTheTrafficOfThePDNConnectionViaAWLANWhenInIuModeIsNotAcceptable,
+    #[deku(id_pat = "1")] OffloadingTheTrafficOfThePDNConnectionViaAWLANWhenInIuModeIsAcceptable,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum WLANOffloadAcceptEUTRANOffloadAccept {
+    #[deku(id_pat = "0")] OffloadingTheTrafficOfThePDNConnectionViaAWLANWhenInS1ModeIsNotAcceptable,
+    #[deku(id_pat = "1")] OffloadingTheTrafficOfThePDNConnectionViaAWLANWhenInS1ModeIsAcceptable,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum ProtConfigProt {
+    #[deku(id_pat = "0")] PPPWithIPPDP,
+    #[deku(id_pat = "1..=7")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u16", bits = 16, endian = "big")]
+pub enum ProtConfigEltID {
+    #[deku(id_pat = "1")] PCSCFIPv6Addr,
+    #[deku(id_pat = "2")] IMCNSubsystemSignalingFlag,
+    #[deku(id_pat = "3")] DNSServerIPv6Addr,
+    #[deku(id_pat = "4")] PolicyControlRejectionCode,
+    #[deku(id_pat = "5")] SelectedBearerControlMode,
+    #[deku(id_pat = "7")] DSMIPv6HomeAgentAddr,
+    #[deku(id_pat = "8")] DSMIPv6HomeNetworkPrefix,
+    #[deku(id_pat = "9")] DSMIPv6IPv4HomeAgentAddr,
+    #[deku(id_pat = "12")] PCSCFIPv4Addr,
+    #[deku(id_pat = "13")] DNSServerIPv4Addr,
+    #[deku(id_pat = "14")] MSISDN,
+    #[deku(id_pat = "15")] IFOMSupport,
+    #[deku(id_pat = "16")] IPv4LinkMTU,
+    #[deku(id_pat = "17")] NetworkSupportOfLocalAddrInTFTInd,
+    #[deku(id_pat = "19")] NBIFOMAcceptedInd,
+    #[deku(id_pat = "20")] NBIFOMmode,
+    #[deku(id_pat = "21")] NonIPLinkMTU,
+    #[deku(id_pat = "22")] APNRateControlPrms,
+    #[deku(id_pat = "23")] TGPPPSDataOffSupportInd,
+    #[deku(id_pat = "24")] ReliableDataServiceAcceptedInd,
+    #[deku(id_pat = "25")] AdditionalAPNRateControlForExceptionDataPrms,
+    #[deku(id_pat = "27")] SNSSAI,
+    #[deku(id_pat = "28")] QoSRules,
+    #[deku(id_pat = "29")] SessionAMBR,
+    #[deku(id_pat = "30")] PDUSessionAddrLifetime,
+    #[deku(id_pat = "31")] QoSFlowDesc,
+    #[deku(id_pat = "32")] EthernetFramePayloadMTU,
+    #[deku(id_pat = "33")] UnstructuredLinkMTU,
+    #[deku(id_pat = "35")] QoSRulesWithLengthOf2,
+    #[deku(id_pat = "36")] QoSFlowDescWithLengthOf2,
+    #[deku(id_pat = "37")] SmallDataRateControlPrms,
+    #[deku(id_pat = "38")] AdditionalSmallDataRateControlForExceptionDataPrms,
+    #[deku(id_pat = "39")] ACSInformation,
+    #[deku(id_pat = "40")] InitialSmallDataRateControlPrms,
+    #[deku(id_pat = "41")] InitialAdditionalSmallDataRateControlForExceptionDataPrms,
+    #[deku(id_pat = "42")] InitialAPNRateControlPrms,
+    #[deku(id_pat = "43")] InitialAdditionalAPNRateControlForExceptionDataPrms,
+    #[deku(id_pat = "48")] ATSSSResponseWithLengthOf2,
+    #[deku(id_pat = "49")] DNSServerSecurityInformationWithLengthOf2,
+    #[deku(id_pat = "50")] ECSAddrWithLengthOf2,
+    #[deku(id_pat = "53")] ECSPIdentifier,
+    #[deku(id_pat = "54")] PVSIPv4Addr,
+    #[deku(id_pat = "55")] PVSIPv6Addr,
+    #[deku(id_pat = "56")] PVSName,
+    #[deku(id_pat = "58")] EASRediscoveryIndWithoutIndicatedImpact,
+    #[deku(id_pat = "59")] EASRediscoveryIndWithImpactedEASIPv4AddrRange,
+    #[deku(id_pat = "60")] EASRediscoveryIndWithImpactedEASIPv6AddrRange,
+    #[deku(id_pat = "61")] EASRediscoveryIndWithImpactedEASFQDN,
+    #[deku(id_pat = "62")] UplinkDataNotAllowed,
+    #[deku(id_pat = "63")] UplinkDataAllowed,
+    #[deku(id_pat = "64")] UASServicesNotAllowedInd,
+    #[deku(id_pat = "65")] ServiceLevelAAContainerWithLengthOf2,
+    #[deku(id_pat = "72")] EDCUsageAllowedInd,
+    #[deku(id_pat = "73")] EDCUsageRequiredInd,
+    #[deku(id_pat = "74")] NetworkSupportOfMACAddrRangeIn5GSInd,
+    #[deku(id_pat = "32801")] IPCP,
+    #[deku(id_pat = "49185")] LCP,
+    #[deku(id_pat = "49187")] PAP,
+    #[deku(id_pat = "49699")] CHAP,
+    #[deku(id_pat = "10")] IPAddrAllocationViaNASSignalling,
+    #[deku(id_pat = "11")] IPv4AddrallocationViaDHCPv4,
+    #[deku(id_pat = "18")] PCSCFReselectionSupport,
+    #[deku(id_pat = "26")] PDUSessionID,
+    #[deku(id_pat = "34")] FGSMCauseValue,
+    #[deku(id_pat = "57")] DNSServerSecurityProtocolSupport,
+    #[deku(id_pat = "71")] EDCSupportInd,
+    #[deku(id_pat = "0 | 6 | 44..=47 | 51..=52 | 66..=70 | 75..=32800 | 32802..=49184 | 49186 | 49188..=49698 | 49700..=65535")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 7)]
+pub enum PacketFlowIdValue {
+    #[deku(id_pat = "0")] BestEffort,
+    #[deku(id_pat = "1")] Signaling,
+    #[deku(id_pat = "2")] SMS,
+    #[deku(id_pat = "3")] TOM8,
+    #[deku(id_pat = "4..=127")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum RadioPriorityValue {
+    #[deku(id_pat = "1")] PriorityLevel1Highest,
+    #[deku(id_pat = "2")] PriorityLevel2,
+    #[deku(id_pat = "3")] PriorityLevel3,
+    #[deku(id_pat = "4")] PriorityLevel4Lowest,
+    #[deku(id_pat = "0 | 5..=7")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 4)]
+pub enum LLCSAPIValue {
+    #[deku(id_pat = "0")] NotAssigned,
+    #[deku(id_pat = "1..=2 | 4 | 6..=8 | 10..=15")] Reserved,
+    #[deku(id_pat = "3 | 5 | 9")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum QoSDelayClass {
+    #[deku(id_pat = "0")] SubscribedDelayClass,
+    #[deku(id_pat = "1")] DelayClass1,
+    #[deku(id_pat = "2")] DelayClass2,
+    #[deku(id_pat = "3")] DelayClass3,
+    #[deku(id_pat = "4")] DelayClass4BestEffort,
+    #[deku(id_pat = "7")] Reserved,
+    #[deku(id_pat = "5..=6")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum QoSReliabilityClass {
+    #[deku(id_pat = "0")] SubscribedReliabilityClass,
+    #[deku(id_pat = "1")] UnusedInterpretedAsUnackGTPAckLLCAndRLCProtectedData,
+    #[deku(id_pat = "2")] UnackGTPAckLLCAndRLCProtectedData,
+    #[deku(id_pat = "3")] UnackGTPAndLLCAckRLCProtectedData,
+    #[deku(id_pat = "4")] UnackGTPLLCAndRLCProtectedData,
+    #[deku(id_pat = "5")] UnackGTPLLCAndRLCUnprotectedData,
+    #[deku(id_pat = "6")] UnackGTPAndRLCAckLLCProtectedData,
+    #[deku(id_pat = "7")] Reserved,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 4)]
+pub enum QoSPeakThroughput {
+    #[deku(id_pat = "0")] SubscribedPeakThroughput,
+    #[deku(id_pat = "1")] UpTo1000OctetS,
+    #[deku(id_pat = "2")] UpTo2000OctetS,
+    #[deku(id_pat = "3")] UpTo4000OctetS,
+    #[deku(id_pat = "4")] UpTo8000OctetS,
+    #[deku(id_pat = "5")] UpTo16000OctetS,
+    #[deku(id_pat = "6")] UpTo32000OctetS,
+    #[deku(id_pat = "7")] UpTo64000OctetS,
+    #[deku(id_pat = "8")] UpTo128000OctetS,
+    #[deku(id_pat = "9")] UpTo256000OctetS,
+    #[deku(id_pat = "10..=15")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum QoSPrecedenceClass {
+    #[deku(id_pat = "0")] SubscribedPrecedence,
+    #[deku(id_pat = "1")] HighPriority,
+    #[deku(id_pat = "2 | 4")] NormalPriority,
+    #[deku(id_pat = "3")] LowPriority,
+    #[deku(id_pat = "7")] Reserved,
+    #[deku(id_pat = "5..=6")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 5)]
+pub enum QoSMeanThroughput {
+    #[deku(id_pat = "0")] SubscribedMeanThroughput,
+    #[deku(id_pat = "1")] OneHundredOctetH,
+    #[deku(id_pat = "2")] TwoHundredOctetH,
+    #[deku(id_pat = "3")] FiveHundredOctetH,
+    #[deku(id_pat = "4")] One000OctetH,
+    #[deku(id_pat = "5")] Two000OctetH,
+    #[deku(id_pat = "6")] Five000OctetH,
+    #[deku(id_pat = "7")] Ten000OctetH,
+    #[deku(id_pat = "8")] Twenty000OctetH,
+    #[deku(id_pat = "9")] Fifty000OctetH,
+    #[deku(id_pat = "10")] OneHundred000OctetH,
+    #[deku(id_pat = "11")] TwoHundred000OctetH,
+    #[deku(id_pat = "12")] FiveHundred000OctetH,
+    #[deku(id_pat = "13")] One000000OctetH,
+    #[deku(id_pat = "14")] Two000000OctetH,
+    #[deku(id_pat = "15")] Five000000OctetH,
+    #[deku(id_pat = "16")] Ten000000OctetH,
+    #[deku(id_pat = "17")] Twenty000000OctetH,
+    #[deku(id_pat = "18")] Fifty000000OctetH,
+    #[deku(id_pat = "30")] Reserved,
+    #[deku(id_pat = "31")] BestEffort,
+    #[deku(id_pat = "19..=29")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum QoSTrafficClass {
+    #[deku(id_pat = "0")] SubscribedTrafficClass,
+    #[deku(id_pat = "1")] ConversationalClass,
+    #[deku(id_pat = "2")] StreamingClass,
+    #[deku(id_pat = "3")] InteractiveClass,
+    #[deku(id_pat = "4")] BackgroundClass,
+    #[deku(id_pat = "7")] Reserved,
+    #[deku(id_pat = "5..=6")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 2)]
+pub enum QoSDeliveryOrder {
+    #[deku(id_pat = "0")] SubscribedDeliveryOrder,
+    #[deku(id_pat = "1")] WithDeliveryOrder,
+    #[deku(id_pat = "2")] WithoutDeliveryOrder,
+    #[deku(id_pat = "3")] Reserved,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum QoSErroneousSDU {
+    #[deku(id_pat = "0")] SubscribedDeliveryOfErroneousSDUs,
+    #[deku(id_pat = "1")] NoDetect,
+    #[deku(id_pat = "2")] ErroneousSDUsAreDelivered,
+    #[deku(id_pat = "3")] ErroneousSDUsAreNotDelivered,
+    #[deku(id_pat = "7")] Reserved,
+    #[deku(id_pat = "4..=6")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum QoSSignallingInd {
+    #[deku(id_pat = "0")] NotOptimisedForSignalling,
+    #[deku(id_pat = "1")] OptimisedForSignalling,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 4)]
+pub enum QoSSourceStatsDesc {
+    #[deku(id_pat = "0")] Unknown,
+    #[deku(id_pat = "1")] Speech,
+    #[deku(id_pat = "2..=15")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum TITIFlag {
+    #[deku(id_pat = "0")] AllocatedBySender,
+    #[deku(id_pat = "1")] AllocatedByReceiver,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 8)]
+pub enum ExtEPSQoSUnitMaxBitrate {
+    #[deku(id_pat = "1")] TwoHundredKbps,
+    #[deku(id_pat = "2")] OneMbps,
+    #[deku(id_pat = "3")] FourMbps,
+    #[deku(id_pat = "4")] SixteenMbps,
+    #[deku(id_pat = "5")] SixtyFourMbps,
+    #[deku(id_pat = "6")] TwoHundredAndFiftySixMbps,
+    #[deku(id_pat = "7")] OneGbps,
+    #[deku(id_pat = "8")] FourGbps,
+    #[deku(id_pat = "9")] SixteenGbps,
+    #[deku(id_pat = "10")] SixtyFourGbps,
+    #[deku(id_pat = "11")] TwoHundredAndFiftySixGbps,
+    #[deku(id_pat = "12")] OneTbps,
+    #[deku(id_pat = "13")] FourTbps,
+    #[deku(id_pat = "14")] SixteenTbps,
+    #[deku(id_pat = "15")] SixtyFourTbps,
+    #[deku(id_pat = "16")] TwoHundredAndFiftySixTbps,
+    #[deku(id_pat = "17")] OnePbps,
+    #[deku(id_pat = "18")] FourPbps,
+    #[deku(id_pat = "19")] SixteenPbps,
+    #[deku(id_pat = "20")] SixtyFourPbps,
+    #[deku(id_pat = "21")] TwoHundredAndFiftySixPbps,
+    #[deku(id_pat = "0 | 22..=255")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 8)]
+pub enum ExtEPSQoSUnitGuaranteedBitrate {
+    #[deku(id_pat = "1")] TwoHundredKbps,
+    #[deku(id_pat = "2")] OneMbps,
+    #[deku(id_pat = "3")] FourMbps,
+    #[deku(id_pat = "4")] SixteenMbps,
+    #[deku(id_pat = "5")] SixtyFourMbps,
+    #[deku(id_pat = "6")] TwoHundredAndFiftySixMbps,
+    #[deku(id_pat = "7")] OneGbps,
+    #[deku(id_pat = "8")] FourGbps,
+    #[deku(id_pat = "9")] SixteenGbps,
+    #[deku(id_pat = "10")] SixtyFourGbps,
+    #[deku(id_pat = "11")] TwoHundredAndFiftySixGbps,
+    #[deku(id_pat = "12")] OneTbps,
+    #[deku(id_pat = "13")] FourTbps,
+    #[deku(id_pat = "14")] SixteenTbps,
+    #[deku(id_pat = "15")] SixtyFourTbps,
+    #[deku(id_pat = "16")] TwoHundredAndFiftySixTbps,
+    #[deku(id_pat = "17")] OnePbps,
+    #[deku(id_pat = "18")] FourPbps,
+    #[deku(id_pat = "19")] SixteenPbps,
+    #[deku(id_pat = "20")] SixtyFourPbps,
+    #[deku(id_pat = "21")] TwoHundredAndFiftySixPbps,
+    #[deku(id_pat = "0 | 22..=255")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum TFTOpcode {
+    #[deku(id_pat = "0")] IgnoreThisIE,
+    #[deku(id_pat = "1")] CreateNewTFT,
+    #[deku(id_pat = "2")] DeleteExistingTFT,
+    #[deku(id_pat = "3")] AddPacketFiltersToExistingTFT,
+    #[deku(id_pat = "4")] ReplacePacketFiltersInExistingTFT,
+    #[deku(id_pat = "5")] DeletePacketFiltersFromExistingTFT,
+    #[deku(id_pat = "6")] NoTFTOperation,
+    #[deku(id_pat = "7")] Reserved,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum TFTE {
+    #[deku(id_pat = "0")] NoParametersList,
+    #[deku(id_pat = "1")] ParametersListIncluded,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum ReattemptIndEPLMNC {
+    #[deku(id_pat = "0")] MSIsAllowedToReAttemptTheProcedureInAnEquivalentPLMN,
+    #[deku(id_pat = "1")] MSIsNotAllowedToReAttemptTheProcedureInAnEquivalentPLMN,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum ReattemptIndRATC {
+    #[deku(id_pat = "0")] MSIsAllowedToReAttemptTheProcedureInS1Mode,
+    #[deku(id_pat = "1")] MSIsNotAllowedToReAttemptTheProcedureInS1Mode,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 3)]
+pub enum TFAggregateOpcode {
+    #[deku(id_pat = "0")] IgnoreThisIE,
+    #[deku(id_pat = "1")] CreateNewTFT,
+    #[deku(id_pat = "2")] DeleteExistingTFT,
+    #[deku(id_pat = "3")] AddPacketFiltersToExistingTFT,
+    #[deku(id_pat = "4")] ReplacePacketFiltersInExistingTFT,
+    #[deku(id_pat = "5")] DeletePacketFiltersFromExistingTFT,
+    #[deku(id_pat = "6")] NoTFTOperation,
+    #[deku(id_pat = "7")] Reserved,
+    #[deku(id_pat = "_")] Other,
+}
+
+#[derive(DekuRead, Debug, Serialize, Clone, PartialEq)]
+#[deku(id_type = "u8", bits = 1)]
+pub enum TFAggregateE {
+    #[deku(id_pat = "0")] NoParametersList,
+    #[deku(id_pat = "1")] ParametersListIncluded,
+    #[deku(id_pat = "_")] Other,
+}
@@ -1,2 +1,4 @@
+pub mod borrowed;
 pub mod emm;
 pub mod esm;
+pub mod ies;
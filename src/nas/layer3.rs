@@ -1,6 +1,7 @@
 use std::io::{Cursor, Read, Seek};
 
 use deku::ctx::{BitSize, ByteSize, Endian};
+use deku::error::NeedSize;
 use deku::prelude::*;
 use serde::Serialize;
 
@@ -50,6 +51,44 @@ fn check_tag<R: Read + Seek>(
     }
 }
 
+// returns the tag of the next IE without consuming it, or None if there are
+// no IEs left. generated messages use this to dispatch each optional IE to
+// its field in a single pass, rather than probing each field's tag in turn.
+pub fn peek_tag<R: Read + Seek>(reader: &mut Reader<R>) -> Result<Option<u8>, DekuError> {
+    if reader.end() {
+        return Ok(None);
+    }
+    let tag = u8::from_reader_with_ctx(reader, ())?;
+    reader
+        .seek_relative(-1)
+        .map_err(|err| DekuError::Io(err.kind()))?;
+    Ok(Some(tag))
+}
+
+// skips over an optional IE which the message doesn't declare, working out
+// its format from the tag as described in 3GPP TS 24.007: IEs whose tag has
+// the high bit set fit in a single octet, EPS IEs tagged 0x7X are TLV-Es, and
+// everything else is a TLV. returns false if the IE was truncated, in which
+// case there's nothing sensible left to parse.
+pub fn skip_unknown_ie<R: Read + Seek>(
+    reader: &mut Reader<R>,
+    tag: u8,
+) -> Result<bool, DekuError> {
+    reader.skip_bits(8)?;
+    if tag & 0x80 != 0 {
+        return Ok(true);
+    }
+    let length = if tag & 0xf0 == 0x70 {
+        u16::from_reader_with_ctx(reader, Endian::Big).map(usize::from)
+    } else {
+        u8::from_reader_with_ctx(reader, ()).map(usize::from)
+    };
+    match length {
+        Ok(length) => Ok(reader.skip_bits(length * 8).is_ok()),
+        Err(_) => Ok(false),
+    }
+}
+
 #[derive(Serialize, DekuRead, Debug, Clone)]
 #[deku(ctx = "ByteSize(byte_size): ByteSize")]
 pub struct Layer3Buffer {
@@ -63,6 +102,50 @@ impl PartialEq<Vec<u8>> for Layer3Buffer {
     }
 }
 
+// The context passed to messages generated with borrowed buffers. It holds the
+// same bytes the message's reader was created from, so that buffer IEs can be
+// sliced out of it instead of copied. Since slices are located using the
+// reader's position, this only works for fields read directly from the
+// message's reader, and not from within an IE's own nested reader.
+#[derive(Copy, Clone, Debug)]
+pub struct Borrowed<'a>(pub &'a [u8]);
+
+// A borrowed alternative to Layer3Buffer, which points into the message's
+// input rather than holding a copy of it.
+#[derive(Serialize, Debug, Clone, Copy, PartialEq)]
+pub struct Layer3Slice<'a> {
+    pub buf: &'a [u8],
+}
+
+impl<'a> Layer3Slice<'a> {
+    fn from_reader<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        Borrowed(input): Borrowed<'a>,
+        byte_size: usize,
+    ) -> Result<Self, DekuError> {
+        if reader.bits_read % 8 != 0 {
+            return Err(DekuError::Parse("borrowed buffer isn't byte aligned".into()));
+        }
+        // bits_read only ever counts up, even when the reader is rewound
+        // after peeking at a tag, so the slice is located using the
+        // underlying stream's position instead
+        let start = reader
+            .stream_position()
+            .map_err(|err| DekuError::Io(err.kind()))? as usize;
+        let buf = input
+            .get(start..start + byte_size)
+            .ok_or(DekuError::Incomplete(NeedSize::new(byte_size * 8)))?;
+        reader.skip_bits(byte_size * 8)?;
+        Ok(Self { buf })
+    }
+}
+
+impl PartialEq<Vec<u8>> for Layer3Slice<'_> {
+    fn eq(&self, other: &Vec<u8>) -> bool {
+        self.buf.eq(other)
+    }
+}
+
 // IE formats described in Sec 11.2.1.1 of 3GPP TS 24.007
 
 #[derive(Serialize, Debug, Clone)]
@@ -72,6 +155,17 @@ pub struct Type1TV<T> {
     pub inner: Option<T>,
 }
 
+impl<T> Type1TV<T> {
+    // the value of an optional IE which wasn't present in the message
+    pub fn absent(tag: Tag) -> Self {
+        Self {
+            tag: tag.into(),
+            v: 0,
+            inner: None,
+        }
+    }
+}
+
 impl<'a, T> DekuReader<'a, Tag> for Type1TV<T>
 where
     T: DekuReader<'a>,
@@ -81,11 +175,7 @@ where
         tag: Tag,
     ) -> Result<Self, DekuError> {
         if reader.end() {
-            return Ok(Self {
-                tag: tag.into(),
-                v: 0,
-                inner: None,
-            });
+            return Ok(Self::absent(tag));
         }
         let t = u8::from_reader_with_ctx(reader, BitSize(4))?;
         let v = u8::from_reader_with_ctx(reader, BitSize(4))?;
@@ -95,11 +185,7 @@ where
             reader
                 .seek_relative(-1)
                 .map_err(|err| DekuError::Io(err.kind()))?;
-            return Ok(Self {
-                tag: tag.into(),
-                v: 0,
-                inner: None,
-            });
+            return Ok(Self::absent(tag));
         }
         let mut cursor = Cursor::new([v]);
         let mut inner_reader = Reader::new(&mut cursor);
@@ -179,6 +265,15 @@ pub struct Type3TV<T> {
     pub inner: Option<T>,
 }
 
+impl<T> Type3TV<T> {
+    pub fn absent(tag: Tag) -> Self {
+        Self {
+            tag: tag.into(),
+            inner: None,
+        }
+    }
+}
+
 impl<'a, T> DekuReader<'a, (ByteSize, Tag)> for Type3TV<T>
 where
     T: DekuReader<'a>,
@@ -188,10 +283,7 @@ where
         (ByteSize(byte_size), tag): (ByteSize, Tag),
     ) -> Result<Self, DekuError> {
         if !check_tag(reader, BitSize(8), tag)? {
-            return Ok(Self {
-                tag: tag.into(),
-                inner: None,
-            });
+            return Ok(Self::absent(tag));
         }
         let buf = read_bytes_from_reader(reader, byte_size)?;
         let mut cursor = Cursor::new(buf);
@@ -213,10 +305,7 @@ where
         (ByteSize(byte_size), tag, _): (ByteSize, Tag, NeedsByteSize),
     ) -> Result<Self, DekuError> {
         if !check_tag(reader, BitSize(8), tag)? {
-            return Ok(Self {
-                tag: tag.into(),
-                inner: None,
-            });
+            return Ok(Self::absent(tag));
         }
         let buf = read_bytes_from_reader(reader, byte_size)?;
         let mut cursor = Cursor::new(buf);
@@ -276,21 +365,11 @@ where
 // results in a possible panic if we read more than 16 bytes at a time
 fn read_bytes_from_reader<R: Read + Seek>(
     reader: &mut Reader<R>,
-    mut amt: usize,
+    amt: usize,
 ) -> Result<Vec<u8>, DekuError> {
-    let mut result = Vec::with_capacity(amt);
-    while amt > 0 {
-        let amt_to_read: usize;
-        if amt <= 16 {
-            amt_to_read = amt;
-            amt = 0;
-        } else {
-            amt -= 16;
-            amt_to_read = 16;
-        };
-        let mut buf = vec![0_u8; amt_to_read];
-        reader.read_bytes(amt_to_read, &mut buf)?;
-        result.extend(buf);
+    let mut result = vec![0_u8; amt];
+    for chunk in result.chunks_mut(16) {
+        reader.read_bytes(chunk.len(), chunk)?;
     }
     Ok(result)
 }
@@ -302,6 +381,16 @@ pub struct Type4TLV<T> {
     pub inner: Option<T>,
 }
 
+impl<T> Type4TLV<T> {
+    pub fn absent(tag: Tag) -> Self {
+        Self {
+            tag: tag.into(),
+            length: 0,
+            inner: None,
+        }
+    }
+}
+
 impl<'a, T> DekuReader<'a, (Tag, NeedsByteSize)> for Type4TLV<T>
 where
     T: DekuReader<'a, ByteSize>,
@@ -311,11 +400,7 @@ where
         (tag, _): (Tag, NeedsByteSize),
     ) -> Result<Self, DekuError> {
         if !check_tag(reader, BitSize(8), tag)? {
-            return Ok(Self {
-                tag: tag.into(),
-                length: 0,
-                inner: None,
-            });
+            return Ok(Self::absent(tag));
         }
         let length = u8::from_reader_with_ctx(reader, ())?;
         let buf = read_bytes_from_reader(reader, length as usize)?;
@@ -342,11 +427,7 @@ where
         tag: Tag,
     ) -> Result<Self, DekuError> {
         if !check_tag(reader, BitSize(8), tag)? {
-            return Ok(Self {
-                tag: tag.into(),
-                length: 0,
-                inner: None,
-            });
+            return Ok(Self::absent(tag));
         }
         let length = u8::from_reader_with_ctx(reader, ())?;
         let buf = read_bytes_from_reader(reader, length as usize)?;
@@ -370,11 +451,7 @@ where
         (endian, tag): (Endian, Tag),
     ) -> Result<Self, DekuError> {
         if !check_tag(reader, BitSize(8), tag)? {
-            return Ok(Self {
-                tag: tag.into(),
-                length: 0,
-                inner: None,
-            });
+            return Ok(Self::absent(tag));
         }
         let length = u8::from_reader_with_ctx(reader, ())?;
         let buf = read_bytes_from_reader(reader, length as usize)?;
@@ -436,6 +513,16 @@ pub struct Type6TLVE<T> {
     pub inner: Option<T>,
 }
 
+impl<T> Type6TLVE<T> {
+    pub fn absent(tag: Tag) -> Self {
+        Self {
+            tag: tag.into(),
+            length: 0,
+            inner: None,
+        }
+    }
+}
+
 impl<'a, T> DekuReader<'a, Tag> for Type6TLVE<T>
 where
     T: DekuReader<'a>,
@@ -445,11 +532,7 @@ where
         tag: Tag,
     ) -> Result<Self, DekuError> {
         if !check_tag(reader, BitSize(8), tag)? {
-            return Ok(Self {
-                tag: tag.into(),
-                length: 0,
-                inner: None,
-            });
+            return Ok(Self::absent(tag));
         }
         let length = u16::from_reader_with_ctx(reader, Endian::Big)?;
         let buf = read_bytes_from_reader(reader, length as usize)?;
@@ -473,11 +556,7 @@ where
         (tag, _): (Tag, NeedsByteSize),
     ) -> Result<Self, DekuError> {
         if !check_tag(reader, BitSize(8), tag)? {
-            return Ok(Self {
-                tag: tag.into(),
-                length: 0,
-                inner: None,
-            });
+            return Ok(Self::absent(tag));
         }
         let length = u16::from_reader_with_ctx(reader, Endian::Big)?;
         let buf = read_bytes_from_reader(reader, length as usize)?;
@@ -494,3 +573,180 @@ where
         })
     }
 }
+
+// Readers for layer 3 containers of borrowed buffers. Rather than copying the
+// value into a new buffer and parsing from that, these just skip over the
+// value and slice it out of the input.
+
+impl<'a, 'b> DekuReader<'b, (ByteSize, Borrowed<'a>)> for Type3V<Layer3Slice<'a>> {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        (ByteSize(byte_size), input): (ByteSize, Borrowed<'a>),
+    ) -> Result<Self, DekuError> {
+        let inner = Layer3Slice::from_reader(reader, input, byte_size)?;
+        Ok(Type3V { inner })
+    }
+}
+
+impl<'a, 'b> DekuReader<'b, (ByteSize, Tag, Borrowed<'a>)> for Type3TV<Layer3Slice<'a>> {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        (ByteSize(byte_size), tag, input): (ByteSize, Tag, Borrowed<'a>),
+    ) -> Result<Self, DekuError> {
+        if !check_tag(reader, BitSize(8), tag)? {
+            return Ok(Self::absent(tag));
+        }
+        let inner = Some(Layer3Slice::from_reader(reader, input, byte_size)?);
+        Ok(Self {
+            tag: tag.into(),
+            inner,
+        })
+    }
+}
+
+impl<'a, 'b> DekuReader<'b, Borrowed<'a>> for Type4LV<Layer3Slice<'a>> {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        input: Borrowed<'a>,
+    ) -> Result<Self, DekuError> {
+        let length = u8::from_reader_with_ctx(reader, ())?;
+        let inner = Layer3Slice::from_reader(reader, input, length as usize)?;
+        Ok(Self { length, inner })
+    }
+}
+
+impl<'a, 'b> DekuReader<'b, (Tag, Borrowed<'a>)> for Type4TLV<Layer3Slice<'a>> {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        (tag, input): (Tag, Borrowed<'a>),
+    ) -> Result<Self, DekuError> {
+        if !check_tag(reader, BitSize(8), tag)? {
+            return Ok(Self::absent(tag));
+        }
+        let length = u8::from_reader_with_ctx(reader, ())?;
+        let inner = Some(Layer3Slice::from_reader(reader, input, length as usize)?);
+        Ok(Self {
+            tag: tag.into(),
+            length,
+            inner,
+        })
+    }
+}
+
+impl<'a, 'b> DekuReader<'b, Borrowed<'a>> for Type6LVE<Layer3Slice<'a>> {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        input: Borrowed<'a>,
+    ) -> Result<Self, DekuError> {
+        let length = u16::from_reader_with_ctx(reader, Endian::Big)?;
+        let inner = Layer3Slice::from_reader(reader, input, length as usize)?;
+        Ok(Self { length, inner })
+    }
+}
+
+impl<'a, 'b> DekuReader<'b, (Tag, Borrowed<'a>)> for Type6TLVE<Layer3Slice<'a>> {
+    fn from_reader_with_ctx<R: Read + Seek>(
+        reader: &mut Reader<R>,
+        (tag, input): (Tag, Borrowed<'a>),
+    ) -> Result<Self, DekuError> {
+        if !check_tag(reader, BitSize(8), tag)? {
+            return Ok(Self::absent(tag));
+        }
+        let length = u16::from_reader_with_ctx(reader, Endian::Big)?;
+        let inner = Some(Layer3Slice::from_reader(reader, input, length as usize)?);
+        Ok(Self {
+            tag: tag.into(),
+            length,
+            inner,
+        })
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_slice_after_rewind() {
+        let input = [0x66, 0x02, 0xaa, 0xbb, 0x67, 0x01, 0xcc];
+        let mut cursor = Cursor::new(&input[..]);
+        let mut reader = Reader::new(&mut cursor);
+        // peeking at the tag, and checking for an IE which isn't there, both
+        // read a byte and then rewind
+        assert_eq!(peek_tag(&mut reader).unwrap(), Some(0x66));
+        let absent: Type4TLV<Layer3Slice> =
+            DekuReader::from_reader_with_ctx(&mut reader, (Tag(0x67), Borrowed(&input))).unwrap();
+        assert!(absent.inner.is_none());
+        // so the slices have to be located after the rewinds
+        let first: Type4TLV<Layer3Slice> =
+            DekuReader::from_reader_with_ctx(&mut reader, (Tag(0x66), Borrowed(&input))).unwrap();
+        assert_eq!(first.inner.unwrap().buf, &[0xaa, 0xbb][..]);
+        let second: Type4TLV<Layer3Slice> =
+            DekuReader::from_reader_with_ctx(&mut reader, (Tag(0x67), Borrowed(&input))).unwrap();
+        assert_eq!(second.inner.unwrap().buf, &[0xcc][..]);
+        assert!(reader.end());
+    }
+
+    #[test]
+    fn test_slice_after_new_reader() {
+        use std::io::SeekFrom;
+        // a message body after a one byte header, read the way dispatch reads
+        // messages without a direction: read it once, then rewind the cursor
+        // and read it again with a new reader
+        let input = [0x07, 0x66, 0x02, 0xaa, 0xbb];
+        let mut cursor = Cursor::new(&input[..]);
+        let mut reader = Reader::new(&mut cursor);
+        reader.skip_bits(8).unwrap();
+        let cursor = reader.into_inner();
+        let bookmark = cursor.seek(SeekFrom::Current(0)).unwrap();
+        for _ in 0..2 {
+            cursor.seek(SeekFrom::Start(bookmark)).unwrap();
+            let mut reader = Reader::new(&mut *cursor);
+            // each new reader counts from zero, but slices are still located
+            // in the whole input
+            let ie: Type4TLV<Layer3Slice> =
+                DekuReader::from_reader_with_ctx(&mut reader, (Tag(0x66), Borrowed(&input))).unwrap();
+            assert_eq!(ie.inner.unwrap().buf, &[0xaa, 0xbb][..]);
+        }
+    }
+
+    #[test]
+    fn test_peek_tag() {
+        let input = [0x93];
+        let mut cursor = Cursor::new(&input[..]);
+        let mut reader = Reader::new(&mut cursor);
+        // peeking doesn't consume the tag
+        assert_eq!(peek_tag(&mut reader).unwrap(), Some(0x93));
+        assert_eq!(peek_tag(&mut reader).unwrap(), Some(0x93));
+        reader.skip_bits(8).unwrap();
+        assert_eq!(peek_tag(&mut reader).unwrap(), None);
+    }
+
+    #[test]
+    fn test_skip_unknown_ie() {
+        // a single octet IE, a TLV and a TLV-E, followed by a byte to show
+        // where each one stopped
+        let input = [0x93, 0x2a, 0x02, 0x01, 0x02, 0x79, 0x00, 0x03, 0x01, 0x02, 0x03, 0xff];
+        let mut cursor = Cursor::new(&input[..]);
+        let mut reader = Reader::new(&mut cursor);
+        for tag in [0x93, 0x2a, 0x79] {
+            assert_eq!(peek_tag(&mut reader).unwrap(), Some(tag));
+            assert!(skip_unknown_ie(&mut reader, tag).unwrap());
+        }
+        assert_eq!(peek_tag(&mut reader).unwrap(), Some(0xff));
+    }
+
+    #[test]
+    fn test_skip_truncated_ie() {
+        // the length runs past the end of the input
+        let input = [0x2b, 0x05, 0x01];
+        let mut cursor = Cursor::new(&input[..]);
+        let mut reader = Reader::new(&mut cursor);
+        assert!(!skip_unknown_ie(&mut reader, 0x2b).unwrap());
+        // and so does a TLV-E's length
+        let input = [0x79, 0x00];
+        let mut cursor = Cursor::new(&input[..]);
+        let mut reader = Reader::new(&mut cursor);
+        assert!(!skip_unknown_ie(&mut reader, 0x79).unwrap());
+    }
+}
@@ -1,11 +1,12 @@
-use deku::ctx::BitSize;
+use deku::ctx::{BitSize, ByteSize};
 use deku::prelude::*;
-use emm::{parse_emm_nas, EMMType};
+use emm::{parse_emm_nas, EMMSecProtNASMessage, EMMServiceRequest, EMMType};
 use esm::{parse_esm_nas, ESMType};
 use serde::Serialize;
 use std::io::Cursor;
 use thiserror::Error;
 
+pub mod csn1;
 pub mod emm;
 pub mod esm;
 pub mod generated;
@@ -15,50 +16,141 @@ mod test_utils;
 
 #[derive(Debug, Error)]
 pub enum ParseError {
-    #[error("Cannot decode encrypted NAS messages")]
-    EncryptedNASMessage,
+    #[error("Unknown EMM security header type {0}")]
+    UnknownSecurityHeader(u8),
     #[error("Unsupported NAS protocol {0:?}")]
     UnsupportedNASProtocol(ProtocolDiscriminator),
     #[error("Failed to parse message")]
     Deku(#[from] DekuError),
 }
 
+// The direction a NAS message was sent in. A few message types are formatted
+// differently depending on direction, so knowing it up front lets them be
+// parsed in a single attempt.
+#[derive(Copy, Clone, Debug, PartialEq, Eq, Serialize)]
+pub enum Direction {
+    // mobile originated
+    Uplink,
+    // mobile terminated
+    Downlink,
+}
+
 #[derive(Clone, Debug, Serialize)]
 pub enum NASMessage {
     EMMMessage(emm::EMMMessage),
     ESMMessage(esm::ESMMessage),
+    SecurityProtected(SecurityProtectedNASMessage),
+    // service requests have a security header of their own instead of a
+    // message type, and are never wrapped in a security protected message
+    ServiceRequest(EMMServiceRequest),
 }
 
 impl NASMessage {
     pub fn parse(data: &[u8]) -> Result<Self, ParseError> {
+        Self::parse_with_direction(data, None)
+    }
+
+    pub fn parse_with_direction(
+        data: &[u8],
+        direction: Option<Direction>,
+    ) -> Result<Self, ParseError> {
+        Self::parse_with_security(data, direction, false)
+    }
+
+    // Parses a message sent under a security context which uses the null
+    // ciphering algorithm (EEA0), so that messages inside ciphered security
+    // protected messages are decoded too.
+    pub fn parse_null_ciphered(
+        data: &[u8],
+        direction: Option<Direction>,
+    ) -> Result<Self, ParseError> {
+        Self::parse_with_security(data, direction, true)
+    }
+
+    fn parse_with_security(
+        data: &[u8],
+        direction: Option<Direction>,
+        null_cipher: bool,
+    ) -> Result<Self, ParseError> {
         let mut cursor = Cursor::new(data);
         let mut reader = Reader::new(&mut cursor);
         let sec_hdr_or_bearer_id = u8::from_reader_with_ctx(&mut reader, BitSize(4))?;
         match ProtocolDiscriminator::from_reader_with_ctx(&mut reader, ())? {
-            ProtocolDiscriminator::EMM => {
-                if sec_hdr_or_bearer_id != SecHdrType::NoSecurity.deku_id()? {
-                    return Err(ParseError::EncryptedNASMessage);
+            ProtocolDiscriminator::EMM => match sec_hdr_or_bearer_id {
+                0 => {
+                    let emm_type = EMMType::from_reader_with_ctx(&mut reader, ())?;
+                    Ok(NASMessage::EMMMessage(parse_emm_nas(emm_type, reader, direction)?))
                 }
-                let emm_type = EMMType::from_reader_with_ctx(&mut reader, ())?;
-                Ok(NASMessage::EMMMessage(parse_emm_nas(emm_type, reader)?))
-            }
+                1..=4 => Ok(NASMessage::SecurityProtected(
+                    SecurityProtectedNASMessage::parse(data, direction, null_cipher)?,
+                )),
+                12 => Ok(NASMessage::ServiceRequest(
+                    EMMServiceRequest::from_reader_with_ctx(&mut reader, ())?,
+                )),
+                id => Err(ParseError::UnknownSecurityHeader(id)),
+            },
             ProtocolDiscriminator::ESM => {
                 let _pti = u8::from_reader_with_ctx(&mut reader, ())?;
                 let esm_type = ESMType::from_reader_with_ctx(&mut reader, ())?;
-                Ok(NASMessage::ESMMessage(parse_esm_nas(esm_type, reader)?))
+                Ok(NASMessage::ESMMessage(parse_esm_nas(esm_type, reader, direction)?))
             }
             p => Err(ParseError::UnsupportedNASProtocol(p)),
         }
     }
 }
 
+// An EMM message with a security header, made up of the header's MAC and
+// sequence number followed by the protected NAS message. The NAS message
+// inside is decoded if it's readable, i.e. if it was only integrity
+// protected, or if it was ciphered with the null ciphering algorithm.
+#[derive(Clone, Debug, Serialize)]
+pub struct SecurityProtectedNASMessage {
+    pub sec_hdr: SecHdrType,
+    pub header: EMMSecProtNASMessage,
+    pub inner: Option<Box<NASMessage>>,
+}
+
+impl SecurityProtectedNASMessage {
+    fn parse(
+        data: &[u8],
+        direction: Option<Direction>,
+        null_cipher: bool,
+    ) -> Result<Self, ParseError> {
+        let (_, nas_header) = NASHeader::from_bytes((data, 0))?;
+        // the protected message reads the rest of its input, so it gets a
+        // reader of its own starting after the header byte
+        let mut cursor = Cursor::new(&data[1..]);
+        let mut reader = Reader::new(&mut cursor);
+        let header = EMMSecProtNASMessage::from_reader_with_ctx(&mut reader, ByteSize(data.len() - 1))?;
+        let readable = null_cipher
+            || matches!(
+                nas_header.sec_hdr,
+                SecHdrType::IntegrityProtected | SecHdrType::IntegrityProtectedNewEPS
+            );
+        // like pycrate, keep the security protected message even if the one
+        // inside it doesn't parse
+        let inner = if readable {
+            NASMessage::parse_with_security(&header.nas_message, direction, null_cipher)
+                .ok()
+                .map(Box::new)
+        } else {
+            None
+        };
+        Ok(Self {
+            sec_hdr: nas_header.sec_hdr,
+            header,
+            inner,
+        })
+    }
+}
+
 #[derive(DekuRead, DekuWrite, Debug)]
 pub struct NASHeader {
     pub sec_hdr: SecHdrType,
     pub protocol_discriminator: ProtocolDiscriminator,
 }
 
-#[derive(DekuRead, DekuWrite, Debug)]
+#[derive(DekuRead, DekuWrite, Debug, Clone, Copy, PartialEq, Serialize)]
 #[deku(id_type = "u8", bits = 4)]
 pub enum SecHdrType {
     #[deku(id = 0)]
@@ -113,3 +205,100 @@ pub enum ProtocolDiscriminator {
     #[deku(id = 126)]
     FiveGMM,
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::nas::test_utils::*;
+
+    #[test]
+    fn test_integrity_protected() {
+        let data = unhexlify("17a1b2c3d405074300035200c2");
+        let NASMessage::SecurityProtected(msg) = NASMessage::parse(&data).unwrap() else {
+            panic!("expected a security protected message");
+        };
+        assert_eq!(msg.sec_hdr, SecHdrType::IntegrityProtected);
+        assert_eq!(msg.header.mac, vec![0xa1, 0xb2, 0xc3, 0xd4]);
+        assert_eq!(msg.header.seqn, 5);
+        assert!(matches!(
+            msg.inner.as_deref(),
+            Some(NASMessage::EMMMessage(emm::EMMMessage::EMMAttachComplete(_)))
+        ));
+    }
+
+    #[test]
+    fn test_ciphered() {
+        let data = unhexlify("27a1b2c3d405074300035200c2");
+        let NASMessage::SecurityProtected(msg) = NASMessage::parse(&data).unwrap() else {
+            panic!("expected a security protected message");
+        };
+        assert!(msg.inner.is_none());
+        let NASMessage::SecurityProtected(msg) = NASMessage::parse_null_ciphered(&data, None).unwrap() else {
+            panic!("expected a security protected message");
+        };
+        assert!(matches!(
+            msg.inner.as_deref(),
+            Some(NASMessage::EMMMessage(emm::EMMMessage::EMMAttachComplete(_)))
+        ));
+    }
+
+    #[test]
+    fn test_service_request() {
+        let data = unhexlify("c70a1b2c");
+        let NASMessage::ServiceRequest(msg) = NASMessage::parse(&data).unwrap() else {
+            panic!("expected a service request");
+        };
+        assert_eq!(msg.seqn_short, 10);
+        assert_eq!(msg.mac_short, vec![0x1b, 0x2c]);
+    }
+
+    #[test]
+    fn test_detach_request_direction() {
+        use emm::EMMMessage;
+        let mt = unhexlify("074502");
+        let mo = unhexlify("0745630bf602f8108003c8c2e65e9a");
+        // with a direction, detach requests are parsed in its form straight
+        // away
+        let msg = NASMessage::parse_with_direction(&mt, Some(Direction::Downlink)).unwrap();
+        assert!(matches!(msg, NASMessage::EMMMessage(EMMMessage::EMMDetachRequestMT(_))));
+        let msg = NASMessage::parse_with_direction(&mo, Some(Direction::Uplink)).unwrap();
+        assert!(matches!(msg, NASMessage::EMMMessage(EMMMessage::EMMDetachRequestMO(_))));
+        // so the downlink form isn't tried if the uplink form doesn't parse
+        assert!(NASMessage::parse_with_direction(&mt, Some(Direction::Uplink)).is_err());
+        // without one, the uplink form is tried first, then the downlink form
+        let msg = NASMessage::parse_with_direction(&mo, None).unwrap();
+        assert!(matches!(msg, NASMessage::EMMMessage(EMMMessage::EMMDetachRequestMO(_))));
+        let msg = NASMessage::parse_with_direction(&mt, None).unwrap();
+        assert!(matches!(msg, NASMessage::EMMMessage(EMMMessage::EMMDetachRequestMT(_))));
+    }
+
+    #[test]
+    fn test_optional_ies_out_of_order() {
+        use emm::EMMMessage;
+        // an attach accept whose optional IEs are out of order, with unknown
+        // IEs in between (0x93, 0x2a and the TLV-E 0x79), and a truncated
+        // unknown IE at the end
+        let data = unhexlify(concat!(
+            "0742014906201301846b0100030202d9",
+            "172c",
+            "93",
+            "5316",
+            "2a020102",
+            "c1",
+            "790003010203",
+            "500bf6130184fa6aaec191ee7d",
+            "2b0501",
+        ));
+        let NASMessage::EMMMessage(EMMMessage::EMMAttachAccept(msg)) = NASMessage::parse(&data).unwrap() else {
+            panic!("expected an attach accept");
+        };
+        let t_3402 = msg.t_3402.inner.unwrap();
+        assert_eq!(t_3402.unit, generated::ies::GPRSTimerUnit::OneMin);
+        assert_eq!(t_3402.value, 12);
+        assert!(msg.emm_cause.inner.is_some());
+        // the type 1 IE is matched on its high nibble
+        assert!(msg.network_pol.inner.is_some());
+        assert!(msg.guti.inner.is_some());
+        assert!(msg.id.inner.is_none());
+    }
+}
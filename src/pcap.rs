@@ -0,0 +1,348 @@
+use std::io::{self, Read};
+use thiserror::Error;
+
+// Offsets of the GSMTAP header within a captured record, which is assumed to
+// be IPv4 (20 bytes) + UDP (8 bytes) + GSMTAP (16 bytes) + payload. These
+// match the generator's pcap reader (generator-script/generator/pcap.py), so
+// both pull the same payloads out of a capture.
+pub const GSMTAP_HDR_START: usize = 28;
+pub const GSMTAP_HDR_END: usize = GSMTAP_HDR_START + 16;
+pub const GSMTAP_TYPE_OFFSET: usize = GSMTAP_HDR_START + 2;
+pub const GSMTAP_TYPE_NAS: u8 = 18;
+
+const PCAP_GLOBAL_HDR_LEN: usize = 24;
+const PCAPNG_SHB_TYPE: u32 = 0x0a0d0d0a;
+const PCAPNG_BYTE_ORDER_MAGIC: u32 = 0x1a2b3c4d;
+const PCAPNG_SPB_TYPE: u32 = 0x00000003;
+const PCAPNG_EPB_TYPE: u32 = 0x00000006;
+
+#[derive(Debug, Error)]
+pub enum PcapError {
+    #[error("unrecognized capture magic {0:02x?}")]
+    UnrecognizedMagic([u8; 4]),
+    #[error("bad pcapng byte order magic")]
+    BadByteOrderMagic,
+    #[error("truncated pcapng section header")]
+    TruncatedSectionHeader,
+    #[error(transparent)]
+    Io(#[from] io::Error),
+}
+
+#[derive(Clone, Copy, Debug, PartialEq)]
+enum Format {
+    Pcap,
+    Pcapng,
+}
+
+// Streams the NAS payloads out of a pcap or pcapng capture of GSMTAP packets,
+// one record at a time. The input only needs to implement Read, so captures
+// can be piped in on stdin.
+//
+// Records which aren't GSMTAP NAS are skipped without being copied anywhere,
+// and NAS payloads are read into a single buffer which is reused for every
+// record, so memory use stays flat regardless of how large the capture is.
+// Like the generator's reader, a truncated capture just ends at its last full
+// record.
+pub struct GsmtapNASReader<R: Read> {
+    reader: R,
+    format: Format,
+    big_endian: bool,
+    payload: Vec<u8>,
+}
+
+impl<R: Read> GsmtapNASReader<R> {
+    pub fn new(mut reader: R) -> Result<Self, PcapError> {
+        let mut magic = [0; 4];
+        reader.read_exact(&mut magic)?;
+        let (format, big_endian) = match magic {
+            // microsecond and nanosecond resolution
+            [0xd4, 0xc3, 0xb2, 0xa1] | [0x4d, 0x3c, 0xb2, 0xa1] => (Format::Pcap, false),
+            [0xa1, 0xb2, 0xc3, 0xd4] | [0xa1, 0xb2, 0x3c, 0x4d] => (Format::Pcap, true),
+            // the section header block type reads the same in either byte
+            // order
+            _ if u32::from_le_bytes(magic) == PCAPNG_SHB_TYPE => (Format::Pcapng, false),
+            _ => return Err(PcapError::UnrecognizedMagic(magic)),
+        };
+        let mut nas_reader = Self {
+            reader,
+            format,
+            big_endian,
+            payload: Vec::new(),
+        };
+        match format {
+            Format::Pcap => {
+                nas_reader.skip((PCAP_GLOBAL_HDR_LEN - 4) as u64)?;
+            }
+            // every section header block declares the byte order for the
+            // blocks in its section, so we start off by reading the first one
+            Format::Pcapng => {
+                let mut block_len = [0; 4];
+                if !nas_reader.read_or_eof(&mut block_len)?
+                    || !nas_reader.read_section_header(block_len)?
+                {
+                    return Err(PcapError::TruncatedSectionHeader);
+                }
+            }
+        }
+        Ok(nas_reader)
+    }
+
+    // Returns the next NAS payload, or None once the capture runs out. The
+    // payload is only valid until the next call.
+    pub fn next_payload(&mut self) -> Result<Option<&[u8]>, PcapError> {
+        let found = match self.format {
+            Format::Pcap => self.next_pcap_record()?,
+            Format::Pcapng => self.next_pcapng_record()?,
+        };
+        Ok(if found { Some(&self.payload) } else { None })
+    }
+
+    fn u32_from(&self, bytes: &[u8]) -> u32 {
+        let bytes = [bytes[0], bytes[1], bytes[2], bytes[3]];
+        if self.big_endian {
+            u32::from_be_bytes(bytes)
+        } else {
+            u32::from_le_bytes(bytes)
+        }
+    }
+
+    // fills buf, returning false if the input ran out first
+    fn read_or_eof(&mut self, buf: &mut [u8]) -> Result<bool, PcapError> {
+        match self.reader.read_exact(buf) {
+            Ok(()) => Ok(true),
+            Err(e) if e.kind() == io::ErrorKind::UnexpectedEof => Ok(false),
+            Err(e) => Err(e.into()),
+        }
+    }
+
+    // skips the next n bytes, returning false if the input ran out first
+    fn skip(&mut self, n: u64) -> Result<bool, PcapError> {
+        let skipped = io::copy(&mut self.reader.by_ref().take(n), &mut io::sink())?;
+        Ok(skipped == n)
+    }
+
+    // Reads a single captured record of the given length into the payload
+    // buffer. Returns Some(true) if it's a GSMTAP NAS packet, Some(false) if
+    // it isn't, or None if the input ran out partway through. In each case
+    // but the last, the input is left at the end of the record.
+    fn read_record(&mut self, captured_len: usize) -> Result<Option<bool>, PcapError> {
+        if captured_len < GSMTAP_HDR_END {
+            return Ok(self.skip(captured_len as u64)?.then_some(false));
+        }
+        let mut hdr = [0; GSMTAP_HDR_END];
+        if !self.read_or_eof(&mut hdr)? {
+            return Ok(None);
+        }
+        let remaining = captured_len - GSMTAP_HDR_END;
+        if hdr[GSMTAP_TYPE_OFFSET] != GSMTAP_TYPE_NAS {
+            return Ok(self.skip(remaining as u64)?.then_some(false));
+        }
+        let mut payload = std::mem::take(&mut self.payload);
+        payload.resize(remaining, 0);
+        let complete = self.read_or_eof(&mut payload)?;
+        self.payload = payload;
+        Ok(complete.then_some(true))
+    }
+
+    fn next_pcap_record(&mut self) -> Result<bool, PcapError> {
+        let mut record_hdr = [0; 16];
+        while self.read_or_eof(&mut record_hdr)? {
+            let captured_len = self.u32_from(&record_hdr[8..12]) as usize;
+            match self.read_record(captured_len)? {
+                Some(true) => return Ok(true),
+                Some(false) => continue,
+                None => break,
+            }
+        }
+        Ok(false)
+    }
+
+    fn next_pcapng_record(&mut self) -> Result<bool, PcapError> {
+        let mut block_hdr = [0; 8];
+        while self.read_or_eof(&mut block_hdr)? {
+            let block_type = self.u32_from(&block_hdr[..4]);
+            let block_len = self.u32_from(&block_hdr[4..]) as usize;
+            if block_type == PCAPNG_SHB_TYPE {
+                // a new section, which may switch byte order
+                let block_len = [block_hdr[4], block_hdr[5], block_hdr[6], block_hdr[7]];
+                if !self.read_section_header(block_len)? {
+                    break;
+                }
+                continue;
+            }
+            // how far into the block we've read so far
+            let mut block_read = block_hdr.len();
+            let captured_len = match block_type {
+                PCAPNG_EPB_TYPE => {
+                    let mut fields = [0; 20];
+                    if !self.read_or_eof(&mut fields)? {
+                        break;
+                    }
+                    block_read += fields.len();
+                    Some(self.u32_from(&fields[12..16]) as usize)
+                }
+                PCAPNG_SPB_TYPE => {
+                    let mut original_len = [0; 4];
+                    if !self.read_or_eof(&mut original_len)? {
+                        break;
+                    }
+                    block_read += original_len.len();
+                    // the packet data is padded out to 32 bits, and may have
+                    // been cut short by the snap length
+                    let original_len = self.u32_from(&original_len) as usize;
+                    Some(original_len.min(block_len.saturating_sub(16)))
+                }
+                _ => None,
+            };
+            let mut is_nas = false;
+            if let Some(captured_len) = captured_len {
+                match self.read_record(captured_len)? {
+                    Some(found) => is_nas = found,
+                    None => break,
+                }
+                block_read += captured_len;
+            }
+            // skip the padding, options, and trailing block length
+            if !self.skip(block_len.saturating_sub(block_read) as u64)? {
+                break;
+            }
+            if is_nas {
+                return Ok(true);
+            }
+        }
+        Ok(false)
+    }
+
+    // Reads the rest of a section header block after its block type and
+    // length, taking on its byte order. The block length is only decoded once
+    // the byte order is known. Returns false if the input ran out first.
+    fn read_section_header(&mut self, block_len: [u8; 4]) -> Result<bool, PcapError> {
+        let mut byte_order_magic = [0; 4];
+        if !self.read_or_eof(&mut byte_order_magic)? {
+            return Ok(false);
+        }
+        if u32::from_le_bytes(byte_order_magic) == PCAPNG_BYTE_ORDER_MAGIC {
+            self.big_endian = false;
+        } else if u32::from_be_bytes(byte_order_magic) == PCAPNG_BYTE_ORDER_MAGIC {
+            self.big_endian = true;
+        } else {
+            return Err(PcapError::BadByteOrderMagic);
+        }
+        let block_len = self.u32_from(&block_len) as u64;
+        // skip the rest of the section header (version, section length,
+        // options, and trailing block length)
+        self.skip(block_len.saturating_sub(12))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn gsmtap_record(gsmtap_type: u8, payload: &[u8]) -> Vec<u8> {
+        let mut record = vec![0; GSMTAP_HDR_START];
+        record.extend([2, 4, gsmtap_type]);
+        record.extend([0; 13]);
+        record.extend(payload);
+        record
+    }
+
+    fn records() -> Vec<Vec<u8>> {
+        vec![
+            gsmtap_record(GSMTAP_TYPE_NAS, &[0x07, 0x55, 0x01]),
+            gsmtap_record(13, &[0xde, 0xad, 0xbe, 0xef]),
+            b"short".to_vec(),
+            gsmtap_record(GSMTAP_TYPE_NAS, &[0x02, 0x02, 0xd9]),
+        ]
+    }
+
+    fn expected() -> Vec<Vec<u8>> {
+        vec![vec![0x07, 0x55, 0x01], vec![0x02, 0x02, 0xd9]]
+    }
+
+    fn u32_bytes(value: u32, big_endian: bool) -> [u8; 4] {
+        if big_endian {
+            value.to_be_bytes()
+        } else {
+            value.to_le_bytes()
+        }
+    }
+
+    fn write_pcap(records: &[Vec<u8>], big_endian: bool) -> Vec<u8> {
+        let mut out = u32_bytes(0xa1b2c3d4, big_endian).to_vec();
+        out.extend([0; PCAP_GLOBAL_HDR_LEN - 4]);
+        for record in records {
+            let len = record.len() as u32;
+            for field in [0, 0, len, len] {
+                out.extend(u32_bytes(field, big_endian));
+            }
+            out.extend(record);
+        }
+        out
+    }
+
+    fn write_pcapng(records: &[Vec<u8>], big_endian: bool) -> Vec<u8> {
+        let mut out = Vec::new();
+        // section header, with no options
+        for field in [PCAPNG_SHB_TYPE, 28, PCAPNG_BYTE_ORDER_MAGIC, 1, 0xffffffff, 0xffffffff, 28] {
+            out.extend(u32_bytes(field, big_endian));
+        }
+        // interface description
+        for field in [1, 20, 228, 65535, 20] {
+            out.extend(u32_bytes(field, big_endian));
+        }
+        for record in records {
+            let padding = (4 - record.len() % 4) % 4;
+            let block_len = (32 + record.len() + padding) as u32;
+            let len = record.len() as u32;
+            for field in [PCAPNG_EPB_TYPE, block_len, 0, 0, 0, len, len] {
+                out.extend(u32_bytes(field, big_endian));
+            }
+            out.extend(record);
+            out.extend(vec![0; padding]);
+            out.extend(u32_bytes(block_len, big_endian));
+        }
+        out
+    }
+
+    fn read_all(capture: &[u8]) -> Vec<Vec<u8>> {
+        let mut reader = GsmtapNASReader::new(capture).unwrap();
+        let mut payloads = Vec::new();
+        while let Some(payload) = reader.next_payload().unwrap() {
+            payloads.push(payload.to_vec());
+        }
+        payloads
+    }
+
+    #[test]
+    fn test_pcap() {
+        for big_endian in [false, true] {
+            assert_eq!(read_all(&write_pcap(&records(), big_endian)), expected());
+        }
+    }
+
+    #[test]
+    fn test_pcapng() {
+        for big_endian in [false, true] {
+            assert_eq!(read_all(&write_pcapng(&records(), big_endian)), expected());
+        }
+        // a second section may switch byte order
+        let mut capture = write_pcapng(&records(), false);
+        capture.extend(write_pcapng(&records(), true));
+        assert_eq!(read_all(&capture), [expected(), expected()].concat());
+    }
+
+    #[test]
+    fn test_truncated() {
+        let capture = write_pcap(&records(), false);
+        assert_eq!(read_all(&capture[..capture.len() - 3]), expected()[..1]);
+    }
+
+    #[test]
+    fn test_bad_magic() {
+        assert!(matches!(
+            GsmtapNASReader::new(&b"nopenopenope"[..]),
+            Err(PcapError::UnrecognizedMagic(_))
+        ));
+    }
+}